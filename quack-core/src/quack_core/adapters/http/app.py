@@ -3,7 +3,7 @@
 # module: quack_core.adapters.http.app
 # role: adapters
 # neighbors: __init__.py, service.py, models.py, config.py, auth.py, dependencies.py (+1 more)
-# exports: create_app
+# exports: create_job_store, create_job_runner, create_app
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -21,14 +21,54 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from quack_core.adapters.http.config import HttpAdapterConfig
+from quack_core.adapters.http.events import JobEvents, NotifyingJobStore
 from quack_core.adapters.http.routes import health, jobs, operations
-from quack_core.lib.jobs import InMemoryJobStore, JobStore, ThreadPoolJobRunner
+from quack_core.adapters.http.runner import AsyncioJobRunner
+from quack_core.lib.jobs import (
+    InMemoryJobStore,
+    JobRunner,
+    JobStore,
+    ThreadPoolJobRunner,
+)
 from quack_core.lib.logging import get_logger
 from quack_core.lib.registry import OperationRegistry, get_registry
 
 logger = get_logger(__name__)
 
 
+def create_job_store(cfg: HttpAdapterConfig) -> JobStore:
+    """Build the job store selected by cfg.job_store."""
+    if cfg.job_store == "sqlite":
+        from quack_core.integrations.database.sqlite import SQLiteJobStore
+
+        return SQLiteJobStore(cfg.job_store_path)
+    return InMemoryJobStore()
+
+
+def create_job_runner(
+        cfg: HttpAdapterConfig,
+        registry: OperationRegistry,
+        store: JobStore,
+) -> JobRunner:
+    """Build the job runner selected by cfg.job_runner."""
+    if cfg.job_runner == "asyncio":
+        return AsyncioJobRunner(
+            registry=registry,
+            store=store,
+            max_workers=cfg.max_workers,
+            hmac_secret=cfg.hmac_secret,
+            max_concurrency=cfg.max_concurrent_jobs,
+            operation_limits=cfg.operation_concurrency,
+            timeout_seconds=cfg.request_timeout_seconds,
+        )
+    return ThreadPoolJobRunner(
+        registry=registry,
+        store=store,
+        max_workers=cfg.max_workers,
+        hmac_secret=cfg.hmac_secret,
+    )
+
+
 async def cleanup_task(store: JobStore, ttl_seconds: int) -> None:
     """Background task to cleanup expired jobs."""
     while True:
@@ -59,13 +99,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Initialize job system
         cfg: HttpAdapterConfig = app.state.cfg
         registry = get_registry()
-        store = InMemoryJobStore()
-        runner = ThreadPoolJobRunner(
-            registry=registry,
-            store=store,
-            max_workers=cfg.max_workers,
-            hmac_secret=cfg.hmac_secret,
-        )
+        # Route the runner's writes through the notifier so long-poll and
+        # SSE waiters wake as soon as a job changes
+        store = NotifyingJobStore(create_job_store(cfg), app.state.job_events)
+        runner = create_job_runner(cfg, registry, store)
 
         # Store in app state
         app.state.job_store = store
@@ -95,14 +132,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if hasattr(app.state, "job_runner"):
         app.state.job_runner.shutdown(wait=True)
 
+    # Only close stores we created; injected stores belong to the caller
+    if cleanup is not None and hasattr(app.state.job_store, "close"):
+        app.state.job_store.close()
+
     logger.info("HTTP adapter stopped")
 
 
 def create_app(
         cfg: HttpAdapterConfig | None = None,
         registry: OperationRegistry | None = None,
-        job_store: InMemoryJobStore | None = None,
-        job_runner: ThreadPoolJobRunner | None = None,
+        job_store: JobStore | None = None,
+        job_runner: JobRunner | None = None,
 ) -> FastAPI:
     """
     Create FastAPI application with dependency injection.
@@ -127,6 +168,7 @@ def create_app(
 
     # Store config in app state (dependency injection source)
     app.state.cfg = cfg
+    app.state.job_events = JobEvents()
 
     # Allow test overrides (bypasses lifespan initialization)
     if registry is not None:
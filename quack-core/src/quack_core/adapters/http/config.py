@@ -13,6 +13,7 @@
 Configuration for the HTTP adapter.
 """
 
+from typing import Literal
 
 from pydantic import AnyHttpUrl, Field
 from quack_core.config.tooling.base import QuackToolConfigModel
@@ -30,3 +31,16 @@ class HttpAdapterConfig(QuackToolConfigModel):
     job_ttl_seconds: int = 3600
     max_workers: int = 4
     request_timeout_seconds: int = 900
+    # "memory" loses jobs on restart; "sqlite" persists them to job_store_path
+    job_store: Literal["memory", "sqlite"] = "memory"
+    job_store_path: str = "./data/quack_jobs.db"
+    # "thread" runs each job on a worker thread (max_workers in flight);
+    # "asyncio" runs coroutine operations on an event loop, offloading sync
+    # ones to max_workers threads
+    job_runner: Literal["thread", "asyncio"] = "thread"
+    max_concurrent_jobs: int = 256
+    operation_concurrency: dict[str, int] = Field(default_factory=dict)
+    # Upper bound for GET /jobs/{job_id}?wait=<seconds>
+    long_poll_max_seconds: int = 60
+    # Keep-alive comment interval on GET /jobs/{job_id}/events
+    sse_heartbeat_seconds: int = 15
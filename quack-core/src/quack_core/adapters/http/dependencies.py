@@ -3,7 +3,7 @@
 # module: quack_core.adapters.http.dependencies
 # role: adapters
 # neighbors: __init__.py, app.py, service.py, models.py, config.py, auth.py (+1 more)
-# exports: get_cfg, get_registry, get_job_store, get_job_runner, require_auth
+# exports: get_cfg, get_registry, get_job_store, get_job_runner, get_job_events, require_auth
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -20,6 +20,7 @@ resources from app.state for use in route handlers.
 from fastapi import Request
 from quack_core.adapters.http.auth import require_bearer
 from quack_core.adapters.http.config import HttpAdapterConfig
+from quack_core.adapters.http.events import JobEvents
 from quack_core.lib.jobs import JobRunner, JobStore
 from quack_core.lib.registry import OperationRegistry
 
@@ -76,6 +77,19 @@ def get_job_runner(request: Request) -> JobRunner:
     return request.app.state.job_runner
 
 
+def get_job_events(request: Request) -> JobEvents:
+    """
+    Get job change notifications from app state.
+
+    Args:
+        request: FastAPI request
+
+    Returns:
+        Job events registry
+    """
+    return request.app.state.job_events
+
+
 def require_auth(request: Request) -> None:
     """
     Dependency that enforces authentication.
@@ -0,0 +1,182 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/adapters/http/events.py
+# module: quack_core.adapters.http.events
+# role: adapters
+# neighbors: __init__.py, app.py, service.py, models.py, config.py, auth.py (+2 more)
+# exports: JobEvents, JobSubscription, NotifyingJobStore, is_terminal
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+
+"""
+Per-job change notifications for long-poll and SSE status endpoints.
+
+The job runner writes job state through the JobStore from worker threads.
+NotifyingJobStore wraps the real store and calls JobEvents.notify(job_id)
+after every write, waking any request that is waiting on that job. Waiters
+live on the event loop, so a waiting client costs one idle connection and
+no polling.
+
+Waiters always re-read the store after waking, and also re-check on a
+fallback interval, so a store that was injected without the wrapper still
+works (just with up to fallback_seconds of extra latency).
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+from quack_core.lib.jobs import JobData, JobStore
+
+TERMINAL_STATUSES = frozenset({"done", "error"})
+
+
+def is_terminal(job_data: JobData) -> bool:
+    """Whether the job has finished (successfully or not)."""
+    status = getattr(job_data.status, "value", job_data.status)
+    return status in TERMINAL_STATUSES
+
+
+class JobSubscription:
+    """
+    A subscription to changes of one job.
+
+    Subscribe *before* reading the store, so a change that lands between the
+    read and the wait still wakes the subscriber.
+    """
+
+    def __init__(self, events: "JobEvents", job_id: str) -> None:
+        self._events = events
+        self.job_id = job_id
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def _signal(self) -> None:
+        """Wake the subscriber (called from any thread)."""
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # Event loop already closed (shutdown); nothing to wake
+            pass
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until the job changes or timeout elapses.
+
+        Returns:
+            True if a change notification arrived, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+    def __enter__(self) -> "JobSubscription":
+        self._events._add(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._events._remove(self)
+
+
+class JobEvents:
+    """Registry of per-job subscriptions, safe to notify from worker threads."""
+
+    def __init__(self, fallback_seconds: float = 5.0) -> None:
+        """
+        Args:
+            fallback_seconds: Max time a waiter sleeps before re-reading the
+                store without a notification
+        """
+        self.fallback_seconds = fallback_seconds
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, set[JobSubscription]] = {}
+
+    def subscribe(self, job_id: str) -> JobSubscription:
+        """Create a subscription; use it as a context manager."""
+        return JobSubscription(self, job_id)
+
+    def notify(self, job_id: str) -> None:
+        """Wake every subscriber of job_id."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(job_id, ()))
+        for subscription in subscriptions:
+            subscription._signal()
+
+    def subscriber_count(self, job_id: str | None = None) -> int:
+        """Number of active subscriptions (for one job, or overall)."""
+        with self._lock:
+            if job_id is not None:
+                return len(self._subscriptions.get(job_id, ()))
+            return sum(len(subs) for subs in self._subscriptions.values())
+
+    def _add(self, subscription: JobSubscription) -> None:
+        with self._lock:
+            self._subscriptions.setdefault(subscription.job_id, set()).add(subscription)
+
+    def _remove(self, subscription: JobSubscription) -> None:
+        with self._lock:
+            subs = self._subscriptions.get(subscription.job_id)
+            if subs is None:
+                return
+            subs.discard(subscription)
+            if not subs:
+                del self._subscriptions[subscription.job_id]
+
+
+class NotifyingJobStore:
+    """
+    JobStore wrapper that publishes a JobEvents notification on every write.
+
+    get/find_by_idempotency_hash/cleanup_expired are plain reads or bulk
+    sweeps and are delegated unchanged. Any other store method called with a
+    job_id (first positional argument or keyword) is treated as a write to
+    that job and notifies after it returns; a spurious notification only
+    costs the waiter one extra store read.
+    """
+
+    def __init__(self, store: JobStore, events: JobEvents) -> None:
+        """
+        Args:
+            store: The real job store
+            events: Where to publish change notifications
+        """
+        self._store = store
+        self._events = events
+
+    def create(self, job_data: JobData) -> Any:
+        result = self._store.create(job_data)
+        self._events.notify(job_data.job_id)
+        return result
+
+    def update(self, job_id: str, *args: Any, **kwargs: Any) -> Any:
+        result = self._store.update(job_id, *args, **kwargs)
+        self._events.notify(job_id)
+        return result
+
+    def get(self, job_id: str) -> JobData | None:
+        return self._store.get(job_id)
+
+    def find_by_idempotency_hash(self, idempotency_hash: str) -> JobData | None:
+        return self._store.find_by_idempotency_hash(idempotency_hash)
+
+    def cleanup_expired(self, ttl_seconds: int) -> int:
+        return self._store.cleanup_expired(ttl_seconds)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._store, name)
+        if not callable(attr):
+            return attr
+
+        def notifying(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            job_id = kwargs.get("job_id", args[0] if args else None)
+            if isinstance(job_id, str):
+                self._events.notify(job_id)
+            return result
+
+        return notifying
@@ -3,7 +3,7 @@
 # module: quack_core.adapters.http.routes.health
 # role: adapters
 # neighbors: __init__.py, operations.py, jobs.py
-# exports: health_live, health_ready
+# exports: health_live, health_ready, health_metrics
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -12,7 +12,11 @@
 Health check routes.
 """
 
-from fastapi import APIRouter
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException
+from quack_core.adapters.http.dependencies import get_job_runner, require_auth
+from quack_core.lib.jobs import JobRunner
 
 router = APIRouter()
 
@@ -27,3 +31,31 @@ def health_live():
 def health_ready():
     """Readiness check - no auth required."""
     return {"ok": True}
+
+
+@router.get("/metrics", dependencies=[Depends(require_auth)])
+def health_metrics(
+        runner: Annotated[JobRunner, Depends(get_job_runner)],
+) -> dict[str, Any]:
+    """
+    Job runner load - auth required.
+
+    Returns the runner's metrics() snapshot (queue depth, in-flight and
+    completed/failed counts) for runners that provide one.
+
+    Raises:
+        HTTPException: If the configured runner does not report metrics
+    """
+    metrics = getattr(runner, "metrics", None)
+    if metrics is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": {
+                    "code": "METRICS_UNAVAILABLE",
+                    "message": f"{type(runner).__name__} does not report metrics",
+                    "details": {},
+                }
+            },
+        )
+    return metrics()
@@ -3,7 +3,7 @@
 # module: quack_core.adapters.http.routes.jobs
 # role: adapters
 # neighbors: __init__.py, operations.py, health.py
-# exports: start_job, job_status
+# exports: start_job, job_status, job_events
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -13,20 +13,28 @@
 Job management routes with dependency injection.
 """
 
+import asyncio
 import hashlib
 import json
 import time
 import uuid
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
+from quack_core.adapters.http.config import HttpAdapterConfig
 from quack_core.adapters.http.dependencies import (
+    get_cfg,
+    get_job_events,
     get_job_runner,
     get_job_store,
     get_registry,
     require_auth,
 )
+from quack_core.adapters.http.events import JobEvents, is_terminal
 from quack_core.adapters.http.models import JobRequest, JobResponse
 from quack_core.adapters.http.models import JobStatus as JobStatusModel
 from quack_core.lib.jobs import JobData, JobRunner, JobStatus, JobStore
@@ -138,18 +146,52 @@ def start_job(
     return JobResponse(job_id=job_id, status=JobStatus.QUEUED.value)
 
 
+def _job_not_found(job_id: str) -> HTTPException:
+    """Build the structured 404 for an unknown job."""
+    return HTTPException(
+        status_code=404,
+        detail={
+            "error": {
+                "code": "JOB_NOT_FOUND",
+                "message": f"Job not found: {job_id}",
+                "details": {"job_id": job_id},
+            }
+        },
+    )
+
+
+def _to_status_model(job_data: JobData) -> JobStatusModel:
+    """Convert stored job data to the response model."""
+    return JobStatusModel(
+        job_id=job_data.job_id,
+        status=job_data.status.value,
+        result=job_data.result,
+        error=job_data.error,
+    )
+
+
 @router.get("/{job_id}", response_model=JobStatusModel,
             dependencies=[Depends(require_auth)])
-def job_status(
+async def job_status(
         job_id: str,
         store: Annotated[JobStore, Depends(get_job_store)],
+        events: Annotated[JobEvents, Depends(get_job_events)],
+        cfg: Annotated[HttpAdapterConfig, Depends(get_cfg)],
+        wait: Annotated[float | None, Query(ge=0)] = None,
 ) -> JobStatusModel:
     """
-    Get job status.
+    Get job status, optionally long-polling until the job finishes.
+
+    With ?wait=<seconds> the request is held open until the job reaches
+    done/error or the wait elapses (capped at cfg.long_poll_max_seconds),
+    then returns the current status either way.
 
     Args:
         job_id: Job identifier
         store: Job store (injected)
+        events: Job change notifications (injected)
+        cfg: Adapter configuration (injected)
+        wait: Optional long-poll timeout in seconds
 
     Returns:
         Job status
@@ -157,22 +199,102 @@ def job_status(
     Raises:
         HTTPException: If job not found
     """
-    job_data = store.get(job_id)
-    if job_data is None:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "JOB_NOT_FOUND",
-                    "message": f"Job not found: {job_id}",
-                    "details": {"job_id": job_id},
-                }
-            },
-        )
+    if not wait:
+        job_data = await run_in_threadpool(store.get, job_id)
+        if job_data is None:
+            raise _job_not_found(job_id)
+        return _to_status_model(job_data)
 
-    return JobStatusModel(
-        job_id=job_data.job_id,
-        status=job_data.status.value,
-        result=job_data.result,
-        error=job_data.error,
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(wait, cfg.long_poll_max_seconds)
+
+    with events.subscribe(job_id) as subscription:
+        while True:
+            job_data = await run_in_threadpool(store.get, job_id)
+            if job_data is None:
+                raise _job_not_found(job_id)
+
+            remaining = deadline - loop.time()
+            if is_terminal(job_data) or remaining <= 0:
+                return _to_status_model(job_data)
+
+            await subscription.wait(min(remaining, events.fallback_seconds))
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.get("/{job_id}/events", dependencies=[Depends(require_auth)])
+async def job_events(
+        job_id: str,
+        request: Request,
+        store: Annotated[JobStore, Depends(get_job_store)],
+        events: Annotated[JobEvents, Depends(get_job_events)],
+        cfg: Annotated[HttpAdapterConfig, Depends(get_cfg)],
+) -> StreamingResponse:
+    """
+    Stream job status changes as server-sent events.
+
+    Emits a "status" event (JobStatus JSON) immediately and on every status
+    change, then closes after the done/error event. Comment lines are sent
+    every cfg.sse_heartbeat_seconds to keep proxies from dropping the
+    connection.
+
+    Args:
+        job_id: Job identifier
+        request: FastAPI request (for disconnect detection)
+        store: Job store (injected)
+        events: Job change notifications (injected)
+        cfg: Adapter configuration (injected)
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException: If job not found
+    """
+    if await run_in_threadpool(store.get, job_id) is None:
+        raise _job_not_found(job_id)
+
+    loop = asyncio.get_running_loop()
+    heartbeat = cfg.sse_heartbeat_seconds
+
+    async def stream() -> AsyncIterator[str]:
+        last_status: str | None = None
+        last_sent = loop.time()
+
+        with events.subscribe(job_id) as subscription:
+            while True:
+                job_data = await run_in_threadpool(store.get, job_id)
+                if job_data is None:
+                    # Evicted (TTL) while streaming
+                    yield _sse_event("gone", json.dumps({"job_id": job_id}))
+                    return
+
+                if job_data.status.value != last_status:
+                    last_status = job_data.status.value
+                    last_sent = loop.time()
+                    yield _sse_event(
+                        "status", _to_status_model(job_data).model_dump_json()
+                    )
+
+                if is_terminal(job_data) or await request.is_disconnected():
+                    return
+
+                until_heartbeat = last_sent + heartbeat - loop.time()
+                if until_heartbeat <= 0:
+                    last_sent = loop.time()
+                    yield ": keep-alive\n\n"
+                    continue
+
+                await subscription.wait(
+                    min(until_heartbeat, events.fallback_seconds)
+                )
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
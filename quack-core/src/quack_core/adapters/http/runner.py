@@ -0,0 +1,326 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/adapters/http/runner.py
+# module: quack_core.adapters.http.runner
+# role: adapters
+# neighbors: __init__.py, app.py, service.py, models.py, config.py, auth.py (+3 more)
+# exports: AsyncioJobRunner
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+
+"""
+Async-native job runner for I/O-bound operations.
+
+ThreadPoolJobRunner ties up one thread per running job, so max_workers caps
+concurrency even when jobs are just waiting on LLM or Google API calls.
+AsyncioJobRunner runs coroutine operations directly on its own event loop
+(one background thread), so hundreds of I/O-bound jobs can be in flight at
+once. Sync operations are offloaded to a bounded thread pool.
+
+Concurrency is limited globally (max_concurrency) and optionally per
+operation (operation_limits). Jobs waiting for a slot count as queued;
+metrics() reports queue depth and in-flight counts.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from quack_core.adapters.http.auth import sign_payload
+from quack_core.adapters.http.util import post_callback
+from quack_core.lib.jobs import JobRunner, JobStatus, JobStore
+from quack_core.lib.logging import get_logger
+from quack_core.lib.registry import OperationRegistry
+
+logger = get_logger(__name__)
+
+
+class AsyncioJobRunner(JobRunner):
+    """
+    Job runner that executes operations on a dedicated asyncio event loop.
+
+    Drop-in alternative to ThreadPoolJobRunner: same constructor core
+    (registry, store, max_workers, hmac_secret) and the same
+    submit()/shutdown() surface. submit() is thread-safe.
+    """
+
+    def __init__(
+            self,
+            registry: OperationRegistry,
+            store: JobStore,
+            max_workers: int = 4,
+            hmac_secret: str | None = None,
+            max_concurrency: int = 256,
+            operation_limits: dict[str, int] | None = None,
+            timeout_seconds: float | None = None,
+    ) -> None:
+        """
+        Start the runner's event loop thread.
+
+        Args:
+            registry: Operation registry
+            store: Job store
+            max_workers: Thread pool size for *sync* operations
+            hmac_secret: Optional secret for signing callbacks
+            max_concurrency: Max jobs in flight across all operations
+            operation_limits: Optional per-operation in-flight limits
+            timeout_seconds: Optional per-job timeout
+        """
+        self.registry = registry
+        self.store = store
+        self.hmac_secret = hmac_secret
+        self.max_concurrency = max_concurrency
+        self.operation_limits = dict(operation_limits or {})
+        self.timeout_seconds = timeout_seconds
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="quack_job_sync"
+        )
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="quack_job_loop", daemon=True
+        )
+        self._thread.start()
+
+        # Semaphores are created on the runner loop (see _slots)
+        self._global_slots: asyncio.Semaphore | None = None
+        self._op_slots: dict[str, asyncio.Semaphore] = {}
+
+        self._lock = threading.Lock()
+        self._futures: set[Future] = set()
+        self._queued: dict[str, int] = {}
+        self._running: dict[str, int] = {}
+        self._completed = 0
+        self._failed = 0
+        self._closed = False
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def submit(
+            self,
+            job_id: str,
+            op_name: str,
+            params: dict[str, Any],
+            callback_url: str | None = None,
+    ) -> None:
+        """
+        Schedule a job on the runner loop.
+
+        Args:
+            job_id: Job identifier (already created in the store)
+            op_name: Registered operation name
+            params: Validated, serialized request params
+            callback_url: Optional URL to POST the final result to
+
+        Raises:
+            RuntimeError: If the runner has been shut down
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Job runner is shut down")
+            self._queued[op_name] = self._queued.get(op_name, 0) + 1
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_job(job_id, op_name, params, callback_url), self._loop
+        )
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _slots(self, op_name: str) -> list[asyncio.Semaphore]:
+        """Semaphores a job must hold to run (runner loop only)."""
+        if self._global_slots is None:
+            self._global_slots = asyncio.Semaphore(self.max_concurrency)
+        slots = [self._global_slots]
+
+        limit = self.operation_limits.get(op_name)
+        if limit:
+            if op_name not in self._op_slots:
+                self._op_slots[op_name] = asyncio.Semaphore(limit)
+            # Take the per-operation slot first so a saturated operation
+            # doesn't hold global slots other operations could use
+            slots.insert(0, self._op_slots[op_name])
+        return slots
+
+    def _move(self, op_name: str, source: dict[str, int],
+              target: dict[str, int] | None) -> None:
+        with self._lock:
+            source[op_name] -= 1
+            if not source[op_name]:
+                del source[op_name]
+            if target is not None:
+                target[op_name] = target.get(op_name, 0) + 1
+
+    async def _update(self, job_id: str, **updates: Any) -> None:
+        """Write to the store without blocking the loop."""
+        await asyncio.to_thread(self.store.update, job_id, **updates)
+
+    async def _invoke(self, op_name: str, params: dict[str, Any]) -> Any:
+        op = self.registry.get(op_name)
+        if op is None:
+            raise ValueError(f"Operation not found: {op_name}")
+
+        request = op.request_model(**params)
+        if inspect.iscoroutinefunction(op.callable):
+            result = await op.callable(request)
+        else:
+            result = await self._loop.run_in_executor(
+                self._executor, functools.partial(op.callable, request)
+            )
+            if inspect.isawaitable(result):
+                result = await result
+
+        if hasattr(result, "model_dump"):
+            return result.model_dump()
+        return result
+
+    async def _run_job(
+            self,
+            job_id: str,
+            op_name: str,
+            params: dict[str, Any],
+            callback_url: str | None,
+    ) -> None:
+        acquired: list[asyncio.Semaphore] = []
+        running = False
+        cancelled = False
+        started = time.monotonic()
+        status, result, error = JobStatus.ERROR, None, None
+
+        try:
+            for slot in self._slots(op_name):
+                await slot.acquire()
+                acquired.append(slot)
+
+            self._move(op_name, self._queued, self._running)
+            running = True
+            started = time.monotonic()
+
+            await self._update(job_id, status=JobStatus.RUNNING)
+            result = await asyncio.wait_for(
+                self._invoke(op_name, params), timeout=self.timeout_seconds
+            )
+            status = JobStatus.DONE
+        except asyncio.TimeoutError:
+            error = f"Job timed out after {self.timeout_seconds}s"
+        except asyncio.CancelledError:
+            # Record the job as failed below, then let the cancellation finish
+            cancelled = True
+            error = "Job cancelled"
+        except Exception as e:
+            logger.error(f"Job {job_id} ({op_name}) failed: {e}")
+            error = str(e)
+        finally:
+            for slot in reversed(acquired):
+                slot.release()
+            self._move(op_name, self._running if running else self._queued, None)
+
+        with self._lock:
+            if status == JobStatus.DONE:
+                self._completed += 1
+            else:
+                self._failed += 1
+
+        try:
+            await self._update(job_id, status=status, result=result, error=error)
+        except Exception as e:
+            logger.error(f"Failed to store result for job {job_id}: {e}")
+
+        logger.debug(
+            f"Job {job_id} ({op_name}) finished as {status.value} "
+            f"in {time.monotonic() - started:.3f}s"
+        )
+
+        if cancelled:
+            raise asyncio.CancelledError()
+
+        if callback_url:
+            await self._send_callback(job_id, status, result, error, callback_url)
+
+    async def _send_callback(
+            self,
+            job_id: str,
+            status: JobStatus,
+            result: Any,
+            error: str | None,
+            callback_url: str,
+    ) -> None:
+        """POST the final job state; failures are logged, never raised."""
+        body = {
+            "job_id": job_id,
+            "status": status.value,
+            "result": result,
+            "error": error,
+        }
+        signature = sign_payload(body, self.hmac_secret) if self.hmac_secret else None
+        try:
+            await post_callback(callback_url, body, signature)
+        except Exception as e:
+            logger.warning(f"Callback for job {job_id} to {callback_url} failed: {e}")
+
+    async def _cancel_jobs(self) -> None:
+        """Cancel every job on the loop and wait until each has recorded it."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of runner load.
+
+        Returns:
+            Dict with total queued/running counts, per-operation breakdowns
+            and completed/failed totals
+        """
+        with self._lock:
+            return {
+                "queued": sum(self._queued.values()),
+                "running": sum(self._running.values()),
+                "queued_by_op": dict(self._queued),
+                "running_by_op": dict(self._running),
+                "completed": self._completed,
+                "failed": self._failed,
+                "max_concurrency": self.max_concurrency,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting jobs and stop the loop.
+
+        Args:
+            wait: Wait for queued and running jobs to finish first;
+                otherwise they are cancelled and stored as failed
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            futures = list(self._futures)
+
+        if wait:
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.debug(f"Job ended with error during shutdown: {e}")
+        else:
+            asyncio.run_coroutine_threadsafe(self._cancel_jobs(), self._loop).result()
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
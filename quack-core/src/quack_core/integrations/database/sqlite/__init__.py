@@ -2,7 +2,16 @@
 # path: quack-core/src/quack_core/integrations/database/sqlite/__init__.py
 # module: quack_core.integrations.database.sqlite.__init__
 # role: module
+# neighbors: job_store.py
+# exports: SQLiteJobStore
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
 
+"""
+SQLite persistence for QuackCore.
+"""
+
+from quack_core.integrations.database.sqlite.job_store import SQLiteJobStore
+
+__all__ = ["SQLiteJobStore"]
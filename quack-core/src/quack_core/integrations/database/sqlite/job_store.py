@@ -0,0 +1,248 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/database/sqlite/job_store.py
+# module: quack_core.integrations.database.sqlite.job_store
+# role: module
+# neighbors: __init__.py
+# exports: SQLiteJobStore
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+
+"""
+SQLite-backed JobStore for the HTTP adapter.
+
+Jobs, results and idempotency hashes survive restarts. The database runs in
+WAL mode so job_status polling (readers) never blocks the job runner
+(writer), and each thread gets its own connection.
+
+Lookup columns (job_id, idempotency_hash, created_at, status) are real
+indexed columns; the full JobData record is stored as JSON so fields added
+to JobData later round-trip without a schema migration.
+"""
+
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from quack_core.lib.jobs import JobData, JobStatus, JobStore
+from quack_core.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id           TEXT PRIMARY KEY,
+    idempotency_hash TEXT,
+    status           TEXT NOT NULL,
+    created_at       REAL NOT NULL,
+    data             TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_idempotency_hash ON jobs (idempotency_hash);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at ON jobs (status, created_at);
+"""
+
+# Only finished jobs are removed by cleanup_expired()
+_FINISHED_STATUSES = (JobStatus.DONE.value, JobStatus.ERROR.value)
+
+
+def _job_to_dict(job: JobData) -> dict[str, Any]:
+    """Convert a JobData (pydantic model or dataclass) to a plain dict."""
+    if hasattr(job, "model_dump"):
+        return job.model_dump()
+    if dataclasses.is_dataclass(job):
+        return dataclasses.asdict(job)
+    return dict(vars(job))
+
+
+def _json_default(value: Any) -> Any:
+    # Results are stored as JSON, but the in-memory store accepted any value;
+    # fall back to str() (datetime, Path, ...) rather than failing the update
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Persistent, crash-safe job store backed by SQLite.
+
+    Drop-in replacement for InMemoryJobStore. Safe to share between the
+    request handlers and the job runner's worker threads.
+    """
+
+    def __init__(
+            self,
+            path: str | Path,
+            busy_timeout_ms: int = 5000,
+            cleanup_batch_size: int = 500,
+    ) -> None:
+        """
+        Open (or create) the job database.
+
+        Args:
+            path: Database file path (":memory:" is not supported because
+                every thread opens its own connection)
+            busy_timeout_ms: How long a writer waits for the write lock
+            cleanup_batch_size: Rows deleted per transaction by cleanup_expired()
+        """
+        self.path = Path(path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cleanup_batch_size = cleanup_batch_size
+
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+        logger.info(f"SQLite job store ready at {self.path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: single statements commit immediately, multi-
+            # statement updates use explicit BEGIN IMMEDIATE.
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _row_to_job(data: str) -> JobData:
+        fields = json.loads(data)
+        fields["status"] = JobStatus(fields["status"])
+        return JobData(**fields)
+
+    def _write(self, conn: sqlite3.Connection, job: JobData, insert: bool) -> None:
+        fields = _job_to_dict(job)
+        status = fields["status"]
+        params = (
+            fields.get("idempotency_hash"),
+            status.value if isinstance(status, Enum) else str(status),
+            float(fields["created_at"]),
+            json.dumps(fields, default=_json_default),
+            fields["job_id"],
+        )
+        if insert:
+            conn.execute(
+                "INSERT INTO jobs (idempotency_hash, status, created_at, data, job_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                params,
+            )
+        else:
+            conn.execute(
+                "UPDATE jobs SET idempotency_hash = ?, status = ?, created_at = ?, "
+                "data = ? WHERE job_id = ?",
+                params,
+            )
+
+    def create(self, job_data: JobData) -> None:
+        """Insert a new job."""
+        self._write(self._connect(), job_data, insert=True)
+
+    def get(self, job_id: str) -> JobData | None:
+        """Look up a job by ID."""
+        row = self._connect().execute(
+            "SELECT data FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return self._row_to_job(row[0]) if row else None
+
+    def update(self, job_id: str, **updates: Any) -> JobData | None:
+        """
+        Update fields of an existing job atomically.
+
+        Returns:
+            The updated job, or None if the job does not exist (e.g. it was
+            evicted while running)
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT data FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            fields = json.loads(row[0])
+            fields.update(updates)
+            fields["status"] = JobStatus(
+                fields["status"].value
+                if isinstance(fields["status"], Enum)
+                else fields["status"]
+            )
+            job = JobData(**fields)
+            self._write(conn, job, insert=False)
+            conn.execute("COMMIT")
+            return job
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def find_by_idempotency_hash(self, idempotency_hash: str) -> JobData | None:
+        """Return the job created with this idempotency hash, if any."""
+        row = self._connect().execute(
+            "SELECT data FROM jobs WHERE idempotency_hash = ? "
+            "ORDER BY created_at DESC LIMIT 1",
+            (idempotency_hash,),
+        ).fetchone()
+        return self._row_to_job(row[0]) if row else None
+
+    def cleanup_expired(self, ttl_seconds: int) -> int:
+        """
+        Delete finished jobs created more than ttl_seconds ago.
+
+        Queued and running jobs are kept however old they are. Deletes in
+        batches of cleanup_batch_size so a large backlog never holds the write
+        lock long enough to stall the job runner.
+
+        Returns:
+            Number of jobs removed
+        """
+        cutoff = time.time() - ttl_seconds
+        conn = self._connect()
+        removed = 0
+        while True:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE rowid IN ("
+                "SELECT rowid FROM jobs WHERE status IN (?, ?) AND created_at < ? "
+                "LIMIT ?)",
+                (*_FINISHED_STATUSES, cutoff, self.cleanup_batch_size),
+            )
+            removed += cursor.rowcount
+            if cursor.rowcount < self.cleanup_batch_size:
+                break
+        return removed
+
+    def count(self) -> int:
+        """Number of stored jobs."""
+        return self._connect().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        """Close every connection opened by this store."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to close job store connection: {e}")
+            self._connections.clear()
+        self._local = threading.local()
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.github.__init__
 # role: module
 # neighbors: service.py, models.py, protocols.py, config.py, auth.py, client.py
-# exports: GitHubIntegration, GitHubClient, GitHubAuthProvider, GitHubConfigProvider, GitHubIntegrationProtocol, GitHubRepo, GitHubUser, PullRequest (+2 more)
+# exports: GitHubIntegration, GitHubClient, GitHubAuthProvider, GitHubConfigProvider, GitHubIntegrationProtocol, GitHubRepo, GitHubUser, PullRequest (+5 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -15,7 +15,15 @@ from __future__ import annotations
 from .auth import GitHubAuthProvider
 from .client import GitHubClient
 from .config import GitHubConfigProvider
-from .models import GitHubRepo, GitHubUser, PullRequest, PullRequestStatus
+from .models import (
+    GitHubRepo,
+    GitHubUser,
+    PullRequest,
+    PullRequestDetails,
+    PullRequestReview,
+    PullRequestStatus,
+    RateLimitStatus,
+)
 from .protocols import GitHubIntegrationProtocol
 from .service import GitHubIntegration
 
@@ -31,7 +39,10 @@ __all__ = [
     "GitHubRepo",
     "GitHubUser",
     "PullRequest",
+    "PullRequestDetails",
+    "PullRequestReview",
     "PullRequestStatus",
+    "RateLimitStatus",
     # Factory function
     "create_integration",
 ]
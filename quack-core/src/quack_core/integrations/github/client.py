@@ -10,12 +10,20 @@
 
 """GitHub API client for quack_core."""
 
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any, Literal
 
 import requests
 from quack_core.lib.logging import get_logger
 
-from .models import GitHubRepo, GitHubUser, PullRequest
+from .models import (
+    GitHubRepo,
+    GitHubUser,
+    PullRequest,
+    PullRequestDetails,
+    RateLimitStatus,
+)
 from .operations import (
     add_issue_comment,
     check_repository_exists,
@@ -24,17 +32,25 @@ from .operations import (
     fork_repo,
     get_issue,
     get_pull_request,
+    get_pull_request_details,
     get_pull_request_files,  # Added import
     get_repo,
     get_repository_file_content,
     get_user,
     is_repo_starred,
+    iter_issues,
+    iter_pull_request_details,
+    iter_pull_request_files,
+    iter_pull_requests,
     list_issues,
+    list_pull_request_details,
     list_pull_requests,
     star_repo,
     unstar_repo,
     update_repository_file,
 )
+from .utils.api import ETagCache, make_request
+from .utils.rate_limit import RateLimitBudget, get_rate_limit_budget
 
 logger = get_logger(__name__)
 
@@ -78,6 +94,42 @@ class GitHubClient:
         # Cache for user info
         self._current_user: GitHubUser | None = None
 
+        # Pages of list endpoints, re-requested with If-None-Match
+        self.etag_cache = ETagCache()
+
+        # Shared with every other client using this token
+        self.rate_limit: RateLimitBudget = get_rate_limit_budget(token)
+
+    def get_rate_limit(
+        self, resource: str = "core", refresh: bool = False
+    ) -> RateLimitStatus:
+        """Get the rate-limit budget of this client's token.
+
+        Args:
+            resource: Rate-limit resource (core, search, graphql, ...)
+            refresh: Ask GitHub for the current budget instead of relying on
+                the headers of earlier responses (does not count against it)
+
+        Returns:
+            RateLimitStatus for the resource
+
+        Raises:
+            QuackApiError: If the API request fails
+        """
+        if refresh:
+            response = make_request(
+                session=self.session,
+                method="GET",
+                url="/rate_limit",
+                api_url=self.api_url,
+                rate_limit=self.rate_limit,
+                timeout=self.timeout,
+                max_retries=self.max_retries,
+                retry_delay=self.retry_delay,
+            )
+            self.rate_limit.update_from_payload(response.json())
+        return self.rate_limit.status(resource)
+
     def get_user(self, username: str | None = None) -> GitHubUser:
         """Get information about a GitHub user.
 
@@ -276,6 +328,50 @@ class GitHubClient:
             api_url=self.api_url,
             state=state,
             author=author,
+            etag_cache=self.etag_cache,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+
+    def iter_pull_requests(
+        self,
+        repo: str,
+        state: Literal["open", "closed", "all"] = "open",
+        author: str | None = None,
+        base: str | None = None,
+        head: str | None = None,
+        sort: Literal["created", "updated", "popularity", "long-running"] = "created",
+        direction: Literal["asc", "desc"] = "desc",
+    ) -> Iterator[PullRequest]:
+        """Iterate over pull requests for a repository, fetching pages lazily.
+
+        Args:
+            repo: Full repository name (owner/repo)
+            state: Pull request state (open, closed, all)
+            author: Filter by author username
+            base: Filter by base branch name
+            head: Filter by head, as user:ref-name
+            sort: What to sort results by
+            direction: Direction to sort
+
+        Yields:
+            PullRequest objects
+
+        Raises:
+            QuackApiError: If the API request fails
+        """
+        return iter_pull_requests(
+            session=self.session,
+            repo=repo,
+            api_url=self.api_url,
+            state=state,
+            author=author,
+            base=base,
+            head=head,
+            sort=sort,
+            direction=direction,
+            etag_cache=self.etag_cache,
             timeout=self.timeout,
             max_retries=self.max_retries,
             retry_delay=self.retry_delay,
@@ -304,6 +400,101 @@ class GitHubClient:
             retry_delay=self.retry_delay,
         )
 
+    def list_pull_request_details(
+        self,
+        repo: str,
+        state: Literal["open", "closed", "all"] = "open",
+        author: str | None = None,
+    ) -> list[PullRequestDetails]:
+        """List pull requests with their files and reviews, via GraphQL.
+
+        Costs one GraphQL query per page of pull requests instead of several
+        REST calls per pull request.
+
+        Args:
+            repo: Full repository name (owner/repo)
+            state: Pull request state (open, closed, all)
+            author: Filter by author username
+
+        Returns:
+            List of PullRequestDetails objects
+
+        Raises:
+            QuackApiError: If the API request fails
+        """
+        return list_pull_request_details(
+            session=self.session,
+            repo=repo,
+            api_url=self.api_url,
+            state=state,
+            author=author,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+
+    def iter_pull_request_details(
+        self,
+        repo: str,
+        state: Literal["open", "closed", "all"] = "open",
+        author: str | None = None,
+        sort: Literal["created", "updated"] = "created",
+        direction: Literal["asc", "desc"] = "desc",
+        per_page: int = 50,
+    ) -> Iterator[PullRequestDetails]:
+        """Iterate over pull requests with their files and reviews, via GraphQL.
+
+        Args:
+            repo: Full repository name (owner/repo)
+            state: Pull request state (open, closed, all)
+            author: Filter by author username
+            sort: What to sort results by
+            direction: Direction to sort
+            per_page: Pull requests per query (at most 100)
+
+        Yields:
+            PullRequestDetails objects
+
+        Raises:
+            QuackApiError: If the API request fails
+        """
+        return iter_pull_request_details(
+            session=self.session,
+            repo=repo,
+            api_url=self.api_url,
+            state=state,
+            author=author,
+            sort=sort,
+            direction=direction,
+            per_page=per_page,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+
+    def get_pull_request_details(self, repo: str, number: int) -> PullRequestDetails:
+        """Get a pull request with its files and reviews in one GraphQL query.
+
+        Args:
+            repo: Full repository name (owner/repo)
+            number: Pull request number
+
+        Returns:
+            PullRequestDetails object
+
+        Raises:
+            QuackApiError: If the API request fails
+        """
+        return get_pull_request_details(
+            session=self.session,
+            repo=repo,
+            number=number,
+            api_url=self.api_url,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+
     def check_repository_exists(self, full_name: str) -> bool:
         """Check if a repository exists.
 
@@ -457,6 +648,53 @@ class GitHubClient:
             labels=labels,
             sort=sort,
             direction=direction,
+            etag_cache=self.etag_cache,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+
+    def iter_issues(
+        self,
+        repo: str,
+        state: Literal["open", "closed", "all"] = "open",
+        labels: str | None = None,
+        sort: Literal["created", "updated", "comments"] = "created",
+        direction: Literal["asc", "desc"] = "desc",
+        creator: str | None = None,
+        assignee: str | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over issues in a repository, fetching pages lazily.
+
+        Args:
+            repo: Full repository name (owner/repo)
+            state: Issue state (open, closed, all)
+            labels: Comma-separated list of label names
+            sort: What to sort results by
+            direction: Direction to sort
+            creator: Only issues created by this user
+            assignee: Only issues assigned to this user
+            since: Only issues updated at or after this time
+
+        Yields:
+            Issue data dictionaries
+
+        Raises:
+            QuackApiError: If the API request fails
+        """
+        return iter_issues(
+            session=self.session,
+            repo=repo,
+            api_url=self.api_url,
+            state=state,
+            labels=labels,
+            sort=sort,
+            direction=direction,
+            creator=creator,
+            assignee=assignee,
+            since=since,
+            etag_cache=self.etag_cache,
             timeout=self.timeout,
             max_retries=self.max_retries,
             retry_delay=self.retry_delay,
@@ -534,6 +772,35 @@ class GitHubClient:
             repo=repo,
             pull_number=pull_number,
             api_url=self.api_url,
+            etag_cache=self.etag_cache,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+
+    def iter_pull_request_files(
+        self,
+        repo: str,
+        pull_number: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the files changed in a pull request, page by page.
+
+        Args:
+            repo: Full repository name (owner/repo)
+            pull_number: Pull request number
+
+        Yields:
+            File information dictionaries
+
+        Raises:
+            QuackApiError: If the API request fails
+        """
+        return iter_pull_request_files(
+            session=self.session,
+            repo=repo,
+            pull_number=pull_number,
+            api_url=self.api_url,
+            etag_cache=self.etag_cache,
             timeout=self.timeout,
             max_retries=self.max_retries,
             retry_delay=self.retry_delay,
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.github.models
 # role: models
 # neighbors: __init__.py, service.py, protocols.py, config.py, auth.py, client.py
-# exports: PullRequestStatus, GitHubUser, GitHubRepo, PullRequest
+# exports: PullRequestStatus, GitHubUser, GitHubRepo, PullRequest, PullRequestReview, PullRequestDetails, RateLimitStatus
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -12,6 +12,7 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
@@ -118,3 +119,64 @@ class PullRequest(BaseModel):
             # Compare with string - allow comparing to URL string directly
             return other == str(self.url)
         return NotImplemented
+
+
+class PullRequestReview(BaseModel):
+    """Model representing a review of a GitHub pull request."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    reviewer: GitHubUser = Field(description="User who submitted the review")
+    state: str = Field(
+        description="Review state (APPROVED, CHANGES_REQUESTED, COMMENTED, ...)"
+    )
+    body: str | None = Field(default=None, description="Review body")
+    submitted_at: datetime | None = Field(
+        default=None, description="Submission date, None while pending"
+    )
+
+
+class PullRequestDetails(BaseModel):
+    """Model bundling a pull request with its changed files and reviews."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    pull_request: PullRequest = Field(description="The pull request")
+    files: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Changed files, shaped like the REST pull request files",
+    )
+    reviews: list[PullRequestReview] = Field(
+        default_factory=list, description="Submitted reviews, oldest first"
+    )
+
+    def __str__(self) -> str:
+        """String representation of the pull request."""
+        return str(self.pull_request)
+
+
+class RateLimitStatus(BaseModel):
+    """Model representing the rate-limit budget of a GitHub token."""
+
+    resource: str = Field(default="core", description="Rate-limit resource")
+    limit: int | None = Field(
+        default=None, description="Requests allowed per window, if known"
+    )
+    remaining: int | None = Field(
+        default=None, description="Requests left in the current window, if known"
+    )
+    used: int | None = Field(
+        default=None, description="Requests made in the current window, if known"
+    )
+    reset_at: datetime | None = Field(
+        default=None, description="When the current window ends"
+    )
+    blocked_until: datetime | None = Field(
+        default=None, description="End of a secondary rate-limit pause, if any"
+    )
+    paced_requests: int = Field(
+        default=0, description="Requests delayed to stay within the budget"
+    )
+    paced_seconds: float = Field(
+        default=0.0, description="Total time requests were delayed for"
+    )
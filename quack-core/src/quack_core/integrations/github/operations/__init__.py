@@ -3,18 +3,29 @@
 # module: quack_core.integrations.github.operations.__init__
 # role: operations
 # neighbors: issues.py, pull_requests.py, repositories.py, users.py
-# exports: get_repo, star_repo, unstar_repo, is_repo_starred, fork_repo, check_repository_exists, get_repository_file_content, update_repository_file (+9 more)
+# exports: get_repo, star_repo, unstar_repo, is_repo_starred, fork_repo, check_repository_exists, get_repository_file_content, update_repository_file (+15 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
 
 """GitHub API _operations."""
 
-from .issues import add_issue_comment, create_issue, get_issue, list_issues
+from .issues import (
+    add_issue_comment,
+    create_issue,
+    get_issue,
+    iter_issues,
+    list_issues,
+)
 from .pull_requests import (
     create_pull_request,
     get_pull_request,
+    get_pull_request_details,
     get_pull_request_files,
+    iter_pull_request_details,
+    iter_pull_request_files,
+    iter_pull_requests,
+    list_pull_request_details,
     list_pull_requests,
 )
 from .repositories import (
@@ -44,11 +55,17 @@ __all__ = [
     # Pull request _operations
     "create_pull_request",
     "list_pull_requests",
+    "iter_pull_requests",
     "get_pull_request",
     "get_pull_request_files",
+    "iter_pull_request_files",
+    "get_pull_request_details",
+    "iter_pull_request_details",
+    "list_pull_request_details",
     # Issue _operations
     "create_issue",
     "list_issues",
+    "iter_issues",
     "get_issue",
     "add_issue_comment",
 ]
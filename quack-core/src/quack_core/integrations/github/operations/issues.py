@@ -3,17 +3,24 @@
 # module: quack_core.integrations.github.operations.issues
 # role: operations
 # neighbors: __init__.py, pull_requests.py, repositories.py, users.py
-# exports: create_issue, list_issues, get_issue, add_issue_comment
+# exports: create_issue, iter_issues, list_issues, get_issue, add_issue_comment
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
 
 """GitHub issues _operations."""
 
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any, Literal
 
 import requests
-from quack_core.integrations.github.utils.api import make_request
+from quack_core.integrations.github.utils.api import (
+    MAX_PER_PAGE,
+    ETagCache,
+    iter_paginated,
+    make_request,
+)
 
 
 def create_issue(
@@ -71,7 +78,7 @@ def create_issue(
     return response.json()
 
 
-def list_issues(
+def iter_issues(
     session: requests.Session,
     repo: str,
     api_url: str,
@@ -79,9 +86,17 @@ def list_issues(
     labels: str | None = None,
     sort: Literal["created", "updated", "comments"] = "created",
     direction: Literal["asc", "desc"] = "desc",
+    creator: str | None = None,
+    assignee: str | None = None,
+    since: datetime | None = None,
+    per_page: int = MAX_PER_PAGE,
+    etag_cache: ETagCache | None = None,
     **request_kwargs: Any,
-) -> list[dict[str, Any]]:
-    """List issues in a repository.
+) -> Iterator[dict[str, Any]]:
+    """Iterate over every issue in a repository, page by page.
+
+    All filters are applied by GitHub. Note that GitHub's issues endpoint
+    also returns pull requests; they carry a ``pull_request`` key.
 
     Args:
         session: Requests session with authentication headers
@@ -91,31 +106,84 @@ def list_issues(
         labels: Comma-separated list of label names
         sort: What to sort results by
         direction: Direction to sort
+        creator: Only issues created by this user
+        assignee: Only issues assigned to this user ("none" or "*" allowed)
+        since: Only issues updated at or after this time
+        per_page: Issues per page (at most 100)
+        etag_cache: Optional cache used for conditional requests
         **request_kwargs: Additional request parameters
 
-    Returns:
-        List of issue data dictionaries
+    Yields:
+        Issue data dictionaries
 
     Raises:
         QuackApiError: If the API request fails
     """
-    endpoint = f"/repos/{repo}/issues"
-
-    params = {"state": state, "sort": sort, "direction": direction}
+    params: dict[str, Any] = {"state": state, "sort": sort, "direction": direction}
 
     if labels:
         params["labels"] = labels
-
-    response = make_request(
+    if creator:
+        params["creator"] = creator
+    if assignee:
+        params["assignee"] = assignee
+    if since:
+        params["since"] = since.isoformat()
+
+    yield from iter_paginated(
         session=session,
-        method="GET",
-        url=endpoint,
+        url=f"/repos/{repo}/issues",
         api_url=api_url,
         params=params,
+        per_page=per_page,
+        etag_cache=etag_cache,
         **request_kwargs,
     )
 
-    return response.json()
+
+def list_issues(
+    session: requests.Session,
+    repo: str,
+    api_url: str,
+    state: Literal["open", "closed", "all"] = "open",
+    labels: str | None = None,
+    sort: Literal["created", "updated", "comments"] = "created",
+    direction: Literal["asc", "desc"] = "desc",
+    etag_cache: ETagCache | None = None,
+    **request_kwargs: Any,
+) -> list[dict[str, Any]]:
+    """List every issue in a repository.
+
+    Args:
+        session: Requests session with authentication headers
+        repo: Full repository name (owner/repo)
+        api_url: Base API URL
+        state: Issue state (open, closed, all)
+        labels: Comma-separated list of label names
+        sort: What to sort results by
+        direction: Direction to sort
+        etag_cache: Optional cache used for conditional requests
+        **request_kwargs: Additional request parameters
+
+    Returns:
+        List of issue data dictionaries
+
+    Raises:
+        QuackApiError: If the API request fails
+    """
+    return list(
+        iter_issues(
+            session=session,
+            repo=repo,
+            api_url=api_url,
+            state=state,
+            labels=labels,
+            sort=sort,
+            direction=direction,
+            etag_cache=etag_cache,
+            **request_kwargs,
+        )
+    )
 
 
 def get_issue(
@@ -3,13 +3,14 @@
 # module: quack_core.integrations.github.operations.pull_requests
 # role: operations
 # neighbors: __init__.py, issues.py, repositories.py, users.py
-# exports: create_pull_request, list_pull_requests, get_pull_request, merge_pull_request, get_pull_request_files, add_pull_request_review, get_pull_requests_by_user
+# exports: create_pull_request, list_pull_requests, get_pull_request, merge_pull_request, get_pull_request_files, add_pull_request_review, get_pull_requests_by_user, iter_pull_requests, iter_pull_request_files, iter_pull_request_details, list_pull_request_details, get_pull_request_details
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
 
 """GitHub pull request _operations."""
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Literal
 
@@ -17,15 +18,70 @@ import requests
 from quack_core.integrations.github.models import (
     GitHubUser,
     PullRequest,
+    PullRequestDetails,
+    PullRequestReview,
     PullRequestStatus,
 )
-from quack_core.integrations.github.utils.api import make_request
-from quack_core.lib.errors import QuackError
+from quack_core.integrations.github.utils.api import (
+    MAX_PER_PAGE,
+    ETagCache,
+    graphql_request,
+    iter_paginated,
+    make_request,
+)
+from quack_core.lib.errors import QuackApiError, QuackError
 from quack_core.lib.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _parse_pull_request(pr_data: dict[str, Any]) -> PullRequest:
+    """Convert a pull request from the REST API into a PullRequest."""
+    author_data = pr_data.get("user", {})
+    author_obj = GitHubUser(
+        username=author_data.get("login"),
+        url=author_data.get("html_url"),
+        avatar_url=author_data.get("avatar_url"),
+    )
+    created_at = datetime.fromisoformat(
+        pr_data.get("created_at").replace("Z", "+00:00")
+    )
+    updated_at = datetime.fromisoformat(
+        pr_data.get("updated_at").replace("Z", "+00:00")
+    )
+    merged_at = None
+    if pr_data.get("merged_at"):
+        merged_at = datetime.fromisoformat(
+            pr_data.get("merged_at").replace("Z", "+00:00")
+        )
+
+    if merged_at:
+        status = PullRequestStatus.MERGED
+    elif pr_data.get("state") == "closed":
+        status = PullRequestStatus.CLOSED
+    else:
+        status = PullRequestStatus.OPEN
+
+    head_repo = pr_data.get("head", {}).get("repo", {}).get("full_name", "")
+    base_repo_name = pr_data.get("base", {}).get("repo", {}).get("full_name", "")
+
+    return PullRequest(
+        number=pr_data.get("number"),
+        title=pr_data.get("title"),
+        url=pr_data.get("html_url"),
+        author=author_obj,
+        status=status,
+        body=pr_data.get("body"),
+        created_at=created_at,
+        updated_at=updated_at,
+        merged_at=merged_at,
+        base_repo=base_repo_name,
+        head_repo=head_repo,
+        base_branch=pr_data.get("base", {}).get("ref", ""),
+        head_branch=pr_data.get("head", {}).get("ref", ""),
+    )
+
+
 def create_pull_request(
     session: requests.Session,
     base_repo: str,
@@ -67,56 +123,72 @@ def create_pull_request(
         json=data,
         **request_kwargs,
     )
-    pr_data = response.json()
+    return _parse_pull_request(response.json())
 
-    # Extract author information.
-    author_data = pr_data.get("user", {})
-    author = GitHubUser(
-        username=author_data.get("login"),
-        url=author_data.get("html_url"),
-        avatar_url=author_data.get("avatar_url"),
-    )
 
-    # Parse the dates.
-    created_at = datetime.fromisoformat(
-        pr_data.get("created_at").replace("Z", "+00:00")
-    )
-    updated_at = datetime.fromisoformat(
-        pr_data.get("updated_at").replace("Z", "+00:00")
-    )
-    merged_at = None
-    if pr_data.get("merged_at"):
-        merged_at = datetime.fromisoformat(
-            pr_data.get("merged_at").replace("Z", "+00:00")
-        )
+def iter_pull_requests(
+    session: requests.Session,
+    repo: str,
+    api_url: str,
+    state: Literal["open", "closed", "all"] = "open",
+    author: str | None = None,
+    base: str | None = None,
+    head: str | None = None,
+    sort: Literal["created", "updated", "popularity", "long-running"] = "created",
+    direction: Literal["asc", "desc"] = "desc",
+    per_page: int = MAX_PER_PAGE,
+    etag_cache: ETagCache | None = None,
+    **request_kwargs: Any,
+) -> Iterator[PullRequest]:
+    """Iterate over every pull request of a repository, page by page.
 
-    # Determine the status.
-    if merged_at:
-        status = PullRequestStatus.MERGED
-    elif pr_data.get("state") == "closed":
-        status = PullRequestStatus.CLOSED
-    else:
-        status = PullRequestStatus.OPEN
+    ``state``, ``base``, ``head``, ``sort`` and ``direction`` are applied by
+    GitHub. The pulls endpoint cannot filter by author, so ``author`` is
+    applied to each page as it arrives.
 
-    # Extract head and base repo full names.
-    head_repo = pr_data.get("head", {}).get("repo", {}).get("full_name", "")
-    base_repo_name = pr_data.get("base", {}).get("repo", {}).get("full_name", "")
+    Args:
+        session: Requests session with authentication headers.
+        repo: Full repository name (owner/repo).
+        api_url: Base API URL.
+        state: Pull request state (open, closed, all).
+        author: Filter by author username.
+        base: Filter by base branch name.
+        head: Filter by head user or organization and branch ("user:branch").
+        sort: What to sort results by.
+        direction: Direction to sort.
+        per_page: Pull requests per page (at most 100).
+        etag_cache: Optional cache used for conditional requests.
+        **request_kwargs: Additional request parameters.
 
-    return PullRequest(
-        number=pr_data.get("number"),
-        title=pr_data.get("title"),
-        url=pr_data.get("html_url"),
-        author=author,
-        status=status,
-        body=pr_data.get("body"),
-        created_at=created_at,
-        updated_at=updated_at,
-        merged_at=merged_at,
-        base_repo=base_repo_name,
-        head_repo=head_repo,
-        base_branch=pr_data.get("base", {}).get("ref", ""),
-        head_branch=pr_data.get("head", {}).get("ref", ""),
-    )
+    Yields:
+        PullRequest objects.
+
+    Raises:
+        QuackApiError: If the API request fails.
+    """
+    params: dict[str, Any] = {"state": state}
+    if base:
+        params["base"] = base
+    if head:
+        params["head"] = head
+    # Only send non-default ordering, so unchanged calls keep their cache keys
+    if sort != "created":
+        params["sort"] = sort
+    if direction != "desc":
+        params["direction"] = direction
+
+    for pr_data in iter_paginated(
+        session=session,
+        url=f"/repos/{repo}/pulls",
+        api_url=api_url,
+        params=params,
+        per_page=per_page,
+        etag_cache=etag_cache,
+        **request_kwargs,
+    ):
+        if author and pr_data.get("user", {}).get("login") != author:
+            continue
+        yield _parse_pull_request(pr_data)
 
 
 def list_pull_requests(
@@ -125,9 +197,10 @@ def list_pull_requests(
     api_url: str,
     state: Literal["open", "closed", "all"] = "open",
     author: str | None = None,
+    etag_cache: ETagCache | None = None,
     **request_kwargs: Any,
 ) -> list[PullRequest]:
-    """List pull requests for a repository.
+    """List every pull request for a repository.
 
     Args:
         session: Requests session with authentication headers.
@@ -135,6 +208,7 @@ def list_pull_requests(
         api_url: Base API URL.
         state: Pull request state (open, closed, all).
         author: Filter by author username.
+        etag_cache: Optional cache used for conditional requests.
         **request_kwargs: Additional request parameters.
 
     Returns:
@@ -143,69 +217,17 @@ def list_pull_requests(
     Raises:
         QuackApiError: If the API request fails.
     """
-    endpoint = f"/repos/{repo}/pulls"
-    params = {"state": state}
-    response = make_request(
-        session=session,
-        method="GET",
-        url=endpoint,
-        api_url=api_url,
-        params=params,
-        **request_kwargs,
-    )
-    pr_list = response.json()
-    result = []
-
-    for pr_data in pr_list:
-        if author and pr_data.get("user", {}).get("login") != author:
-            continue
-
-        author_data = pr_data.get("user", {})
-        author_obj = GitHubUser(
-            username=author_data.get("login"),
-            url=author_data.get("html_url"),
-            avatar_url=author_data.get("avatar_url"),
-        )
-        created_at = datetime.fromisoformat(
-            pr_data.get("created_at").replace("Z", "+00:00")
-        )
-        updated_at = datetime.fromisoformat(
-            pr_data.get("updated_at").replace("Z", "+00:00")
-        )
-        merged_at = None
-        if pr_data.get("merged_at"):
-            merged_at = datetime.fromisoformat(
-                pr_data.get("merged_at").replace("Z", "+00:00")
-            )
-
-        if merged_at:
-            status = PullRequestStatus.MERGED
-        elif pr_data.get("state") == "closed":
-            status = PullRequestStatus.CLOSED
-        else:
-            status = PullRequestStatus.OPEN
-
-        head_repo = pr_data.get("head", {}).get("repo", {}).get("full_name", "")
-        base_repo_name = pr_data.get("base", {}).get("repo", {}).get("full_name", "")
-
-        pr = PullRequest(
-            number=pr_data.get("number"),
-            title=pr_data.get("title"),
-            url=pr_data.get("html_url"),
-            author=author_obj,
-            status=status,
-            body=pr_data.get("body"),
-            created_at=created_at,
-            updated_at=updated_at,
-            merged_at=merged_at,
-            base_repo=base_repo_name,
-            head_repo=head_repo,
-            base_branch=pr_data.get("base", {}).get("ref", ""),
-            head_branch=pr_data.get("head", {}).get("ref", ""),
+    return list(
+        iter_pull_requests(
+            session=session,
+            repo=repo,
+            api_url=api_url,
+            state=state,
+            author=author,
+            etag_cache=etag_cache,
+            **request_kwargs,
         )
-        result.append(pr)
-
-    return result
+    )
 
 
 def get_pull_request(
@@ -234,51 +256,7 @@ def get_pull_request(
     response = make_request(
         session=session, method="GET", url=endpoint, api_url=api_url, **request_kwargs
     )
-    pr_data = response.json()
-
-    author_data = pr_data.get("user", {})
-    author = GitHubUser(
-        username=author_data.get("login"),
-        url=author_data.get("html_url"),
-        avatar_url=author_data.get("avatar_url"),
-    )
-    created_at = datetime.fromisoformat(
-        pr_data.get("created_at").replace("Z", "+00:00")
-    )
-    updated_at = datetime.fromisoformat(
-        pr_data.get("updated_at").replace("Z", "+00:00")
-    )
-    merged_at = None
-    if pr_data.get("merged_at"):
-        merged_at = datetime.fromisoformat(
-            pr_data.get("merged_at").replace("Z", "+00:00")
-        )
-
-    if merged_at:
-        status = PullRequestStatus.MERGED
-    elif pr_data.get("state") == "closed":
-        status = PullRequestStatus.CLOSED
-    else:
-        status = PullRequestStatus.OPEN
-
-    head_repo = pr_data.get("head", {}).get("repo", {}).get("full_name", "")
-    base_repo_name = pr_data.get("base", {}).get("repo", {}).get("full_name", "")
-
-    return PullRequest(
-        number=pr_data.get("number"),
-        title=pr_data.get("title"),
-        url=pr_data.get("html_url"),
-        author=author,
-        status=status,
-        body=pr_data.get("body"),
-        created_at=created_at,
-        updated_at=updated_at,
-        merged_at=merged_at,
-        base_repo=base_repo_name,
-        head_repo=head_repo,
-        base_branch=pr_data.get("base", {}).get("ref", ""),
-        head_branch=pr_data.get("head", {}).get("ref", ""),
-    )
+    return _parse_pull_request(response.json())
 
 
 def merge_pull_request(
@@ -328,20 +306,60 @@ def merge_pull_request(
     return result.get("merged", False)
 
 
+def iter_pull_request_files(
+    session: requests.Session,
+    repo: str,
+    pull_number: int,
+    api_url: str,
+    per_page: int = MAX_PER_PAGE,
+    etag_cache: ETagCache | None = None,
+    **request_kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the files changed in a pull request, page by page.
+
+    Args:
+        session: Requests session with authentication headers.
+        repo: Full repository name (owner/repo).
+        pull_number: Pull request number.
+        api_url: Base API URL.
+        per_page: Files per page (at most 100).
+        etag_cache: Optional cache used for conditional requests.
+        **request_kwargs: Additional request parameters.
+
+    Yields:
+        File information dictionaries.
+
+    Raises:
+        QuackApiError: If the API request fails.
+    """
+    yield from iter_paginated(
+        session=session,
+        url=f"/repos/{repo}/pulls/{pull_number}/files",
+        api_url=api_url,
+        per_page=per_page,
+        etag_cache=etag_cache,
+        **request_kwargs,
+    )
+
+
 def get_pull_request_files(
     session: requests.Session,
     repo: str,
     pull_number: int,
     api_url: str,
+    etag_cache: ETagCache | None = None,
     **request_kwargs: Any,
 ) -> list[dict[str, Any]]:
-    """Get the files changed in a pull request.
+    """Get every file changed in a pull request.
+
+    GitHub returns at most 3000 files for a pull request.
 
     Args:
         session: Requests session with authentication headers.
         repo: Full repository name (owner/repo).
         pull_number: Pull request number.
         api_url: Base API URL.
+        etag_cache: Optional cache used for conditional requests.
         **request_kwargs: Additional request parameters.
 
     Returns:
@@ -350,15 +368,16 @@ def get_pull_request_files(
     Raises:
         QuackApiError: If the API request fails.
     """
-    endpoint = f"/repos/{repo}/pulls/{pull_number}/files"
-    response = make_request(
-        session=session,
-        method="GET",
-        url=endpoint,
-        api_url=api_url,
-        **request_kwargs,
+    return list(
+        iter_pull_request_files(
+            session=session,
+            repo=repo,
+            pull_number=pull_number,
+            api_url=api_url,
+            etag_cache=etag_cache,
+            **request_kwargs,
+        )
     )
-    return response.json()
 
 
 def add_pull_request_review(
@@ -508,3 +527,442 @@ def get_pull_requests_by_user(
             continue
 
     return pr_list
+
+
+# GraphQL bulk fetching: one query returns a page of pull requests together
+# with their files and reviews, which would take three REST calls per PR.
+
+_GRAPHQL_USER_FIELDS = "login url avatarUrl"
+_GRAPHQL_FILE_FIELDS = "path additions deletions changeType"
+_GRAPHQL_REVIEW_FIELDS = f"author {{ {_GRAPHQL_USER_FIELDS} }} state body submittedAt"
+
+_GRAPHQL_PULL_REQUEST_FRAGMENT = f"""
+fragment PullRequestDetails on PullRequest {{
+  number
+  title
+  url
+  body
+  state
+  createdAt
+  updatedAt
+  mergedAt
+  author {{ {_GRAPHQL_USER_FIELDS} }}
+  baseRefName
+  headRefName
+  baseRepository {{ nameWithOwner }}
+  headRepository {{ nameWithOwner }}
+  files(first: $files) {{
+    pageInfo {{ hasNextPage endCursor }}
+    nodes {{ {_GRAPHQL_FILE_FIELDS} }}
+  }}
+  reviews(first: $reviews) {{
+    pageInfo {{ hasNextPage endCursor }}
+    nodes {{ {_GRAPHQL_REVIEW_FIELDS} }}
+  }}
+}}
+"""
+
+_GRAPHQL_LIST_PULL_REQUESTS = (
+    """
+query(
+  $owner: String!, $name: String!, $states: [PullRequestState!],
+  $orderField: IssueOrderField!, $direction: OrderDirection!,
+  $first: Int!, $after: String, $files: Int!, $reviews: Int!
+) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      first: $first, after: $after, states: $states,
+      orderBy: {field: $orderField, direction: $direction}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...PullRequestDetails }
+    }
+  }
+}
+"""
+    + _GRAPHQL_PULL_REQUEST_FRAGMENT
+)
+
+_GRAPHQL_GET_PULL_REQUEST = (
+    """
+query($owner: String!, $name: String!, $number: Int!, $files: Int!, $reviews: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) { ...PullRequestDetails }
+  }
+}
+"""
+    + _GRAPHQL_PULL_REQUEST_FRAGMENT
+)
+
+# Follow-up query for pull requests with more files or reviews than fit in
+# the first page of the bulk query
+_GRAPHQL_CONNECTION_PAGE = """
+query($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    pullRequest(number: $number) {{
+      {connection}(first: $first, after: $after) {{
+        pageInfo {{ hasNextPage endCursor }}
+        nodes {{ {fields} }}
+      }}
+    }}
+  }}
+}}
+"""
+
+_GRAPHQL_CONNECTION_FIELDS = {
+    "files": _GRAPHQL_FILE_FIELDS,
+    "reviews": _GRAPHQL_REVIEW_FIELDS,
+}
+
+_GRAPHQL_STATES: dict[str, list[str] | None] = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": None,
+}
+
+_GRAPHQL_ORDER_FIELDS = {"created": "CREATED_AT", "updated": "UPDATED_AT"}
+
+# GraphQL change types, as the status names used by the REST files endpoint
+_GRAPHQL_FILE_STATUS = {"DELETED": "removed"}
+
+
+def _split_repo(repo: str) -> tuple[str, str]:
+    owner, _, name = repo.partition("/")
+    if not owner or not name:
+        raise ValueError(f"Repository must be given as owner/repo, got {repo!r}")
+    return owner, name
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _parse_graphql_user(user_data: dict[str, Any] | None) -> GitHubUser:
+    """Convert a GraphQL actor into a GitHubUser."""
+    if not user_data:
+        # Deleted accounts are reported as null, REST shows them as "ghost"
+        return GitHubUser(username="ghost", url="https://github.com/ghost")
+    return GitHubUser(
+        username=user_data.get("login"),
+        url=user_data.get("url"),
+        avatar_url=user_data.get("avatarUrl"),
+    )
+
+
+def _parse_graphql_file(file_data: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL changed file into the REST files endpoint shape."""
+    change_type = file_data.get("changeType") or ""
+    additions = file_data.get("additions") or 0
+    deletions = file_data.get("deletions") or 0
+    return {
+        "filename": file_data.get("path"),
+        "status": _GRAPHQL_FILE_STATUS.get(change_type, change_type.lower()),
+        "additions": additions,
+        "deletions": deletions,
+        "changes": additions + deletions,
+    }
+
+
+def _parse_graphql_review(review_data: dict[str, Any]) -> PullRequestReview:
+    """Convert a GraphQL review into a PullRequestReview."""
+    return PullRequestReview(
+        reviewer=_parse_graphql_user(review_data.get("author")),
+        state=review_data.get("state"),
+        body=review_data.get("body") or None,
+        submitted_at=_parse_datetime(review_data.get("submittedAt")),
+    )
+
+
+def _parse_graphql_pull_request(pr_data: dict[str, Any], repo: str) -> PullRequest:
+    """Convert a GraphQL pull request node into a PullRequest."""
+    state = pr_data.get("state")
+    if state == "MERGED":
+        status = PullRequestStatus.MERGED
+    elif state == "CLOSED":
+        status = PullRequestStatus.CLOSED
+    else:
+        status = PullRequestStatus.OPEN
+
+    # The head repository is null once a fork has been deleted
+    base_repo = (pr_data.get("baseRepository") or {}).get("nameWithOwner", repo)
+    head_repo = (pr_data.get("headRepository") or {}).get("nameWithOwner", "")
+
+    return PullRequest(
+        number=pr_data.get("number"),
+        title=pr_data.get("title"),
+        url=pr_data.get("url"),
+        author=_parse_graphql_user(pr_data.get("author")),
+        status=status,
+        body=pr_data.get("body") or None,
+        created_at=_parse_datetime(pr_data.get("createdAt")),
+        updated_at=_parse_datetime(pr_data.get("updatedAt")),
+        merged_at=_parse_datetime(pr_data.get("mergedAt")),
+        base_repo=base_repo,
+        head_repo=head_repo,
+        base_branch=pr_data.get("baseRefName") or "",
+        head_branch=pr_data.get("headRefName") or "",
+    )
+
+
+def _collect_connection(
+    session: requests.Session,
+    repo: str,
+    number: int,
+    connection: str,
+    first_page: dict[str, Any],
+    api_url: str,
+    per_page: int,
+    **request_kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Return every node of a pull request connection, starting from a page."""
+    nodes = list(first_page.get("nodes") or [])
+    page_info = first_page.get("pageInfo") or {}
+    if not page_info.get("hasNextPage"):
+        return nodes
+
+    owner, name = _split_repo(repo)
+    query = _GRAPHQL_CONNECTION_PAGE.format(
+        connection=connection, fields=_GRAPHQL_CONNECTION_FIELDS[connection]
+    )
+    while page_info.get("hasNextPage"):
+        data = graphql_request(
+            session=session,
+            query=query,
+            api_url=api_url,
+            variables={
+                "owner": owner,
+                "name": name,
+                "number": number,
+                "first": per_page,
+                "after": page_info.get("endCursor"),
+            },
+            **request_kwargs,
+        )
+        page = ((data.get("repository") or {}).get("pullRequest") or {}).get(
+            connection
+        ) or {}
+        nodes.extend(page.get("nodes") or [])
+        page_info = page.get("pageInfo") or {}
+    return nodes
+
+
+def _build_pull_request_details(
+    session: requests.Session,
+    pr_data: dict[str, Any],
+    repo: str,
+    api_url: str,
+    files_per_page: int,
+    reviews_per_page: int,
+    **request_kwargs: Any,
+) -> PullRequestDetails:
+    """Convert a GraphQL pull request node, fetching any remaining pages."""
+    pull_request = _parse_graphql_pull_request(pr_data, repo)
+    files = _collect_connection(
+        session,
+        repo,
+        pull_request.number,
+        "files",
+        pr_data.get("files") or {},
+        api_url,
+        files_per_page,
+        **request_kwargs,
+    )
+    reviews = _collect_connection(
+        session,
+        repo,
+        pull_request.number,
+        "reviews",
+        pr_data.get("reviews") or {},
+        api_url,
+        reviews_per_page,
+        **request_kwargs,
+    )
+    return PullRequestDetails(
+        pull_request=pull_request,
+        files=[_parse_graphql_file(file_data) for file_data in files],
+        reviews=[_parse_graphql_review(review_data) for review_data in reviews],
+    )
+
+
+def iter_pull_request_details(
+    session: requests.Session,
+    repo: str,
+    api_url: str,
+    state: Literal["open", "closed", "all"] = "open",
+    author: str | None = None,
+    sort: Literal["created", "updated"] = "created",
+    direction: Literal["asc", "desc"] = "desc",
+    per_page: int = 50,
+    files_per_page: int = MAX_PER_PAGE,
+    reviews_per_page: int = 50,
+    **request_kwargs: Any,
+) -> Iterator[PullRequestDetails]:
+    """Iterate over pull requests with their files and reviews, via GraphQL.
+
+    Each page of pull requests, including the first ``files_per_page`` files
+    and ``reviews_per_page`` reviews of every pull request, costs a single
+    GraphQL query. Pull requests with more files or reviews than that get
+    follow-up queries for the rest. As with the REST listing, ``author`` is
+    applied to each page as it arrives.
+
+    Args:
+        session: Requests session with authentication headers.
+        repo: Full repository name (owner/repo).
+        api_url: Base API URL.
+        state: Pull request state (open, closed, all).
+        author: Filter by author username.
+        sort: What to sort results by.
+        direction: Direction to sort.
+        per_page: Pull requests per query (at most 100).
+        files_per_page: Files fetched per pull request and query (at most 100).
+        reviews_per_page: Reviews fetched per pull request and query
+            (at most 100).
+        **request_kwargs: Additional request parameters.
+
+    Yields:
+        PullRequestDetails objects.
+
+    Raises:
+        QuackApiError: If the API request fails.
+    """
+    owner, name = _split_repo(repo)
+    files_per_page = max(1, min(files_per_page, MAX_PER_PAGE))
+    reviews_per_page = max(1, min(reviews_per_page, MAX_PER_PAGE))
+    variables: dict[str, Any] = {
+        "owner": owner,
+        "name": name,
+        "states": _GRAPHQL_STATES[state],
+        "orderField": _GRAPHQL_ORDER_FIELDS[sort],
+        "direction": direction.upper(),
+        "first": max(1, min(per_page, MAX_PER_PAGE)),
+        "after": None,
+        "files": files_per_page,
+        "reviews": reviews_per_page,
+    }
+
+    while True:
+        data = graphql_request(
+            session=session,
+            query=_GRAPHQL_LIST_PULL_REQUESTS,
+            api_url=api_url,
+            variables=variables,
+            **request_kwargs,
+        )
+        page = (data.get("repository") or {}).get("pullRequests") or {}
+        for pr_data in page.get("nodes") or []:
+            if author and ((pr_data.get("author") or {}).get("login") != author):
+                continue
+            yield _build_pull_request_details(
+                session,
+                pr_data,
+                repo,
+                api_url,
+                files_per_page,
+                reviews_per_page,
+                **request_kwargs,
+            )
+
+        page_info = page.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            return
+        variables["after"] = page_info.get("endCursor")
+
+
+def list_pull_request_details(
+    session: requests.Session,
+    repo: str,
+    api_url: str,
+    state: Literal["open", "closed", "all"] = "open",
+    author: str | None = None,
+    **request_kwargs: Any,
+) -> list[PullRequestDetails]:
+    """List every pull request of a repository with its files and reviews.
+
+    Args:
+        session: Requests session with authentication headers.
+        repo: Full repository name (owner/repo).
+        api_url: Base API URL.
+        state: Pull request state (open, closed, all).
+        author: Filter by author username.
+        **request_kwargs: Additional request parameters.
+
+    Returns:
+        List of PullRequestDetails objects.
+
+    Raises:
+        QuackApiError: If the API request fails.
+    """
+    return list(
+        iter_pull_request_details(
+            session=session,
+            repo=repo,
+            api_url=api_url,
+            state=state,
+            author=author,
+            **request_kwargs,
+        )
+    )
+
+
+def get_pull_request_details(
+    session: requests.Session,
+    repo: str,
+    number: int,
+    api_url: str,
+    files_per_page: int = MAX_PER_PAGE,
+    reviews_per_page: int = 50,
+    **request_kwargs: Any,
+) -> PullRequestDetails:
+    """Get a pull request with its files and reviews in one GraphQL query.
+
+    Args:
+        session: Requests session with authentication headers.
+        repo: Full repository name (owner/repo).
+        number: Pull request number.
+        api_url: Base API URL.
+        files_per_page: Files fetched per query (at most 100).
+        reviews_per_page: Reviews fetched per query (at most 100).
+        **request_kwargs: Additional request parameters.
+
+    Returns:
+        PullRequestDetails object.
+
+    Raises:
+        QuackApiError: If the API request fails or the pull request does not
+            exist.
+    """
+    owner, name = _split_repo(repo)
+    files_per_page = max(1, min(files_per_page, MAX_PER_PAGE))
+    reviews_per_page = max(1, min(reviews_per_page, MAX_PER_PAGE))
+    data = graphql_request(
+        session=session,
+        query=_GRAPHQL_GET_PULL_REQUEST,
+        api_url=api_url,
+        variables={
+            "owner": owner,
+            "name": name,
+            "number": number,
+            "files": files_per_page,
+            "reviews": reviews_per_page,
+        },
+        **request_kwargs,
+    )
+    pr_data = (data.get("repository") or {}).get("pullRequest")
+    if not pr_data:
+        raise QuackApiError(
+            f"GitHub API error: pull request {repo}#{number} not found",
+            service="GitHub",
+            status_code=404,
+            api_method="graphql",
+        )
+    return _build_pull_request_details(
+        session,
+        pr_data,
+        repo,
+        api_url,
+        files_per_page,
+        reviews_per_page,
+        **request_kwargs,
+    )
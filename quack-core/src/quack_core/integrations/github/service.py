@@ -21,7 +21,13 @@ from quack_core.lib.logging import get_logger
 from .auth import GitHubAuthProvider
 from .client import GitHubClient
 from .config import GitHubConfigProvider
-from .models import GitHubRepo, GitHubUser, PullRequest
+from .models import (
+    GitHubRepo,
+    GitHubUser,
+    PullRequest,
+    PullRequestDetails,
+    RateLimitStatus,
+)
 from .protocols import GitHubIntegrationProtocol
 
 logger = get_logger(__name__)
@@ -233,6 +239,35 @@ class GitHubIntegration(BaseIntegrationService, GitHubIntegrationProtocol):
         """
         return self._initialized and self.client is not None
 
+    def get_rate_limit(
+        self, resource: str = "core", refresh: bool = False
+    ) -> IntegrationResult[RateLimitStatus]:
+        """Get the remaining GitHub API budget.
+
+        Args:
+            resource: Rate-limit resource (core, search, graphql, ...)
+            refresh: Ask GitHub instead of using the last response headers
+
+        Returns:
+            Result with RateLimitStatus
+        """
+        init_error = self._ensure_initialized()
+        if init_error:
+            return init_error
+
+        try:
+            status = self.client.get_rate_limit(resource=resource, refresh=refresh)
+            return IntegrationResult.success_result(
+                content=status,
+                message=f"{status.remaining} of {status.limit} {resource} requests left",
+            )
+        except Exception as e:
+            error_msg = str(e)
+            return IntegrationResult.error_result(
+                error=f"Failed to get rate limit: {error_msg}",
+                message=f"Failed to get rate limit: {error_msg}",
+            )
+
     # User and Repository Methods
 
     def get_current_user(self) -> IntegrationResult[GitHubUser]:
@@ -408,6 +443,42 @@ class GitHubIntegration(BaseIntegrationService, GitHubIntegrationProtocol):
                 message=f"Failed to list pull requests: {error_msg}",
             )
 
+    def list_pull_request_details(
+        self, repo: str, state: str = "open", author: str | None = None
+    ) -> IntegrationResult[list[PullRequestDetails]]:
+        """List pull requests with their files and reviews.
+
+        Uses GitHub's GraphQL API, so a whole page of pull requests with
+        their files and reviews costs a single request.
+
+        Args:
+            repo: Full repository name (owner/repo)
+            state: Pull request state (open, closed, all)
+            author: Filter by author username
+
+        Returns:
+            Result with list of PullRequestDetails objects
+        """
+        init_error = self._ensure_initialized()
+        if init_error:
+            return init_error
+
+        try:
+            details = self.client.list_pull_request_details(
+                repo=repo, state=state, author=author
+            )
+            return IntegrationResult.success_result(
+                content=details,
+                message=f"Successfully retrieved {len(details)} pull requests "
+                f"with files and reviews for {repo}",
+            )
+        except Exception as e:
+            error_msg = str(e)
+            return IntegrationResult.error_result(
+                error=f"Failed to list pull request details: {error_msg}",
+                message=f"Failed to list pull request details: {error_msg}",
+            )
+
     def get_pull_request(
         self, repo: str, number: int
     ) -> IntegrationResult[PullRequest]:
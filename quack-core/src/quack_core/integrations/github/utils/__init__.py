@@ -2,8 +2,8 @@
 # path: quack-core/src/quack_core/integrations/github/utils/__init__.py
 # module: quack_core.integrations.github.utils.__init__
 # role: utils
-# neighbors: api.py
-# exports: make_request
+# neighbors: api.py, rate_limit.py
+# exports: make_request, RateLimitBudget, get_rate_limit_budget
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -11,5 +11,6 @@
 """Utility functions for GitHub integration."""
 
 from .api import make_request
+from .rate_limit import RateLimitBudget, get_rate_limit_budget
 
-__all__ = ["make_request"]
+__all__ = ["make_request", "RateLimitBudget", "get_rate_limit_budget"]
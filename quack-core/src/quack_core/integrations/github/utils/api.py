@@ -2,15 +2,18 @@
 # path: quack-core/src/quack_core/integrations/github/utils/api.py
 # module: quack_core.integrations.github.utils.api
 # role: utils
-# neighbors: __init__.py
-# exports: make_request
+# neighbors: __init__.py, rate_limit.py
+# exports: make_request, iter_paginated, graphql_request, graphql_url, ETagCache, MAX_PER_PAGE
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
 
 """GitHub API request utilities."""
 
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -21,9 +24,238 @@ from quack_core.lib.errors import (
     QuackQuotaExceededError,
 )
 from quack_core.lib.logging import get_logger
+from requests.utils import parse_header_links
+
+from .rate_limit import (
+    SECONDARY_LIMIT_WAIT,
+    RateLimitBudget,
+    budget_for_session,
+    resource_for,
+)
 
 logger = get_logger(__name__)
 
+# Largest page size GitHub's REST list endpoints accept
+MAX_PER_PAGE = 100
+
+# A cached page: (ETag, decoded JSON body, URL of the next page)
+CachedPage = tuple[str, Any, str | None]
+
+
+class ETagCache:
+    """Thread-safe LRU cache of list pages, for conditional GET requests.
+
+    GitHub answers a request whose ``If-None-Match`` header matches the
+    current ETag with ``304 Not Modified`` and does not count it against the
+    rate limit, so re-polling an unchanged listing is free.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Pages kept before the least recently used is dropped
+        """
+        self.max_entries = max_entries
+        self.not_modified = 0
+        self._pages: OrderedDict[str, CachedPage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, key: str) -> CachedPage | None:
+        """Return the cached page for a request key, if any."""
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+            return page
+
+    def put(self, key: str, page: CachedPage) -> None:
+        """Cache a page under a request key."""
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_entries:
+                self._pages.popitem(last=False)
+
+    def record_not_modified(self) -> None:
+        """Count a request answered from the cache with a 304."""
+        with self._lock:
+            self.not_modified += 1
+
+    def clear(self) -> None:
+        """Drop every cached page."""
+        with self._lock:
+            self._pages.clear()
+
+
+def _next_page_url(response: requests.Response) -> str | None:
+    """Return the ``rel="next"`` URL from a response's Link header."""
+    link_header = response.headers.get("Link")
+    if not isinstance(link_header, str):
+        return None
+    for link in parse_header_links(link_header):
+        if link.get("rel") == "next":
+            return link.get("url")
+    return None
+
+
+def _cache_key(url: str, params: dict[str, Any] | None) -> str:
+    if not params:
+        return url
+    query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{url}?{query}"
+
+
+def iter_paginated(
+    session: requests.Session,
+    url: str,
+    api_url: str,
+    params: dict[str, Any] | None = None,
+    per_page: int = MAX_PER_PAGE,
+    etag_cache: ETagCache | None = None,
+    **request_kwargs: Any,
+) -> Iterator[Any]:
+    """Iterate over every item of a paginated GitHub list endpoint.
+
+    Pages are requested lazily, following the ``rel="next"`` Link header, so
+    a caller that stops early never fetches the remaining pages. With an
+    ``etag_cache``, each page is requested conditionally and a 304 answer is
+    served from the cache.
+
+    Args:
+        session: Requests session with authentication headers
+        url: API endpoint (without base URL)
+        api_url: Base API URL
+        params: URL parameters for the first page
+        per_page: Items per page (at most 100)
+        etag_cache: Optional cache of previously fetched pages
+        **request_kwargs: Additional request parameters
+
+    Yields:
+        Items from each page, in order
+
+    Raises:
+        QuackApiError: If a request fails
+    """
+    page_params: dict[str, Any] | None = {
+        **(params or {}),
+        "per_page": max(1, min(per_page, MAX_PER_PAGE)),
+    }
+    page_url: str | None = url
+    page_api_url = api_url
+    headers: dict[str, str] = request_kwargs.pop("headers", None) or {}
+
+    while page_url:
+        key = _cache_key(f"{page_api_url}{page_url}", page_params)
+        cached = etag_cache.get(key) if etag_cache is not None else None
+        if cached is not None:
+            request_kwargs["headers"] = {**headers, "If-None-Match": cached[0]}
+        elif headers:
+            request_kwargs["headers"] = headers
+        else:
+            request_kwargs.pop("headers", None)
+
+        response = make_request(
+            session=session,
+            method="GET",
+            url=page_url,
+            api_url=page_api_url,
+            params=page_params,
+            **request_kwargs,
+        )
+        if cached is not None and response.status_code == 304:
+            etag_cache.record_not_modified()
+            _, items, next_url = cached
+        else:
+            items = response.json()
+            next_url = _next_page_url(response)
+            etag = response.headers.get("ETag")
+            if etag_cache is not None and isinstance(etag, str):
+                etag_cache.put(key, (etag, items, next_url))
+
+        yield from items
+
+        # The next link is absolute and already carries the query string
+        page_url, page_api_url, page_params = next_url, "", None
+
+
+def graphql_url(api_url: str) -> str:
+    """Return the GraphQL endpoint that belongs to a REST API URL.
+
+    GitHub Enterprise Server serves REST under ``/api/v3`` and GraphQL under
+    ``/api/graphql``; github.com serves both from the API root.
+    """
+    api_url = api_url.rstrip("/")
+    if api_url.endswith("/api/v3"):
+        return f"{api_url[: -len('/v3')]}/graphql"
+    return f"{api_url}/graphql"
+
+
+def graphql_request(
+    session: requests.Session,
+    query: str,
+    api_url: str,
+    variables: dict[str, Any] | None = None,
+    **request_kwargs: Any,
+) -> dict[str, Any]:
+    """Run a GraphQL query against the GitHub API.
+
+    GraphQL requests are counted against the separate ``graphql`` rate-limit
+    resource, and GitHub reports query errors in the body of a 200 response,
+    so those are raised here as well.
+
+    Args:
+        session: Requests session with authentication headers
+        query: GraphQL query document
+        api_url: Base (REST) API URL
+        variables: Query variables
+        **request_kwargs: Additional request parameters
+
+    Returns:
+        The ``data`` object of the response
+
+    Raises:
+        QuackApiError: If the request fails or the query returns errors
+    """
+    response = make_request(
+        session=session,
+        method="POST",
+        url=graphql_url(api_url),
+        api_url="",
+        json={"query": query, "variables": variables or {}},
+        **request_kwargs,
+    )
+    payload = response.json()
+    errors = payload.get("errors")
+    if errors:
+        message = "; ".join(
+            str(error.get("message", error)) if isinstance(error, dict) else str(error)
+            for error in errors
+        )
+        raise QuackApiError(
+            f"GitHub GraphQL error: {message}",
+            service="GitHub",
+            api_method="graphql",
+        )
+    return payload.get("data") or {}
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    """Whether a response rejected the request for rate-limit reasons."""
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+    headers = response.headers
+    if "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0":
+        return True
+    # Secondary limits can also come without a Retry-After header
+    text = response.text
+    return isinstance(text, str) and "rate limit" in text.lower()
+
 
 def make_request(
     session: requests.Session,
@@ -35,10 +267,16 @@ def make_request(
     retry_delay: float = 1.0,
     params: dict[str, Any] | None = None,
     json: dict[str, Any] | None = None,
+    rate_limit: RateLimitBudget | None = None,
     **kwargs: Any,
 ) -> requests.Response:
     """Make an HTTP request to the GitHub API with retries.
 
+    Requests are paced by the rate-limit budget of the session's token, which
+    is shared by every session using that token. When the budget is used up,
+    or GitHub asks to back off, the request waits for the budget to recover
+    before it is retried, or fails if that would take too long.
+
     Args:
         session: Requests session with authentication headers
         method: HTTP method (GET, POST, PUT, DELETE)
@@ -49,6 +287,7 @@ def make_request(
         retry_delay: Delay between retries in seconds
         params: URL parameters
         json: JSON body data
+        rate_limit: Budget to use instead of the one for the session's token
         **kwargs: Additional request parameters
 
     Returns:
@@ -61,33 +300,59 @@ def make_request(
     """
     full_url = f"{api_url}{url}"
     kwargs.setdefault("timeout", timeout)
+    budget = rate_limit if rate_limit is not None else budget_for_session(session)
+    resource = resource_for(full_url)
 
     for attempt in range(1, max_retries + 1):
         try:
+            if budget is not None:
+                budget.acquire(resource)
+
             response = session.request(
                 method, full_url, params=params, json=json, **kwargs
             )
 
-            # Check for rate limiting - Need to check before raise_for_status
-            remaining = int(response.headers.get("X-RateLimit-Remaining", "1"))
-            if remaining == 0 or response.status_code == 429:
-                reset_time = int(response.headers.get("X-RateLimit-Reset", "0"))
-                current_time = int(time.time())
-                wait_time = max(1, reset_time - current_time)
-
-                if attempt < max_retries:
-                    logger.warning(
-                        f"GitHub API rate limit exceeded. Waiting {wait_time} seconds before retry."
-                    )
-                    time.sleep(min(wait_time, 60))  # Wait at most 60 seconds
-                    continue
-                else:
-                    # We've hit max retries, raise the quota error
+            if budget is not None:
+                budget.update(resource, response.headers)
+                if _is_rate_limited(response):
+                    if (
+                        "Retry-After" not in response.headers
+                        and response.headers.get("X-RateLimit-Remaining") != "0"
+                    ):
+                        budget.block(SECONDARY_LIMIT_WAIT)
+                    if attempt < max_retries:
+                        # The next acquire() waits for the budget to recover
+                        logger.warning(
+                            "GitHub API rate limit hit. Waiting for the budget "
+                            "to recover before retry."
+                        )
+                        continue
                     raise QuackQuotaExceededError(
-                        message=f"GitHub API rate limit exceeded. Reset at {datetime.fromtimestamp(reset_time)}",
+                        message="GitHub API rate limit exceeded",
                         service="GitHub",
                         resource=url,
                     )
+            else:
+                # Check for rate limiting - Need to check before raise_for_status
+                remaining = int(response.headers.get("X-RateLimit-Remaining", "1"))
+                if remaining == 0 or response.status_code == 429:
+                    reset_time = int(response.headers.get("X-RateLimit-Reset", "0"))
+                    current_time = int(time.time())
+                    wait_time = max(1, reset_time - current_time)
+
+                    if attempt < max_retries:
+                        logger.warning(
+                            f"GitHub API rate limit exceeded. Waiting {wait_time} seconds before retry."
+                        )
+                        time.sleep(min(wait_time, 60))  # Wait at most 60 seconds
+                        continue
+                    else:
+                        # We've hit max retries, raise the quota error
+                        raise QuackQuotaExceededError(
+                            message=f"GitHub API rate limit exceeded. Reset at {datetime.fromtimestamp(reset_time)}",
+                            service="GitHub",
+                            resource=url,
+                        )
 
             # Check for successful response
             response.raise_for_status()
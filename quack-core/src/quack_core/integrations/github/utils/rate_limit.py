@@ -0,0 +1,283 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/github/utils/rate_limit.py
+# module: quack_core.integrations.github.utils.rate_limit
+# role: utils
+# neighbors: __init__.py, api.py
+# exports: RateLimitBudget, get_rate_limit_budget, budget_for_session, resource_for, DEFAULT_MAX_WAIT, DEFAULT_PACE_BELOW, SECONDARY_LIMIT_WAIT
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""Shared GitHub rate-limit budgets.
+
+GitHub limits each token to a number of requests per window, tracked
+separately for each resource (core, search, graphql), and may additionally
+ask a client to back off with a ``Retry-After`` header (secondary limits).
+A :class:`RateLimitBudget` records both from response headers and spaces
+requests out once half of a window's budget is used, so bulk jobs slow down
+gradually instead of running into a hard stop. Every client using the same
+token shares one budget.
+"""
+
+import hashlib
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from quack_core.lib.errors import QuackQuotaExceededError
+
+from ..models import RateLimitStatus
+
+# Longest a request may be held back before it fails instead
+DEFAULT_MAX_WAIT = 60.0
+
+# Start pacing once the remaining budget falls below this fraction of the limit
+DEFAULT_PACE_BELOW = 0.5
+
+# GitHub asks for at least a minute's pause after a secondary limit that
+# comes without a Retry-After header
+SECONDARY_LIMIT_WAIT = 60.0
+
+_budgets: dict[str, "RateLimitBudget"] = {}
+_budgets_lock = threading.Lock()
+
+
+def _header_number(headers: Any, name: str) -> float | None:
+    value = headers.get(name) if isinstance(headers, Mapping) else None
+    if not isinstance(value, str | int | float):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def resource_for(url: str) -> str:
+    """Return the rate-limit resource a request URL is counted against."""
+    path = urlsplit(url).path
+    if path.endswith("/graphql"):
+        return "graphql"
+    if "/search/" in path:
+        return "search"
+    return "core"
+
+
+class _Window:
+    """Budget of one resource for the current rate-limit window."""
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.used: int | None = None
+        self.reset_at: float | None = None
+        self.next_slot = 0.0
+
+
+class RateLimitBudget:
+    """Thread-safe rate-limit budget for one GitHub token."""
+
+    def __init__(
+        self,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        pace_below: float = DEFAULT_PACE_BELOW,
+    ) -> None:
+        """Initialize the budget.
+
+        Args:
+            max_wait: Longest a request is held back; if the budget needs a
+                longer pause, QuackQuotaExceededError is raised instead
+            pace_below: Fraction of the limit below which requests are spread
+                evenly over the rest of the window
+        """
+        self.max_wait = max_wait
+        self.pace_below = pace_below
+        self.paced_requests = 0
+        self.paced_seconds = 0.0
+        self._windows: dict[str, _Window] = {}
+        # Secondary limits apply to the token as a whole
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _window(self, resource: str, now: float) -> _Window:
+        window = self._windows.setdefault(resource, _Window())
+        if window.reset_at is not None and window.reset_at <= now:
+            # The window has rolled over; wait for fresh headers
+            self._windows[resource] = window = _Window()
+        return window
+
+    def acquire(self, resource: str = "core") -> float:
+        """Wait until a request against a resource fits the budget.
+
+        Args:
+            resource: Rate-limit resource the request is counted against
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            QuackQuotaExceededError: If the budget cannot recover within
+                max_wait seconds
+        """
+        with self._lock:
+            now = time.time()
+            window = self._window(resource, now)
+            start = max(now, self._blocked_until)
+
+            remaining, limit = window.remaining, window.limit
+            if remaining is not None and window.reset_at is not None:
+                if remaining <= 0:
+                    start = max(start, window.reset_at)
+                elif limit and remaining <= limit * self.pace_below:
+                    # Soft limit: never hold a request past max_wait for pacing
+                    paced = min(window.next_slot, now + self.max_wait)
+                    start = max(start, paced)
+                    interval = (window.reset_at - now) / remaining
+                    window.next_slot = start + interval
+
+            wait = start - now
+            if wait > self.max_wait:
+                resets = datetime.fromtimestamp(start)
+                raise QuackQuotaExceededError(
+                    message=f"GitHub API rate limit exhausted. Resets at {resets}",
+                    service="GitHub",
+                    resource=resource,
+                )
+            if window.remaining is not None:
+                # Reserve our request so concurrent callers see it
+                window.remaining -= 1
+            if wait > 0:
+                self.paced_requests += 1
+                self.paced_seconds += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+    def update(self, resource: str, headers: Any) -> None:
+        """Record the rate-limit headers of a response.
+
+        Args:
+            resource: Resource the request was counted against, used when the
+                response does not name one
+            headers: Response headers
+        """
+        if isinstance(headers, Mapping):
+            named = headers.get("X-RateLimit-Resource")
+            if isinstance(named, str):
+                resource = named
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        used = _header_number(headers, "X-RateLimit-Used")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        retry_after = _header_number(headers, "Retry-After")
+
+        with self._lock:
+            now = time.time()
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if remaining is None or reset is None:
+                return
+            window = self._window(resource, now)
+            if window.reset_at != reset or window.remaining is None:
+                window.remaining = int(remaining)
+            else:
+                # Responses can arrive out of order; never give back budget
+                # that in-flight requests have reserved
+                window.remaining = min(window.remaining, int(remaining))
+            window.reset_at = reset
+            if limit is not None:
+                window.limit = int(limit)
+            if used is not None:
+                window.used = int(used)
+
+    def update_from_payload(self, payload: Mapping[str, Any]) -> None:
+        """Record the body of a ``GET /rate_limit`` response.
+
+        Args:
+            payload: Decoded response body
+        """
+        resources = payload.get("resources", {})
+        with self._lock:
+            for resource, values in resources.items():
+                if not isinstance(values, Mapping) or "reset" not in values:
+                    continue
+                window = self._windows[resource] = _Window()
+                window.limit = values.get("limit")
+                window.remaining = values.get("remaining")
+                window.used = values.get("used")
+                window.reset_at = float(values["reset"])
+
+    def block(self, seconds: float) -> None:
+        """Hold back every request for the given number of seconds."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + seconds)
+
+    def status(self, resource: str = "core") -> RateLimitStatus:
+        """Return the current budget of a resource.
+
+        Args:
+            resource: Rate-limit resource (core, search, graphql, ...)
+
+        Returns:
+            RateLimitStatus snapshot
+        """
+        with self._lock:
+            now = time.time()
+            window = self._window(resource, now)
+            return RateLimitStatus(
+                resource=resource,
+                limit=window.limit,
+                remaining=window.remaining,
+                used=window.used,
+                reset_at=(
+                    datetime.fromtimestamp(window.reset_at)
+                    if window.reset_at is not None
+                    else None
+                ),
+                blocked_until=(
+                    datetime.fromtimestamp(self._blocked_until)
+                    if self._blocked_until > now
+                    else None
+                ),
+                paced_requests=self.paced_requests,
+                paced_seconds=self.paced_seconds,
+            )
+
+
+def get_rate_limit_budget(token: str) -> RateLimitBudget:
+    """Return the budget shared by every client using a token.
+
+    Args:
+        token: GitHub token, or an empty string for anonymous requests
+
+    Returns:
+        RateLimitBudget for the token
+    """
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    with _budgets_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            budget = _budgets[key] = RateLimitBudget()
+        return budget
+
+
+def budget_for_session(session: requests.Session) -> RateLimitBudget | None:
+    """Return the budget for the token a session authenticates with.
+
+    Args:
+        session: Requests session with authentication headers
+
+    Returns:
+        RateLimitBudget, or None if the session has no usable headers
+    """
+    headers = getattr(session, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    authorization = headers.get("Authorization") or ""
+    if not isinstance(authorization, str):
+        return None
+    return get_rate_limit_budget(authorization.split(" ")[-1])
@@ -66,6 +66,24 @@ class GoogleDriveConfig(GoogleBaseConfig):
     public_sharing: bool = Field(
         True, description="Whether to enable public sharing of files"
     )
+    download_chunk_size: int = Field(
+        8 * 1024 * 1024,
+        gt=0,
+        description="Bytes fetched per ranged request when downloading files",
+    )
+    upload_chunk_size: int = Field(
+        8 * 1024 * 1024,
+        gt=0,
+        multiple_of=256 * 1024,
+        description="Bytes sent per chunk in resumable uploads (multiple of 256 KiB)",
+    )
+    upload_workers: int = Field(4, gt=0, description="Concurrent uploads in upload_many")
+    list_page_size: int = Field(
+        1000,
+        gt=0,
+        le=1000,
+        description="Files requested per page when listing (Drive allows 1000)",
+    )
 
 
 class GoogleMailConfig(GoogleBaseConfig):
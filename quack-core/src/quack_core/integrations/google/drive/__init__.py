@@ -3,7 +3,7 @@
 # module: quack_core.integrations.google.drive.__init__
 # role: module
 # neighbors: service.py, models.py, protocols.py
-# exports: GoogleDriveService, DriveFile, DriveFolder, create_integration
+# exports: GoogleDriveService, DriveFile, DriveFolder, DriveBatchItem, DriveBatchOperation, create_integration
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,13 +16,20 @@ files, with a consistent interface for uploading, downloading, and managing cont
 """
 
 from quack_core.integrations.core.protocols import StorageIntegrationProtocol
-from quack_core.integrations.google.drive.models import DriveFile, DriveFolder
+from quack_core.integrations.google.drive.models import (
+    DriveBatchItem,
+    DriveBatchOperation,
+    DriveFile,
+    DriveFolder,
+)
 from quack_core.integrations.google.drive.service import GoogleDriveService
 
 __all__ = [
     "GoogleDriveService",
     "DriveFile",
     "DriveFolder",
+    "DriveBatchItem",
+    "DriveBatchOperation",
     "create_integration",
 ]
 
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.google.drive.models
 # role: models
 # neighbors: __init__.py, service.py, protocols.py
-# exports: DrivePermission, DriveFile, DriveFolder
+# exports: DrivePermission, DriveFile, DriveFolder, DriveDownload, DriveUpload, DriveUploadBatch, DriveBatchOperation, DriveBatchItem
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,9 +16,12 @@ standardizing the representation of Drive resources.
 """
 
 from datetime import datetime
+from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
+from quack_core.contracts.artifacts.refs import Checksum
+from quack_core.integrations.core.results import IntegrationResult
 
 
 class DrivePermission(BaseModel):
@@ -153,3 +156,96 @@ class DriveFolder(DriveFile):
             **file.model_dump(),
             folder_color_rgb=response.get("folderColorRgb"),
         )
+
+
+class DriveDownload(BaseModel):
+    """Model for the outcome of a streamed Google Drive download."""
+
+    remote_id: str = Field(..., description="ID of the downloaded file")
+    path: str = Field(..., description="Local path of the completed download")
+    size: int = Field(0, description="File size in bytes")
+    resumed_from: int = Field(
+        0, description="Bytes reused from an interrupted earlier attempt"
+    )
+    sha256: str | None = Field(
+        None, description="Hex SHA-256 of the file, if it was computed"
+    )
+
+    def to_checksum(self) -> Checksum | None:
+        """
+        Build a Checksum for an ArtifactRef from the computed digest.
+
+        Returns:
+            Checksum | None: SHA-256 checksum, or None if it was not computed
+        """
+        if self.sha256 is None:
+            return None
+        return Checksum(value=self.sha256)
+
+
+class DriveUpload(BaseModel):
+    """Model for the outcome of a resumable Google Drive upload."""
+
+    local_path: str = Field(..., description="Path of the uploaded local file")
+    file_id: str = Field(..., description="ID of the created Drive file")
+    link: str = Field(..., description="Web link to the uploaded file")
+    size: int = Field(0, description="File size in bytes")
+    elapsed_seconds: float = Field(0.0, description="Wall time for the upload")
+    retries: int = Field(
+        0, description="Transient failures recovered by resuming the upload"
+    )
+
+
+class DriveUploadBatch(BaseModel):
+    """Model for the results of an upload_many request."""
+
+    results: list[IntegrationResult[DriveUpload]] = Field(
+        default_factory=list, description="Per-file results, in input order"
+    )
+    succeeded: int = Field(0, description="Number of successful uploads")
+    failed: int = Field(0, description="Number of failed uploads")
+    failed_indices: list[int] = Field(
+        default_factory=list, description="Input positions of failed uploads"
+    )
+    total_bytes: int = Field(0, description="Bytes uploaded by successful files")
+    elapsed_seconds: float = Field(0.0, description="Wall time for the whole batch")
+
+    @property
+    def success(self) -> bool:
+        """Whether every upload succeeded."""
+        return self.failed == 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Aggregate throughput across all uploads."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_bytes / self.elapsed_seconds
+
+
+class DriveBatchOperation(str, Enum):
+    """Operations that can be grouped into a Drive batch request."""
+
+    FILE_INFO = "file_info"
+    SET_PERMISSIONS = "set_permissions"
+    SHARING_LINK = "sharing_link"
+    DELETE = "delete"
+
+
+class DriveBatchItem(BaseModel):
+    """A single operation inside a Google Drive batch request."""
+
+    operation: DriveBatchOperation = Field(..., description="Operation to perform")
+    file_id: str = Field(..., description="ID of the file or folder")
+    fields: str | None = Field(
+        None, description="Fields to retrieve (file_info only)"
+    )
+    role: str | None = Field(
+        None, description="Permission role (set_permissions only)"
+    )
+    permission_type: str = Field(
+        "anyone", description="Permission type (set_permissions only)"
+    )
+    permanent: bool = Field(
+        False, description="Delete permanently instead of trashing (delete only)"
+    )
@@ -2,8 +2,8 @@
 # path: quack-core/src/quack_core/integrations/google/drive/operations/__init__.py
 # module: quack_core.integrations.google.drive.operations.__init__
 # role: operations
-# neighbors: download.py, folder.py, list_files.py, permissions.py, upload.py
-# exports: download, folder, list_files, permissions, upload
+# neighbors: batch.py, download.py, folder.py, list_files.py, permissions.py, upload.py
+# exports: batch, download, folder, list_files, permissions, upload
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,6 +16,7 @@ such as uploading, downloading, listing files, and managing permissions.
 """
 
 from quack_core.integrations.google.drive.operations import (
+    batch,
     download,
     folder,
     list_files,
@@ -24,6 +25,7 @@ from quack_core.integrations.google.drive.operations import (
 )
 
 __all__ = [
+    "batch",
     "download",
     "folder",
     "list_files",
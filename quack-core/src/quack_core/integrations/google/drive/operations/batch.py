@@ -0,0 +1,238 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/google/drive/operations/batch.py
+# module: quack_core.integrations.google.drive.operations.batch
+# role: operations
+# neighbors: __init__.py, download.py, folder.py, list_files.py, permissions.py, upload.py
+# exports: execute_batch, MAX_BATCH_SIZE
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Batch _operations for Google Drive integration.
+
+This module groups metadata, permission, sharing-link and delete calls into
+Drive batch requests, so publishing many files costs one HTTP round trip per
+100 operations instead of one per operation.
+
+Each operation gets its own IntegrationResult. Sub-requests that fail with a
+retryable status (429, 500, 503) are resent in a new, smaller batch with
+exponential backoff; the ones that succeeded are not repeated.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from googleapiclient.errors import HttpError
+from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.google.drive.models import (
+    DriveBatchItem,
+    DriveBatchOperation,
+)
+from quack_core.integrations.google.drive.protocols import (
+    DriveBatchService,
+    DriveRequest,
+)
+from quack_core.integrations.google.drive.utils.api import with_exponential_backoff
+
+# Google's batch endpoint accepts at most 100 calls per request
+MAX_BATCH_SIZE = 100
+
+DEFAULT_FILE_INFO_FIELDS = (
+    "id,name,mimeType,parents,webViewLink,webContentLink,"
+    "size,createdTime,modifiedTime,shared,trashed"
+)
+
+# Error message prefixes, matching the single-call service methods
+_ERROR_MESSAGES = {
+    DriveBatchOperation.FILE_INFO: "Failed to retrieve file metadata",
+    DriveBatchOperation.SET_PERMISSIONS: "Failed to set permissions in Google Drive",
+    DriveBatchOperation.SHARING_LINK: "Failed to get file metadata from Google Drive",
+    DriveBatchOperation.DELETE: "Failed to delete file from Google Drive",
+}
+
+_RETRYABLE_STATUSES = (429, 500, 503)
+
+
+def _build_request(
+    drive_service: DriveBatchService, item: DriveBatchItem, default_role: str
+) -> DriveRequest[Any]:
+    """Build the API request for one batch item."""
+    if item.operation == DriveBatchOperation.FILE_INFO:
+        return drive_service.files().get(
+            fileId=item.file_id, fields=item.fields or DEFAULT_FILE_INFO_FIELDS
+        )
+    if item.operation == DriveBatchOperation.SET_PERMISSIONS:
+        permission = {
+            "type": item.permission_type,
+            "role": item.role or default_role,
+            "allowFileDiscovery": True,
+        }
+        return drive_service.permissions().create(
+            fileId=item.file_id, body=permission, fields="id"
+        )
+    if item.operation == DriveBatchOperation.SHARING_LINK:
+        return drive_service.files().get(
+            fileId=item.file_id, fields="webViewLink, webContentLink"
+        )
+    if item.permanent:
+        return drive_service.files().delete(fileId=item.file_id)
+    return drive_service.files().update(fileId=item.file_id, body={"trashed": True})
+
+
+def _success_result(
+    item: DriveBatchItem, response: Any, default_role: str
+) -> IntegrationResult:
+    """Convert a sub-request response into the single-call result shape."""
+    if item.operation == DriveBatchOperation.FILE_INFO:
+        return IntegrationResult.success_result(
+            content=response, message="File metadata retrieved successfully"
+        )
+    if item.operation == DriveBatchOperation.SET_PERMISSIONS:
+        role = item.role or default_role
+        return IntegrationResult.success_result(
+            content=True,
+            message=f"Permission set successfully: {role} for {item.permission_type}",
+        )
+    if item.operation == DriveBatchOperation.SHARING_LINK:
+        metadata = response or {}
+        link = (
+            metadata.get("webViewLink")
+            or metadata.get("webContentLink")
+            or f"https://drive.google.com/file/d/{item.file_id}/view"
+        )
+        return IntegrationResult.success_result(
+            content=link, message="Got sharing link successfully"
+        )
+    return IntegrationResult.success_result(
+        content=True, message=f"File deleted successfully: {item.file_id}"
+    )
+
+
+def _error_result(item: DriveBatchItem, error: Exception) -> IntegrationResult:
+    return IntegrationResult.error_result(
+        f"API error: {_ERROR_MESSAGES[item.operation]}: {error}"
+    )
+
+
+def _is_retryable(error: Exception) -> bool:
+    return (
+        isinstance(error, HttpError)
+        and getattr(error.resp, "status", None) in _RETRYABLE_STATUSES
+    )
+
+
+def execute_batch(
+    drive_service: DriveBatchService,
+    items: Sequence[DriveBatchItem],
+    default_role: str = "reader",
+    batch_size: int = MAX_BATCH_SIZE,
+    max_retries: int = 5,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    logger: logging.Logger | None = None,
+) -> list[IntegrationResult]:
+    """
+    Run Drive operations as batch requests.
+
+    Args:
+        drive_service: Google Drive service object.
+        items: Operations to perform.
+        default_role: Permission role used when an item does not set one.
+        batch_size: Operations per batch request (capped at 100).
+        max_retries: Retry rounds for sub-requests that failed transiently.
+        initial_delay: Delay in seconds before the first retry round.
+        max_delay: Maximum delay in seconds between retry rounds.
+        logger: Optional logger instance.
+
+    Returns:
+        list[IntegrationResult]: One result per item, in input order.
+    """
+    local_logger = logger or logging.getLogger(__name__)
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+    results: list[IntegrationResult | None] = [None] * len(items)
+
+    for start in range(0, len(items), batch_size):
+        _execute_chunk(
+            drive_service,
+            items,
+            list(range(start, min(start + batch_size, len(items)))),
+            results,
+            default_role,
+            max_retries,
+            initial_delay,
+            max_delay,
+            local_logger,
+        )
+
+    return [
+        result
+        if result is not None
+        else IntegrationResult.error_result("No response for batched request")
+        for result in results
+    ]
+
+
+def _execute_chunk(
+    drive_service: DriveBatchService,
+    items: Sequence[DriveBatchItem],
+    indices: list[int],
+    results: list[IntegrationResult | None],
+    default_role: str,
+    max_retries: int,
+    initial_delay: float,
+    max_delay: float,
+    logger: logging.Logger,
+) -> None:
+    """Send one batch, resending only the transiently failed sub-requests."""
+    # Indices still waiting for a final result, shrunk after each round
+    pending = list(indices)
+    last_errors: dict[int, Exception] = {}
+
+    def send_round() -> None:
+        nonlocal pending
+        retry: list[int] = []
+
+        def callback(
+            request_id: str, response: Any, exception: Exception | None
+        ) -> None:
+            index = int(request_id)
+            item = items[index]
+            if exception is None:
+                results[index] = _success_result(item, response, default_role)
+            elif _is_retryable(exception):
+                last_errors[index] = exception
+                retry.append(index)
+            else:
+                results[index] = _error_result(item, exception)
+
+        batch = drive_service.new_batch_http_request(callback=callback)
+        for index in pending:
+            batch.add(
+                _build_request(drive_service, items[index], default_role),
+                request_id=str(index),
+            )
+        batch.execute()
+
+        pending = sorted(retry)
+        if pending:
+            logger.warning(
+                f"Retrying {len(pending)} of {len(indices)} batched Drive requests"
+            )
+            # Re-raise a transient failure so with_exponential_backoff waits
+            # and calls us again with only the failed sub-requests
+            raise last_errors[pending[0]]
+
+    try:
+        with_exponential_backoff(
+            send_round,
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+        )()
+    except Exception as e:
+        logger.error(f"Batch request to Google Drive failed: {e}")
+        for index in pending:
+            if results[index] is None:
+                results[index] = _error_result(items[index], last_errors.get(index, e))
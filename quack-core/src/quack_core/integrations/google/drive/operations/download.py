@@ -3,7 +3,7 @@
 # module: quack_core.integrations.google.drive.operations.download
 # role: operations
 # neighbors: __init__.py, folder.py, list_files.py, permissions.py, upload.py
-# exports: resolve_download_path, download_file
+# exports: resolve_download_path, stream_download, download_file, download_artifact
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -12,20 +12,141 @@
 Download _operations for Google Drive integration.
 
 This module provides robust file download functionality with improved error handling.
+
+Downloads are streamed chunk by chunk into a ``<name>.part`` file next to the
+destination and renamed into place once complete, so memory use is bounded by
+the chunk size and a partially written file is never visible under the final
+name. If a download is interrupted, the next attempt resumes from the end of
+the ``.part`` file with a ranged request, provided the remote file is still
+the revision recorded next to it.
 """
 
-import io
+import hashlib
 import logging
+import os
 import os.path as ospath
+import random
+import time
 from collections.abc import Mapping
+from typing import Any, BinaryIO
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.google.drive.models import DriveDownload
 from quack_core.integrations.google.drive.protocols import DriveService
 from quack_core.integrations.google.drive.utils.api import execute_api_request
 from quack_core.lib.errors import QuackApiError
 from quack_core.lib.fs.service import standalone
 from quack_core.lib.paths import service as paths_service
 
+# Bytes fetched per ranged request (a multiple of 256 KiB, as Drive recommends)
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Retries per chunk on transient HTTP errors, with randomized exponential backoff
+DEFAULT_CHUNK_RETRIES = 3
+
+# Suffix of the in-progress file kept next to the destination
+PARTIAL_SUFFIX = ".part"
+
+# Suffix of the file recording which remote revision the .part file holds
+REVISION_SUFFIX = ".revision"
+
+_TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+
+class _HashingWriter:
+    """File sink that updates digests as chunks are written."""
+
+    def __init__(self, fh: BinaryIO, digests: list[Any]) -> None:
+        self._fh = fh
+        self._digests = digests
+
+    def write(self, data: bytes) -> int:
+        for digest in self._digests:
+            digest.update(data)
+        return self._fh.write(data)
+
+
+def _hash_existing(path: str, digests: list[Any], chunk_size: int) -> None:
+    """Feed the bytes already on disk into the digests before resuming."""
+    with open(path, "rb") as fh:
+        while block := fh.read(chunk_size):
+            for digest in digests:
+                digest.update(block)
+
+
+def _read_revision(path: str) -> str | None:
+    """Return the revision recorded for a partial download, if any."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return fh.read().strip() or None
+    except OSError:
+        return None
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fetch_range(
+        request: Any, start: int, end: int, retries: int
+) -> tuple[bytes, int | None]:
+    """
+    Fetch bytes ``start..end`` (inclusive) of a media request.
+
+    Args:
+        request: The HttpRequest returned by ``files().get_media()``.
+        start: First byte to fetch.
+        end: Last byte to fetch.
+        retries: Retries on dropped connections and transient HTTP errors.
+
+    Returns:
+        tuple: The bytes received and the total file size, if the response
+        reported it.
+
+    Raises:
+        googleapiclient.errors.HttpError: If the request keeps failing.
+        QuackApiError: If the server ignored the range of a resumed download.
+    """
+    from googleapiclient.errors import HttpError
+
+    headers = dict(request.headers)
+    headers["range"] = f"bytes={start}-{end}"
+    attempt = 0
+    while True:
+        try:
+            resp, content = request.http.request(request.uri, "GET", headers=headers)
+        except OSError:
+            # Dropped connections and timeouts
+            if attempt >= retries:
+                raise
+        else:
+            if resp.status not in _TRANSIENT_STATUSES or attempt >= retries:
+                break
+        attempt += 1
+        time.sleep(random.random() * 2**attempt)
+
+    if resp.status == 416 and start == 0:
+        # Drive answers a range request for an empty file this way
+        return b"", 0
+    if resp.status not in (200, 206):
+        raise HttpError(resp, content, uri=request.uri)
+    if resp.status == 200 and start > 0:
+        raise QuackApiError(
+            "Server ignored the range of a resumed download",
+            service="Google Drive",
+            api_method="files.get_media",
+        )
+    total = None
+    if "content-range" in resp:
+        length = resp["content-range"].rpartition("/")[2]
+        total = int(length) if length.isdigit() else None
+    elif resp.status == 200:
+        total = len(content)
+    return content, total
+
 
 def resolve_download_path(
         file_metadata: Mapping[str, object], local_path: str | None = None
@@ -78,11 +199,126 @@ def resolve_download_path(
     return str(local_path_obj)
 
 
+def stream_download(
+        drive_service: DriveService,
+        remote_id: str,
+        download_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        compute_checksum: bool = False,
+        expected_size: int | None = None,
+        revision: str | None = None,
+        expected_md5: str | None = None,
+        logger: logging.Logger | None = None,
+) -> DriveDownload:
+    """
+    Stream a Drive file to disk chunk by chunk.
+
+    Args:
+        drive_service: Google Drive service object.
+        remote_id: ID of the file to download.
+        download_path: Final local path of the file.
+        chunk_size: Bytes fetched per ranged request.
+        resume: Continue from an existing ``.part`` file instead of restarting.
+        compute_checksum: Compute the SHA-256 of the file while downloading.
+        expected_size: File size from the metadata, used to discard a stale
+            ``.part`` file that is larger than the remote file.
+        revision: Identifier of the remote file's current content (its
+            ``headRevisionId`` or ``md5Checksum``). A ``.part`` file is only
+            resumed if it was started from the same revision.
+        expected_md5: The file's ``md5Checksum``, verified once the download
+            is complete.
+        logger: Optional logger instance.
+
+    Returns:
+        DriveDownload: Path, size, resume offset and optional digest.
+
+    Raises:
+        googleapiclient.errors.HttpError: If a chunk request keeps failing.
+        QuackApiError: If the downloaded content does not match expected_md5.
+        OSError: If the partial file cannot be written or renamed.
+    """
+    local_logger = logger or logging.getLogger(__name__)
+    partial_path = download_path + PARTIAL_SUFFIX
+    revision_path = partial_path + REVISION_SUFFIX
+
+    offset = 0
+    if resume and ospath.exists(partial_path):
+        offset = ospath.getsize(partial_path)
+        recorded = _read_revision(revision_path)
+        if recorded != revision:
+            local_logger.warning(
+                f"Discarding partial download {partial_path}: it holds revision "
+                f"{recorded}, the remote file is now {revision}"
+            )
+            offset = 0
+        elif expected_size is not None and offset > expected_size:
+            local_logger.warning(
+                f"Discarding stale partial download {partial_path} "
+                f"({offset} bytes, remote file has {expected_size})"
+            )
+            offset = 0
+
+    digest = hashlib.sha256() if compute_checksum else None
+    md5 = hashlib.md5(usedforsecurity=False) if expected_md5 else None
+    digests = [d for d in (digest, md5) if d is not None]
+    if offset and digests:
+        _hash_existing(partial_path, digests, chunk_size)
+    if offset:
+        local_logger.info(f"Resuming download of {remote_id} at byte {offset}")
+    elif revision is not None:
+        with open(revision_path, "w", encoding="utf-8") as fh:
+            fh.write(revision)
+    else:
+        _remove_if_exists(revision_path)
+
+    request = drive_service.files().get_media(fileId=remote_id)
+    position = offset
+    total = expected_size
+    with open(partial_path, "ab" if offset else "wb") as fh:
+        writer = _HashingWriter(fh, digests)
+        while total is None or position < total:
+            content, reported_total = _fetch_range(
+                request, position, position + chunk_size - 1, DEFAULT_CHUNK_RETRIES
+            )
+            writer.write(content)
+            position += len(content)
+            if reported_total is not None:
+                total = reported_total
+            if not content or total is None:
+                break
+            local_logger.debug(
+                f"Download progress: {int(position / max(total, 1) * 100)}%"
+            )
+
+    if md5 is not None and md5.hexdigest() != expected_md5:
+        _remove_if_exists(partial_path)
+        _remove_if_exists(revision_path)
+        raise QuackApiError(
+            f"Downloaded content of {remote_id} does not match its md5Checksum",
+            service="Google Drive",
+            api_method="files.get_media",
+        )
+
+    os.replace(partial_path, download_path)
+    _remove_if_exists(revision_path)
+
+    return DriveDownload(
+        remote_id=remote_id,
+        path=download_path,
+        size=ospath.getsize(download_path),
+        resumed_from=offset,
+        sha256=digest.hexdigest() if digest is not None else None,
+    )
+
+
 def download_file(
         drive_service: DriveService,
         remote_id: str,
         local_path: str | None = None,
         logger: logging.Logger | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
 ) -> IntegrationResult[str]:
     """
     Download a file from Google Drive.
@@ -92,17 +328,66 @@ def download_file(
         remote_id: ID of the file to download.
         local_path: Optional local path to save the file.
         logger: Optional logger instance.
+        chunk_size: Bytes fetched per ranged request.
+        resume: Continue an interrupted download instead of restarting.
 
     Returns:
         IntegrationResult with the local file path.
     """
+    result = download_artifact(
+        drive_service,
+        remote_id,
+        local_path,
+        logger=logger,
+        chunk_size=chunk_size,
+        resume=resume,
+        compute_checksum=False,
+    )
+    if not result.success or result.content is None:
+        return IntegrationResult.error_result(result.error or "Download failed")
+
+    return IntegrationResult.success_result(
+        content=result.content.path, message=result.message
+    )
+
+
+def download_artifact(
+        drive_service: DriveService,
+        remote_id: str,
+        local_path: str | None = None,
+        logger: logging.Logger | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        compute_checksum: bool = True,
+) -> IntegrationResult[DriveDownload]:
+    """
+    Download a file from Google Drive and describe the result.
+
+    Unlike download_file, the result carries the size and (by default) the
+    SHA-256 computed during the download, ready for an ArtifactRef checksum.
+
+    Args:
+        drive_service: Google Drive service object.
+        remote_id: ID of the file to download.
+        local_path: Optional local path to save the file.
+        logger: Optional logger instance.
+        chunk_size: Bytes fetched per ranged request.
+        resume: Continue an interrupted download instead of restarting.
+        compute_checksum: Compute the SHA-256 while downloading.
+
+    Returns:
+        IntegrationResult with the DriveDownload.
+    """
     local_logger = logger or logging.getLogger(__name__)
 
     try:
         # Get file metadata
         try:
             file_metadata = execute_api_request(
-                drive_service.files().get(fileId=remote_id, fields="name, mimeType"),
+                drive_service.files().get(
+                    fileId=remote_id,
+                    fields="name, mimeType, size, md5Checksum, headRevisionId",
+                ),
                 "Failed to get file metadata from Google Drive",
                 "files.get",
             )
@@ -123,39 +408,30 @@ def download_file(
                 f"Failed to create directory: {create_result.error}"
             )
 
-        # Download the file content
+        # Stream the file content to disk
+        expected_size = file_metadata.get("size")
+        md5_checksum = file_metadata.get("md5Checksum")
         try:
-            request = drive_service.files().get_media(fileId=remote_id)
-            from googleapiclient.http import MediaIoBaseDownload
-
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                local_logger.debug(
-                    f"Download progress: {int(status.progress() * 100)}%"
-                )
+            outcome = stream_download(
+                drive_service,
+                remote_id,
+                download_path,
+                chunk_size=chunk_size,
+                resume=resume,
+                compute_checksum=compute_checksum,
+                expected_size=int(expected_size) if expected_size else None,
+                revision=file_metadata.get("headRevisionId") or md5_checksum,
+                expected_md5=md5_checksum,
+                logger=local_logger,
+            )
         except Exception as download_error:
             local_logger.error(f"Failed to download file: {download_error}")
             return IntegrationResult.error_result(
                 f"Failed to download file from Google Drive: {download_error}"
             )
 
-        # Reset pointer to beginning of the buffer and read content
-        fh.seek(0)
-        file_content = fh.read()
-
-        # Write file to disk
-        write_result = standalone.write_binary(download_path, file_content)
-        if not write_result.success:
-            return IntegrationResult.error_result(
-                f"Failed to write file: {write_result.error}"
-            )
-
         return IntegrationResult.success_result(
-            content=download_path,
+            content=outcome,
             message=f"File downloaded successfully to {download_path}",
         )
 
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.google.drive.operations.list_files
 # role: operations
 # neighbors: __init__.py, download.py, folder.py, permissions.py, upload.py
-# exports: list_files
+# exports: list_files, iter_files
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -13,25 +13,195 @@ File listing _operations for Google Drive integration.
 
 This module provides functions for listing files and folders in Google Drive,
 including query building and result formatting.
+
+iter_files is the streaming primitive: it follows ``nextPageToken`` so large
+folders are never truncated, yields raw file resources one at a time, and can
+walk a folder tree, listing sub-folders concurrently. list_files collects it
+into models for callers that want the whole listing.
 """
 
 import logging
-from collections.abc import Iterable, Mapping
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
 
 from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.google.drive.models import DriveFile, DriveFolder
 from quack_core.integrations.google.drive.protocols import DriveService
 from quack_core.integrations.google.drive.utils.api import execute_api_request
-from quack_core.integrations.google.drive.utils.query import build_query
+from quack_core.integrations.google.drive.utils.query import (
+    FOLDER_MIME_TYPE,
+    build_file_fields,
+    build_query,
+    matches_pattern,
+)
 from quack_core.lib.errors import QuackApiError
 from quack_core.lib.logging import get_logger
 
+# files.list accepts at most 1000 results per page
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = MAX_PAGE_SIZE
+DEFAULT_LIST_WORKERS = 4
+
+
+def _iter_pages(
+    drive_service: DriveService, query: str, fields: str, page_size: int
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield every file matching a query, one page request at a time.
+
+    Args:
+        drive_service: Google Drive service object.
+        query: Drive query string.
+        fields: Fields parameter, including ``nextPageToken``.
+        page_size: Results per page.
+
+    Yields:
+        dict: Raw file resources from the API.
+    """
+    page_token: str | None = None
+    while True:
+        params: dict[str, Any] = {"q": query, "fields": fields, "pageSize": page_size}
+        if page_token:
+            params["pageToken"] = page_token
+
+        response = execute_api_request(
+            drive_service.files().list(**params),
+            "Failed to list files from Google Drive",
+            "files.list",
+        )
+
+        # Handle the case where files might not be present or not iterable
+        files_data = response.get("files")
+        if isinstance(files_data, Iterable):
+            for item in files_data:
+                if isinstance(item, dict):
+                    yield item
+
+        page_token = response.get("nextPageToken")
+        if not isinstance(page_token, str) or not page_token:
+            return
+
+
+def iter_files(
+    drive_service: DriveService,
+    folder_id: str | None = None,
+    pattern: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    fields: Sequence[str] | None = None,
+    include_permissions: bool = False,
+    recursive: bool = False,
+    max_workers: int = DEFAULT_LIST_WORKERS,
+    service_factory: Callable[[], DriveService] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily list files in Google Drive, following page tokens.
+
+    Args:
+        drive_service: Google Drive service object.
+        folder_id: Optional folder ID to list files from.
+        pattern: Optional filename pattern to filter results.
+        page_size: Results per request (capped at 1000).
+        fields: File fields to request (see build_file_fields).
+        include_permissions: Whether to include permission details.
+        recursive: Also list the contents of every sub-folder of folder_id.
+        max_workers: Sub-folders listed concurrently in a recursive walk.
+        service_factory: Builds a Drive service for each worker thread. The
+            client's HTTP transport is not thread-safe, so without a factory
+            a recursive walk lists one folder at a time.
+
+    Yields:
+        dict: Raw file resources as returned by the API.
+
+    Raises:
+        QuackApiError: If a list request fails.
+    """
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+    if fields is not None and recursive:
+        # The walk needs these to find sub-folders
+        fields = [*fields, *(f for f in ("id", "mimeType") if f not in fields)]
+    fields_param = build_file_fields(include_permissions, fields, paginated=True)
+
+    # Listing without a parent already spans the whole drive
+    if not recursive or not folder_id:
+        yield from _iter_pages(
+            drive_service, build_query(folder_id, pattern), fields_param, page_size
+        )
+        return
+
+    yield from _walk_folders(
+        drive_service,
+        folder_id,
+        pattern,
+        fields_param,
+        page_size,
+        max_workers if service_factory is not None else 1,
+        service_factory,
+    )
+
+
+def _walk_folders(
+    drive_service: DriveService,
+    root_id: str,
+    pattern: str | None,
+    fields: str,
+    page_size: int,
+    max_workers: int,
+    service_factory: Callable[[], DriveService] | None,
+) -> Iterator[dict[str, Any]]:
+    """
+    List a folder tree, fetching up to max_workers folders at a time.
+
+    Items are yielded as each folder's listing completes, so the order
+    across folders is not deterministic.
+    """
+    local = threading.local()
+
+    def thread_service() -> DriveService:
+        if service_factory is None:
+            return drive_service
+        service = getattr(local, "service", None)
+        if service is None:
+            service = local.service = service_factory()
+        return service
+
+    def list_folder(folder_id: str) -> list[dict[str, Any]]:
+        query = build_query(folder_id, pattern, include_folders=True)
+        return list(_iter_pages(thread_service(), query, fields, page_size))
+
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="drive-list"
+    )
+    seen = {root_id}
+    pending: set[Future[list[dict[str, Any]]]] = {pool.submit(list_folder, root_id)}
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for item in future.result():
+                    if item.get("mimeType") == FOLDER_MIME_TYPE:
+                        child_id = item.get("id")
+                        if child_id and child_id not in seen:
+                            seen.add(child_id)
+                            pending.add(pool.submit(list_folder, child_id))
+                        # Folders are matched too so the walk can descend;
+                        # only report the ones the pattern asked for
+                        if not matches_pattern(item.get("name", ""), pattern):
+                            continue
+                    yield item
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
 
 def list_files(
     drive_service: DriveService,
     folder_id: str | None = None,
     pattern: str | None = None,
     logger: logging.Logger | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    recursive: bool = False,
 ) -> IntegrationResult[list[Mapping]]:
     """
     List files in Google Drive.
@@ -41,6 +211,8 @@ def list_files(
         folder_id: Optional folder ID to list files from.
         pattern: Optional filename pattern to filter results.
         logger: Optional logger instance.
+        page_size: Results per request (capped at 1000).
+        recursive: Also list the contents of every sub-folder.
 
     Returns:
         IntegrationResult containing a list of file information dictionaries.
@@ -48,39 +220,18 @@ def list_files(
     local_logger = get_logger(__name__) or logger(__name__)
 
     try:
-        # Build query string
-        query = build_query(folder_id, pattern)
-
-        # Execute list request
-        response = execute_api_request(
-            drive_service.files().list(
-                q=query,
-                fields=(
-                    "files(id, name, mimeType, webViewLink, webContentLink, "
-                    "size, createdTime, modifiedTime, parents, shared, trashed)"
-                ),
-                page_size=100,
-            ),
-            "Failed to list files from Google Drive",
-            "files.list",
-        )
-
-        # Process results - add explicit type checking and casting
         files = []
-
-        # Get the files from the response with proper type handling
-        files_data = response.get("files")
-
-        # Handle the case where files might not be present or not iterable
-        if not isinstance(files_data, Iterable):
-            files_data = []
-
-        for item in files_data:
-            if isinstance(item, dict):
-                if item.get("mimeType") == "application/vnd.google-apps.folder":
-                    files.append(DriveFolder.from_api_response(item))
-                else:
-                    files.append(DriveFile.from_api_response(item))
+        for item in iter_files(
+            drive_service,
+            folder_id,
+            pattern,
+            page_size=page_size,
+            recursive=recursive,
+        ):
+            if item.get("mimeType") == FOLDER_MIME_TYPE:
+                files.append(DriveFolder.from_api_response(item))
+            else:
+                files.append(DriveFile.from_api_response(item))
 
         # Create the typed list for the return value
         file_maps: list[Mapping] = [file.model_dump() for file in files]
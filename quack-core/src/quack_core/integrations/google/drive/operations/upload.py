@@ -3,7 +3,7 @@
 # module: quack_core.integrations.google.drive.operations.upload
 # role: operations
 # neighbors: __init__.py, download.py, folder.py, list_files.py, permissions.py
-# exports: initialize_drive_service, resolve_file_details, upload_file
+# exports: initialize_drive_service, resolve_file_details, upload_file, resumable_upload
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -15,13 +15,23 @@ This module provides functions for uploading files to Google Drive,
 including file metadata handling and media upload.
 All file paths are handled as strings. Filesystem _operations such as
 reading a file or obtaining file metadata are delegated to the QuackCore FS API.
+
+resumable_upload streams a file from disk in fixed-size chunks over a
+resumable upload session. When a chunk fails transiently the session is kept
+and the next attempt asks Drive how many bytes it already has, so the upload
+continues from that offset instead of starting over.
 """
 
 import logging
+import os
+import time
+from collections.abc import Callable
 
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaInMemoryUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaInMemoryUpload, MediaIoBaseUpload
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.google.drive.models import DriveUpload
 from quack_core.integrations.google.drive.operations import permissions
 from quack_core.integrations.google.drive.protocols import (
     DriveService,
@@ -32,6 +42,19 @@ from quack_core.lib.errors import QuackApiError, QuackIntegrationError
 from quack_core.lib.fs.service import standalone
 from quack_core.lib.paths import service as paths_service
 
+# Resumable upload chunks must be a multiple of 256 KiB (except the last one)
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Resumes after transient failures, on top of the client's own chunk retries
+DEFAULT_UPLOAD_RETRIES = 5
+DEFAULT_CHUNK_RETRIES = 3
+
+_TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+ProgressCallback = Callable[[str, int, int], None]
+
 
 def initialize_drive_service(credentials: GoogleCredentials) -> DriveService:
     """
@@ -197,3 +220,108 @@ def upload_file(
         return IntegrationResult.error_result(
             f"Failed to upload file to Google Drive: {e}"
         )
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether an upload error is worth resuming after."""
+    if isinstance(error, HttpError):
+        return getattr(error.resp, "status", None) in _TRANSIENT_STATUSES
+    # Dropped connections and timeouts surface as OSError subclasses
+    return isinstance(error, OSError)
+
+
+def resumable_upload(
+    drive_service: DriveService,
+    file_path: str,
+    file_metadata: dict[str, object],
+    mime_type: str,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+    max_retries: int = DEFAULT_UPLOAD_RETRIES,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    logger: logging.Logger | None = None,
+) -> DriveUpload:
+    """
+    Upload a local file in chunks over a resumable upload session.
+
+    Args:
+        drive_service: Google Drive service object.
+        file_path: Local file to upload.
+        file_metadata: Drive file metadata (name, parents, ...).
+        mime_type: MIME type of the content.
+        chunk_size: Bytes per chunk, rounded up to a multiple of 256 KiB.
+        progress: Called as ``progress(file_path, bytes_sent, total_bytes)``
+            after every chunk.
+        max_retries: Times to resume after a transient failure.
+        initial_delay: Delay in seconds before the first resume.
+        max_delay: Maximum delay in seconds between resumes.
+        logger: Optional logger instance.
+
+    Returns:
+        DriveUpload: The created file and upload statistics.
+
+    Raises:
+        HttpError: If the API rejects the upload.
+        OSError: If the file cannot be read or the connection keeps failing.
+    """
+    local_logger = logger or logging.getLogger(__name__)
+    chunk_size = max(
+        UPLOAD_CHUNK_ALIGNMENT,
+        -(-chunk_size // UPLOAD_CHUNK_ALIGNMENT) * UPLOAD_CHUNK_ALIGNMENT,
+    )
+    size = os.path.getsize(file_path)
+    started = time.monotonic()
+    retries = 0
+    delay = initial_delay
+
+    with open(file_path, "rb") as fh:
+        media = MediaIoBaseUpload(
+            fh, mimetype=mime_type, chunksize=chunk_size, resumable=True
+        )
+        request = drive_service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields="id, webViewLink, webContentLink",
+        )
+
+        response = None
+        while response is None:
+            try:
+                status, response = request.next_chunk(
+                    num_retries=DEFAULT_CHUNK_RETRIES
+                )
+            except Exception as e:
+                if not _is_transient(e) or retries >= max_retries:
+                    raise
+                retries += 1
+                local_logger.warning(
+                    f"Upload of {file_path} interrupted ({e}); resuming "
+                    f"in {delay:.1f}s (attempt {retries}/{max_retries})"
+                )
+                # The request keeps its session URI and asks Drive for the
+                # committed offset on the next call
+                time.sleep(delay)
+                delay = min(delay * 2, max_delay)
+                continue
+
+            if status is not None and progress is not None:
+                progress(file_path, status.resumable_progress, size)
+
+    if progress is not None:
+        progress(file_path, size, size)
+
+    file_id = str(response["id"])
+    link = (
+        str(response.get("webViewLink", ""))
+        or str(response.get("webContentLink", ""))
+        or f"https://drive.google.com/file/d/{file_id}/view"
+    )
+    return DriveUpload(
+        local_path=file_path,
+        file_id=file_id,
+        link=link,
+        size=size,
+        elapsed_seconds=time.monotonic() - started,
+        retries=retries,
+    )
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.google.drive.protocols
 # role: protocols
 # neighbors: __init__.py, service.py, models.py
-# exports: DrivePermissionsResource, DriveRequest, DriveFilesResource, DriveService, GoogleCredentials
+# exports: DrivePermissionsResource, DriveRequest, DriveFilesResource, DriveService, DriveBatchHttpRequest, DriveBatchService, GoogleCredentials
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -15,6 +15,7 @@ This module defines protocol classes for Google Drive services and resources,
 ensuring proper typing throughout the codebase and avoiding the use of Any.
 """
 
+from collections.abc import Callable
 from typing import Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")  # Generic type for result content
@@ -110,7 +111,8 @@ class DriveFilesResource(Protocol):
         self,
         q: str | None = None,
         fields: str | None = None,
-        page_size: int | None = None,
+        pageSize: int | None = None,
+        pageToken: str | None = None,
     ) -> DriveRequest[dict[str, object]]:
         """
         List files.
@@ -118,7 +120,8 @@ class DriveFilesResource(Protocol):
         Args:
             q: Query string.
             fields: Fields to include in the response.
-            page_size: Maximum number of files to return.
+            pageSize: Maximum number of files to return per page.
+            pageToken: Token of the page to fetch, from ``nextPageToken``.
 
         Returns:
             DriveRequest: Request object for listing files.
@@ -177,6 +180,59 @@ class DriveService(Protocol):
         ...
 
 
+@runtime_checkable
+class DriveBatchHttpRequest(Protocol):
+    """Protocol for a Google API batch request envelope."""
+
+    def add(
+        self,
+        request: DriveRequest[object],
+        callback: Callable[[str, object, Exception | None], None] | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        """
+        Add a request to the batch.
+
+        Args:
+            request: Request to send as part of the batch.
+            callback: Called with (request_id, response, exception).
+            request_id: Identifier passed back to the callback.
+        """
+        ...
+
+    def execute(self) -> None:
+        """Send every request in the batch in a single HTTP round trip."""
+        ...
+
+
+@runtime_checkable
+class DriveBatchService(DriveService, Protocol):
+    """Protocol for a Google Drive service that supports batch requests."""
+
+    def permissions(self) -> DrivePermissionsResource:
+        """
+        Get the permissions resource.
+
+        Returns:
+            DrivePermissionsResource: The permissions resource.
+        """
+        ...
+
+    def new_batch_http_request(
+        self, callback: Callable[[str, object, Exception | None], None] | None = None
+    ) -> DriveBatchHttpRequest:
+        """
+        Create a batch request envelope.
+
+        Args:
+            callback: Default callback for requests added without one.
+
+        Returns:
+            DriveBatchHttpRequest: The empty batch.
+        """
+        ...
+
+
 @runtime_checkable
 class GoogleCredentials(Protocol):
     """Protocol for Google API credentials."""
@@ -15,9 +15,11 @@ This module provides the main service class for Google Drive integration,
 handling file _operations, folder management, and permissions.
 """
 
-import io
 import logging
-from collections.abc import Mapping
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, TypeVar
 
 from quack_core.integrations.core.base import BaseIntegrationService
@@ -25,7 +27,39 @@ from quack_core.integrations.core.protocols import StorageIntegrationProtocol
 from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.google.auth import GoogleAuthProvider
 from quack_core.integrations.google.config import GoogleConfigProvider
-from quack_core.integrations.google.drive.models import DriveFile, DriveFolder
+from quack_core.integrations.google.drive.models import (
+    DriveBatchItem,
+    DriveBatchOperation,
+    DriveDownload,
+    DriveFile,
+    DriveFolder,
+    DriveUpload,
+    DriveUploadBatch,
+)
+from quack_core.integrations.google.drive.operations.batch import (
+    execute_batch as execute_drive_batch,
+)
+from quack_core.integrations.google.drive.operations.download import (
+    DEFAULT_CHUNK_SIZE,
+    stream_download,
+)
+from quack_core.integrations.google.drive.operations.list_files import (
+    DEFAULT_LIST_WORKERS,
+    DEFAULT_PAGE_SIZE,
+)
+from quack_core.integrations.google.drive.operations.list_files import (
+    iter_files as iter_drive_files,
+)
+from quack_core.integrations.google.drive.operations.upload import (
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    DEFAULT_UPLOAD_WORKERS,
+    ProgressCallback,
+    resumable_upload,
+)
+from quack_core.integrations.google.drive.utils.query import (
+    FOLDER_MIME_TYPE,
+    build_query,
+)
 from quack_core.lib.errors import (
     QuackApiError,
     QuackBaseAuthError,
@@ -281,19 +315,7 @@ class GoogleDriveService(BaseIntegrationService, StorageIntegrationProtocol):
         Returns:
             str: The query string.
         """
-        query_parts: list[str] = []
-        folder_id = remote_path or self.shared_folder_id
-        if folder_id:
-            query_parts.append(f"'{folder_id}' in parents")
-        query_parts.append("trashed = false")
-        if pattern:
-            if "*" in pattern:
-                name_pattern = pattern.replace("*", "")
-                if name_pattern:
-                    query_parts.append(f"name contains '{name_pattern}'")
-            else:
-                query_parts.append(f"name = '{pattern}'")
-        return " and ".join(query_parts)
+        return build_query(remote_path or self.shared_folder_id, pattern)
 
     def _execute_upload(
         self, file_metadata: dict[str, Any], media: Any
@@ -331,27 +353,82 @@ class GoogleDriveService(BaseIntegrationService, StorageIntegrationProtocol):
             ) from api_error
 
     def download_file(
-        self, remote_id: str, local_path: str | None = None
+        self,
+        remote_id: str,
+        local_path: str | None = None,
+        chunk_size: int | None = None,
+        resume: bool = True,
     ) -> IntegrationResult[str]:
         """
         Download a file from Google Drive.
 
+        The file is streamed to disk in chunks, so memory use does not grow
+        with the file size; see download_artifact.
+
         Args:
             remote_id: ID of the file to download.
             local_path: Optional local path to save the file.
+            chunk_size: Bytes per ranged request (defaults to the
+                ``download_chunk_size`` config value, or 8 MiB).
+            resume: Continue an interrupted download instead of restarting.
 
         Returns:
             IntegrationResult with the local file path.
         """
+        result = self.download_artifact(
+            remote_id,
+            local_path,
+            chunk_size=chunk_size,
+            resume=resume,
+            checksum=False,
+        )
+        if not result.success or result.content is None:
+            return IntegrationResult.error_result(result.error or "Download failed")
+
+        return IntegrationResult.success_result(
+            content=result.content.path, message=result.message
+        )
+
+    def download_artifact(
+        self,
+        remote_id: str,
+        local_path: str | None = None,
+        chunk_size: int | None = None,
+        resume: bool = True,
+        checksum: bool = True,
+    ) -> IntegrationResult[DriveDownload]:
+        """
+        Download a file from Google Drive, streaming it to disk.
+
+        Chunks are written to ``<path>.part`` and the file is renamed into
+        place once complete. An interrupted download leaves the ``.part``
+        file behind and the next call resumes from its end. The SHA-256 is
+        computed on the fly; use ``result.content.to_checksum()`` for an
+        ArtifactRef.
+
+        Args:
+            remote_id: ID of the file to download.
+            local_path: Optional local path to save the file.
+            chunk_size: Bytes per ranged request (defaults to the
+                ``download_chunk_size`` config value, or 8 MiB).
+            resume: Continue an interrupted download instead of restarting.
+            checksum: Compute the SHA-256 while downloading.
+
+        Returns:
+            IntegrationResult with the DriveDownload.
+        """
         if init_error := self._ensure_initialized():
             return init_error
 
         try:
-            # First, get file metadata to determine filename
+            # First, get file metadata to determine filename and size
             try:
                 file_metadata = (
                     self.drive_service.files()
-                    .get(fileId=remote_id, fields="name, mimeType")
+                    .get(
+                        fileId=remote_id,
+                        fields="name, mimeType, size, md5Checksum, headRevisionId",
+                    )
                     .execute()
                 )
             except Exception as api_error:
@@ -371,39 +448,31 @@ class GoogleDriveService(BaseIntegrationService, StorageIntegrationProtocol):
                     f"Failed to create directory: {parent_result.error}"
                 )
 
-            # Download the file content
+            # Stream the file content to disk
+            expected_size = file_metadata.get("size")
+            md5_checksum = file_metadata.get("md5Checksum")
             try:
-                request = self.drive_service.files().get_media(fileId=remote_id)
-                from googleapiclient.http import MediaIoBaseDownload
-
-                fh = io.BytesIO()
-                downloader = MediaIoBaseDownload(fh, request)
-
-                done = False
-                while not done:
-                    status, done = downloader.next_chunk()
-                    self.logger.debug(
-                        f"Download progress: {int(status.progress() * 100)}%"
-                    )
+                outcome = stream_download(
+                    self.drive_service,
+                    remote_id,
+                    download_path,
+                    chunk_size=chunk_size
+                    or self.config.get("download_chunk_size", DEFAULT_CHUNK_SIZE),
+                    resume=resume,
+                    compute_checksum=checksum,
+                    expected_size=int(expected_size) if expected_size else None,
+                    revision=file_metadata.get("headRevisionId") or md5_checksum,
+                    expected_md5=md5_checksum,
+                    logger=self.logger,
+                )
             except Exception as download_error:
                 self.logger.error(f"Failed to download file: {download_error}")
                 return IntegrationResult.error_result(
                     f"Failed to download file from Google Drive: {download_error}"
                 )
 
-            # Reset pointer to beginning of the buffer and read content
-            fh.seek(0)
-            file_content = fh.read()
-
-            # Write file to disk using fs module
-            write_result = standalone.write_binary(download_path, file_content)
-            if not write_result.success:
-                return IntegrationResult.error_result(
-                    f"Failed to write file: {write_result.error}"
-                )
-
             return IntegrationResult.success_result(
-                content=download_path,
+                content=outcome,
                 message=f"File downloaded successfully to {download_path}",
             )
 
@@ -413,15 +482,80 @@ class GoogleDriveService(BaseIntegrationService, StorageIntegrationProtocol):
                 f"Failed to download file from Google Drive: {e}"
             )
 
+    def iter_files(
+        self,
+        remote_path: str | None = None,
+        pattern: str | None = None,
+        page_size: int | None = None,
+        fields: Sequence[str] | None = None,
+        recursive: bool = False,
+        max_workers: int = DEFAULT_LIST_WORKERS,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily list files in Google Drive, following page tokens.
+
+        Unlike list_files, nothing is materialized: raw file resources are
+        yielded as pages arrive, so arbitrarily large folders can be
+        processed in constant memory.
+
+        Args:
+            remote_path: Optional folder ID (defaults to the shared folder).
+            pattern: Optional filename pattern to filter results.
+            page_size: Results per request (defaults to the
+                ``list_page_size`` config value, at most 1000).
+            fields: File fields to request; ask only for what you need.
+            recursive: Also list every sub-folder, several at a time.
+            max_workers: Sub-folders listed concurrently when recursive.
+
+        Yields:
+            dict: Raw file resources as returned by the API.
+
+        Raises:
+            QuackIntegrationError: If the service is not initialized.
+            QuackApiError: If a list request fails.
+        """
+        if init_error := self._ensure_initialized():
+            raise QuackIntegrationError(init_error.error or "Service not initialized")
+
+        yield from iter_drive_files(
+            self.drive_service,
+            remote_path or self.shared_folder_id,
+            pattern,
+            page_size=page_size
+            or self.config.get("list_page_size", DEFAULT_PAGE_SIZE),
+            fields=fields,
+            recursive=recursive,
+            max_workers=max_workers,
+            service_factory=self._build_thread_service if recursive else None,
+        )
+
+    def _build_thread_service(self) -> Any:
+        """Build a Drive client for a worker thread (clients are not thread-safe)."""
+        from googleapiclient.discovery import build
+
+        return build(
+            "drive",
+            "v3",
+            credentials=self.auth_provider.get_credentials(),
+            cache_discovery=False,
+        )
+
     def list_files(
-        self, remote_path: str | None = None, pattern: str | None = None
+        self,
+        remote_path: str | None = None,
+        pattern: str | None = None,
+        recursive: bool = False,
     ) -> IntegrationResult[list[Mapping]]:
         """
         List files in Google Drive.
 
+        Every page is fetched; use iter_files to process large folders
+        without holding the whole listing in memory.
+
         Args:
             remote_path: Optional folder ID to list files from.
             pattern: Optional filename pattern to filter results.
+            recursive: Also list the contents of every sub-folder.
 
         Returns:
             IntegrationResult with the list of files.
@@ -430,31 +564,9 @@ class GoogleDriveService(BaseIntegrationService, StorageIntegrationProtocol):
             return init_error
 
         try:
-            query = self._build_query(remote_path, pattern)
-            try:
-                response = (
-                    self.drive_service.files()
-                    .list(
-                        q=query,
-                        fields=(
-                            "files(id, name, mimeType, webViewLink, webContentLink, "
-                            "size, createdTime, modifiedTime, parents, shared, trashed)"
-                        ),
-                        page_size=100,
-                    )
-                    .execute()
-                )
-            except Exception as api_error:
-                raise QuackApiError(
-                    f"Failed to list files from Google Drive: {api_error}",
-                    service="Google Drive",
-                    api_method="files.list",
-                    original_error=api_error,
-                ) from api_error
-
             files: list = []
-            for item in response.get("files", []):
-                if item["mimeType"] == "application/vnd.google-apps.folder":
+            for item in self.iter_files(remote_path, pattern, recursive=recursive):
+                if item.get("mimeType") == FOLDER_MIME_TYPE:
                     files.append(DriveFolder.from_api_response(item))
                 else:
                     files.append(DriveFile.from_api_response(item))
@@ -724,6 +836,125 @@ class GoogleDriveService(BaseIntegrationService, StorageIntegrationProtocol):
                 f"Failed to retrieve file metadata: {api_error}"
             )
 
+    def execute_batch(self, items: Sequence[DriveBatchItem]) -> list[IntegrationResult]:
+        """
+        Run several Drive operations in batch requests.
+
+        Operations are grouped into batches of up to 100, each sent as a
+        single HTTP round trip. Sub-requests that fail transiently (429, 500,
+        503) are retried with exponential backoff; successful ones are not
+        repeated.
+
+        Args:
+            items: Operations to perform.
+
+        Returns:
+            list[IntegrationResult]: One result per item, in input order,
+            with the same content as the corresponding single-call method.
+        """
+        if init_error := self._ensure_initialized():
+            return [init_error for _ in items]
+
+        return execute_drive_batch(
+            self.drive_service,
+            items,
+            default_role=self.config.get("default_share_access", "reader"),
+            logger=self.logger,
+        )
+
+    def get_file_info_many(
+        self, remote_ids: Sequence[str], fields: str | None = None
+    ) -> list[IntegrationResult[dict[str, Any]]]:
+        """
+        Retrieve metadata for several files using batch requests.
+
+        Args:
+            remote_ids: IDs of the files in Google Drive.
+            fields: Optional fields to retrieve (defaults to basic metadata).
+
+        Returns:
+            list[IntegrationResult]: File metadata per ID, in input order.
+        """
+        return self.execute_batch(
+            [
+                DriveBatchItem(
+                    operation=DriveBatchOperation.FILE_INFO,
+                    file_id=remote_id,
+                    fields=fields,
+                )
+                for remote_id in remote_ids
+            ]
+        )
+
+    def set_file_permissions_many(
+        self, fileIds: Sequence[str], role: str | None = None, type_: str = "anyone"
+    ) -> list[IntegrationResult[bool]]:
+        """
+        Set the same permission on several files using batch requests.
+
+        Args:
+            fileIds: IDs of the files or folders.
+            role: Permission role (e.g., "reader", "writer").
+            type_: Permission type (e.g., "anyone", "user").
+
+        Returns:
+            list[IntegrationResult]: Success per ID, in input order.
+        """
+        return self.execute_batch(
+            [
+                DriveBatchItem(
+                    operation=DriveBatchOperation.SET_PERMISSIONS,
+                    file_id=file_id,
+                    role=role,
+                    permission_type=type_,
+                )
+                for file_id in fileIds
+            ]
+        )
+
+    def get_sharing_links(self, fileIds: Sequence[str]) -> list[IntegrationResult[str]]:
+        """
+        Get the sharing links for several files using batch requests.
+
+        Args:
+            fileIds: IDs of the files.
+
+        Returns:
+            list[IntegrationResult]: Sharing link per ID, in input order.
+        """
+        return self.execute_batch(
+            [
+                DriveBatchItem(
+                    operation=DriveBatchOperation.SHARING_LINK, file_id=file_id
+                )
+                for file_id in fileIds
+            ]
+        )
+
+    def delete_files(
+        self, fileIds: Sequence[str], permanent: bool = False
+    ) -> list[IntegrationResult[bool]]:
+        """
+        Delete several files using batch requests.
+
+        Args:
+            fileIds: IDs of the files or folders.
+            permanent: Whether to permanently delete or move to trash.
+
+        Returns:
+            list[IntegrationResult]: Success per ID, in input order.
+        """
+        return self.execute_batch(
+            [
+                DriveBatchItem(
+                    operation=DriveBatchOperation.DELETE,
+                    file_id=file_id,
+                    permanent=permanent,
+                )
+                for file_id in fileIds
+            ]
+        )
+
 
     # --- End of Helper Methods ---
 
@@ -814,3 +1045,145 @@ class GoogleDriveService(BaseIntegrationService, StorageIntegrationProtocol):
             return IntegrationResult.error_result(
                 f"Failed to upload file to Google Drive: {e}"
             )
+
+    def upload_many(
+        self,
+        paths: Sequence[str],
+        parent_id: str | None = None,
+        chunk_size: int | None = None,
+        max_workers: int | None = None,
+        progress: ProgressCallback | None = None,
+        public: bool | None = None,
+    ) -> DriveUploadBatch:
+        """
+        Upload several files concurrently with resumable, chunked uploads.
+
+        Each file is streamed from disk over its own resumable session, so
+        memory use stays at one chunk per worker. A chunk that fails
+        transiently is retried from the offset Drive already committed.
+        Public permissions are then set for every uploaded file in batch
+        requests.
+
+        Args:
+            paths: Local files to upload.
+            parent_id: Folder to upload into (defaults to the shared folder).
+            chunk_size: Bytes per chunk (defaults to the ``upload_chunk_size``
+                config value, or 8 MiB).
+            max_workers: Concurrent uploads (defaults to the
+                ``upload_workers`` config value, or 4).
+            progress: Called as ``progress(path, bytes_sent, total_bytes)``
+                after every chunk, from the worker threads.
+            public: Whether to make the files publicly accessible.
+
+        Returns:
+            DriveUploadBatch: Per-file results and throughput summary.
+        """
+        if init_error := self._ensure_initialized():
+            return DriveUploadBatch(
+                results=[init_error for _ in paths],
+                failed=len(paths),
+                failed_indices=list(range(len(paths))),
+            )
+
+        chunk_size = chunk_size or self.config.get(
+            "upload_chunk_size", DEFAULT_UPLOAD_CHUNK_SIZE
+        )
+        max_workers = max_workers or self.config.get(
+            "upload_workers", DEFAULT_UPLOAD_WORKERS
+        )
+        local = threading.local()
+
+        def upload_one(path: str) -> IntegrationResult[DriveUpload]:
+            # Drive clients are not thread-safe, so each worker builds its own
+            service = getattr(local, "service", None)
+            if service is None:
+                service = local.service = self._build_thread_service()
+            return self._resumable_upload(service, path, parent_id, chunk_size, progress)
+
+        started = time.monotonic()
+        if paths:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(paths))),
+                thread_name_prefix="drive-upload",
+            ) as pool:
+                results = list(pool.map(upload_one, paths))
+        else:
+            results = []
+        elapsed = time.monotonic() - started
+
+        make_public = (
+            public if public is not None else self.config.get("public_sharing", True)
+        )
+        uploaded = [result.content for result in results if result.success]
+        if make_public and uploaded:
+            for upload, perm_result in zip(
+                uploaded,
+                self.set_file_permissions_many([upload.file_id for upload in uploaded]),
+                strict=True,
+            ):
+                if not perm_result.success:
+                    self.logger.warning(
+                        f"Failed to set permissions for {upload.file_id}: "
+                        f"{perm_result.error}"
+                    )
+
+        failed_indices = [i for i, result in enumerate(results) if not result.success]
+        batch = DriveUploadBatch(
+            results=results,
+            succeeded=len(results) - len(failed_indices),
+            failed=len(failed_indices),
+            failed_indices=failed_indices,
+            total_bytes=sum(upload.size for upload in uploaded),
+            elapsed_seconds=elapsed,
+        )
+        self.logger.info(
+            f"Uploaded {batch.succeeded}/{len(results)} files "
+            f"({batch.total_bytes / 1_000_000:.1f} MB) in {elapsed:.1f}s, "
+            f"{batch.bytes_per_second / 1_000_000:.2f} MB/s"
+        )
+        return batch
+
+    def _resumable_upload(
+        self,
+        drive_service: Any,
+        path: str,
+        parent_id: str | None,
+        chunk_size: int,
+        progress: ProgressCallback | None,
+    ) -> IntegrationResult[DriveUpload]:
+        """Upload one file for upload_many, converting errors to a result."""
+        try:
+            path_obj, filename, folder_id, mime_type = self._resolve_file_details(
+                path, None, parent_id
+            )
+        except QuackIntegrationError as e:
+            return IntegrationResult.error_result(str(e))
+
+        file_metadata: dict[str, object] = {"name": filename, "mimeType": mime_type}
+        if folder_id:
+            file_metadata["parents"] = [folder_id]
+
+        try:
+            upload = resumable_upload(
+                drive_service,
+                str(path_obj),
+                file_metadata,
+                mime_type,
+                chunk_size=chunk_size,
+                progress=(
+                    (lambda _, sent, total: progress(path, sent, total))
+                    if progress is not None
+                    else None
+                ),
+                logger=self.logger,
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to upload {path}: {e}")
+            return IntegrationResult.error_result(
+                f"Failed to upload file to Google Drive: {e}"
+            )
+
+        return IntegrationResult.success_result(
+            content=upload,
+            message=f"File uploaded successfully with ID: {upload.file_id}",
+        )
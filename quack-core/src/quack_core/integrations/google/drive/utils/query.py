@@ -3,7 +3,7 @@
 # module: quack_core.integrations.google.drive.utils.query
 # role: utils
 # neighbors: __init__.py, api.py
-# exports: build_query, build_file_fields
+# exports: build_query, build_file_fields, matches_pattern, FOLDER_MIME_TYPE, DEFAULT_FILE_FIELDS
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -15,14 +15,70 @@ This module provides functions for building query strings for
 Google Drive API requests.
 """
 
+from collections.abc import Sequence
 
-def build_query(folder_id: str | None = None, pattern: str | None = None) -> str:
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# Fields returned for each file when the caller does not choose them
+DEFAULT_FILE_FIELDS: tuple[str, ...] = (
+    "id",
+    "name",
+    "mimeType",
+    "webViewLink",
+    "webContentLink",
+    "size",
+    "createdTime",
+    "modifiedTime",
+    "parents",
+    "shared",
+    "trashed",
+)
+
+
+def _name_condition(pattern: str) -> tuple[str, str]:
+    """
+    Translate a filename pattern into a Drive name operator and value.
+
+    Args:
+        pattern: Filename pattern, optionally containing ``*`` wildcards.
+
+    Returns:
+        tuple[str, str]: The operator (``contains`` or ``=``) and its value.
+    """
+    if "*" not in pattern:
+        # Exact match
+        return "=", pattern
+
+    # Handle wildcards in the pattern
+    if not pattern.replace("*", ""):
+        # Empty wildcard (*)
+        return "contains", ""
+    if pattern.startswith("*") and pattern.endswith("*"):
+        # *text* pattern
+        return "contains", pattern.strip("*")
+    if pattern.startswith("*"):
+        # *text pattern (ends with)
+        return "contains", pattern[1:]
+    if pattern.endswith("*"):
+        # text* pattern (starts with)
+        return "contains", pattern[:-1]
+    # Handle pattern with * in the middle: use the first part as the filter
+    return "contains", pattern.split("*")[0]
+
+
+def build_query(
+    folder_id: str | None = None,
+    pattern: str | None = None,
+    include_folders: bool = False,
+) -> str:
     """
     Build a query string for listing files in Google Drive.
 
     Args:
         folder_id: Optional folder ID to list files from.
         pattern: Optional filename pattern to filter results.
+        include_folders: Also match folders whose names do not match the
+            pattern, so a recursive listing can descend into them.
 
     Returns:
         str: The query string.
@@ -38,67 +94,60 @@ def build_query(folder_id: str | None = None, pattern: str | None = None) -> str
 
     # Filter by name pattern
     if pattern:
-        if "*" in pattern:
-            # Handle wildcards in the pattern
-            name_pattern = pattern.replace("*", "")
-            if name_pattern:
-                if "*" in pattern and pattern != "*":
-                    # Extract the part before the asterisk if it exists
-                    if pattern.startswith("*") and pattern.endswith("*"):
-                        # *text* pattern
-                        clean_pattern = pattern.strip("*")
-                        query_parts.append(f"name contains '{clean_pattern}'")
-                    elif pattern.startswith("*"):
-                        # *text pattern (ends with)
-                        clean_pattern = pattern[1:]
-                        query_parts.append(f"name contains '{clean_pattern}'")
-                    elif pattern.endswith("*"):
-                        # text* pattern (starts with)
-                        clean_pattern = pattern[:-1]
-                        query_parts.append(f"name contains '{clean_pattern}'")
-                    else:
-                        # Handle pattern with * in the middle
-                        parts = pattern.split("*")
-                        # Use the first part as the filter
-                        query_parts.append(f"name contains '{parts[0]}'")
-                else:
-                    # Empty wildcard (*)
-                    query_parts.append("name contains ''")
-            else:
-                # Empty wildcard (*)
-                query_parts.append("name contains ''")
-        else:
-            # Exact match
-            query_parts.append(f"name = '{pattern}'")
+        operator, value = _name_condition(pattern)
+        condition = f"name {operator} '{value}'"
+        if include_folders:
+            condition = f"({condition} or mimeType = '{FOLDER_MIME_TYPE}')"
+        query_parts.append(condition)
 
     return " and ".join(query_parts)
 
 
-def build_file_fields(include_permissions: bool = False) -> str:
+def matches_pattern(name: str, pattern: str | None) -> bool:
+    """
+    Check a name against a pattern locally, the way build_query filters it.
+
+    Drive's ``contains`` operator is case-insensitive, so the local check is
+    as well.
+
+    Args:
+        name: File or folder name.
+        pattern: Filename pattern (None matches everything).
+
+    Returns:
+        bool: True if the name matches.
+    """
+    if not pattern:
+        return True
+    operator, value = _name_condition(pattern)
+    if operator == "=":
+        return name == value
+    return value.lower() in name.lower()
+
+
+def build_file_fields(
+    include_permissions: bool = False,
+    fields: Sequence[str] | None = None,
+    paginated: bool = False,
+) -> str:
     """
     Build a fields parameter string for file requests.
 
     Args:
         include_permissions: Whether to include permission details.
+        fields: File fields to request (defaults to DEFAULT_FILE_FIELDS).
+            Asking only for what is needed keeps list responses small.
+        paginated: Also request ``nextPageToken`` for paged listings.
 
     Returns:
         str: The fields parameter string.
     """
-    fields = [
-        "id",
-        "name",
-        "mimeType",
-        "webViewLink",
-        "webContentLink",
-        "size",
-        "createdTime",
-        "modifiedTime",
-        "parents",
-        "shared",
-        "trashed",
-    ]
+    file_fields = list(fields) if fields is not None else list(DEFAULT_FILE_FIELDS)
 
     if include_permissions:
-        fields.append("permissions(id,type,role,emailAddress,domain)")
+        file_fields.append("permissions(id,type,role,emailAddress,domain)")
 
-    return f"files({', '.join(fields)})"
+    result = f"files({', '.join(file_fields)})"
+    if paginated:
+        result = f"nextPageToken, {result}"
+    return result
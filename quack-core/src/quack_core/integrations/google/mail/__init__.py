@@ -2,8 +2,8 @@
 # path: quack-core/src/quack_core/integrations/google/mail/__init__.py
 # module: quack_core.integrations.google.mail.__init__
 # role: module
-# neighbors: service.py, protocols.py, config.py
-# exports: GoogleMailService, create_integration
+# neighbors: service.py, protocols.py, config.py, models.py
+# exports: GoogleMailService, GmailDownload, GmailDownloadBatch, GmailSyncResult, create_integration
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,10 +16,18 @@ retrieval, listing, and management through a consistent interface.
 """
 
 from quack_core.integrations.core.protocols import IntegrationProtocol
+from quack_core.integrations.google.mail.models import (
+    GmailDownload,
+    GmailDownloadBatch,
+    GmailSyncResult,
+)
 from quack_core.integrations.google.mail.service import GoogleMailService
 
 __all__ = [
     "GoogleMailService",
+    "GmailDownload",
+    "GmailDownloadBatch",
+    "GmailSyncResult",
     "create_integration",
 ]
 
@@ -38,3 +38,17 @@ class GmailServiceConfig(GoogleMailConfig):
     include_sender: bool = Field(
         False, description="Include email sender in downloaded file"
     )
+    sync_batch_size: int = Field(
+        50,
+        gt=0,
+        le=100,
+        description="Messages fetched per batch request during sync (Gmail allows 100)",
+    )
+    download_workers: int = Field(
+        4, gt=0, description="Concurrent message downloads in download_emails"
+    )
+    sync_state_file: str | None = Field(
+        None,
+        description="File storing the last synced history ID "
+        "(defaults to .gmail_sync_state.json in storage_path)",
+    )
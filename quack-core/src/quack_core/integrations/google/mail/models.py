@@ -0,0 +1,104 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/google/mail/models.py
+# module: quack_core.integrations.google.mail.models
+# role: models
+# neighbors: __init__.py, service.py, protocols.py, config.py
+# exports: GmailSyncResult, GmailDownload, GmailDownloadBatch
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Data models for Google Mail integration.
+
+This module provides Pydantic models for the results of Gmail operations
+that cover many messages at once.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+from quack_core.integrations.core.results import IntegrationResult
+
+
+class GmailSyncResult(BaseModel):
+    """Model for the outcome of an incremental mailbox sync."""
+
+    history_id: str | None = Field(
+        None, description="History ID to start the next sync from"
+    )
+    messages: list[dict[str, Any]] = Field(
+        default_factory=list, description="New messages, oldest change first"
+    )
+    failed_ids: list[str] = Field(
+        default_factory=list,
+        description="IDs of new messages that could not be fetched",
+    )
+    full_sync: bool = Field(
+        False, description="Whether a full listing was used instead of history"
+    )
+    history_pages: int = Field(
+        0, description="History pages fetched (0 for a full sync)"
+    )
+    batch_requests: int = Field(0, description="Batch HTTP requests sent")
+    elapsed_seconds: float = Field(0.0, description="Wall time for the whole sync")
+
+    @property
+    def success(self) -> bool:
+        """Whether every new message was fetched."""
+        return not self.failed_ids
+
+    @property
+    def message_ids(self) -> list[str]:
+        """IDs of the fetched messages, in sync order."""
+        return [str(message.get("id")) for message in self.messages]
+
+
+class GmailDownload(BaseModel):
+    """Model for one message saved by download_emails."""
+
+    msg_id: str = Field(..., description="Gmail message ID")
+    file_path: str = Field(..., description="Path of the saved HTML file")
+    attachments: list[str] = Field(
+        default_factory=list, description="Paths of the message's attachments"
+    )
+    deduplicated: int = Field(
+        0, description="Attachments already stored locally, so not written again"
+    )
+    bytes_written: int = Field(0, description="Bytes written to disk")
+    elapsed_seconds: float = Field(0.0, description="Time taken for this message")
+
+
+class GmailDownloadBatch(BaseModel):
+    """Model for the results of a download_emails request."""
+
+    results: list[IntegrationResult[GmailDownload]] = Field(
+        default_factory=list, description="Per-message results, in input order"
+    )
+    succeeded: int = Field(0, description="Number of messages saved")
+    failed: int = Field(0, description="Number of messages that failed")
+    failed_indices: list[int] = Field(
+        default_factory=list, description="Input positions of failed messages"
+    )
+    total_bytes: int = Field(0, description="Bytes written by successful messages")
+    deduplicated: int = Field(0, description="Attachments skipped as duplicates")
+    elapsed_seconds: float = Field(0.0, description="Wall time for the whole batch")
+
+    @property
+    def success(self) -> bool:
+        """Whether every message was saved."""
+        return self.failed == 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Aggregate write throughput across all messages."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_bytes / self.elapsed_seconds
+
+    @property
+    def messages_per_second(self) -> float:
+        """Messages saved per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.succeeded / self.elapsed_seconds
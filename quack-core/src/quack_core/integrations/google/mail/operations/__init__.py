@@ -2,8 +2,8 @@
 # path: quack-core/src/quack_core/integrations/google/mail/operations/__init__.py
 # module: quack_core.integrations.google.mail.operations.__init__
 # role: operations
-# neighbors: attachments.py, auth.py, email.py
-# exports: email, auth, attachments
+# neighbors: attachments.py, auth.py, download.py, email.py, sync.py
+# exports: email, auth, attachments, download, sync
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -15,10 +15,18 @@ This package contains specialized modules for different Gmail _operations,
 such as listing emails, downloading messages, and handling attachments.
 """
 
-from quack_core.integrations.google.mail.operations import attachments, auth, email
+from quack_core.integrations.google.mail.operations import (
+    attachments,
+    auth,
+    download,
+    email,
+    sync,
+)
 
 __all__ = [
     "email",
     "auth",
     "attachments",
+    "download",
+    "sync",
 ]
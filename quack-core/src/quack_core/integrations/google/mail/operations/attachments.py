@@ -2,7 +2,7 @@
 # path: quack-core/src/quack_core/integrations/google/mail/operations/attachments.py
 # module: quack_core.integrations.google.mail.operations.attachments
 # role: operations
-# neighbors: __init__.py, auth.py, email.py
+# neighbors: __init__.py, auth.py, download.py, email.py, sync.py
 # exports: process_message_parts, handle_attachment
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
@@ -2,7 +2,7 @@
 # path: quack-core/src/quack_core/integrations/google/mail/operations/auth.py
 # module: quack_core.integrations.google.mail.operations.auth
 # role: operations
-# neighbors: __init__.py, attachments.py, email.py
+# neighbors: __init__.py, attachments.py, download.py, email.py, sync.py
 # exports: initialize_gmail_service
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
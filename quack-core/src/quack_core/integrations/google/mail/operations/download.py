@@ -0,0 +1,390 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/google/mail/operations/download.py
+# module: quack_core.integrations.google.mail.operations.download
+# role: operations
+# neighbors: __init__.py, attachments.py, auth.py, email.py, sync.py
+# exports: AttachmentIndex, decode_to_file, save_attachment, download_message, DECODE_CHUNK_CHARS, INDEX_FILENAME
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Download _operations for saving many Gmail messages.
+
+This module saves a message's HTML body and attachments in a way that is safe
+to run from several threads at once. Attachment data is base64-decoded to
+disk in fixed-size chunks while it is hashed, so no second full-size copy of
+the decoded bytes is held in memory. Attachments whose SHA-256 is already
+recorded in the storage directory's index are not written again.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import cast
+
+from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.google.mail.models import GmailDownload
+from quack_core.integrations.google.mail.operations.email import (
+    GmailResponse,
+    _extract_header,
+    _get_message_with_retry,
+    clean_filename,
+)
+from quack_core.integrations.google.mail.protocols import GmailService
+from quack_core.integrations.google.mail.utils.api import execute_api_request
+
+# Base64 characters decoded per step; a multiple of 4 so each chunk decodes
+# on its own (3 MiB of output per step)
+DECODE_CHUNK_CHARS = 4 * 1024 * 1024
+
+# Index of stored attachments, kept in the storage directory
+INDEX_FILENAME = ".attachment_index.json"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AttachmentIndex:
+    """
+    Thread-safe record of the attachments stored in a directory.
+
+    Maps the SHA-256 of each attachment to the path it was saved at, so an
+    attachment seen again (in another message, or on a later run) is linked
+    to the existing file instead of being written a second time.
+    """
+
+    def __init__(self, storage_path: str, entries: dict[str, str] | None = None):
+        """
+        Initialize the index.
+
+        Args:
+            storage_path: Directory the attachments are stored in.
+            entries: Known digests mapped to file paths.
+        """
+        self.storage_path = storage_path
+        self._entries: dict[str, str] = dict(entries or {})
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> str:
+        """Path of the file the index is saved to."""
+        return os.path.join(self.storage_path, INDEX_FILENAME)
+
+    @classmethod
+    def load(cls, storage_path: str) -> "AttachmentIndex":
+        """
+        Load the index saved in a storage directory.
+
+        Entries whose files no longer exist are dropped. If no index has been
+        saved yet, the files already in the directory are hashed instead, so
+        attachments written before the index existed are still recognised.
+
+        Args:
+            storage_path: Directory the attachments are stored in.
+
+        Returns:
+            AttachmentIndex: The loaded index.
+        """
+        index = cls(storage_path)
+        entries: dict[str, str] | None = None
+        if os.path.exists(index.index_path):
+            try:
+                with open(index.index_path, encoding="utf-8") as fh:
+                    entries = json.load(fh)
+            except (OSError, ValueError):
+                entries = None  # Unreadable; rebuild it from the directory
+        if isinstance(entries, dict):
+            index._entries = {
+                str(digest): str(path)
+                for digest, path in entries.items()
+                if os.path.isfile(str(path))
+            }
+        elif os.path.isdir(storage_path):
+            for name in os.listdir(storage_path):
+                path = os.path.join(storage_path, name)
+                # Skip saved emails, partial downloads and our own state files
+                if name.startswith(".") or name.endswith(".html"):
+                    continue
+                if os.path.isfile(path):
+                    index._entries.setdefault(_sha256_file(path), path)
+        return index
+
+    def save(self) -> None:
+        """Write the index to the storage directory."""
+        with self._lock:
+            entries = dict(self._entries)
+        with open(self.index_path, "w", encoding="utf-8") as fh:
+            json.dump(entries, fh, indent=2, sort_keys=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str) -> str | None:
+        """Return the stored path for a digest, if the file still exists."""
+        with self._lock:
+            path = self._entries.get(digest)
+        return path if path and os.path.isfile(path) else None
+
+    def claim(self, digest: str, temp_path: str, file_name: str) -> tuple[str, bool]:
+        """
+        Store a decoded attachment, or discard it if it is a duplicate.
+
+        Args:
+            digest: SHA-256 of the decoded attachment.
+            temp_path: Where the attachment was decoded to.
+            file_name: Preferred file name in the storage directory.
+
+        Returns:
+            Tuple of (path of the stored attachment, whether it was a duplicate).
+        """
+        # Name selection and the rename happen under the lock, so two threads
+        # never pick the same free name or store the same content twice
+        with self._lock:
+            existing = self._entries.get(digest)
+            if existing and os.path.isfile(existing):
+                os.remove(temp_path)
+                return existing, True
+
+            file_path = os.path.join(self.storage_path, file_name)
+            base, ext = os.path.splitext(file_name)
+            counter = 1
+            while os.path.exists(file_path):
+                file_path = os.path.join(self.storage_path, f"{base}-{counter}{ext}")
+                counter += 1
+            os.replace(temp_path, file_path)
+            self._entries[digest] = file_path
+            return file_path, False
+
+
+def decode_to_file(
+    data: str, file_path: str, chunk_chars: int = DECODE_CHUNK_CHARS
+) -> tuple[str, int]:
+    """
+    Base64url-decode data into a file, chunk by chunk.
+
+    Args:
+        data: Base64url-encoded content, with or without padding.
+        file_path: File to write the decoded bytes to.
+        chunk_chars: Encoded characters decoded per step (rounded down to a
+            multiple of 4).
+
+    Returns:
+        Tuple of (SHA-256 hex digest, number of bytes written).
+
+    Raises:
+        binascii.Error: If the data is not valid base64.
+    """
+    chunk_chars = max(4, chunk_chars - chunk_chars % 4)
+    data = data.strip()
+    digest = hashlib.sha256()
+    size = 0
+    with open(file_path, "wb") as fh:
+        for start in range(0, len(data), chunk_chars):
+            chunk = data[start : start + chunk_chars]
+            # Only the last chunk can be short; restore any stripped padding
+            chunk += "=" * (-len(chunk) % 4)
+            decoded = base64.urlsafe_b64decode(chunk)
+            digest.update(decoded)
+            fh.write(decoded)
+            size += len(decoded)
+    return digest.hexdigest(), size
+
+
+def save_attachment(
+    gmail_service: GmailService,
+    user_id: str,
+    part: Mapping,
+    msg_id: str,
+    index: AttachmentIndex,
+    logger: logging.Logger,
+) -> tuple[str, bool, int] | None:
+    """
+    Download an attachment and store it unless it is already stored.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        part: Message part dictionary containing attachment data.
+        msg_id: The Gmail message ID.
+        index: Index of the attachments already stored.
+        logger: Logger instance.
+
+    Returns:
+        Tuple of (stored path, whether it was a duplicate, bytes written), or
+        None if the part has no attachment data.
+    """
+    filename = part.get("filename")
+    if not filename:
+        return None
+
+    body = part.get("body", {})
+    data = body.get("data")
+    if data is None and "attachmentId" in body:
+        attachment = execute_api_request(
+            gmail_service.users()
+            .messages()
+            .attachments()
+            .get(
+                user_id=user_id,
+                message_id=msg_id,
+                attachment_id=body["attachmentId"],
+            ),
+            "Failed to get attachment from Gmail",
+            "users.messages.attachments.get",
+        )
+        data = attachment.get("data")
+    if data is None:
+        return None
+
+    name, ext = os.path.splitext(str(filename))
+    file_name = (clean_filename(name) or "attachment") + ext.lower()
+    temp_path = os.path.join(
+        index.storage_path, f".{msg_id}-{threading.get_ident()}.part"
+    )
+    try:
+        digest, size = decode_to_file(str(data), temp_path)
+        file_path, duplicate = index.claim(digest, temp_path, file_name)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if duplicate:
+        logger.debug(f"Attachment {filename} of {msg_id} already stored: {file_path}")
+        return file_path, True, 0
+    return file_path, False, size
+
+
+def download_message(
+    gmail_service: GmailService,
+    user_id: str,
+    msg_id: str,
+    index: AttachmentIndex,
+    include_subject: bool = False,
+    include_sender: bool = False,
+    max_retries: int = 5,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    logger: logging.Logger | None = None,
+) -> IntegrationResult[GmailDownload]:
+    """
+    Save a Gmail message as HTML, with its attachments, into index's directory.
+
+    The HTML file is named after the time, sender and message ID, so messages
+    saved concurrently never overwrite each other.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        msg_id: The Gmail message ID.
+        index: Index of the attachments already stored.
+        include_subject: Whether to include the email subject in the output.
+        include_sender: Whether to include the sender in the output.
+        max_retries: Maximum number of retries for API calls.
+        initial_delay: Initial delay in seconds before the first retry.
+        max_delay: Maximum delay in seconds before any retry.
+        logger: Optional logger instance.
+
+    Returns:
+        IntegrationResult containing a GmailDownload.
+    """
+    logger = logger or logging.getLogger(__name__)
+    started = time.monotonic()
+    try:
+        message = _get_message_with_retry(
+            gmail_service,
+            user_id,
+            msg_id,
+            max_retries,
+            initial_delay,
+            max_delay,
+            logger,
+        )
+        if not message:
+            return IntegrationResult.error_result(
+                f"Message {msg_id} could not be retrieved"
+            )
+
+        payload = cast(GmailResponse, message).get("payload", {})
+        headers = cast(GmailResponse, payload).get("headers", [])
+        html_content: str | None = None
+        attachments: list[str] = []
+        deduplicated = 0
+        bytes_written = 0
+
+        parts_stack = [payload]
+        while parts_stack:
+            part = parts_stack.pop()
+            if "parts" in part:
+                parts_stack.extend(part["parts"])
+                continue
+            if part.get("mimeType") == "text/html" and html_content is None:
+                data = part.get("body", {}).get("data")
+                if data is not None:
+                    html_content = base64.urlsafe_b64decode(
+                        str(data).encode("utf-8")
+                    ).decode("utf-8")
+            elif part.get("filename"):
+                saved = save_attachment(
+                    gmail_service, user_id, part, msg_id, index, logger
+                )
+                if saved:
+                    path, duplicate, size = saved
+                    attachments.append(path)
+                    deduplicated += duplicate
+                    bytes_written += size
+
+        if not html_content:
+            logger.warning(f"No HTML content found in message {msg_id}")
+            return IntegrationResult.error_result(
+                f"No HTML content found in message {msg_id}"
+            )
+
+        subject = _extract_header(headers, "subject", "No Subject")
+        sender = _extract_header(headers, "from", "unknown@sender")
+        header_parts = []
+        if include_subject:
+            header_parts.append(f"<h1>Subject: {subject}</h1>")
+        if include_sender:
+            header_parts.append(f"<h2>From: {sender}</h2>")
+        if header_parts:
+            html_content = f"{''.join(header_parts)}<hr/>{html_content}"
+
+        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+        file_path = os.path.join(
+            index.storage_path,
+            f"{timestamp}-{clean_filename(sender)}-{clean_filename(msg_id)}.html",
+        )
+        encoded = html_content.encode("utf-8")
+        with open(file_path, "wb") as fh:
+            fh.write(encoded)
+        bytes_written += len(encoded)
+
+        return IntegrationResult.success_result(
+            content=GmailDownload(
+                msg_id=msg_id,
+                file_path=file_path,
+                attachments=attachments,
+                deduplicated=deduplicated,
+                bytes_written=bytes_written,
+                elapsed_seconds=time.monotonic() - started,
+            ),
+            message=f"Email downloaded successfully to {file_path}",
+        )
+    except Exception as e:
+        logger.error(f"Failed to download email {msg_id}: {e}")
+        return IntegrationResult.error_result(f"Failed to download email {msg_id}: {e}")
@@ -2,8 +2,8 @@
 # path: quack-core/src/quack_core/integrations/google/mail/operations/email.py
 # module: quack_core.integrations.google.mail.operations.email
 # role: operations
-# neighbors: __init__.py, attachments.py, auth.py
-# exports: MessagesRequest, MessagesResource, UsersResource, GmailResponse, build_query, list_emails, download_email, clean_filename (+2 more)
+# neighbors: __init__.py, attachments.py, auth.py, download.py, sync.py
+# exports: MessagesRequest, MessagesResource, UsersResource, GmailResponse, build_query, list_emails, download_email, clean_filename (+3 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -36,6 +36,9 @@ from quack_core.lib.fs.service import standalone
 
 T = TypeVar("T")  # Generic type for result content
 
+# Largest page users.messages.list will return
+MAX_PAGE_SIZE = 500
+
 
 class MessagesRequest(GmailRequest, Protocol):
     """Protocol for Gmail messages request object."""
@@ -46,10 +49,10 @@ class MessagesRequest(GmailRequest, Protocol):
 class MessagesResource(Protocol):
     """Protocol for Gmail messages resource."""
 
-    def list(self, user_id: str, q: str, max_results: int) -> MessagesRequest: ...
-    def get(
-        self, user_id: str, message_id: str, message_format: str
+    def list(
+        self, userId: str, q: str, maxResults: int, pageToken: str | None = None
     ) -> MessagesRequest: ...
+    def get(self, userId: str, id: str, format: str) -> MessagesRequest: ...
 
 
 class UsersResource(Protocol):
@@ -88,30 +91,53 @@ def list_emails(
     user_id: str = "me",
     query: str = "",
     logger: logging.Logger | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_pages: int | None = None,
 ) -> IntegrationResult[list[Mapping]]:
     """
     List emails matching the provided query.
 
+    Follows ``nextPageToken`` until every match has been listed, or until
+    ``max_pages`` pages have been fetched.
+
     Args:
         gmail_service: Gmail API service object.
         user_id: Gmail user ID.
         query: Gmail search query.
         logger: Optional logger instance.
+        page_size: Messages requested per page (Gmail allows at most 500).
+        max_pages: Optional limit on the number of pages to fetch.
 
     Returns:
         IntegrationResult containing a list of email message dictionaries.
     """
     logger = logger or logging.getLogger(__name__)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
     try:
-        response_obj = execute_api_request(
-            gmail_service.users()
-            .messages()
-            .list(user_id=user_id, q=query, max_results=100),
-            "Failed to list emails from Gmail",
-            "users.messages.list",
-        )
-        response = cast(GmailResponse, response_obj)
-        messages = response.get("messages", [])
+        messages: list[Mapping] = []
+        page_token: str | None = None
+        pages = 0
+        while True:
+            # Only send pageToken once there is one, so the first request
+            # matches a plain single-page listing
+            params: dict[str, object] = {
+                "userId": user_id,
+                "q": query,
+                "maxResults": page_size,
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            response_obj = execute_api_request(
+                gmail_service.users().messages().list(**params),
+                "Failed to list emails from Gmail",
+                "users.messages.list",
+            )
+            response = cast(GmailResponse, response_obj)
+            messages.extend(response.get("messages", []))
+            pages += 1
+            page_token = response.get("nextPageToken", None)
+            if not page_token or (max_pages is not None and pages >= max_pages):
+                break
         return IntegrationResult.success_result(
             content=messages,
             message=f"Listed {len(messages)} emails",
@@ -243,7 +269,7 @@ def _get_message_with_retry(
             result = execute_api_request(
                 gmail_service.users()
                 .messages()
-                .get(user_id=user_id, message_id=msg_id, message_format="full"),
+                .get(userId=user_id, id=msg_id, format="full"),
                 "Failed to get message from Gmail",
                 "users.messages.get",
             )
@@ -0,0 +1,426 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/google/mail/operations/sync.py
+# module: quack_core.integrations.google.mail.operations.sync
+# role: operations
+# neighbors: __init__.py, attachments.py, auth.py, download.py, email.py
+# exports: list_history, fetch_messages, sync_emails, MAX_BATCH_SIZE, DEFAULT_BATCH_SIZE, HISTORY_PAGE_SIZE
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Incremental sync _operations for Google Mail integration.
+
+This module pulls only the mailbox changes made since a stored history ID
+using users.history.list, then fetches the new messages with Gmail batch
+requests in bounded groups instead of one messages.get call per message.
+
+When no history ID is known, or Gmail no longer keeps history that far back
+(HTTP 404), the sync falls back to a paginated full listing and returns the
+history ID of the newest message as the starting point for the next sync.
+"""
+
+import logging
+import time
+from collections.abc import Mapping, Sequence
+from typing import cast
+
+from googleapiclient.errors import HttpError
+from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.google.mail.models import GmailSyncResult
+from quack_core.integrations.google.mail.operations.email import list_emails
+from quack_core.integrations.google.mail.protocols import GmailBatchService
+from quack_core.integrations.google.mail.utils.api import (
+    execute_api_request,
+    with_exponential_backoff,
+)
+
+# Gmail's batch endpoint accepts at most 100 calls per request, but batches
+# larger than 50 are likely to trip the per-user rate limit
+MAX_BATCH_SIZE = 100
+DEFAULT_BATCH_SIZE = 50
+
+# Largest page users.history.list will return
+HISTORY_PAGE_SIZE = 500
+
+_RETRYABLE_STATUSES = (429, 500, 503)
+
+
+def _http_status(error: BaseException | None) -> int | None:
+    """Return the HTTP status behind an error, unwrapping QuackApiError."""
+    if error is not None and not isinstance(error, HttpError):
+        error = error.__cause__
+    if isinstance(error, HttpError):
+        return getattr(error.resp, "status", None)
+    return None
+
+
+def list_history(
+    gmail_service: GmailBatchService,
+    user_id: str,
+    start_history_id: str,
+    label_id: str | None = None,
+    page_size: int = HISTORY_PAGE_SIZE,
+) -> tuple[list[str], str, int]:
+    """
+    Collect the IDs of messages added to the mailbox since a history ID.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        start_history_id: History ID to list changes after.
+        label_id: Only include messages added with this label.
+        page_size: History records requested per page (at most 500).
+
+    Returns:
+        Tuple of (message IDs in the order they were added, latest mailbox
+        history ID, number of pages fetched).
+
+    Raises:
+        QuackApiError: If a page cannot be fetched. A 404 status means the
+            start history ID has expired and a full sync is needed.
+    """
+    page_size = max(1, min(page_size, HISTORY_PAGE_SIZE))
+    message_ids: list[str] = []
+    seen: set[str] = set()
+    history_id = start_history_id
+    page_token: str | None = None
+    pages = 0
+
+    while True:
+        # googleapiclient takes the API's own camelCase parameter names
+        params: dict[str, object] = {
+            "userId": user_id,
+            "startHistoryId": start_history_id,
+            "historyTypes": ["messageAdded"],
+            "maxResults": page_size,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        if label_id:
+            params["labelId"] = label_id
+        response = cast(
+            Mapping,
+            execute_api_request(
+                gmail_service.users().history().list(**params),
+                "Failed to list Gmail history",
+                "users.history.list",
+            ),
+        )
+        pages += 1
+
+        for record in response.get("history", []):
+            for added in record.get("messagesAdded", []):
+                msg_id = added.get("message", {}).get("id")
+                if msg_id and msg_id not in seen:
+                    seen.add(msg_id)
+                    message_ids.append(msg_id)
+
+        # Every page carries the mailbox's current history ID
+        history_id = str(response.get("historyId", history_id))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return message_ids, history_id, pages
+
+
+def fetch_messages(
+    gmail_service: GmailBatchService,
+    user_id: str,
+    msg_ids: Sequence[str],
+    message_format: str = "full",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_retries: int = 5,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    logger: logging.Logger | None = None,
+) -> list[IntegrationResult[Mapping]]:
+    """
+    Fetch many messages using Gmail batch requests.
+
+    Sub-requests that fail with a retryable status (429, 500, 503) are resent
+    in a new, smaller batch with exponential backoff; the ones that succeeded
+    are not repeated.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        msg_ids: IDs of the messages to fetch.
+        message_format: Format passed to users.messages.get.
+        batch_size: Messages per batch request (capped at 100).
+        max_retries: Retry rounds for sub-requests that failed transiently.
+        initial_delay: Delay in seconds before the first retry round.
+        max_delay: Maximum delay in seconds between retry rounds.
+        logger: Optional logger instance.
+
+    Returns:
+        list[IntegrationResult]: One result per message ID, in input order.
+    """
+    results, _, _ = _fetch(
+        gmail_service,
+        user_id,
+        msg_ids,
+        message_format,
+        batch_size,
+        max_retries,
+        initial_delay,
+        max_delay,
+        logger or logging.getLogger(__name__),
+    )
+    return results
+
+
+def _fetch(
+    gmail_service: GmailBatchService,
+    user_id: str,
+    msg_ids: Sequence[str],
+    message_format: str,
+    batch_size: int,
+    max_retries: int,
+    initial_delay: float,
+    max_delay: float,
+    logger: logging.Logger,
+) -> tuple[list[IntegrationResult[Mapping]], set[int], int]:
+    """Fetch messages, also returning deleted positions and batch count."""
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+    results: list[IntegrationResult[Mapping] | None] = [None] * len(msg_ids)
+    deleted: set[int] = set()
+    batches = 0
+
+    for start in range(0, len(msg_ids), batch_size):
+        batches += _execute_chunk(
+            gmail_service,
+            user_id,
+            msg_ids,
+            list(range(start, min(start + batch_size, len(msg_ids)))),
+            message_format,
+            results,
+            deleted,
+            max_retries,
+            initial_delay,
+            max_delay,
+            logger,
+        )
+
+    return (
+        [
+            result
+            if result is not None
+            else IntegrationResult.error_result("No response for batched request")
+            for result in results
+        ],
+        deleted,
+        batches,
+    )
+
+
+def _execute_chunk(
+    gmail_service: GmailBatchService,
+    user_id: str,
+    msg_ids: Sequence[str],
+    indices: list[int],
+    message_format: str,
+    results: list[IntegrationResult[Mapping] | None],
+    deleted: set[int],
+    max_retries: int,
+    initial_delay: float,
+    max_delay: float,
+    logger: logging.Logger,
+) -> int:
+    """Send one batch, resending only the transiently failed sub-requests."""
+    # Positions still waiting for a final result, shrunk after each round
+    pending = list(indices)
+    last_errors: dict[int, Exception] = {}
+    rounds = 0
+
+    def send_round() -> None:
+        nonlocal pending, rounds
+        retry: list[int] = []
+
+        def callback(
+            request_id: str, response: object, exception: Exception | None
+        ) -> None:
+            index = int(request_id)
+            msg_id = msg_ids[index]
+            status = _http_status(exception)
+            if exception is None:
+                results[index] = IntegrationResult.success_result(
+                    content=cast(Mapping, response),
+                    message=f"Fetched message {msg_id}",
+                )
+            elif status in _RETRYABLE_STATUSES:
+                last_errors[index] = exception
+                retry.append(index)
+            else:
+                if status == 404:
+                    # Added and then deleted before we got to it
+                    deleted.add(index)
+                results[index] = IntegrationResult.error_result(
+                    f"Failed to get message {msg_id} from Gmail: {exception}"
+                )
+
+        batch = gmail_service.new_batch_http_request(callback=callback)
+        messages = gmail_service.users().messages()
+        for index in pending:
+            batch.add(
+                messages.get(
+                    userId=user_id,
+                    id=msg_ids[index],
+                    format=message_format,
+                ),
+                request_id=str(index),
+            )
+        rounds += 1
+        batch.execute()
+
+        pending = sorted(retry)
+        if pending:
+            logger.warning(
+                f"Retrying {len(pending)} of {len(indices)} batched Gmail requests"
+            )
+            # Re-raise a transient failure so with_exponential_backoff waits
+            # and calls us again with only the failed sub-requests
+            raise last_errors[pending[0]]
+
+    try:
+        with_exponential_backoff(
+            send_round,
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+        )()
+    except Exception as e:
+        logger.error(f"Batch request to Gmail failed: {e}")
+        for index in pending:
+            if results[index] is None:
+                error = last_errors.get(index, e)
+                results[index] = IntegrationResult.error_result(
+                    f"Failed to get message {msg_ids[index]} from Gmail: {error}"
+                )
+    return rounds
+
+
+def _newest_history_id(messages: Sequence[Mapping]) -> str | None:
+    """Return the highest historyId among fetched messages."""
+    history_ids = [
+        int(str(message.get("historyId")))
+        for message in messages
+        if str(message.get("historyId", "")).isdigit()
+    ]
+    return str(max(history_ids)) if history_ids else None
+
+
+def sync_emails(
+    gmail_service: GmailBatchService,
+    user_id: str = "me",
+    start_history_id: str | None = None,
+    query: str = "",
+    label_id: str | None = None,
+    message_format: str = "full",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_retries: int = 5,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    logger: logging.Logger | None = None,
+) -> IntegrationResult[GmailSyncResult]:
+    """
+    Fetch the messages added to the mailbox since the last sync.
+
+    With a ``start_history_id`` only the changes recorded after it are read.
+    Without one, or when it has expired, every message matching ``query`` is
+    listed instead. Either way the returned ``history_id`` should be stored
+    and passed back in on the next call.
+
+    Messages that fail to fetch are listed in ``failed_ids`` and can be
+    retried with :func:`fetch_messages`; the history ID still advances.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        start_history_id: History ID returned by the previous sync.
+        query: Gmail search query used for a full sync.
+        label_id: Only include messages added with this label (incremental
+            sync only).
+        message_format: Format passed to users.messages.get.
+        batch_size: Messages per batch request (capped at 100).
+        max_retries: Retry rounds for sub-requests that failed transiently.
+        initial_delay: Delay in seconds before the first retry round.
+        max_delay: Maximum delay in seconds between retry rounds.
+        logger: Optional logger instance.
+
+    Returns:
+        IntegrationResult containing a GmailSyncResult.
+    """
+    logger = logger or logging.getLogger(__name__)
+    started = time.perf_counter()
+    try:
+        full_sync = start_history_id is None
+        history_id = start_history_id
+        pages = 0
+        msg_ids: list[str] = []
+
+        if start_history_id is not None:
+            try:
+                msg_ids, history_id, pages = list_history(
+                    gmail_service, user_id, start_history_id, label_id
+                )
+            except Exception as e:
+                if _http_status(e) != 404:
+                    raise
+                logger.warning(
+                    f"History ID {start_history_id} has expired, "
+                    "falling back to a full sync"
+                )
+                full_sync = True
+
+        if full_sync:
+            list_result = list_emails(gmail_service, user_id, query, logger)
+            if not list_result.success:
+                return IntegrationResult.error_result(list_result.error)
+            # Listings are newest first; fetch oldest first, like history
+            msg_ids = [
+                str(message["id"]) for message in reversed(list_result.content or [])
+            ]
+
+        results, deleted, batches = _fetch(
+            gmail_service,
+            user_id,
+            msg_ids,
+            message_format,
+            batch_size,
+            max_retries,
+            initial_delay,
+            max_delay,
+            logger,
+        )
+        messages: list[dict[str, object]] = []
+        failed_ids: list[str] = []
+        for index, (msg_id, result) in enumerate(zip(msg_ids, results, strict=True)):
+            if result.success and result.content is not None:
+                messages.append(dict(result.content))
+            elif index not in deleted:
+                failed_ids.append(msg_id)
+
+        if full_sync:
+            # The newest message's history ID is the starting point for the
+            # next incremental sync
+            history_id = _newest_history_id(messages)
+
+        sync = GmailSyncResult(
+            history_id=history_id,
+            messages=messages,
+            failed_ids=failed_ids,
+            full_sync=full_sync,
+            history_pages=pages,
+            batch_requests=batches,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        message = f"Synced {len(messages)} new emails"
+        if failed_ids:
+            message += f", {len(failed_ids)} could not be fetched"
+            logger.warning(message)
+        else:
+            logger.info(f"{message} in {sync.elapsed_seconds:.2f}s")
+        return IntegrationResult.success_result(content=sync, message=message)
+    except Exception as e:
+        logger.error(f"Failed to sync emails: {e}")
+        return IntegrationResult.error_result(f"Failed to sync emails: {e}")
@@ -2,8 +2,8 @@
 # path: quack-core/src/quack_core/integrations/google/mail/protocols.py
 # module: quack_core.integrations.google.mail.protocols
 # role: protocols
-# neighbors: __init__.py, service.py, config.py
-# exports: GoogleCredentials, GmailRequest, GmailAttachmentsResource, GmailMessagesResource, GmailUsersResource, GmailService
+# neighbors: __init__.py, service.py, config.py, models.py
+# exports: GoogleCredentials, GmailRequest, GmailAttachmentsResource, GmailMessagesResource, GmailHistoryResource, GmailUsersResource, GmailSyncUsersResource, GmailService (+2 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -15,6 +15,7 @@ This module defines protocol classes for Gmail services and resources,
 ensuring proper typing throughout the codebase and avoiding the use of Any.
 """
 
+from collections.abc import Callable
 from typing import Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")  # Generic type for result content
@@ -73,31 +74,30 @@ class GmailMessagesResource(Protocol):
     """Protocol for Gmail messages resource."""
 
     def list(
-        self, user_id: str, q: str, max_results: int
+        self, userId: str, q: str, maxResults: int, pageToken: str | None = None
     ) -> GmailRequest[dict[str, list[dict[str, object]]]]:
         """
         List messages.
 
         Args:
-            user_id: Gmail user ID.
+            userId: Gmail user ID.
             q: Query string.
-            max_results: Maximum number of results.
+            maxResults: Maximum number of results.
+            pageToken: Token of the page to fetch, from ``nextPageToken``.
 
         Returns:
             GmailRequest: Request object for listing messages.
         """
         ...
 
-    def get(
-        self, user_id: str, message_id: str, message_format: str
-    ) -> GmailRequest[dict[str, object]]:
+    def get(self, userId: str, id: str, format: str) -> GmailRequest[dict[str, object]]:
         """
         Get a message.
 
         Args:
-            user_id: Gmail user ID.
-            message_id: Message ID.
-            message_format: Message format.
+            userId: Gmail user ID.
+            id: Message ID.
+            format: Message format.
 
         Returns:
             GmailRequest: Request object for getting a message.
@@ -114,6 +114,36 @@ class GmailMessagesResource(Protocol):
         ...
 
 
+@runtime_checkable
+class GmailHistoryResource(Protocol):
+    """Protocol for Gmail history resource."""
+
+    def list(
+        self,
+        userId: str,
+        startHistoryId: str,
+        historyTypes: list[str],
+        maxResults: int,
+        pageToken: str | None = None,
+        labelId: str | None = None,
+    ) -> GmailRequest[dict[str, object]]:
+        """
+        List mailbox changes since a history ID.
+
+        Args:
+            userId: Gmail user ID.
+            startHistoryId: History ID to list changes after.
+            historyTypes: Kinds of change to return (e.g. ``messageAdded``).
+            maxResults: Maximum number of history records per page.
+            pageToken: Token of the page to fetch, from ``nextPageToken``.
+            labelId: Only return changes to messages with this label.
+
+        Returns:
+            GmailRequest: Request object for listing history records.
+        """
+        ...
+
+
 @runtime_checkable
 class GmailUsersResource(Protocol):
     """Protocol for Gmail users resource."""
@@ -140,3 +170,70 @@ class GmailService(Protocol):
             GmailUsersResource: Users resource.
         """
         ...
+
+
+@runtime_checkable
+class GmailSyncUsersResource(GmailUsersResource, Protocol):
+    """Protocol for a Gmail users resource that exposes mailbox history."""
+
+    def history(self) -> GmailHistoryResource:
+        """
+        Get history resource.
+
+        Returns:
+            GmailHistoryResource: History resource.
+        """
+        ...
+
+
+@runtime_checkable
+class GmailBatchHttpRequest(Protocol):
+    """Protocol for a Google API batch request envelope."""
+
+    def add(
+        self,
+        request: GmailRequest[object],
+        callback: Callable[[str, object, Exception | None], None] | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        """
+        Add a request to the batch.
+
+        Args:
+            request: Request to send as part of the batch.
+            callback: Called with (request_id, response, exception).
+            request_id: Identifier passed back to the callback.
+        """
+        ...
+
+    def execute(self) -> None:
+        """Send every request in the batch in a single HTTP round trip."""
+        ...
+
+
+@runtime_checkable
+class GmailBatchService(GmailService, Protocol):
+    """Protocol for a Gmail service that supports history and batch requests."""
+
+    def users(self) -> GmailSyncUsersResource:
+        """
+        Get users resource.
+
+        Returns:
+            GmailSyncUsersResource: Users resource.
+        """
+        ...
+
+    def new_batch_http_request(
+        self, callback: Callable[[str, object, Exception | None], None] | None = None
+    ) -> GmailBatchHttpRequest:
+        """
+        Create a batch request envelope.
+
+        Args:
+            callback: Default callback for requests added without one.
+
+        Returns:
+            GmailBatchHttpRequest: The empty batch.
+        """
+        ...
@@ -2,14 +2,19 @@
 # path: quack-core/src/quack_core/integrations/google/mail/service.py
 # module: quack_core.integrations.google.mail.service
 # role: service
-# neighbors: __init__.py, protocols.py, config.py
-# exports: GoogleMailService
+# neighbors: __init__.py, protocols.py, config.py, models.py
+# exports: GoogleMailService, SYNC_STATE_FILENAME, DEFAULT_DOWNLOAD_WORKERS
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
 
+import json
 import logging
+import os
+import threading
+import time
 from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from types import NoneType
 from typing import cast
 
@@ -18,8 +23,19 @@ from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.google.auth import GoogleAuthProvider
 from quack_core.integrations.google.config import GoogleConfigProvider
 from quack_core.integrations.google.mail.config import GmailServiceConfig
-from quack_core.integrations.google.mail.operations import auth, email
+from quack_core.integrations.google.mail.models import (
+    GmailDownload,
+    GmailDownloadBatch,
+    GmailSyncResult,
+)
+from quack_core.integrations.google.mail.operations import (
+    auth,
+    download,
+    email,
+    sync,
+)
 from quack_core.integrations.google.mail.protocols import (
+    GmailBatchService,
     GmailService,
     GoogleCredentials,
 )
@@ -27,6 +43,11 @@ from quack_core.lib.errors import QuackIntegrationError
 from quack_core.lib.fs import service as fs
 from quack_core.lib.paths import service as paths
 
+# Default sync state file, stored alongside downloaded emails
+SYNC_STATE_FILENAME = ".gmail_sync_state.json"
+
+DEFAULT_DOWNLOAD_WORKERS = 4
+
 
 class GoogleMailService(BaseIntegrationService):
     """Integration service for Google Mail (Gmail)."""
@@ -315,6 +336,246 @@ class GoogleMailService(BaseIntegrationService):
                 f"Failed to download email {msg_id}: {e}"
             )
 
+    def download_emails(
+        self, msg_ids: Sequence[str], max_workers: int | None = None
+    ) -> GmailDownloadBatch:
+        """
+        Download several Gmail messages concurrently.
+
+        Messages are fetched and saved by a bounded pool of worker threads,
+        each with its own Gmail client. Attachments are decoded straight to
+        disk and any attachment whose content is already stored in the
+        storage directory is linked to the existing file rather than written
+        again.
+
+        Args:
+            msg_ids: The Gmail message IDs.
+            max_workers: Concurrent downloads (defaults to the
+                ``download_workers`` config value, or 4).
+
+        Returns:
+            GmailDownloadBatch: Per-message results and throughput summary.
+        """
+        if init_error := self._ensure_initialized():
+            return GmailDownloadBatch(
+                results=[init_error for _ in msg_ids],
+                failed=len(msg_ids),
+                failed_indices=list(range(len(msg_ids))),
+            )
+        if self.storage_path is None:
+            error = IntegrationResult.error_result("Storage path not initialized")
+            return GmailDownloadBatch(
+                results=[error for _ in msg_ids],
+                failed=len(msg_ids),
+                failed_indices=list(range(len(msg_ids))),
+            )
+
+        user_id_value: object = self.config.get("gmail_user_id", "me")
+        user_id: str = str(user_id_value) if user_id_value is not None else "me"
+        include_subject = bool(self.config.get("include_subject", self.include_subject))
+        include_sender = bool(self.config.get("include_sender", self.include_sender))
+        max_retries = self._safe_cast_int(
+            self.config.get("max_retries", self.max_retries), self.max_retries
+        )
+        initial_delay = self._safe_cast_float(
+            self.config.get("initial_delay", self.initial_delay), self.initial_delay
+        )
+        max_delay = self._safe_cast_float(
+            self.config.get("max_delay", self.max_delay), self.max_delay
+        )
+        max_workers = max_workers or self._safe_cast_int(
+            self.config.get("download_workers", DEFAULT_DOWNLOAD_WORKERS),
+            DEFAULT_DOWNLOAD_WORKERS,
+        )
+
+        index = download.AttachmentIndex.load(self.storage_path)
+        local = threading.local()
+
+        def download_one(msg_id: str) -> IntegrationResult[GmailDownload]:
+            # Gmail clients are not thread-safe, so each worker builds its own
+            try:
+                service = getattr(local, "service", None)
+                if service is None:
+                    service = local.service = self._build_thread_service()
+            except Exception as e:
+                self.logger.error(f"Failed to create Gmail client: {e}")
+                return IntegrationResult.error_result(
+                    f"Failed to download email {msg_id}: {e}"
+                )
+            return download.download_message(
+                service,
+                user_id,
+                msg_id,
+                index,
+                include_subject,
+                include_sender,
+                max_retries,
+                initial_delay,
+                max_delay,
+                self.logger,
+            )
+
+        started = time.monotonic()
+        if msg_ids:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(msg_ids))),
+                thread_name_prefix="gmail-download",
+            ) as pool:
+                results = list(pool.map(download_one, msg_ids))
+        else:
+            results = []
+        elapsed = time.monotonic() - started
+
+        try:
+            index.save()
+        except OSError as e:
+            self.logger.warning(f"Could not save attachment index: {e}")
+
+        failed_indices = [i for i, result in enumerate(results) if not result.success]
+        saved = [result.content for result in results if result.success]
+        batch = GmailDownloadBatch(
+            results=results,
+            succeeded=len(results) - len(failed_indices),
+            failed=len(failed_indices),
+            failed_indices=failed_indices,
+            total_bytes=sum(item.bytes_written for item in saved),
+            deduplicated=sum(item.deduplicated for item in saved),
+            elapsed_seconds=elapsed,
+        )
+        self.logger.info(
+            f"Downloaded {batch.succeeded}/{len(results)} emails "
+            f"({batch.total_bytes / 1_000_000:.1f} MB, "
+            f"{batch.deduplicated} duplicate attachments skipped) in {elapsed:.1f}s, "
+            f"{batch.messages_per_second:.1f} emails/s, "
+            f"{batch.bytes_per_second / 1_000_000:.2f} MB/s"
+        )
+        return batch
+
+    def _build_thread_service(self) -> GmailService:
+        """Build a Gmail client for use by a single worker thread."""
+        if self.auth_provider is None:
+            raise QuackIntegrationError("Gmail credentials are not initialized", {})
+        return auth.initialize_gmail_service(
+            cast(GoogleCredentials, self.auth_provider.get_credentials())
+        )
+
+    def sync_emails(
+        self,
+        query: str | None = None,
+        history_id: str | None = None,
+        label_id: str | None = None,
+        message_format: str = "full",
+    ) -> IntegrationResult[GmailSyncResult]:
+        """
+        Fetch the messages added since the last sync.
+
+        The history ID reached by each successful sync is stored in the sync
+        state file, so repeated calls only read mailbox changes. The first
+        sync, or one whose history ID has expired, lists every message
+        matching the query instead.
+
+        Args:
+            query: Gmail search query for a full sync. If not provided, a
+                default query is built using the configured parameters.
+            history_id: History ID to sync from instead of the stored one.
+            label_id: Only include messages added with this label ID.
+            message_format: Format passed to users.messages.get.
+
+        Returns:
+            IntegrationResult containing a GmailSyncResult.
+        """
+        if init_error := self._ensure_initialized():
+            return init_error
+
+        try:
+            if query is None:
+                days_back_value: object = self.config.get("gmail_days_back", 7)
+                days_back: int = self._safe_cast_int(days_back_value, 7)
+
+                labels_value: object = self.config.get("gmail_labels", [])
+                labels: list[str] | None = self._convert_to_string_list(labels_value)
+
+                query = email.build_query(days_back, labels)
+
+            user_id_value: object = self.config.get("gmail_user_id", "me")
+            user_id: str = str(user_id_value) if user_id_value is not None else "me"
+
+            if self.gmail_service is None:
+                return IntegrationResult.error_result(
+                    "Gmail service is not initialized"
+                )
+
+            if history_id is None:
+                history_id = self._load_history_id(user_id)
+
+            batch_size: int = self._safe_cast_int(
+                self.config.get("sync_batch_size", sync.DEFAULT_BATCH_SIZE),
+                sync.DEFAULT_BATCH_SIZE,
+            )
+            result = sync.sync_emails(
+                cast(GmailBatchService, self.gmail_service),
+                user_id,
+                history_id,
+                query,
+                label_id,
+                message_format,
+                batch_size,
+                self._safe_cast_int(
+                    self.config.get("max_retries", self.max_retries), self.max_retries
+                ),
+                self._safe_cast_float(
+                    self.config.get("initial_delay", self.initial_delay),
+                    self.initial_delay,
+                ),
+                self._safe_cast_float(
+                    self.config.get("max_delay", self.max_delay), self.max_delay
+                ),
+                self.logger,
+            )
+            if result.success and result.content and result.content.history_id:
+                self._save_history_id(user_id, result.content.history_id)
+            return result
+        except Exception as e:
+            self.logger.error(f"Failed to sync emails: {e}")
+            return IntegrationResult.error_result(f"Failed to sync emails: {e}")
+
+    def _sync_state_path(self) -> str:
+        """Return the path of the file holding the last synced history IDs."""
+        state_file: object = self.config.get("sync_state_file")
+        if isinstance(state_file, str) and state_file:
+            return state_file
+        return os.path.join(self.storage_path or ".", SYNC_STATE_FILENAME)
+
+    def _read_sync_state(self) -> dict[str, str]:
+        """Read the stored history IDs, keyed by Gmail user ID."""
+        read_result = fs.read_text(self._sync_state_path(), encoding="utf-8")
+        if not read_result.success or not read_result.content:
+            return {}
+        try:
+            state = json.loads(read_result.content)
+        except ValueError:
+            self.logger.warning("Ignoring unreadable Gmail sync state file")
+            return {}
+        if not isinstance(state, dict):
+            return {}
+        return {str(key): str(value) for key, value in state.items()}
+
+    def _load_history_id(self, user_id: str) -> str | None:
+        """Return the history ID stored by the last sync for a user."""
+        return self._read_sync_state().get(user_id)
+
+    def _save_history_id(self, user_id: str, history_id: str) -> None:
+        """Store the history ID reached by a sync for a user."""
+        state = self._read_sync_state()
+        state[user_id] = history_id
+        write_result = fs.write_text(
+            self._sync_state_path(), json.dumps(state, indent=2), encoding="utf-8"
+        )
+        if not write_result.success:
+            self.logger.warning(
+                f"Could not store Gmail sync state: {write_result.error}"
+            )
+
     def _validate_and_convert_config(self) -> None:
         """
         Validate configuration values and convert them to the appropriate types.
@@ -327,7 +588,12 @@ class GoogleMailService(BaseIntegrationService):
                 self.config[key] = str(self.config[key])
 
         # Convert integer fields.
-        for key in ("max_retries", "gmail_days_back"):
+        for key in (
+            "max_retries",
+            "gmail_days_back",
+            "sync_batch_size",
+            "download_workers",
+        ):
             if key in self.config:
                 self.config[key] = self._safe_cast_int(self.config[key], 0)
 
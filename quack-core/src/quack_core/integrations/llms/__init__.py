@@ -17,6 +17,7 @@ LLM providers.
 """
 
 from quack_core.integrations.core.protocols import IntegrationProtocol
+from quack_core.integrations.llms.cache import ResponseCache, ResponseCacheConfig
 from quack_core.integrations.llms.clients import (
     LLMClient,
     MockLLMClient,
@@ -27,6 +28,7 @@ from quack_core.integrations.llms.clients.openai import OpenAIClient
 from quack_core.integrations.llms.config import LLMConfig, LLMConfigProvider
 from quack_core.integrations.llms.fallback import FallbackConfig, FallbackLLMClient
 from quack_core.integrations.llms.models import (
+    ChatBatchResult,
     ChatMessage,
     FunctionCall,
     LLMOptions,
@@ -34,6 +36,7 @@ from quack_core.integrations.llms.models import (
     ToolCall,
 )
 from quack_core.integrations.llms.protocols import LLMProviderProtocol
+from quack_core.integrations.llms.rate_limit import RateLimiter
 from quack_core.integrations.llms.registry import (
     get_llm_client,
     register_llm_client,
@@ -51,7 +54,12 @@ __all__ = [
     "LLMConfig",
     "LLMConfigProvider",
     "FallbackConfig",
+    "ResponseCacheConfig",
+    # Caching and rate limiting
+    "ResponseCache",
+    "RateLimiter",
     # Models
+    "ChatBatchResult",
     "ChatMessage",
     "FunctionCall",
     "LLMOptions",
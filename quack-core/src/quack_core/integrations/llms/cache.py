@@ -0,0 +1,319 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/llms/cache.py
+# module: quack_core.integrations.llms.cache
+# role: module
+# neighbors: __init__.py, models.py, protocols.py, config.py, registry.py, fallback.py
+# exports: ResponseCacheConfig, CacheTier, MemoryCache, SQLiteCache, ResponseCache, make_cache_key
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Response cache for LLM clients.
+
+Pipelines often re-send identical prompts (re-processing the same transcript,
+retrying a failed batch). LLMClient.chat consults a ResponseCache before
+calling the provider and stores successful completions afterwards.
+
+The cache has two tiers: an in-memory LRU with TTL, and an optional on-disk
+SQLite tier that survives restarts. Entries are keyed on a stable hash of the
+normalized messages, the model and the options that affect the completion.
+Calls whose output is not reproducible (sampling without a seed, streaming)
+bypass the cache.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+from quack_core.integrations.llms.models import ChatMessage, LLMOptions
+
+# LLMOptions fields that change what the provider returns. Transport settings
+# (timeout, retries, stream) are deliberately left out of the key.
+_KEY_OPTION_FIELDS = (
+    "model",
+    "temperature",
+    "seed",
+    "max_tokens",
+    "top_p",
+    "frequency_penalty",
+    "presence_penalty",
+    "stop",
+    "functions",
+    "tools",
+    "response_format",
+)
+
+
+class ResponseCacheConfig(BaseModel):
+    """Configuration for the LLM response cache."""
+
+    enabled: bool = Field(False, description="Whether to cache chat responses")
+    max_entries: int = Field(
+        1024, ge=1, description="Maximum number of entries in the memory tier"
+    )
+    ttl_seconds: float | None = Field(
+        86400.0, description="Entry lifetime in seconds (None for no expiry)"
+    )
+    path: str | None = Field(
+        None, description="SQLite file for the on-disk tier (None to disable it)"
+    )
+    cache_sampled: bool = Field(
+        False,
+        description="Also cache calls that sample (temperature > 0) without a seed",
+    )
+
+
+def make_cache_key(messages: Sequence[ChatMessage], options: LLMOptions) -> str:
+    """
+    Build a stable cache key for a chat request.
+
+    Args:
+        messages: Normalized messages for the conversation
+        options: Request options (options.model should already be resolved)
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical request
+    """
+    payload = {
+        "messages": [
+            message.model_dump(mode="json", exclude_none=True) for message in messages
+        ],
+        "options": options.model_dump(
+            mode="json", include=set(_KEY_OPTION_FIELDS), exclude_none=True
+        ),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CacheTier(ABC):
+    """A key/value store for cached completions."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Return the cached value, or None if missing or expired."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store a value."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+
+class MemoryCache(CacheTier):
+    """Thread-safe in-memory LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Entry lifetime in seconds (None for no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCache(CacheTier):
+    """On-disk cache tier backed by a single SQLite table."""
+
+    def __init__(self, path: str | Path, ttl_seconds: float | None = None):
+        """
+        Args:
+            path: Database file path (created if missing)
+            ttl_seconds: Entry lifetime in seconds (None for no expiry)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    Two-tier response cache with hit/miss counters.
+
+    Lookups check memory first, then disk; a disk hit is promoted into
+    memory. Writes go to both tiers.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryCache | None = None,
+        disk: CacheTier | None = None,
+        cache_sampled: bool = False,
+    ) -> None:
+        """
+        Args:
+            memory: In-memory tier (a default MemoryCache if omitted)
+            disk: Optional persistent tier
+            cache_sampled: Also cache sampled calls without a seed
+        """
+        self.memory = memory if memory is not None else MemoryCache()
+        self.disk = disk
+        self.cache_sampled = cache_sampled
+
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "memory_hits": 0,
+                          "disk_hits": 0, "bypassed": 0}
+
+    @classmethod
+    def from_config(cls, config: ResponseCacheConfig) -> "ResponseCache":
+        """Build a cache from its configuration model."""
+        disk = SQLiteCache(config.path, config.ttl_seconds) if config.path else None
+        return cls(
+            memory=MemoryCache(config.max_entries, config.ttl_seconds),
+            disk=disk,
+            cache_sampled=config.cache_sampled,
+        )
+
+    def is_cacheable(
+        self,
+        options: LLMOptions,
+        callback: Callable[[str], None] | None = None,
+    ) -> bool:
+        """
+        Whether a request's response may be served from or stored in the cache.
+
+        Streaming calls are never cached because the callback would not fire
+        on a hit. Sampling without a seed is only cached if cache_sampled is set.
+        """
+        if callback is not None or options.stream:
+            return False
+        if options.temperature > 0 and options.seed is None:
+            return self.cache_sampled
+        return True
+
+    def get(self, key: str) -> str | None:
+        """Look up a key, updating the hit/miss counters."""
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("hits", "memory_hits")
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self._count("hits", "disk_hits")
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value in every tier."""
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def record_bypass(self) -> None:
+        """Count a request that skipped the cache."""
+        self._count("bypassed")
+
+    def clear(self) -> None:
+        """Empty every tier (counters are kept)."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of the cache counters.
+
+        Returns:
+            dict: hits, misses, memory_hits, disk_hits, bypassed, hit_rate
+                and the current memory tier size
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._counters)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["memory_entries"] = len(self.memory)
+        return stats
+
+    def _count(self, *names: str) -> None:
+        with self._lock:
+            for name in names:
+                self._counters[name] += 1
@@ -9,6 +9,7 @@
 # === QV-LLM:END ===
 
 
+import asyncio
 import logging
 import os
 import sys
@@ -62,6 +63,10 @@ class AnthropicClient(LLMClient):
         )
         self._api_base = api_base
         self._client = None
+        # The SDK's httpx pool is bound to the event loop it was first used
+        # on, so keep that loop and rebuild the client for a different one
+        self._async_client = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
 
         # Skip dependency check if we're in a test environment with mocks
         if not self._is_test_environment():
@@ -143,6 +148,56 @@ class AnthropicClient(LLMClient):
 
         return self._client
 
+    def _get_async_client(self) -> Any:
+        """
+        Get an AsyncAnthropic client for the running event loop.
+
+        Returns:
+            Any: AsyncAnthropic client instance
+
+        Raises:
+            QuackIntegrationError: If Anthropic package is not installed
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            try:
+                from anthropic import AsyncAnthropic
+            except ImportError as e:
+                raise QuackIntegrationError(
+                    "Anthropic package not installed. "
+                    "Please install it with: pip install anthropic",
+                    original_error=e,
+                ) from e
+
+            try:
+                api_key = self._api_key or self._get_api_key_from_env()
+
+                kwargs = {}
+                if self._api_base:
+                    kwargs["base_url"] = self._api_base
+
+                self._async_client = AsyncAnthropic(api_key=api_key, **kwargs)
+                self._async_client_loop = loop
+            except Exception as e:
+                self.logger.error(f"Error initializing async Anthropic client: {e}")
+                raise QuackIntegrationError(
+                    f"Failed to initialize async Anthropic client: {e}",
+                    original_error=e,
+                ) from e
+
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async Anthropic client, if one was opened."""
+        if self._async_client is not None:
+            client, loop = self._async_client, self._async_client_loop
+            self._async_client = None
+            self._async_client_loop = None
+            # Connections opened on another, possibly closed, loop cannot be
+            # closed from here; they are dropped with the client
+            if loop is asyncio.get_running_loop():
+                await client.close()
+
     def _get_api_key_from_env(self) -> str:
         """
         Get the Anthropic API key from environment variables.
@@ -343,23 +398,10 @@ class AnthropicClient(LLMClient):
         try:
             client = self._get_client()
 
-            # Convert messages to the format expected by Anthropic
-            system_message = None
-            anthropic_messages = []
-
-            for msg in messages:
-                if msg.role == RoleType.SYSTEM:
-                    system_message = msg.content
-                else:
-                    anthropic_messages.append(self._convert_message_to_anthropic(msg))
-
-            # Prepare parameters for Anthropic API call
-            params = {
-                "top_p": options.top_p,
-            }
-
-            if options.stop:
-                params["stop_sequences"] = options.stop
+            # Convert messages and options to the format expected by Anthropic
+            system_message, anthropic_messages, params = self._prepare_request(
+                messages, options
+            )
 
             # Override model if specified in options
             model = options.model or self.model
@@ -386,24 +428,121 @@ class AnthropicClient(LLMClient):
                 )
 
                 # Process the response
-                if (
-                    hasattr(response, "content")
-                    and len(response.content) > 0
-                    and hasattr(response.content[0], "text")
-                ):
-                    result = response.content[0].text
-                elif hasattr(response, "text"):
-                    result = response.text
-                else:
-                    # Fallback for mocks or unexpected response formats
-                    result = str(response)
-
-                return IntegrationResult.success_result(result)
+                return IntegrationResult.success_result(
+                    self._extract_response_text(response)
+                )
 
         except Exception as e:
             # Convert Anthropic errors to QuackApiError
             raise self._convert_error(e)
 
+    async def _achat_with_provider(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Send a chat completion request using the async Anthropic SDK.
+
+        Args:
+            messages: List of messages for the conversation
+            options: Additional options for the completion request
+            callback: Optional callback function for streaming responses
+
+        Returns:
+            IntegrationResult[str]: Result of the chat completion request
+
+        Raises:
+            QuackIntegrationError: If Anthropic package is not installed
+            QuackApiError: If there's an error with the Anthropic API
+        """
+        client = self._get_async_client()
+
+        try:
+            system_message, anthropic_messages, params = self._prepare_request(
+                messages, options
+            )
+            request = {
+                "model": options.model or self.model,
+                "messages": anthropic_messages,
+                "max_tokens": options.max_tokens or 1024,
+                "temperature": options.temperature,
+                **params,
+            }
+            if system_message is not None:
+                request["system"] = system_message
+
+            if callback or options.stream:
+                collected_content = []
+                async with client.messages.stream(**request) as stream:
+                    async for text in stream.text_stream:
+                        collected_content.append(text)
+                        if callback:
+                            callback(text)
+                return IntegrationResult.success_result("".join(collected_content))
+
+            response = await client.messages.create(**request)
+            return IntegrationResult.success_result(
+                self._extract_response_text(response)
+            )
+
+        except Exception as e:
+            raise self._convert_error(e)
+
+    def _prepare_request(
+        self, messages: list[ChatMessage], options: LLMOptions
+    ) -> tuple[str | None, list[dict], dict]:
+        """
+        Split out the system prompt and build Anthropic request parameters.
+
+        Args:
+            messages: List of messages for the conversation
+            options: Additional options for the completion request
+
+        Returns:
+            tuple: System message, messages in Anthropic format, and extra
+            API parameters
+        """
+        system_message = None
+        anthropic_messages = []
+
+        for msg in messages:
+            if msg.role == RoleType.SYSTEM:
+                system_message = msg.content
+            else:
+                anthropic_messages.append(self._convert_message_to_anthropic(msg))
+
+        params = {
+            "top_p": options.top_p,
+        }
+
+        if options.stop:
+            params["stop_sequences"] = options.stop
+
+        return system_message, anthropic_messages, params
+
+    def _extract_response_text(self, response: Any) -> str:
+        """
+        Get the completion text from a messages.create response.
+
+        Args:
+            response: Anthropic API response
+
+        Returns:
+            str: Completion text
+        """
+        if (
+            hasattr(response, "content")
+            and len(response.content) > 0
+            and hasattr(response.content[0], "text")
+        ):
+            return response.content[0].text
+        if hasattr(response, "text"):
+            return response.text
+        # Fallback for mocks or unexpected response formats
+        return str(response)
+
     def _count_tokens_with_provider(
         self, messages: list[ChatMessage]
     ) -> IntegrationResult[int]:
@@ -15,6 +15,7 @@ This module provides the abstract base class for all LLM clients with common
 functionality for handling requests, retries, and error handling.
 """
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -22,8 +23,10 @@ from collections.abc import Callable, Sequence
 from typing import Any
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.llms.cache import ResponseCache, make_cache_key
 from quack_core.integrations.llms.models import ChatMessage, LLMOptions
 from quack_core.integrations.llms.protocols import LLMProviderProtocol
+from quack_core.integrations.llms.rate_limit import RateLimiter, estimate_request_tokens
 from quack_core.lib.errors import QuackApiError, QuackIntegrationError
 
 
@@ -39,6 +42,8 @@ class LLMClient(ABC, LLMProviderProtocol):
         initial_retry_delay: float = 1.0,
         max_retry_delay: float = 30.0,
         log_level: int = logging.INFO,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -52,6 +57,8 @@ class LLMClient(ABC, LLMProviderProtocol):
             initial_retry_delay: Initial delay for exponential backoff
             max_retry_delay: Maximum delay between retries
             log_level: Logging level
+            cache: Optional response cache consulted before calling the provider
+            rate_limiter: Optional client-side limiter applied to every provider call
             **kwargs: Additional provider-specific arguments
         """
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -63,6 +70,8 @@ class LLMClient(ABC, LLMProviderProtocol):
         self._retry_count = retry_count
         self._initial_retry_delay = initial_retry_delay
         self._max_retry_delay = max_retry_delay
+        self._cache = cache
+        self._rate_limiter = rate_limiter
         self._kwargs = kwargs
 
     @property
@@ -80,6 +89,16 @@ class LLMClient(ABC, LLMProviderProtocol):
             raise ValueError("Model name not specified")
         return self._model
 
+    @property
+    def cache(self) -> ResponseCache | None:
+        """
+        Get the response cache, if one is configured.
+
+        Returns:
+            ResponseCache | None: The cache used by chat()
+        """
+        return self._cache
+
     def chat(
         self,
         messages: Sequence[ChatMessage] | Sequence[dict],
@@ -90,7 +109,9 @@ class LLMClient(ABC, LLMProviderProtocol):
         Send a chat completion request to the LLM.
 
         This method normalizes the messages, calls the provider-specific
-        implementation, and applies retry logic for failed requests.
+        implementation, and applies retry logic for failed requests. If a
+        response cache is configured, deterministic requests are answered
+        from it when possible and successful responses are stored in it.
 
         Args:
             messages: Sequence of messages for the conversation
@@ -101,21 +122,16 @@ class LLMClient(ABC, LLMProviderProtocol):
             IntegrationResult[str]: Result of the chat completion request
         """
         try:
-            # Validate inputs
-            if not messages:
-                raise QuackIntegrationError("No messages provided for chat request")
-
-            # Normalize messages
-            normalized_messages = self._normalize_messages(messages)
+            normalized_messages, request_options = self._prepare_chat(
+                messages, options
+            )
 
-            # Use default options if not provided
-            request_options = options or LLMOptions()
-            if request_options.model is None:
-                # Override with instance model if not specified in options
-                try:
-                    request_options.model = self.model
-                except ValueError:
-                    pass  # If model is not specified, let the concrete implementation handle it
+            # Serve repeated deterministic requests from the cache
+            cache_key, cached = self._check_cache(
+                normalized_messages, request_options, callback
+            )
+            if cached is not None:
+                return cached
 
             # Apply retry logic
             retry_count = 0
@@ -123,9 +139,14 @@ class LLMClient(ABC, LLMProviderProtocol):
 
             while True:
                 try:
-                    return self._chat_with_provider(
+                    wait = self._reserve_rate_limit(normalized_messages, request_options)
+                    if wait > 0:
+                        time.sleep(wait)
+                    result = self._chat_with_provider(
                         normalized_messages, request_options, callback
                     )
+                    self._store_in_cache(cache_key, result)
+                    return result
                 except QuackApiError as e:
                     retry_count += 1
                     if retry_count > self._retry_count:
@@ -140,17 +161,184 @@ class LLMClient(ABC, LLMProviderProtocol):
                     time.sleep(delay)
                     delay = min(delay * 2, self._max_retry_delay)
 
-        except QuackApiError as e:
+        except Exception as e:
+            return self._chat_error_result(e)
+
+    async def achat(
+        self,
+        messages: Sequence[ChatMessage] | Sequence[dict],
+        options: LLMOptions | None = None,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Send a chat completion request to the LLM without blocking the event loop.
+
+        Async counterpart of chat(): same normalization, caching and error
+        handling, with retries backing off via asyncio.sleep.
+
+        Args:
+            messages: Sequence of messages for the conversation
+            options: Additional options for the completion request
+            callback: Optional callback function for streaming responses
+
+        Returns:
+            IntegrationResult[str]: Result of the chat completion request
+        """
+        try:
+            normalized_messages, request_options = self._prepare_chat(
+                messages, options
+            )
+
+            cache_key, cached = self._check_cache(
+                normalized_messages, request_options, callback
+            )
+            if cached is not None:
+                return cached
+
+            retry_count = 0
+            delay = self._initial_retry_delay
+
+            while True:
+                try:
+                    wait = self._reserve_rate_limit(normalized_messages, request_options)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    result = await self._achat_with_provider(
+                        normalized_messages, request_options, callback
+                    )
+                    self._store_in_cache(cache_key, result)
+                    return result
+                except QuackApiError as e:
+                    retry_count += 1
+                    if retry_count > self._retry_count:
+                        raise
+
+                    self.logger.warning(
+                        f"Retrying chat request ({retry_count}/{self._retry_count}) after error: {e}"
+                    )
+
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._max_retry_delay)
+
+        except Exception as e:
+            return self._chat_error_result(e)
+
+    def _prepare_chat(
+        self,
+        messages: Sequence[ChatMessage] | Sequence[dict],
+        options: LLMOptions | None,
+    ) -> tuple[list[ChatMessage], LLMOptions]:
+        """
+        Validate and normalize the inputs of a chat request.
+
+        Args:
+            messages: Sequence of messages for the conversation
+            options: Additional options for the completion request
+
+        Returns:
+            tuple[list[ChatMessage], LLMOptions]: Normalized messages and
+            options with the model resolved
+
+        Raises:
+            QuackIntegrationError: If no messages are provided or they cannot
+                be normalized
+        """
+        # Validate inputs
+        if not messages:
+            raise QuackIntegrationError("No messages provided for chat request")
+
+        # Normalize messages
+        normalized_messages = self._normalize_messages(messages)
+
+        # Use default options if not provided
+        request_options = options or LLMOptions()
+        if request_options.model is None:
+            # Override with instance model if not specified in options
+            try:
+                request_options.model = self.model
+            except ValueError:
+                pass  # If model is not specified, let the concrete implementation handle it
+
+        return normalized_messages, request_options
+
+    def _check_cache(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None,
+    ) -> tuple[str | None, IntegrationResult[str] | None]:
+        """
+        Look a request up in the response cache.
+
+        Returns:
+            tuple: The cache key (None if the request is not cacheable) and
+            the cached result (None on a miss)
+        """
+        if self._cache is None:
+            return None, None
+
+        if not self._cache.is_cacheable(options, callback):
+            self._cache.record_bypass()
+            return None, None
+
+        cache_key = make_cache_key(messages, options)
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        self.logger.debug("Returning cached chat response")
+        return cache_key, IntegrationResult.success_result(
+            content=cached, message="Cached response"
+        )
+
+    def _reserve_rate_limit(
+        self, messages: list[ChatMessage], options: LLMOptions
+    ) -> float:
+        """
+        Reserve rate-limit capacity for one provider call.
+
+        Returns:
+            float: Seconds to wait before calling the provider
+        """
+        if self._rate_limiter is None:
+            return 0.0
+        delay = self._rate_limiter.reserve(estimate_request_tokens(messages, options))
+        if delay > 0:
+            self.logger.debug(f"Rate limit reached, waiting {delay:.2f}s")
+        return delay
+
+    def _store_in_cache(
+        self, cache_key: str | None, result: IntegrationResult[str]
+    ) -> None:
+        """Store a successful response under cache_key, if there is one."""
+        if (
+            self._cache is not None
+            and cache_key is not None
+            and result.success
+            and result.content
+        ):
+            self._cache.set(cache_key, result.content)
+
+    def _chat_error_result(self, error: Exception) -> IntegrationResult[str]:
+        """
+        Map an exception raised during a chat request to an error result.
+
+        Args:
+            error: The exception
+
+        Returns:
+            IntegrationResult[str]: Error result describing the failure
+        """
+        if isinstance(error, QuackApiError):
             # Handle API-specific errors (rate limits, authentication, etc.)
-            self.logger.error(f"API error during chat request: {e}")
-            return IntegrationResult.error_result(f"API error: {e}")
-        except QuackIntegrationError as e:
+            self.logger.error(f"API error during chat request: {error}")
+            return IntegrationResult.error_result(f"API error: {error}")
+        if isinstance(error, QuackIntegrationError):
             # Handle other integration-specific errors (configuration, setup, etc.)
-            self.logger.error(f"Integration error during chat request: {e}")
-            return IntegrationResult.error_result(f"Integration error: {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error during chat request: {e}")
-            return IntegrationResult.error_result(f"Unexpected error: {e}")
+            self.logger.error(f"Integration error during chat request: {error}")
+            return IntegrationResult.error_result(f"Integration error: {error}")
+        self.logger.error(f"Unexpected error during chat request: {error}")
+        return IntegrationResult.error_result(f"Unexpected error: {error}")
 
     @abstractmethod
     def _chat_with_provider(
@@ -172,6 +360,31 @@ class LLMClient(ABC, LLMProviderProtocol):
         """
         ...
 
+    async def _achat_with_provider(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Provider-specific async implementation of chat completion request.
+
+        Clients backed by an async SDK override this. The default runs the
+        synchronous implementation in a worker thread so every client
+        supports achat().
+
+        Args:
+            messages: Normalized list of messages for the conversation
+            options: Additional options for the completion request
+            callback: Optional callback function for streaming responses
+
+        Returns:
+            IntegrationResult[str]: Result of the chat completion request
+        """
+        return await asyncio.to_thread(
+            self._chat_with_provider, messages, options, callback
+        )
+
     def count_tokens(
         self, messages: Sequence[ChatMessage] | Sequence[dict]
     ) -> IntegrationResult[int]:
@@ -195,15 +408,76 @@ class LLMClient(ABC, LLMProviderProtocol):
             # Call provider-specific implementation
             return self._count_tokens_with_provider(normalized_messages)
 
-        except QuackApiError as e:
-            self.logger.error(f"API error during token counting: {e}")
-            return IntegrationResult.error_result(f"API error: {e}")
-        except QuackIntegrationError as e:
-            self.logger.error(f"Integration error during token counting: {e}")
-            return IntegrationResult.error_result(f"Integration error: {e}")
         except Exception as e:
-            self.logger.error(f"Error counting tokens: {e}")
-            return IntegrationResult.error_result(f"Error counting tokens: {e}")
+            return self._count_tokens_error_result(e)
+
+    def count_tokens_many(
+        self, message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]]
+    ) -> IntegrationResult[list[int]]:
+        """
+        Count the tokens of several conversations in one call.
+
+        Useful when packing many chunks against a context budget. Clients
+        with a local tokenizer (OpenAI) load it once for the whole batch.
+
+        Args:
+            message_lists: Conversations to count, one sequence of messages each
+
+        Returns:
+            IntegrationResult[list[int]]: Token counts in input order, or an
+            error naming the first conversation that could not be counted
+        """
+        counts: list[int] = []
+        for index, messages in enumerate(message_lists):
+            result = self.count_tokens(messages)
+            if not result.success:
+                return IntegrationResult.error_result(
+                    f"Conversation {index}: {result.error}"
+                )
+            counts.append(result.content)
+
+        return IntegrationResult.success_result(counts)
+
+    async def acount_tokens(
+        self, messages: Sequence[ChatMessage] | Sequence[dict]
+    ) -> IntegrationResult[int]:
+        """
+        Count the number of tokens in the messages without blocking the event loop.
+
+        Args:
+            messages: Sequence of messages to count tokens for
+
+        Returns:
+            IntegrationResult[int]: Result containing the token count
+        """
+        try:
+            if not messages:
+                raise QuackIntegrationError("No messages provided for token counting")
+
+            normalized_messages = self._normalize_messages(messages)
+            return await self._acount_tokens_with_provider(normalized_messages)
+
+        except Exception as e:
+            return self._count_tokens_error_result(e)
+
+    def _count_tokens_error_result(self, error: Exception) -> IntegrationResult[int]:
+        """
+        Map an exception raised during token counting to an error result.
+
+        Args:
+            error: The exception
+
+        Returns:
+            IntegrationResult[int]: Error result describing the failure
+        """
+        if isinstance(error, QuackApiError):
+            self.logger.error(f"API error during token counting: {error}")
+            return IntegrationResult.error_result(f"API error: {error}")
+        if isinstance(error, QuackIntegrationError):
+            self.logger.error(f"Integration error during token counting: {error}")
+            return IntegrationResult.error_result(f"Integration error: {error}")
+        self.logger.error(f"Error counting tokens: {error}")
+        return IntegrationResult.error_result(f"Error counting tokens: {error}")
 
     @abstractmethod
     def _count_tokens_with_provider(
@@ -220,6 +494,31 @@ class LLMClient(ABC, LLMProviderProtocol):
         """
         ...
 
+    async def _acount_tokens_with_provider(
+        self, messages: list[ChatMessage]
+    ) -> IntegrationResult[int]:
+        """
+        Provider-specific async implementation of token counting.
+
+        The default runs the synchronous implementation in a worker thread
+        (local tokenizers are CPU-bound and would otherwise stall the loop).
+
+        Args:
+            messages: Normalized list of messages to count tokens for
+
+        Returns:
+            IntegrationResult[int]: Result containing the token count
+        """
+        return await asyncio.to_thread(self._count_tokens_with_provider, messages)
+
+    async def aclose(self) -> None:
+        """
+        Close async resources such as pooled HTTP connections.
+
+        Clients holding connections bound to an event loop override this;
+        it should be awaited on that loop before it is closed.
+        """
+
     def _normalize_messages(
         self, messages: Sequence[ChatMessage] | Sequence[dict]
     ) -> list[ChatMessage]:
@@ -13,9 +13,15 @@ Ollama LLM client implementation.
 
 This module provides a client for the Ollama API, supporting local LLM inference
 with proper error handling and retry logic.
+
+Requests go through one pooled, keep-alive HTTP session per client, so a
+high-volume local workload does not pay for a TCP connection per request.
 """
 
-from collections.abc import Callable
+import asyncio
+import json
+import threading
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from quack_core.integrations.core.results import IntegrationResult
@@ -24,6 +30,12 @@ from quack_core.integrations.llms.models import ChatMessage, LLMOptions, RoleTyp
 from quack_core.lib.errors import QuackApiError, QuackIntegrationError
 from quack_core.lib.logging import LOG_LEVELS, LogLevel
 
+# Connections kept open to the Ollama server per client
+DEFAULT_POOL_SIZE = 10
+
+# Bytes read per iteration when streaming; lines are yielded as soon as complete
+STREAM_CHUNK_SIZE = 8192
+
 
 class OllamaClient(LLMClient):
     """Ollama LLM client implementation."""
@@ -38,6 +50,8 @@ class OllamaClient(LLMClient):
         initial_retry_delay: float = 1.0,
         max_retry_delay: float = 30.0,
         log_level: int = LOG_LEVELS[LogLevel.INFO],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: str | int | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -52,6 +66,9 @@ class OllamaClient(LLMClient):
             initial_retry_delay: Initial delay for exponential backoff
             max_retry_delay: Maximum delay between retries
             log_level: Logging level
+            pool_size: Maximum pooled keep-alive connections to the server
+            keep_alive: How long Ollama keeps the model loaded after a request
+                (e.g. "10m", or -1 to keep it loaded; None for the server default)
             **kwargs: Additional arguments
         """
         super().__init__(
@@ -65,7 +82,15 @@ class OllamaClient(LLMClient):
             **kwargs,
         )
         self._api_base = api_base or "http://localhost:11434"
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
         self._client = None
+        self._session = None
+        self._session_lock = threading.Lock()
+        # httpx.AsyncClient pools connections per event loop, so keep the
+        # loop it was created on and rebuild it for a different one
+        self._async_client = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def model(self) -> str:
@@ -97,6 +122,42 @@ class OllamaClient(LLMClient):
                 original_error=e,
             )
 
+    def _get_session(self) -> Any:
+        """
+        Get the pooled requests session, creating it on first use.
+
+        Returns:
+            requests.Session: Session with a keep-alive connection pool
+
+        Raises:
+            QuackIntegrationError: If requests is not installed
+        """
+        if self._session is not None:
+            return self._session
+
+        self._check_requests_installed()
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                # Retries are handled by LLMClient, not by urllib3
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self._pool_size, max_retries=0
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close the pooled HTTP session, if one was opened."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     def _chat_with_provider(
         self,
         messages: list[ChatMessage],
@@ -120,26 +181,8 @@ class OllamaClient(LLMClient):
         try:
             import requests
 
-            # Convert messages to Ollama format
-            ollama_messages = self._convert_messages_to_ollama(messages)
-
             # Prepare request data
-            request_data = {
-                "model": options.model or self.model,
-                "messages": ollama_messages,
-                "stream": options.stream or callback is not None,
-                "options": {
-                    "temperature": options.temperature,
-                },
-            }
-
-            # Add max_tokens if provided
-            if options.max_tokens is not None:
-                request_data["options"]["num_predict"] = options.max_tokens
-
-            # Add stop if provided
-            if options.stop:
-                request_data["options"]["stop"] = options.stop
+            request_data = self._build_chat_request(messages, options, callback)
 
             # Prepare endpoint URL
             api_url = f"{self._api_base}/api/chat"
@@ -150,7 +193,7 @@ class OllamaClient(LLMClient):
 
             # Non-streaming request
             try:
-                response = requests.post(
+                response = self._get_session().post(
                     api_url, json=request_data, timeout=self._timeout
                 )
 
@@ -190,6 +233,167 @@ class OllamaClient(LLMClient):
                 original_error=e,
             )
 
+    def _build_chat_request(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None,
+    ) -> dict:
+        """
+        Build the /api/chat request body.
+
+        Args:
+            messages: List of messages for the conversation.
+            options: Additional options for the completion request.
+            callback: Optional callback function for streaming responses.
+
+        Returns:
+            dict: Request body
+        """
+        request_data = {
+            "model": options.model or self.model,
+            "messages": self._convert_messages_to_ollama(messages),
+            "stream": options.stream or callback is not None,
+            "options": {
+                "temperature": options.temperature,
+            },
+        }
+
+        # Add max_tokens if provided
+        if options.max_tokens is not None:
+            request_data["options"]["num_predict"] = options.max_tokens
+
+        # Add stop if provided
+        if options.stop:
+            request_data["options"]["stop"] = options.stop
+
+        # Keep the model loaded between requests if configured
+        if self._keep_alive is not None:
+            request_data["keep_alive"] = self._keep_alive
+
+        return request_data
+
+    @staticmethod
+    def _parse_stream_line(line: str | bytes) -> str | None:
+        """
+        Extract the content from one line of Ollama's NDJSON stream.
+
+        Args:
+            line: Raw line
+
+        Returns:
+            str | None: The chunk's content, or None if it has none
+
+        Raises:
+            json.JSONDecodeError: If the line is not valid JSON
+        """
+        message = json.loads(line).get("message")
+        return message.get("content") if message else None
+
+    def _get_async_client(self) -> Any:
+        """
+        Get an httpx.AsyncClient for the running event loop.
+
+        Returns:
+            Any: httpx.AsyncClient instance
+
+        Raises:
+            QuackIntegrationError: If httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise QuackIntegrationError(
+                f"Failed to import required package: {e}. Please install httpx: pip install httpx",
+                original_error=e,
+            )
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                base_url=self._api_base,
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._pool_size,
+                    max_keepalive_connections=self._pool_size,
+                ),
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was opened."""
+        if self._async_client is not None:
+            client, loop = self._async_client, self._async_client_loop
+            self._async_client = None
+            self._async_client_loop = None
+            # Connections opened on another, possibly closed, loop cannot be
+            # closed from here; they are dropped with the client
+            if loop is asyncio.get_running_loop():
+                await client.aclose()
+
+    async def _achat_with_provider(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Send a chat completion request to the Ollama API using httpx.
+
+        Args:
+            messages: List of messages for the conversation.
+            options: Additional options for the completion request.
+            callback: Optional callback function for streaming responses.
+
+        Returns:
+            IntegrationResult[str]: Result of the chat completion request.
+        """
+        client = self._get_async_client()
+        request_data = self._build_chat_request(messages, options, callback)
+
+        try:
+            if request_data["stream"]:
+                collected_content = []
+                async with client.stream(
+                    "POST", "/api/chat", json=request_data
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        try:
+                            content = self._parse_stream_line(line)
+                        except json.JSONDecodeError:
+                            self.logger.warning(
+                                f"Failed to parse Ollama stream chunk: {line}"
+                            )
+                            continue
+
+                        if content:
+                            collected_content.append(content)
+                            if callback:
+                                callback(content)
+                return IntegrationResult.success_result("".join(collected_content))
+
+            response = await client.post("/api/chat", json=request_data)
+            response.raise_for_status()
+            result = response.json()
+
+        except Exception as e:
+            raise QuackApiError(
+                f"Ollama API request failed: {e}",
+                service="Ollama",
+                api_method="chat",
+                original_error=e,
+            )
+
+        if "message" in result and "content" in result["message"]:
+            return IntegrationResult.success_result(result["message"]["content"])
+        return IntegrationResult.error_result(
+            f"Unexpected response format from Ollama: {result}"
+        )
+
     def _handle_streaming(
         self,
         api_url: str,
@@ -207,10 +411,7 @@ class OllamaClient(LLMClient):
         Returns:
             IntegrationResult[str]: Complete response
         """
-        # Import at the beginning to avoid reference issues
         try:
-            import json
-
             import requests
         except ImportError as e:
             return IntegrationResult.error_result(
@@ -220,28 +421,28 @@ class OllamaClient(LLMClient):
         try:
             collected_content = []
 
-            with requests.post(
+            with self._get_session().post(
                 api_url, json=request_data, timeout=self._timeout, stream=True
             ) as response:
                 response.raise_for_status()
 
-                for line in response.iter_lines():
+                for line in response.iter_lines(chunk_size=STREAM_CHUNK_SIZE):
                     if not line:
                         continue
 
                     try:
-                        chunk = json.loads(line)
-
-                        if "message" in chunk and "content" in chunk["message"]:
-                            content = chunk["message"]["content"]
-                            collected_content.append(content)
-
-                            if callback:
-                                callback(content)
+                        content = self._parse_stream_line(line)
                     except json.JSONDecodeError:
                         self.logger.warning(
                             f"Failed to parse Ollama stream chunk: {line}"
                         )
+                        continue
+
+                    if content:
+                        collected_content.append(content)
+
+                        if callback:
+                            callback(content)
 
             return IntegrationResult.success_result("".join(collected_content))
 
@@ -253,6 +454,118 @@ class OllamaClient(LLMClient):
                 original_error=e,
             )
 
+    def embed(
+        self,
+        texts: Sequence[str],
+        model: str | None = None,
+        batch_size: int = 64,
+    ) -> IntegrationResult[list[list[float]]]:
+        """
+        Embed texts with Ollama's batch /api/embed endpoint.
+
+        Texts are sent batch_size at a time, so a large corpus takes a
+        handful of requests instead of one per text.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (defaults to the client's model)
+            batch_size: Texts per request
+
+        Returns:
+            IntegrationResult[list[list[float]]]: One embedding per text, in order
+        """
+        if not texts:
+            return IntegrationResult.error_result("No texts provided for embedding")
+
+        try:
+            session = self._get_session()
+        except QuackIntegrationError as e:
+            return IntegrationResult.error_result(str(e))
+
+        import requests
+
+        try:
+            embeddings: list[list[float]] = []
+
+            for start in range(0, len(texts), batch_size):
+                response = session.post(
+                    f"{self._api_base}/api/embed",
+                    json=self._build_embed_request(
+                        texts[start : start + batch_size], model
+                    ),
+                    timeout=self._timeout,
+                )
+                response.raise_for_status()
+                embeddings.extend(response.json()["embeddings"])
+
+            return IntegrationResult.success_result(embeddings)
+
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            self.logger.error(f"Ollama embedding request failed: {e}")
+            return IntegrationResult.error_result(
+                f"Ollama embedding request failed: {e}"
+            )
+
+    async def aembed(
+        self,
+        texts: Sequence[str],
+        model: str | None = None,
+        batch_size: int = 64,
+    ) -> IntegrationResult[list[list[float]]]:
+        """
+        Embed texts with Ollama's batch /api/embed endpoint using httpx.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (defaults to the client's model)
+            batch_size: Texts per request
+
+        Returns:
+            IntegrationResult[list[list[float]]]: One embedding per text, in order
+        """
+        if not texts:
+            return IntegrationResult.error_result("No texts provided for embedding")
+
+        try:
+            client = self._get_async_client()
+            embeddings: list[list[float]] = []
+
+            for start in range(0, len(texts), batch_size):
+                response = await client.post(
+                    "/api/embed",
+                    json=self._build_embed_request(
+                        texts[start : start + batch_size], model
+                    ),
+                )
+                response.raise_for_status()
+                embeddings.extend(response.json()["embeddings"])
+
+            return IntegrationResult.success_result(embeddings)
+
+        except QuackIntegrationError as e:
+            return IntegrationResult.error_result(str(e))
+        except Exception as e:
+            self.logger.error(f"Ollama embedding request failed: {e}")
+            return IntegrationResult.error_result(
+                f"Ollama embedding request failed: {e}"
+            )
+
+    def _build_embed_request(self, texts: Sequence[str], model: str | None) -> dict:
+        """
+        Build the /api/embed request body.
+
+        Args:
+            texts: Texts in this batch
+            model: Embedding model (defaults to the client's model)
+
+        Returns:
+            dict: Request body
+        """
+        request_data = {"model": model or self.model, "input": list(texts)}
+        if self._keep_alive is not None:
+            request_data["keep_alive"] = self._keep_alive
+        return request_data
+
     def _convert_messages_to_ollama(self, messages: list[ChatMessage]) -> list[dict]:
         """
         Convert ChatMessage objects to Ollama format.
@@ -331,7 +644,7 @@ class OllamaClient(LLMClient):
 
             # Call Ollama API for token counting
             try:
-                response = requests.post(
+                response = self._get_session().post(
                     f"{self._api_base}/api/tokenize",
                     json=request_data,
                     timeout=self._timeout,
@@ -365,3 +678,43 @@ class OllamaClient(LLMClient):
         except Exception as e:
             self.logger.error(f"Error counting tokens: {e}")
             return IntegrationResult.error_result(f"Error counting tokens: {e}")
+
+    async def _acount_tokens_with_provider(
+        self, messages: list[ChatMessage]
+    ) -> IntegrationResult[int]:
+        """
+        Count tokens using the Ollama API over httpx.
+
+        Args:
+            messages: List of messages to count tokens for
+
+        Returns:
+            IntegrationResult[int]: Token count
+        """
+        combined_text = "".join(
+            message.content + "\n" for message in messages if message.content
+        )
+        estimated_tokens = len(combined_text) // 4
+
+        try:
+            client = self._get_async_client()
+            response = await client.post(
+                "/api/tokenize", json={"model": self.model, "prompt": combined_text}
+            )
+            response.raise_for_status()
+            result = response.json()
+        except QuackIntegrationError:
+            raise
+        except Exception as e:
+            self.logger.warning(f"Ollama token counting failed: {e}. Using estimation.")
+            return IntegrationResult.success_result(
+                estimated_tokens,
+                message="Token count is an estimation. Ollama token counting API failed.",
+            )
+
+        if "tokens" in result and isinstance(result["tokens"], list):
+            return IntegrationResult.success_result(len(result["tokens"]))
+        return IntegrationResult.success_result(
+            estimated_tokens,
+            message="Token count is an estimation based on text length.",
+        )
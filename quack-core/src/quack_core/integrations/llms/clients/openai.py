@@ -3,7 +3,7 @@
 # module: quack_core.integrations.llms.clients.openai
 # role: module
 # neighbors: __init__.py, anthropic.py, base.py, mock.py, ollama.py
-# exports: OpenAIClient
+# exports: OpenAIClient, get_encoding
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -15,6 +15,8 @@ This module provides a client for the OpenAI API, supporting chat completions
 and token counting with proper error handling and retry logic.
 """
 
+import asyncio
+import functools
 import logging
 import os
 from collections.abc import Callable
@@ -25,6 +27,62 @@ from quack_core.integrations.llms.clients.base import LLMClient
 from quack_core.integrations.llms.models import ChatMessage, LLMOptions
 from quack_core.lib.errors import QuackApiError, QuackIntegrationError
 
+# Encoding used when tiktoken does not know the model
+DEFAULT_ENCODING = "cl100k_base"
+
+TOKENS_PER_MESSAGE = 3  # This already accounts for role tokens.
+TOKENS_PER_NAME = 1  # Extra token for name if present.
+TOKENS_PER_REPLY = 3  # Priming tokens for the assistant's reply.
+
+# Distinct messages whose token counts are memoized per process
+MESSAGE_TOKEN_CACHE_SIZE = 8192
+
+
+@functools.cache
+def get_encoding(model: str) -> Any:
+    """
+    Get the tiktoken encoding for a model, loading it once per process.
+
+    Resolving an encoding reads and parses the BPE ranks, which costs far
+    more than encoding a typical message, so the result is cached for every
+    client. Failures (including ImportError) are not cached.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        tiktoken.Encoding: The model's encoding, or cl100k_base for unknown models
+
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+@functools.lru_cache(maxsize=MESSAGE_TOKEN_CACHE_SIZE)
+def _message_token_count(encoding: Any, fields: tuple[tuple[str, str], ...]) -> int:
+    """
+    Count the tokens of one converted message, memoized.
+
+    Args:
+        encoding: tiktoken encoding
+        fields: The message's (key, text) pairs, excluding the role
+
+    Returns:
+        int: Tokens for the message including the per-message overhead
+    """
+    token_count = TOKENS_PER_MESSAGE
+    for key, value in fields:
+        token_count += len(encoding.encode(value))
+        if key == "name" and value:
+            token_count += TOKENS_PER_NAME
+    return token_count
+
 
 class OpenAIClient(LLMClient):
     """OpenAI LLM client implementation."""
@@ -58,6 +116,10 @@ class OpenAIClient(LLMClient):
         self._api_base = api_base
         self._organization = organization
         self._client = None
+        # The SDK's httpx pool is bound to the event loop it was first used
+        # on, so keep that loop and rebuild the client for a different one
+        self._async_client = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
 
         # If API key is provided, set it in environment so the OpenAI SDK can find it
         if api_key and not os.environ.get("OPENAI_API_KEY"):
@@ -94,16 +156,7 @@ class OpenAIClient(LLMClient):
                         original_error=e,
                     )
 
-                # Get API key from provided value or from environment variable
-                if not self._api_key:
-                    self._api_key = self._get_api_key_from_env()
-
-                kwargs = {"api_key": self._api_key, "timeout": self._timeout}
-
-                if self._api_base:
-                    kwargs["base_url"] = self._api_base
-                if self._organization:
-                    kwargs["organization"] = self._organization
+                kwargs = self._client_kwargs()
 
                 # Ensure the API key is also set in the environment
                 # This helps with certain OpenAI SDK versions/implementations
@@ -131,6 +184,70 @@ class OpenAIClient(LLMClient):
 
         return self._client
 
+    def _client_kwargs(self) -> dict[str, Any]:
+        """
+        Build the constructor arguments shared by the sync and async SDK clients.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for OpenAI / AsyncOpenAI
+        """
+        # Get API key from provided value or from environment variable
+        if not self._api_key:
+            self._api_key = self._get_api_key_from_env()
+
+        kwargs = {"api_key": self._api_key, "timeout": self._timeout}
+
+        if self._api_base:
+            kwargs["base_url"] = self._api_base
+        if self._organization:
+            kwargs["organization"] = self._organization
+        return kwargs
+
+    def _get_async_client(self) -> Any:
+        """
+        Get an AsyncOpenAI client for the running event loop.
+
+        Returns:
+            Any: AsyncOpenAI client instance
+
+        Raises:
+            QuackIntegrationError: If the OpenAI package is not installed
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError as e:
+                raise QuackIntegrationError(
+                    f"OpenAI package not installed or cannot be imported: {e}. "
+                    "Please install it with: pip install openai",
+                    original_error=e,
+                ) from e
+
+            try:
+                self._async_client = AsyncOpenAI(**self._client_kwargs())
+                self._async_client_loop = loop
+            except QuackIntegrationError:
+                raise
+            except Exception as e:
+                raise QuackIntegrationError(
+                    f"Failed to initialize async OpenAI client: {e}",
+                    original_error=e,
+                ) from e
+
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async OpenAI client, if one was opened."""
+        if self._async_client is not None:
+            client, loop = self._async_client, self._async_client_loop
+            self._async_client = None
+            self._async_client_loop = None
+            # Connections opened on another, possibly closed, loop cannot be
+            # closed from here; they are dropped with the client
+            if loop is asyncio.get_running_loop():
+                await client.close()
+
     def _get_api_key_from_env(self) -> str:
         """
         Get the OpenAI API key from environment variables.
@@ -233,25 +350,7 @@ class OpenAIClient(LLMClient):
             )
 
             for chunk in stream:
-                # Support both dict and object formats for chunks
-                if isinstance(chunk, dict):
-                    choices = chunk.get("choices", [])
-                    if not choices:
-                        continue
-
-                    delta = choices[0].get("delta", {})
-                    content = delta.get("content")
-                else:
-                    if not hasattr(chunk, "choices") or not chunk.choices:
-                        continue
-
-                    delta = (
-                        chunk.choices[0].delta
-                        if hasattr(chunk.choices[0], "delta")
-                        else {}
-                    )
-                    content = delta.content if hasattr(delta, "content") else None
-
+                content = self._extract_chunk_content(chunk)
                 if content:
                     collected_content.append(content)
                     if callback:
@@ -262,6 +361,62 @@ class OpenAIClient(LLMClient):
             # Convert OpenAI errors to QuackApiError
             raise self._convert_error(e)
 
+    def _extract_chunk_content(self, chunk: Any) -> str | None:
+        """
+        Get the text delta from a streaming chunk.
+        Supports both dict and object chunks.
+        """
+        if isinstance(chunk, dict):
+            choices = chunk.get("choices", [])
+            if not choices:
+                return None
+            return choices[0].get("delta", {}).get("content")
+
+        if not hasattr(chunk, "choices") or not chunk.choices:
+            return None
+
+        delta = chunk.choices[0].delta if hasattr(chunk.choices[0], "delta") else {}
+        return delta.content if hasattr(delta, "content") else None
+
+    async def _achat_with_provider(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Send a chat completion request using the async OpenAI SDK.
+        """
+        client = self._get_async_client()
+
+        try:
+            openai_messages = [self._convert_message_to_openai(msg) for msg in messages]
+            model = options.model or self.model
+            params = options.to_openai_params(model=model)
+
+            if callback or options.stream:
+                params.pop("stream", None)
+                stream = await client.chat.completions.create(
+                    model=model, messages=openai_messages, stream=True, **params
+                )
+
+                collected_content = []
+                async for chunk in stream:
+                    content = self._extract_chunk_content(chunk)
+                    if content:
+                        collected_content.append(content)
+                        if callback:
+                            callback(content)
+                return IntegrationResult.success_result("".join(collected_content))
+
+            response = await client.chat.completions.create(
+                model=model, messages=openai_messages, **params
+            )
+            return IntegrationResult.success_result(self._process_response(response))
+
+        except Exception as e:
+            raise self._convert_error(e)
+
     def _convert_message_to_openai(self, message: ChatMessage) -> dict:
         """
         Convert a ChatMessage to the format expected by OpenAI.
@@ -351,61 +506,56 @@ class OpenAIClient(LLMClient):
     ) -> IntegrationResult[int]:
         """
         Count the number of tokens in the messages using OpenAI's tokenizer.
+
+        The encoding is loaded once per process and per-message counts are
+        memoized, so re-counting overlapping prompts only encodes new messages.
         """
         try:
             try:
-                import tiktoken
-
-                model = self.model
-                encoding_name = "cl100k_base"
-                try:
-                    encoding = tiktoken.encoding_for_model(model)
-                except KeyError:
-                    encoding = tiktoken.get_encoding(encoding_name)
-
-                token_count = 0
-                openai_messages = [
-                    self._convert_message_to_openai(msg) for msg in messages
-                ]
-
-                tokens_per_message = 3  # This already accounts for role tokens.
-                tokens_per_name = 1  # Extra token for name if present.
-
-                for message in openai_messages:
-                    token_count += tokens_per_message
-
-                    for key, value in message.items():
-                        # Skip the role since it's already counted in tokens_per_message.
-                        if key == "role":
-                            continue
-                        if isinstance(value, str):
-                            token_count += len(encoding.encode(value))
-                        elif isinstance(value, dict):
-                            json_str = str(value)
-                            token_count += len(encoding.encode(json_str))
-                        if key == "name" and value:
-                            token_count += tokens_per_name
-
-                # Add 3 tokens for the assistant's reply.
-                token_count += 3
-
-                return IntegrationResult.success_result(token_count)
-
+                encoding = get_encoding(self.model)
             except ImportError:
                 self.logger.warning(
                     "tiktoken not installed. Using simple token estimation. "
                     "Install tiktoken for more accurate counts: pip install tiktoken"
                 )
-                total_text = ""
-                for message in messages:
-                    if message.content:
-                        total_text += message.content + " "
-                estimated_tokens = len(total_text) // 4
+                estimated_tokens = (
+                    sum(len(message.content) + 1 for message in messages if message.content)
+                    // 4
+                )
                 return IntegrationResult.success_result(
                     estimated_tokens,
                     message="Using simple token estimation. Install tiktoken for accuracy.",
                 )
 
+            token_count = TOKENS_PER_REPLY
+            for message in messages:
+                token_count += _message_token_count(
+                    encoding, self._token_fields(message)
+                )
+
+            return IntegrationResult.success_result(token_count)
+
         except Exception as e:
             self.logger.error(f"Error counting tokens: {e}")
             return IntegrationResult.error_result(f"Error counting tokens: {e}")
+
+    def _token_fields(self, message: ChatMessage) -> tuple[tuple[str, str], ...]:
+        """
+        Get the text of a message that counts towards its tokens.
+
+        Args:
+            message: Message to convert
+
+        Returns:
+            tuple: Hashable (key, text) pairs of the OpenAI message, without the role
+        """
+        fields = []
+        for key, value in self._convert_message_to_openai(message).items():
+            # Skip the role since it's already counted in TOKENS_PER_MESSAGE.
+            if key == "role":
+                continue
+            if isinstance(value, str):
+                fields.append((key, value))
+            elif isinstance(value, dict):
+                fields.append((key, str(value)))
+        return tuple(fields)
@@ -23,6 +23,7 @@ from pydantic import BaseModel, Field, field_validator
 from quack_core.config.models import LoggingConfig
 from quack_core.integrations.core import ConfigResult
 from quack_core.integrations.core.base import BaseConfigProvider
+from quack_core.integrations.llms.cache import ResponseCacheConfig
 from quack_core.integrations.llms.fallback import FallbackConfig
 
 
@@ -40,6 +41,12 @@ class OpenAIConfig(BaseModel):
         "https://api.openai.com/v1", description="OpenAI API base URL"
     )
     default_model: str = Field("gpt-4o", description="Default model to use")
+    requests_per_minute: int | None = Field(
+        None, description="Client-side request limit per minute (None for no limit)"
+    )
+    tokens_per_minute: int | None = Field(
+        None, description="Client-side token limit per minute (None for no limit)"
+    )
 
 
 class AnthropicConfig(BaseModel):
@@ -55,6 +62,12 @@ class AnthropicConfig(BaseModel):
     default_model: str = Field(
         "claude-3-opus-20240229", description="Default model to use"
     )
+    requests_per_minute: int | None = Field(
+        None, description="Client-side request limit per minute (None for no limit)"
+    )
+    tokens_per_minute: int | None = Field(
+        None, description="Client-side token limit per minute (None for no limit)"
+    )
 
 
 class OllamaConfig(BaseModel):
@@ -62,6 +75,19 @@ class OllamaConfig(BaseModel):
 
     api_base: str = Field("http://localhost:11434", description="Ollama API base URL")
     default_model: str = Field("llama3", description="Default model to use")
+    pool_size: int = Field(
+        10, ge=1, description="Maximum pooled keep-alive connections to the server"
+    )
+    keep_alive: str | int | None = Field(
+        None,
+        description="How long the server keeps the model loaded (e.g. '10m', -1 for always)",
+    )
+    requests_per_minute: int | None = Field(
+        None, description="Client-side request limit per minute (None for no limit)"
+    )
+    tokens_per_minute: int | None = Field(
+        None, description="Client-side token limit per minute (None for no limit)"
+    )
 
 
 class LLMConfig(BaseModel):
@@ -83,12 +109,19 @@ class LLMConfig(BaseModel):
     enable_fallback: bool = Field(
         True, description="Whether to enable fallback between providers"
     )
+    cache: ResponseCacheConfig = Field(
+        default_factory=ResponseCacheConfig,
+        description="Configuration for the chat response cache",
+    )
     timeout: int = Field(60, description="Request timeout in seconds")
     retry_count: int = Field(3, description="Number of retries for failed requests")
     initial_retry_delay: float = Field(
         1.0, description="Initial delay for exponential backoff"
     )
     max_retry_delay: float = Field(30.0, description="Maximum delay between retries")
+    max_concurrency: int = Field(
+        8, ge=1, description="Default number of concurrent requests in chat_many"
+    )
     logging: LoggingConfig = Field(
         default_factory=LoggingConfig, description="Logging configuration"
     )
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.llms.fallback
 # role: module
 # neighbors: __init__.py, models.py, protocols.py, config.py, registry.py
-# exports: FallbackConfig, ProviderStatus, FallbackLLMClient
+# exports: FallbackConfig, CircuitState, ProviderStatus, FallbackLLMClient
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -13,14 +13,25 @@ Fallback mechanism for LLM clients.
 
 This module provides a fallback mechanism for LLM clients, allowing graceful
 degradation when primary providers are unavailable or fail.
+
+Each provider has a circuit breaker. After enough consecutive failures the
+circuit opens and the provider is skipped without paying for retries. Once
+the cooldown has passed, a single half-open probe decides whether to close
+the circuit again. Providers can optionally be ordered by observed latency
+instead of their configured order.
 """
 
+import asyncio
+import math
 import time
+from collections import deque
 from collections.abc import Callable
+from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.llms.cache import ResponseCache
 from quack_core.integrations.llms.clients.base import LLMClient
 from quack_core.integrations.llms.models import ChatMessage, LLMOptions
 from quack_core.lib.errors import QuackApiError, QuackIntegrationError
@@ -48,6 +59,37 @@ class FallbackConfig(BaseModel):
         True,
         description="Whether to remember and use only the last successful provider for subsequent calls",
     )
+    circuit_breaker_threshold: int = Field(
+        3,
+        ge=0,
+        description="Consecutive failures that open a provider's circuit (0 disables the breaker)",
+    )
+    circuit_breaker_cooldown: float = Field(
+        30.0,
+        ge=0,
+        description="Seconds an open circuit waits before allowing a half-open probe",
+    )
+    latency_weighted_ordering: bool = Field(
+        False,
+        description="Try healthy providers fastest first (by rolling p50/p95 latency) instead of in configured order",
+    )
+    latency_window: int = Field(
+        50, ge=1, description="Number of recent successful calls kept per provider for latency percentiles"
+    )
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state of a provider."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty sample list."""
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
 
 
 class ProviderStatus(BaseModel):
@@ -61,6 +103,101 @@ class ProviderStatus(BaseModel):
     )
     success_count: int = Field(0, description="Number of successful calls")
     fail_count: int = Field(0, description="Number of failed calls")
+    consecutive_failures: int = Field(
+        0, description="Failures since the last successful call"
+    )
+    circuit_state: CircuitState = Field(
+        CircuitState.CLOSED, description="Circuit breaker state"
+    )
+    opened_at: float | None = Field(
+        None, description="Timestamp when the circuit last opened"
+    )
+    p50_latency: float | None = Field(
+        None, description="Rolling median latency of successful calls in seconds"
+    )
+    p95_latency: float | None = Field(
+        None, description="Rolling 95th percentile latency in seconds"
+    )
+
+    _latencies: deque[float] = PrivateAttr(default_factory=deque)
+    _probe_in_flight: bool = PrivateAttr(False)
+
+    def allow_request(self, cooldown: float, now: float | None = None) -> bool:
+        """
+        Check whether the circuit lets a request through.
+
+        An open circuit turns half-open once the cooldown has passed. A
+        half-open circuit admits one probe at a time; the probe's outcome
+        closes or re-opens the circuit.
+
+        Args:
+            cooldown: Seconds an open circuit stays open
+            now: Current timestamp (defaults to time.time())
+
+        Returns:
+            bool: True if the provider may be called
+        """
+        if self.circuit_state == CircuitState.CLOSED:
+            return True
+
+        now = time.time() if now is None else now
+        if self.circuit_state == CircuitState.OPEN:
+            if self.opened_at is not None and now - self.opened_at < cooldown:
+                return False
+            self.circuit_state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self, latency: float | None = None, window: int = 50) -> None:
+        """
+        Record a successful call, closing the circuit.
+
+        Args:
+            latency: Call duration in seconds, added to the rolling window
+            window: Number of latency samples to keep
+        """
+        self.success_count += 1
+        self.last_attempt_time = time.time()
+        self.consecutive_failures = 0
+        self.circuit_state = CircuitState.CLOSED
+        self.opened_at = None
+        self._probe_in_flight = False
+
+        if latency is not None:
+            self._latencies.append(latency)
+            while len(self._latencies) > window:
+                self._latencies.popleft()
+            samples = sorted(self._latencies)
+            self.p50_latency = _percentile(samples, 0.50)
+            self.p95_latency = _percentile(samples, 0.95)
+
+    def record_failure(self, error: object, threshold: int = 0) -> None:
+        """
+        Record a failed call, opening the circuit if warranted.
+
+        A failed half-open probe re-opens the circuit immediately; otherwise
+        the circuit opens after threshold consecutive failures.
+
+        Args:
+            error: The error (or error message) from the call
+            threshold: Consecutive failures that open the circuit (0 disables)
+        """
+        now = time.time()
+        self.last_attempt_time = now
+        self.last_error = str(error)
+        self.fail_count += 1
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+
+        if self.circuit_state == CircuitState.HALF_OPEN or (
+            threshold > 0 and self.consecutive_failures >= threshold
+        ):
+            self.circuit_state = CircuitState.OPEN
+            self.opened_at = now
 
 
 class FallbackLLMClient(LLMClient):
@@ -77,6 +214,7 @@ class FallbackLLMClient(LLMClient):
         model_map: dict[str, str] | None = None,
         api_key_map: dict[str, str] | None = None,
         log_level: int = LOG_LEVELS[LogLevel.INFO],
+        cache: ResponseCache | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -87,6 +225,7 @@ class FallbackLLMClient(LLMClient):
             model_map: Mapping from provider to model name
             api_key_map: Mapping from provider to API key
             log_level: Logging level
+            cache: Optional response cache, consulted by this client only
             **kwargs: Additional arguments passed to all underlying clients
         """
         # Initialize with a placeholder model name - it will be overridden
@@ -94,6 +233,7 @@ class FallbackLLMClient(LLMClient):
             model="fallback-client",
             api_key=None,  # No API key for the parent, we'll use provider-specific keys
             log_level=log_level,
+            cache=cache,
             **kwargs,
         )
 
@@ -220,9 +360,7 @@ class FallbackLLMClient(LLMClient):
             # Update provider status
             status = self._provider_status[provider]
             status.available = False
-            status.last_error = str(e)
-            status.last_attempt_time = time.time()
-            status.fail_count += 1
+            status.record_failure(e)
 
             raise QuackIntegrationError(
                 f"Failed to initialize {provider} client: {e}",
@@ -230,6 +368,156 @@ class FallbackLLMClient(LLMClient):
                 original_error=e,
             )
 
+    def _provider_order(self) -> list[str]:
+        """
+        Get the providers in the order they should be tried.
+
+        Returns:
+            list[str]: Provider names, fastest first if latency_weighted_ordering
+            is set, otherwise last successful provider first if
+            stop_on_successful_provider is set
+        """
+        if self._fallback_config.latency_weighted_ordering:
+            return self._latency_order()
+
+        # If we have a successful provider and configuration says to use it, try it first
+        if (
+            self._last_successful_provider
+            and self._fallback_config.stop_on_successful_provider
+        ):
+            return [
+                self._last_successful_provider,
+                *[
+                    p
+                    for p in self._fallback_config.providers
+                    if p != self._last_successful_provider
+                ],
+            ]
+        return self._fallback_config.providers
+
+    def _latency_order(self) -> list[str]:
+        """
+        Order providers by rolling p50 latency, breaking ties on p95.
+
+        Providers without latency samples keep their configured order after
+        the measured ones, so an untested provider is never preferred over
+        one that is known to work.
+
+        Returns:
+            list[str]: Provider names, fastest first
+        """
+
+        def sort_key(provider: str) -> tuple[float, float]:
+            status = self._provider_status[provider]
+            if status.p50_latency is None:
+                return math.inf, math.inf
+            return status.p50_latency, status.p95_latency or status.p50_latency
+
+        return sorted(self._fallback_config.providers, key=sort_key)
+
+    def _provider_allowed(self, provider_status: ProviderStatus) -> bool:
+        """
+        Check whether a provider may be tried for this request.
+
+        Args:
+            provider_status: Status of the provider
+
+        Returns:
+            bool: False if the provider is unavailable or its circuit is open
+        """
+        if not provider_status.available:
+            self.logger.info(
+                f"Skipping provider {provider_status.provider} "
+                f"(marked unavailable: {provider_status.last_error})"
+            )
+            return False
+
+        if not provider_status.allow_request(
+            self._fallback_config.circuit_breaker_cooldown
+        ):
+            self.logger.info(
+                f"Skipping provider {provider_status.provider} "
+                f"(circuit {provider_status.circuit_state.value}: {provider_status.last_error})"
+            )
+            return False
+
+        return True
+
+    def _max_attempts_for(self, provider_status: ProviderStatus) -> int:
+        """
+        Get the number of attempts allowed for a provider.
+
+        A half-open circuit gets a single probe rather than the full retry
+        budget.
+
+        Args:
+            provider_status: Status of the provider
+
+        Returns:
+            int: Maximum number of attempts
+        """
+        if provider_status.circuit_state == CircuitState.HALF_OPEN:
+            return 1
+        return self._fallback_config.max_attempts_per_provider
+
+    def _record_failure(self, provider_status: ProviderStatus, error: object) -> None:
+        """Record a failed attempt against the provider's circuit breaker."""
+        was_open = provider_status.circuit_state == CircuitState.OPEN
+        provider_status.record_failure(
+            error, self._fallback_config.circuit_breaker_threshold
+        )
+        if not was_open and provider_status.circuit_state == CircuitState.OPEN:
+            self.logger.warning(
+                f"Circuit opened for provider {provider_status.provider} after "
+                f"{provider_status.consecutive_failures} consecutive failures"
+            )
+
+    def _options_for_provider(self, options: LLMOptions, provider: str) -> LLMOptions:
+        """
+        Fill in the provider's model if the options don't name one.
+
+        Args:
+            options: Request options
+            provider: Provider name
+
+        Returns:
+            LLMOptions: The original options, or a copy with the model set
+        """
+        if options.model is None:
+            provider_model = self._model_map.get(provider)
+            if provider_model:
+                # Create a copy to avoid modifying the original
+                options = LLMOptions(**options.model_dump())
+                options.model = provider_model
+        return options
+
+    def _record_chat_success(
+        self, provider: str, result: IntegrationResult[str], latency: float
+    ) -> IntegrationResult[str]:
+        """
+        Update provider status after a successful chat and tag the result.
+
+        Args:
+            provider: Provider that answered
+            result: Successful result
+            latency: Duration of the successful call in seconds
+
+        Returns:
+            IntegrationResult[str]: The result with provider info in its message
+        """
+        self._provider_status[provider].record_success(
+            latency, self._fallback_config.latency_window
+        )
+        self._last_successful_provider = provider
+
+        # Add provider info to result
+        if result.message:
+            result.message = f"{result.message} (via {provider})"
+        else:
+            result.message = f"Success (via {provider})"
+
+        return result
+
     def _is_auth_error(self, error: Exception) -> bool:
         """
         Check if an error is related to authentication.
@@ -274,37 +562,22 @@ class FallbackLLMClient(LLMClient):
         Returns:
             IntegrationResult[str]: Result of the chat completion request
         """
-        # If we have a successful provider and configuration says to use it, try it first
-        if (
-            self._last_successful_provider
-            and self._fallback_config.stop_on_successful_provider
-        ):
-            providers_to_try = [
-                self._last_successful_provider,
-                *[
-                    p
-                    for p in self._fallback_config.providers
-                    if p != self._last_successful_provider
-                ],
-            ]
-        else:
-            providers_to_try = self._fallback_config.providers
+        providers_to_try = self._provider_order()
 
         last_error = None
+        tried_provider = False
 
         # Try each provider in sequence
-        for provider_idx, provider in enumerate(providers_to_try):
-            # Check if provider is marked as unavailable
+        for provider in providers_to_try:
+            # Skip providers that are unavailable or whose circuit is open
             provider_status = self._provider_status[provider]
-            if not provider_status.available:
-                self.logger.info(
-                    f"Skipping provider {provider} (marked unavailable: {provider_status.last_error})"
-                )
+            if not self._provider_allowed(provider_status):
                 continue
 
-            # Add delay before trying next provider (except for the first one)
-            if provider_idx > 0 and self._fallback_config.delay_between_providers > 0:
+            # Add delay before trying next provider (except for the first one tried)
+            if tried_provider and self._fallback_config.delay_between_providers > 0:
                 time.sleep(self._fallback_config.delay_between_providers)
+            tried_provider = True
 
             # Try to get client for this provider
             try:
@@ -318,7 +591,7 @@ class FallbackLLMClient(LLMClient):
                 continue
 
             # Try the provider with appropriate retry logic
-            max_attempts = self._fallback_config.max_attempts_per_provider
+            max_attempts = self._max_attempts_for(provider_status)
 
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -328,12 +601,7 @@ class FallbackLLMClient(LLMClient):
                     )
 
                     # Set the model in options if not already set
-                    if options.model is None:
-                        provider_model = self._model_map.get(provider)
-                        if provider_model:
-                            # Create a copy to avoid modifying the original
-                            options = LLMOptions(**options.model_dump())
-                            options.model = provider_model
+                    options = self._options_for_provider(options, provider)
 
                     # Send the request
                     start_time = time.time()
@@ -345,24 +613,19 @@ class FallbackLLMClient(LLMClient):
                         self.logger.info(
                             f"Request to {provider} succeeded in {elapsed_time:.2f}s"
                         )
-                        provider_status.success_count += 1
-                        provider_status.last_attempt_time = time.time()
-                        self._last_successful_provider = provider
-
-                        # Add provider info to result
-                        if result.message:
-                            result.message = f"{result.message} (via {provider})"
-                        else:
-                            result.message = f"Success (via {provider})"
+                        return self._record_chat_success(
+                            provider, result, elapsed_time
+                        )
 
-                        return result
+                    # The client already exhausted its own retries, so move
+                    # on to the next provider
+                    last_error = result.error
+                    self._record_failure(provider_status, result.error)
+                    break
 
                 except QuackApiError as e:
                     # Handle API errors
-                    error_time = time.time()
-                    provider_status.last_attempt_time = error_time
-                    provider_status.last_error = str(e)
-                    provider_status.fail_count += 1
+                    self._record_failure(provider_status, e)
 
                     # Check if it's an auth error and we should fail fast
                     if (
@@ -375,12 +638,16 @@ class FallbackLLMClient(LLMClient):
                         last_error = e
                         break
 
-                    # If it's the last attempt for this provider, log and continue to next
-                    if attempt == max_attempts:
+                    # If it's the last attempt or the circuit opened, move to the next provider
+                    if (
+                        attempt == max_attempts
+                        or provider_status.circuit_state == CircuitState.OPEN
+                    ):
                         self.logger.warning(
                             f"All attempts failed for provider {provider}: {e}"
                         )
                         last_error = e
+                        break
                     else:
                         # Otherwise retry
                         retry_delay = min(2 ** (attempt - 1), 30)  # Exponential backoff
@@ -392,16 +659,130 @@ class FallbackLLMClient(LLMClient):
 
                 except Exception as e:
                     # Handle other exceptions
-                    provider_status.last_attempt_time = time.time()
-                    provider_status.last_error = str(e)
-                    provider_status.fail_count += 1
+                    self._record_failure(provider_status, e)
 
                     self.logger.error(f"Unexpected error with provider {provider}: {e}")
                     last_error = e
                     break  # Don't retry on unexpected errors
 
         # If we get here, all providers failed
-        error_message = f"All LLM providers failed. Last error: {last_error}"
+        if not tried_provider:
+            error_message = (
+                "All LLM providers are unavailable or have open circuits: "
+                f"{', '.join(providers_to_try)}"
+            )
+        else:
+            error_message = f"All LLM providers failed. Last error: {last_error}"
+        self.logger.error(error_message)
+        return IntegrationResult.error_result(error_message)
+
+    async def _achat_with_provider(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Send a chat completion request with fallback support, asynchronously.
+
+        Same provider order, retry and fail-fast rules as _chat_with_provider;
+        each provider is called through its achat() and delays use asyncio.sleep.
+
+        Args:
+            messages: List of messages for the conversation
+            options: Additional options for the completion request
+            callback: Optional callback function for streaming responses
+
+        Returns:
+            IntegrationResult[str]: Result of the chat completion request
+        """
+        providers_to_try = self._provider_order()
+
+        last_error = None
+        tried_provider = False
+
+        for provider in providers_to_try:
+            provider_status = self._provider_status[provider]
+            if not self._provider_allowed(provider_status):
+                continue
+
+            if tried_provider and self._fallback_config.delay_between_providers > 0:
+                await asyncio.sleep(self._fallback_config.delay_between_providers)
+            tried_provider = True
+
+            try:
+                client = self._get_client_for_provider(provider)
+            except QuackIntegrationError as e:
+                self.logger.warning(f"Could not initialize provider {provider}: {e}")
+                last_error = e
+                continue
+
+            max_attempts = self._max_attempts_for(provider_status)
+
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    options = self._options_for_provider(options, provider)
+
+                    start_time = time.time()
+                    result = await client.achat(messages, options, callback)
+                    elapsed_time = time.time() - start_time
+
+                    if result.success:
+                        self.logger.info(
+                            f"Request to {provider} succeeded in {elapsed_time:.2f}s"
+                        )
+                        return self._record_chat_success(
+                            provider, result, elapsed_time
+                        )
+
+                    last_error = result.error
+                    self._record_failure(provider_status, result.error)
+                    break
+
+                except QuackApiError as e:
+                    self._record_failure(provider_status, e)
+
+                    if (
+                        self._fallback_config.fail_fast_on_auth_errors
+                        and self._is_auth_error(e)
+                    ):
+                        self.logger.warning(
+                            f"Authentication error with {provider}, skipping remaining attempts: {e}"
+                        )
+                        last_error = e
+                        break
+
+                    if (
+                        attempt == max_attempts
+                        or provider_status.circuit_state == CircuitState.OPEN
+                    ):
+                        self.logger.warning(
+                            f"All attempts failed for provider {provider}: {e}"
+                        )
+                        last_error = e
+                        break
+                    else:
+                        retry_delay = min(2 ** (attempt - 1), 30)
+                        self.logger.warning(
+                            f"Attempt {attempt}/{max_attempts} failed for {provider}, "
+                            f"retrying in {retry_delay}s: {e}"
+                        )
+                        await asyncio.sleep(retry_delay)
+
+                except Exception as e:
+                    self._record_failure(provider_status, e)
+
+                    self.logger.error(f"Unexpected error with provider {provider}: {e}")
+                    last_error = e
+                    break
+
+        if not tried_provider:
+            error_message = (
+                "All LLM providers are unavailable or have open circuits: "
+                f"{', '.join(providers_to_try)}"
+            )
+        else:
+            error_message = f"All LLM providers failed. Last error: {last_error}"
         self.logger.error(error_message)
         return IntegrationResult.error_result(error_message)
 
@@ -420,33 +801,22 @@ class FallbackLLMClient(LLMClient):
             IntegrationResult[int]: Result containing the token count
         """
         # Similar fallback logic as _chat_with_provider, but for token counting
-        # If we have a successful provider and configuration says to use it, try it first
-        if (
-            self._last_successful_provider
-            and self._fallback_config.stop_on_successful_provider
-        ):
-            providers_to_try = [
-                self._last_successful_provider,
-                *[
-                    p
-                    for p in self._fallback_config.providers
-                    if p != self._last_successful_provider
-                ],
-            ]
-        else:
-            providers_to_try = self._fallback_config.providers
+        providers_to_try = self._provider_order()
 
         last_error = None
 
-        for provider_idx, provider in enumerate(providers_to_try):
-            # Check if provider is marked as unavailable
+        tried_provider = False
+
+        for provider in providers_to_try:
+            # Skip providers that are unavailable or whose circuit is open
             provider_status = self._provider_status[provider]
-            if not provider_status.available:
+            if not self._provider_allowed(provider_status):
                 continue
 
-            # Add delay before trying next provider (except for the first one)
-            if provider_idx > 0 and self._fallback_config.delay_between_providers > 0:
+            # Add delay before trying next provider (except for the first one tried)
+            if tried_provider and self._fallback_config.delay_between_providers > 0:
                 time.sleep(self._fallback_config.delay_between_providers)
+            tried_provider = True
 
             # Try to get client for this provider
             try:
@@ -461,9 +831,8 @@ class FallbackLLMClient(LLMClient):
                 result = client.count_tokens(messages)
 
                 if result.success:
-                    # Update provider status
-                    provider_status.success_count += 1
-                    provider_status.last_attempt_time = time.time()
+                    # Update provider status; token counts add no latency sample
+                    provider_status.record_success()
 
                     # Add provider info to result
                     if result.message:
@@ -475,13 +844,11 @@ class FallbackLLMClient(LLMClient):
 
                 # If unsuccessful, try next provider
                 last_error = result.error or Exception("Unknown token counting error")
+                self._record_failure(provider_status, last_error)
 
             except Exception as e:
                 # Update provider status
-                provider_status.last_attempt_time = time.time()
-                provider_status.last_error = str(e)
-                provider_status.fail_count += 1
-
+                self._record_failure(provider_status, e)
                 last_error = e
 
         # If we get here, all providers failed
@@ -490,3 +857,64 @@ class FallbackLLMClient(LLMClient):
         )
         self.logger.error(error_message)
         return IntegrationResult.error_result(error_message)
+
+    async def _acount_tokens_with_provider(
+        self, messages: list[ChatMessage]
+    ) -> IntegrationResult[int]:
+        """
+        Count tokens with fallback support, asynchronously.
+
+        Args:
+            messages: List of messages to count tokens for
+
+        Returns:
+            IntegrationResult[int]: Result containing the token count
+        """
+        last_error = None
+        tried_provider = False
+
+        for provider in self._provider_order():
+            provider_status = self._provider_status[provider]
+            if not self._provider_allowed(provider_status):
+                continue
+
+            if tried_provider and self._fallback_config.delay_between_providers > 0:
+                await asyncio.sleep(self._fallback_config.delay_between_providers)
+            tried_provider = True
+
+            try:
+                client = self._get_client_for_provider(provider)
+            except QuackIntegrationError as e:
+                last_error = e
+                continue
+
+            try:
+                result = await client.acount_tokens(messages)
+
+                if result.success:
+                    provider_status.record_success()
+
+                    if result.message:
+                        result.message = f"{result.message} (via {provider})"
+                    else:
+                        result.message = f"Success (via {provider})"
+
+                    return result
+
+                last_error = result.error or Exception("Unknown token counting error")
+                self._record_failure(provider_status, last_error)
+
+            except Exception as e:
+                self._record_failure(provider_status, e)
+                last_error = e
+
+        error_message = (
+            f"All providers failed to count tokens. Last error: {last_error}"
+        )
+        self.logger.error(error_message)
+        return IntegrationResult.error_result(error_message)
+
+    async def aclose(self) -> None:
+        """Close the async resources of every provider client created so far."""
+        for client in self._client_cache.values():
+            await client.aclose()
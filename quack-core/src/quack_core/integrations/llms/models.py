@@ -19,6 +19,7 @@ from enum import Enum
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
+from quack_core.integrations.core.results import IntegrationResult
 
 
 class RoleType(str, Enum):
@@ -210,3 +211,27 @@ class LLMResult(BaseModel):
     total_tokens: int | None = Field(None, description="Total number of tokens")
     function_call: FunctionCall | None = Field(None, description="Function call data")
     tool_calls: list[ToolCall] | None = Field(None, description="Tool call data")
+
+
+class ChatBatchResult(BaseModel):
+    """Model for the results of a chat_many request."""
+
+    results: list[IntegrationResult[str]] = Field(
+        default_factory=list, description="Per-request results, in input order"
+    )
+    succeeded: int = Field(0, description="Number of successful requests")
+    failed: int = Field(0, description="Number of failed requests")
+    failed_indices: list[int] = Field(
+        default_factory=list, description="Input positions of failed requests"
+    )
+    elapsed_seconds: float = Field(0.0, description="Wall time for the whole batch")
+
+    @property
+    def success(self) -> bool:
+        """Whether every request succeeded."""
+        return self.failed == 0
+
+    @property
+    def contents(self) -> list[str | None]:
+        """Response text per request (None where the request failed)."""
+        return [result.content if result.success else None for result in self.results]
@@ -0,0 +1,159 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/llms/rate_limit.py
+# module: quack_core.integrations.llms.rate_limit
+# role: module
+# neighbors: __init__.py, models.py, protocols.py, config.py, registry.py, fallback.py
+# exports: TokenBucket, RateLimiter, estimate_request_tokens
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Client-side rate limiting for LLM providers.
+
+Each provider client can carry a RateLimiter built from the provider's
+requests_per_minute / tokens_per_minute settings. Before every provider call
+the client reserves capacity and waits (time.sleep or asyncio.sleep) until
+the reservation is due, so bulk jobs stay under the provider's limits instead
+of hitting 429s and retrying.
+
+Buckets are guarded by a threading lock rather than asyncio primitives, so
+one limiter can be shared by sync callers, worker threads and any number of
+event loops.
+"""
+
+import threading
+import time
+from collections.abc import Sequence
+
+from quack_core.integrations.llms.models import ChatMessage, LLMOptions
+
+# Completion budget assumed when a request does not set max_tokens
+DEFAULT_COMPLETION_TOKENS = 256
+
+
+def estimate_request_tokens(
+    messages: Sequence[ChatMessage], options: LLMOptions | None = None
+) -> int:
+    """
+    Cheaply estimate the tokens a request will consume.
+
+    Uses the ~4 characters per token rule for the prompt (exact counting
+    would cost a tokenizer pass or an API call per request) plus the
+    completion budget.
+
+    Args:
+        messages: Normalized messages for the conversation
+        options: Request options
+
+    Returns:
+        int: Estimated prompt + completion tokens
+    """
+    prompt_chars = sum(len(message.content or "") for message in messages)
+    completion = (
+        options.max_tokens
+        if options is not None and options.max_tokens
+        else DEFAULT_COMPLETION_TOKENS
+    )
+    return prompt_chars // 4 + completion
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of blocking.
+
+    reserve() always succeeds and returns how long the caller must wait
+    before using the capacity; the bucket may go negative, which queues
+    later callers behind earlier ones in arrival order.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        """
+        Args:
+            capacity: Maximum burst size
+            refill_per_second: Capacity regained per second
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._level = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take amount from the bucket.
+
+        Args:
+            amount: Capacity to consume (clamped to the bucket size so a
+                single oversized request cannot wait forever)
+
+        Returns:
+            float: Seconds to wait before proceeding (0 if available now)
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._level = min(
+                self.capacity,
+                self._level + (now - self._updated) * self.refill_per_second,
+            )
+            self._updated = now
+            self._level -= amount
+            if self._level >= 0:
+                return 0.0
+            return -self._level / self.refill_per_second
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for one provider."""
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        """
+        Args:
+            requests_per_minute: Max requests per minute (None for no limit)
+            tokens_per_minute: Max estimated tokens per minute (None for no limit)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+            if requests_per_minute
+            else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute
+            else None
+        )
+
+    @classmethod
+    def from_limits(
+        cls,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> "RateLimiter | None":
+        """Build a limiter, or return None if neither limit is set."""
+        if not requests_per_minute and not tokens_per_minute:
+            return None
+        return cls(requests_per_minute, tokens_per_minute)
+
+    def reserve(self, tokens: int) -> float:
+        """
+        Reserve one request and the given token estimate.
+
+        Args:
+            tokens: Estimated tokens for the request
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        delay = 0.0
+        if self._requests is not None:
+            delay = max(delay, self._requests.reserve(1))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.reserve(tokens))
+        return delay
@@ -23,7 +23,11 @@ from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.llms.clients import LLMClient, MockLLMClient
 from quack_core.integrations.llms.config import LLMConfig, LLMConfigProvider
 from quack_core.integrations.llms.fallback import FallbackConfig
-from quack_core.integrations.llms.models import ChatMessage, LLMOptions
+from quack_core.integrations.llms.models import ChatBatchResult, ChatMessage, LLMOptions
+from quack_core.integrations.llms.service.initialization import (
+    create_rate_limiter,
+    create_response_cache,
+)
 from quack_core.lib.errors import QuackIntegrationError
 from quack_core.lib.logging import LOG_LEVELS, LogLevel
 
@@ -270,6 +274,8 @@ class LLMIntegration(BaseIntegrationService):
             "initial_retry_delay": llm_config.get("initial_retry_delay", 1.0),
             "max_retry_delay": llm_config.get("max_retry_delay", 30.0),
             "log_level": self.log_level,
+            "cache": create_response_cache(self, llm_config),
+            "rate_limiter": create_rate_limiter(provider_config),
         }
 
         # Add provider-specific config
@@ -280,6 +286,8 @@ class LLMIntegration(BaseIntegrationService):
             client_args["api_base"] = provider_config.get("api_base")
         elif provider == "ollama":
             client_args["api_base"] = provider_config.get("api_base")
+            client_args["pool_size"] = provider_config.get("pool_size", 10)
+            client_args["keep_alive"] = provider_config.get("keep_alive")
 
         try:
             # Import the registry functions for getting an LLM client
@@ -370,10 +378,21 @@ class LLMIntegration(BaseIntegrationService):
                     "api_base": provider_config.get("api_base"),
                     "organization": provider_config.get("organization"),
                 }
-            elif provider in ["anthropic", "ollama"]:
+            elif provider == "anthropic":
                 provider_args[provider] = {
                     "api_base": provider_config.get("api_base"),
                 }
+            elif provider == "ollama":
+                provider_args[provider] = {
+                    "api_base": provider_config.get("api_base"),
+                    "pool_size": provider_config.get("pool_size", 10),
+                    "keep_alive": provider_config.get("keep_alive"),
+                }
+
+            # Each provider client gets its own limiter
+            rate_limiter = create_rate_limiter(provider_config)
+            if rate_limiter is not None:
+                provider_args[provider]["rate_limiter"] = rate_limiter
 
         # Common args for all providers
         common_args = {
@@ -383,6 +402,9 @@ class LLMIntegration(BaseIntegrationService):
             "max_retry_delay": llm_config.get("max_retry_delay", 30.0),
         }
 
+        # The cache sits on the fallback client so a hit skips provider selection
+        cache = create_response_cache(self, llm_config)
+
         # Initialize the fallback client
         try:
             # Import here to avoid circular imports
@@ -393,6 +415,7 @@ class LLMIntegration(BaseIntegrationService):
                 model_map=model_map,
                 api_key_map=api_key_map,
                 log_level=self.log_level,
+                cache=cache,
                 **common_args,
             )
 
@@ -475,6 +498,134 @@ class LLMIntegration(BaseIntegrationService):
 
         return result
 
+    def count_tokens_many(
+        self, message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]]
+    ) -> IntegrationResult[list[int]]:
+        """
+        Count the tokens of several conversations in one call.
+
+        Args:
+            message_lists: Conversations to count, one sequence of messages each
+
+        Returns:
+            IntegrationResult[list[int]]: Token counts in input order
+        """
+        if init_error := self._ensure_initialized():
+            return init_error
+
+        if not self.client:
+            return IntegrationResult.error_result("LLM client not initialized")
+
+        result = self.client.count_tokens_many(message_lists)
+
+        # Add a note if we're using the mock client
+        if self._using_mock and result.success:
+            result.message = f"{result.message or 'Success'} (using mock estimation)"
+
+        return result
+
+    async def achat(
+        self,
+        messages: Sequence[ChatMessage] | Sequence[dict],
+        options: LLMOptions | None = None,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Send a chat completion request to the LLM without blocking the event loop.
+
+        Args:
+            messages: Sequence of messages for the conversation
+            options: Additional options for the completion request
+            callback: Optional callback function for streaming responses
+
+        Returns:
+            IntegrationResult[str]: Result of the chat completion request
+        """
+        if init_error := self._ensure_initialized():
+            return init_error
+
+        if not self.client:
+            return IntegrationResult.error_result("LLM client not initialized")
+
+        result = await self.client.achat(messages, options, callback)
+
+        if self._using_mock and result.success:
+            result.message = f"{result.message or 'Success'} (using mock LLM)"
+
+        return result
+
+    async def acount_tokens(
+        self, messages: Sequence[ChatMessage] | Sequence[dict]
+    ) -> IntegrationResult[int]:
+        """
+        Count the number of tokens in the messages without blocking the event loop.
+
+        Args:
+            messages: Sequence of messages to count tokens for
+
+        Returns:
+            IntegrationResult[int]: Result containing the token count
+        """
+        if init_error := self._ensure_initialized():
+            return init_error
+
+        if not self.client:
+            return IntegrationResult.error_result("LLM client not initialized")
+
+        result = await self.client.acount_tokens(messages)
+
+        if self._using_mock and result.success:
+            result.message = f"{result.message or 'Success'} (using mock estimation)"
+
+        return result
+
+    def chat_many(
+        self,
+        message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]],
+        options: LLMOptions | Sequence[LLMOptions] | None = None,
+        max_concurrency: int | None = None,
+    ) -> ChatBatchResult:
+        """
+        Send many independent chat requests concurrently.
+
+        Requests run with at most max_concurrency in flight, each with the
+        usual fallback and per-provider rate limiting. Failures are reported
+        per request rather than aborting the batch.
+
+        Args:
+            message_lists: One message sequence per request
+            options: Options shared by every request, or one per request
+            max_concurrency: Max requests in flight (defaults to the
+                configured max_concurrency)
+
+        Returns:
+            ChatBatchResult: Per-request results in input order
+        """
+        from quack_core.integrations.llms.service.operations import chat_many
+
+        return chat_many(self, message_lists, options, max_concurrency)
+
+    async def achat_many(
+        self,
+        message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]],
+        options: LLMOptions | Sequence[LLMOptions] | None = None,
+        max_concurrency: int | None = None,
+    ) -> ChatBatchResult:
+        """
+        Async version of chat_many, for use inside a running event loop.
+
+        Args:
+            message_lists: One message sequence per request
+            options: Options shared by every request, or one per request
+            max_concurrency: Max requests in flight
+
+        Returns:
+            ChatBatchResult: Per-request results in input order
+        """
+        from quack_core.integrations.llms.service.operations import achat_many
+
+        return await achat_many(self, message_lists, options, max_concurrency)
+
     def get_provider_status(self) -> list[dict] | None:
         """
         Get the status of all providers when using fallback.
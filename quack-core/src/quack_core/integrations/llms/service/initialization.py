@@ -15,7 +15,53 @@ This module provides functions for initializing single providers and fallback co
 """
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.llms.cache import ResponseCache, ResponseCacheConfig
 from quack_core.integrations.llms.fallback import FallbackConfig
+from quack_core.integrations.llms.rate_limit import RateLimiter
+
+
+def create_response_cache(self, llm_config: dict) -> ResponseCache | None:
+    """
+    Create the chat response cache if it is enabled in the configuration.
+
+    Args:
+        self: LLMIntegration instance
+        llm_config: LLM configuration
+
+    Returns:
+        ResponseCache | None: The cache, or None if caching is disabled or
+        the configuration is invalid
+    """
+    try:
+        cache_config = ResponseCacheConfig(**(llm_config.get("cache") or {}))
+    except Exception as e:
+        self.logger.warning(f"Invalid cache configuration, caching disabled: {e}")
+        return None
+
+    if not cache_config.enabled:
+        return None
+
+    self.logger.info(
+        f"Response cache enabled (max_entries={cache_config.max_entries}, "
+        f"disk={cache_config.path or 'off'})"
+    )
+    return ResponseCache.from_config(cache_config)
+
+
+def create_rate_limiter(provider_config: dict) -> RateLimiter | None:
+    """
+    Create a provider's client-side rate limiter from its configuration.
+
+    Args:
+        provider_config: Provider section of the LLM configuration
+
+    Returns:
+        RateLimiter | None: The limiter, or None if no limits are configured
+    """
+    return RateLimiter.from_limits(
+        provider_config.get("requests_per_minute"),
+        provider_config.get("tokens_per_minute"),
+    )
 
 
 def initialize_single_provider(
@@ -69,6 +115,8 @@ def initialize_single_provider(
         "initial_retry_delay": llm_config.get("initial_retry_delay", 1.0),
         "max_retry_delay": llm_config.get("max_retry_delay", 30.0),
         "log_level": self.log_level,
+        "cache": create_response_cache(self, llm_config),
+        "rate_limiter": create_rate_limiter(provider_config),
     }
 
     # Add provider-specific config
@@ -79,6 +127,8 @@ def initialize_single_provider(
         client_args["api_base"] = provider_config.get("api_base")
     elif provider == "ollama":
         client_args["api_base"] = provider_config.get("api_base")
+        client_args["pool_size"] = provider_config.get("pool_size", 10)
+        client_args["keep_alive"] = provider_config.get("keep_alive")
 
     try:
         # Import the registry functions for getting an LLM client
@@ -170,10 +220,21 @@ def initialize_with_fallback(
                 "api_base": provider_config.get("api_base"),
                 "organization": provider_config.get("organization"),
             }
-        elif provider in ["anthropic", "ollama"]:
+        elif provider == "anthropic":
             provider_args[provider] = {
                 "api_base": provider_config.get("api_base"),
             }
+        elif provider == "ollama":
+            provider_args[provider] = {
+                "api_base": provider_config.get("api_base"),
+                "pool_size": provider_config.get("pool_size", 10),
+                "keep_alive": provider_config.get("keep_alive"),
+            }
+
+        # Each provider client gets its own limiter
+        rate_limiter = create_rate_limiter(provider_config)
+        if rate_limiter is not None:
+            provider_args[provider]["rate_limiter"] = rate_limiter
 
     # Common args for all providers
     common_args = {
@@ -183,6 +244,9 @@ def initialize_with_fallback(
         "max_retry_delay": llm_config.get("max_retry_delay", 30.0),
     }
 
+    # The cache sits on the fallback client so a hit skips provider selection
+    cache = create_response_cache(self, llm_config)
+
     # Initialize the fallback client
     try:
         # Import here to avoid circular imports
@@ -193,6 +257,7 @@ def initialize_with_fallback(
             model_map=model_map,
             api_key_map=api_key_map,
             log_level=self.log_level,
+            cache=cache,
             **common_args,
         )
 
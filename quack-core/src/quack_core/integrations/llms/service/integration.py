@@ -19,6 +19,7 @@ from collections.abc import Callable, Sequence
 from quack_core.integrations.core.base import BaseIntegrationService
 from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.llms import ChatMessage, LLMOptions
+from quack_core.integrations.llms.models import ChatBatchResult
 from quack_core.integrations.llms.clients import LLMClient
 from quack_core.integrations.llms.config import LLMConfigProvider
 from quack_core.integrations.llms.fallback import FallbackConfig
@@ -240,6 +241,108 @@ class LLMIntegration(BaseIntegrationService):
 
         return count_tokens(self, messages)
 
+    def count_tokens_many(
+        self, message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]]
+    ) -> IntegrationResult[list[int]]:
+        """
+        Count the tokens of several conversations in one call.
+
+        Args:
+            message_lists: Conversations to count, one sequence of messages each
+
+        Returns:
+            IntegrationResult[list[int]]: Token counts in input order
+        """
+        from quack_core.integrations.llms.service.operations import (
+            count_tokens_many,
+        )
+
+        return count_tokens_many(self, message_lists)
+
+    async def achat(
+        self,
+        messages: Sequence[ChatMessage] | Sequence[dict],
+        options: LLMOptions | None = None,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Send a chat completion request to the LLM without blocking the event loop.
+
+        Args:
+            messages: Sequence of messages for the conversation
+            options: Additional options for the completion request
+            callback: Optional callback function for streaming responses
+
+        Returns:
+            IntegrationResult[str]: Result of the chat completion request
+        """
+        from quack_core.integrations.llms.service.operations import achat
+
+        return await achat(self, messages, options, callback)
+
+    async def acount_tokens(
+        self, messages: Sequence[ChatMessage] | Sequence[dict]
+    ) -> IntegrationResult[int]:
+        """
+        Count the number of tokens in the messages without blocking the event loop.
+
+        Args:
+            messages: Sequence of messages to count tokens for
+
+        Returns:
+            IntegrationResult[int]: Result containing the token count
+        """
+        from quack_core.integrations.llms.service.operations import acount_tokens
+
+        return await acount_tokens(self, messages)
+
+    def chat_many(
+        self,
+        message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]],
+        options: LLMOptions | Sequence[LLMOptions] | None = None,
+        max_concurrency: int | None = None,
+    ) -> ChatBatchResult:
+        """
+        Send many independent chat requests concurrently.
+
+        Requests run with at most max_concurrency in flight, each with the
+        usual fallback and per-provider rate limiting. Failures are reported
+        per request rather than aborting the batch.
+
+        Args:
+            message_lists: One message sequence per request
+            options: Options shared by every request, or one per request
+            max_concurrency: Max requests in flight (defaults to the
+                configured max_concurrency)
+
+        Returns:
+            ChatBatchResult: Per-request results in input order
+        """
+        from quack_core.integrations.llms.service.operations import chat_many
+
+        return chat_many(self, message_lists, options, max_concurrency)
+
+    async def achat_many(
+        self,
+        message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]],
+        options: LLMOptions | Sequence[LLMOptions] | None = None,
+        max_concurrency: int | None = None,
+    ) -> ChatBatchResult:
+        """
+        Async version of chat_many, for use inside a running event loop.
+
+        Args:
+            message_lists: One message sequence per request
+            options: Options shared by every request, or one per request
+            max_concurrency: Max requests in flight
+
+        Returns:
+            ChatBatchResult: Per-request results in input order
+        """
+        from quack_core.integrations.llms.service.operations import achat_many
+
+        return await achat_many(self, message_lists, options, max_concurrency)
+
     def get_provider_status(self) -> list[dict] | None:
         """
         Get the status of all providers when using fallback.
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.llms.service.operations
 # role: service
 # neighbors: __init__.py, dependencies.py, initialization.py, integration.py
-# exports: chat, count_tokens, get_provider_status, reset_provider_status
+# exports: chat, count_tokens, count_tokens_many, get_provider_status, reset_provider_status
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -14,10 +14,12 @@ LLM _operations for the integration service.
 This module provides methods for interacting with LLMs, such as chat and token counting.
 """
 
+import asyncio
+import time
 from collections.abc import Callable, Sequence
 
 from quack_core.integrations.core.results import IntegrationResult
-from quack_core.integrations.llms.models import ChatMessage, LLMOptions
+from quack_core.integrations.llms.models import ChatBatchResult, ChatMessage, LLMOptions
 
 
 def chat(
@@ -81,6 +83,206 @@ def count_tokens(
     return result
 
 
+def count_tokens_many(
+    self, message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]]
+) -> IntegrationResult[list[int]]:
+    """
+    Count the tokens of several conversations in one call.
+
+    Args:
+        self: LLMIntegration instance
+        message_lists: Conversations to count, one sequence of messages each
+
+    Returns:
+        IntegrationResult[list[int]]: Token counts in input order
+    """
+    if init_error := self._ensure_initialized():
+        return init_error
+
+    if not self.client:
+        return IntegrationResult(success=False, error="LLM client not initialized")
+
+    result = self.client.count_tokens_many(message_lists)
+
+    # Add a note if we're using the mock client
+    if self._using_mock and result.success:
+        result.message = f"{result.message or 'Success'} (using mock estimation)"
+
+    return result
+
+
+async def achat(
+    self,
+    messages: Sequence[ChatMessage] | Sequence[dict],
+    options: LLMOptions | None = None,
+    callback: Callable[[str], None] | None = None,
+) -> IntegrationResult[str]:
+    """
+    Send a chat completion request to the LLM without blocking the event loop.
+
+    Args:
+        self: LLMIntegration instance
+        messages: Sequence of messages for the conversation
+        options: Additional options for the completion request
+        callback: Optional callback function for streaming responses
+
+    Returns:
+        IntegrationResult[str]: Result of the chat completion request
+    """
+    if init_error := self._ensure_initialized():
+        return init_error
+
+    if not self.client:
+        return IntegrationResult(success=False, error="LLM client not initialized")
+
+    result = await self.client.achat(messages, options, callback)
+
+    if self._using_mock and result.success:
+        result.message = f"{result.message or 'Success'} (using mock LLM)"
+
+    return result
+
+
+async def acount_tokens(
+    self, messages: Sequence[ChatMessage] | Sequence[dict]
+) -> IntegrationResult[int]:
+    """
+    Count the number of tokens in the messages without blocking the event loop.
+
+    Args:
+        self: LLMIntegration instance
+        messages: Sequence of messages to count tokens for
+
+    Returns:
+        IntegrationResult[int]: Result containing the token count
+    """
+    if init_error := self._ensure_initialized():
+        return init_error
+
+    if not self.client:
+        return IntegrationResult(success=False, error="LLM client not initialized")
+
+    result = await self.client.acount_tokens(messages)
+
+    if self._using_mock and result.success:
+        result.message = f"{result.message or 'Success'} (using mock estimation)"
+
+    return result
+
+
+async def achat_many(
+    self,
+    message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]],
+    options: LLMOptions | Sequence[LLMOptions] | None = None,
+    max_concurrency: int | None = None,
+) -> ChatBatchResult:
+    """
+    Send many independent chat requests concurrently.
+
+    Each request goes through the configured client (and so through
+    FallbackLLMClient's per-request fallback when enabled). Provider rate
+    limits are enforced by the provider clients themselves.
+
+    Args:
+        self: LLMIntegration instance
+        message_lists: One message sequence per request
+        options: Options shared by every request, or one per request
+        max_concurrency: Max requests in flight (defaults to the configured
+            max_concurrency)
+
+    Returns:
+        ChatBatchResult: Per-request results in input order, with failure counts
+    """
+    started = time.monotonic()
+
+    if isinstance(options, LLMOptions) or options is None:
+        per_request = [options] * len(message_lists)
+    else:
+        per_request = list(options)
+        if len(per_request) != len(message_lists):
+            raise ValueError(
+                f"Got {len(per_request)} options for {len(message_lists)} requests"
+            )
+
+    init_error = self._ensure_initialized()
+    if init_error is None and not self.client:
+        init_error = IntegrationResult.error_result("LLM client not initialized")
+
+    if init_error is not None:
+        results = [init_error] * len(message_lists)
+    else:
+        if max_concurrency is None:
+            max_concurrency = (self.config or {}).get("max_concurrency", 8)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(
+            messages: Sequence[ChatMessage] | Sequence[dict],
+            request_options: LLMOptions | None,
+        ) -> IntegrationResult[str]:
+            # Copy options: the client fills in the model on the instance
+            if request_options is not None:
+                request_options = request_options.model_copy(deep=True)
+            async with semaphore:
+                try:
+                    return await achat(self, messages, request_options)
+                except Exception as e:
+                    self.logger.error(f"Unexpected error in chat_many request: {e}")
+                    return IntegrationResult.error_result(f"Unexpected error: {e}")
+
+        results = list(
+            await asyncio.gather(
+                *(
+                    run_one(messages, request_options)
+                    for messages, request_options in zip(
+                        message_lists, per_request, strict=True
+                    )
+                )
+            )
+        )
+
+    failed_indices = [i for i, result in enumerate(results) if not result.success]
+    return ChatBatchResult(
+        results=results,
+        succeeded=len(results) - len(failed_indices),
+        failed=len(failed_indices),
+        failed_indices=failed_indices,
+        elapsed_seconds=time.monotonic() - started,
+    )
+
+
+def chat_many(
+    self,
+    message_lists: Sequence[Sequence[ChatMessage] | Sequence[dict]],
+    options: LLMOptions | Sequence[LLMOptions] | None = None,
+    max_concurrency: int | None = None,
+) -> ChatBatchResult:
+    """
+    Blocking wrapper around achat_many.
+
+    Runs the batch on a new event loop and closes the client's async
+    connections before that loop ends, so later calls start clean. Must
+    not be called from a running event loop; use achat_many there.
+
+    Args:
+        self: LLMIntegration instance
+        message_lists: One message sequence per request
+        options: Options shared by every request, or one per request
+        max_concurrency: Max requests in flight
+
+    Returns:
+        ChatBatchResult: Per-request results in input order, with failure counts
+    """
+
+    async def run() -> ChatBatchResult:
+        try:
+            return await achat_many(self, message_lists, options, max_concurrency)
+        finally:
+            if self.client is not None:
+                await self.client.aclose()
+
+    return asyncio.run(run())
+
+
 def get_provider_status(self) -> list[dict] | None:
     """
     Get the status of all providers when using fallback.
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.pandoc.__init__
 # role: module
 # neighbors: service.py, models.py, protocols.py, config.py, converter.py
-# exports: PandocIntegration, PandocConfig, PandocConfigProvider, DocumentConverter, ConversionMetrics, ConversionTask, FileInfo, create_integration
+# exports: PandocIntegration, PandocConfig, PandocConfigProvider, DocumentConverter, PypandocBackend, PandocServerBackend, ConversionCache, ConversionMetrics, ConversionTask, FileInfo, create_integration
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,6 +16,8 @@ including HTML to Markdown and Markdown to DOCX conversion.
 """
 
 from quack_core.integrations.core.protocols import IntegrationProtocol
+from quack_core.integrations.pandoc.backends import PypandocBackend
+from quack_core.integrations.pandoc.cache import ConversionCache
 from quack_core.integrations.pandoc.config import PandocConfig, PandocConfigProvider
 from quack_core.integrations.pandoc.converter import DocumentConverter
 from quack_core.integrations.pandoc.models import (
@@ -23,6 +25,7 @@ from quack_core.integrations.pandoc.models import (
     ConversionTask,
     FileInfo,
 )
+from quack_core.integrations.pandoc.server import PandocServerBackend
 from quack_core.integrations.pandoc.service import PandocIntegration
 
 __all__ = [
@@ -33,6 +36,9 @@ __all__ = [
     "PandocConfigProvider",
     # Core converter
     "DocumentConverter",
+    "PypandocBackend",
+    "PandocServerBackend",
+    "ConversionCache",
     # Models
     "ConversionMetrics",
     "ConversionTask",
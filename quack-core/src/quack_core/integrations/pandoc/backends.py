@@ -0,0 +1,126 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/pandoc/backends.py
+# module: quack_core.integrations.pandoc.backends
+# role: module
+# neighbors: __init__.py, service.py, models.py, protocols.py, config.py, converter.py
+# exports: PypandocBackend, get_default_backend
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Conversion backends for Pandoc integration.
+
+A backend runs pandoc for a single conversion. The conversion operations take
+the backend as a parameter, so callers (and tests) choose the engine
+explicitly instead of the operations importing pypandoc themselves.
+"""
+
+import importlib
+from collections.abc import Sequence
+
+from quack_core.lib.errors import QuackIntegrationError
+from quack_core.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PypandocBackend:
+    """Backend that runs each conversion as a pandoc subprocess via pypandoc."""
+
+    def convert_file(
+        self,
+        source_path: str,
+        to_format: str,
+        from_format: str,
+        output_path: str | None = None,
+        extra_args: Sequence[str] = (),
+    ) -> str:
+        """
+        Convert a file with pypandoc.
+
+        Args:
+            source_path: Path to the input file (as a string).
+            to_format: Pandoc output format.
+            from_format: Pandoc input format.
+            output_path: Path to write the output to, or None to return it.
+            extra_args: Additional pandoc command-line arguments.
+
+        Returns:
+            str: The converted document, or an empty string when written to
+            output_path.
+
+        Raises:
+            QuackIntegrationError: If pypandoc is not installed.
+        """
+        pypandoc = _import_pypandoc({"path": source_path})
+        output = pypandoc.convert_file(
+            source_path,
+            to_format,
+            format=from_format,
+            outputfile=output_path,
+            extra_args=list(extra_args),
+        )
+        return output if isinstance(output, str) else ""
+
+    def convert_text(
+        self,
+        source: str,
+        to_format: str,
+        from_format: str,
+        output_path: str | None = None,
+        extra_args: Sequence[str] = (),
+    ) -> str:
+        """
+        Convert a document held in memory with pypandoc.
+
+        The source is piped to pandoc on stdin, so no input file is written.
+
+        Args:
+            source: The document to convert.
+            to_format: Pandoc output format.
+            from_format: Pandoc input format.
+            output_path: Path to write the output to, or None to return it.
+                         Required for binary formats such as docx.
+            extra_args: Additional pandoc command-line arguments.
+
+        Returns:
+            str: The converted document, or an empty string when written to
+            output_path.
+
+        Raises:
+            QuackIntegrationError: If pypandoc is not installed.
+        """
+        pypandoc = _import_pypandoc({"format": from_format})
+        output = pypandoc.convert_text(
+            source,
+            to_format,
+            format=from_format,
+            outputfile=output_path,
+            extra_args=list(extra_args),
+        )
+        return output if isinstance(output, str) else ""
+
+
+def _import_pypandoc(context: dict[str, str]):
+    # Imported per call so a missing pypandoc only fails conversions
+    try:
+        return importlib.import_module("pypandoc")
+    except ImportError as e:
+        raise QuackIntegrationError(
+            f"pypandoc module is not installed: {str(e)}",
+            {"module": "pypandoc", **context},
+        ) from e
+
+
+_default_backend = PypandocBackend()
+
+
+def get_default_backend() -> PypandocBackend:
+    """
+    Get the backend used when a conversion is not given one.
+
+    Returns:
+        PypandocBackend: The shared pypandoc backend.
+    """
+    return _default_backend
@@ -0,0 +1,289 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/pandoc/cache.py
+# module: quack_core.integrations.pandoc.cache
+# role: module
+# neighbors: __init__.py, service.py, models.py, protocols.py, config.py, converter.py, backends.py
+# exports: ConversionCache
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Content-addressed on-disk cache of conversion outputs.
+
+Outputs are stored under a key derived from the input bytes, the pandoc
+arguments and the pandoc version, so a cached output is reused only when a
+conversion would produce the same result. The cache works directly on the
+local filesystem: entries are written atomically and may be shared by several
+processes, e.g. the workers of a batch conversion.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from collections.abc import Sequence
+
+from quack_core.integrations.pandoc.config import CacheConfig
+from quack_core.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Prefix of partially written files in the cache directory and next to outputs
+_TEMP_PREFIX = ".tmp-"
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+class ConversionCache:
+    """
+    Size-bounded, least-recently-used cache of conversion outputs.
+
+    Attributes:
+        cache_dir: Directory holding the cached outputs.
+        max_size: Maximum total size of the cache in bytes.
+        hardlink: Whether outputs are hardlinked into place instead of copied.
+    """
+
+    def __init__(
+            self, cache_dir: str, max_size: int, hardlink: bool = False
+    ) -> None:
+        """
+        Initialize the conversion cache.
+
+        Args:
+            cache_dir: Directory holding the cached outputs; created if missing.
+            max_size: Maximum total size of the cache in bytes.
+            hardlink: Hardlink cached outputs into place instead of copying them.
+        """
+        self.cache_dir: str = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_size: int = max_size
+        self.hardlink: bool = hardlink
+        # Running total of the entry sizes, seeded by one scan on first store.
+        # Entries added by other processes are only seen by the next scan.
+        self._size: int | None = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: CacheConfig) -> "ConversionCache":
+        """
+        Create a cache from the cache section of a PandocConfig.
+
+        Args:
+            config: Cache configuration.
+
+        Returns:
+            ConversionCache: The configured cache.
+        """
+        return cls(config.cache_dir, config.max_size, hardlink=config.hardlink)
+
+    @staticmethod
+    def make_key(
+            input_path: str,
+            pandoc_args: Sequence[str],
+            source_format: str,
+            target_format: str,
+            pandoc_version: str,
+    ) -> str:
+        """
+        Compute the cache key of a conversion.
+
+        Args:
+            input_path: Path of the file to convert.
+            pandoc_args: Arguments passed to pandoc, from prepare_pandoc_args.
+            source_format: Source format.
+            target_format: Target format.
+            pandoc_version: Version of pandoc doing the conversion.
+
+        Returns:
+            str: Hex sha256 digest identifying the conversion.
+
+        Raises:
+            OSError: If the input file cannot be read.
+        """
+        content_hash = hashlib.sha256()
+        with open(input_path, "rb") as f:
+            while chunk := f.read(_READ_CHUNK_SIZE):
+                content_hash.update(chunk)
+
+        key = hashlib.sha256()
+        for part in (
+                content_hash.hexdigest(),
+                pandoc_version,
+                source_format,
+                target_format,
+                *pandoc_args,
+        ):
+            # NUL cannot occur in arguments, so the parts cannot run together
+            key.update(part.encode("utf-8"))
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """
+        Place the cached output for a key at output_path, if there is one.
+
+        On a miss with hardlinking enabled, an existing output that is still
+        linked to a cache entry is removed, so that the new conversion cannot
+        write through the link into the cache.
+
+        Args:
+            key: Cache key from make_key.
+            output_path: Where the output should be placed.
+
+        Returns:
+            bool: True on a cache hit, False otherwise.
+        """
+        entry = self._entry_path(key)
+        try:
+            # Mark the entry as recently used
+            os.utime(entry)
+            self._materialize(entry, output_path)
+        except FileNotFoundError:
+            if self.hardlink:
+                self._unlink_shared_output(output_path)
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to read conversion cache entry {key}: {e}")
+            return False
+        return True
+
+    def store(self, key: str, output_path: str) -> None:
+        """
+        Add a conversion output to the cache and evict old entries if needed.
+
+        Failures are logged and otherwise ignored; the cache never fails a
+        conversion.
+
+        Args:
+            key: Cache key from make_key.
+            output_path: Path of the output produced by the conversion.
+        """
+        entry = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=_TEMP_PREFIX, dir=os.path.dirname(entry)
+            )
+            os.close(fd)
+            try:
+                shutil.copyfile(output_path, tmp_path)
+                new_size = os.stat(tmp_path).st_size
+                old_size = _size_or_zero(entry)
+                os.replace(tmp_path, entry)
+            except BaseException:
+                _remove_quietly(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to store conversion output in cache: {e}")
+            return
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._scan_entries())
+        else:
+            self._size += new_size - old_size
+        if self._size > self.max_size:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_size.
+
+        This scans the whole cache directory, which also picks up entries
+        written by other processes; store() only calls it once the running
+        size exceeds max_size.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        entries = self._scan_entries()
+        total = sum(size for _, size, _ in entries)
+
+        removed = 0
+        if total > self.max_size:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_size:
+                    break
+                if _remove_quietly(path):
+                    total -= size
+                    removed += 1
+            logger.debug(f"Evicted {removed} entries from the conversion cache")
+        self._size = total
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._size = 0
+
+    def _scan_entries(self) -> list[tuple[float, int, str]]:
+        """Return (mtime, size, path) of every entry in the cache directory."""
+        entries: list[tuple[float, int, str]] = []
+        for shard in _scan(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in _scan(shard.path):
+                if entry.name.startswith(_TEMP_PREFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _materialize(self, entry: str, output_path: str) -> None:
+        """Atomically replace output_path with a link to, or copy of, entry."""
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        tmp_path = os.path.join(
+            output_dir, f"{_TEMP_PREFIX}{os.getpid()}-{os.path.basename(output_path)}"
+        )
+        _remove_quietly(tmp_path)
+        try:
+            if self.hardlink:
+                try:
+                    os.link(entry, tmp_path)
+                except OSError:
+                    # Different filesystem or no hardlink support
+                    shutil.copyfile(entry, tmp_path)
+            else:
+                shutil.copyfile(entry, tmp_path)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            _remove_quietly(tmp_path)
+            raise
+
+    @staticmethod
+    def _unlink_shared_output(output_path: str) -> None:
+        try:
+            if os.stat(output_path).st_nlink > 1:
+                os.unlink(output_path)
+        except OSError:
+            pass
+
+
+def _scan(path: str) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _size_or_zero(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _remove_quietly(path: str) -> bool:
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    return True
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.pandoc.config
 # role: module
 # neighbors: __init__.py, service.py, models.py, protocols.py, converter.py
-# exports: PandocOptions, ValidationConfig, RetryConfig, MetricsConfig, PandocConfig, PandocConfigProvider
+# exports: PandocOptions, ValidationConfig, RetryConfig, MetricsConfig, BatchConfig, CacheConfig, ServerConfig, PandocConfig, PandocConfigProvider
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -105,6 +105,85 @@ class MetricsConfig(BaseModel):
     )
 
 
+class BatchConfig(BaseModel):
+    """Configuration for batch conversion."""
+
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes for batch conversion (1 converts in-process)",
+    )
+    max_in_flight: int | None = Field(
+        default=None,
+        ge=1,
+        description="Tasks queued or running at once (defaults to 2 x max_workers)",
+    )
+    task_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds a worker may spend on one file before it is restarted",
+    )
+
+
+class CacheConfig(BaseModel):
+    """Configuration for the on-disk conversion cache."""
+
+    enabled: bool = Field(
+        default=False, description="Whether to reuse outputs of unchanged conversions"
+    )
+    cache_dir: str = Field(
+        default="~/.quack/cache/pandoc", description="Directory for cached outputs"
+    )
+    max_size: int = Field(
+        default=512 * 1024 * 1024,
+        ge=0,
+        description="Maximum cache size in bytes; least recently used outputs are evicted",
+    )
+    hardlink: bool = Field(
+        default=False,
+        description="Hardlink cached outputs into place instead of copying them; "
+        "linked outputs must not be modified in place",
+    )
+
+
+class ServerConfig(BaseModel):
+    """Configuration for converting through a long-lived pandoc server."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Whether to convert through pandoc-server instead of one "
+        "pandoc process per file",
+    )
+    url: str | None = Field(
+        default=None,
+        description="URL of a running pandoc server to use; when unset a local "
+        "server is started and supervised",
+    )
+    command: list[str] = Field(
+        default_factory=lambda: ["pandoc", "server"],
+        description="Command that starts a local server (pandoc 3+, or pandoc-server)",
+    )
+    host: str = Field(default="127.0.0.1", description="Host for the local server")
+    port: int = Field(
+        default=0, ge=0, le=65535, description="Port for the local server (0 picks a free port)"
+    )
+    timeout: float = Field(
+        default=60.0, gt=0, description="Seconds allowed for one conversion request"
+    )
+    startup_timeout: float = Field(
+        default=10.0, gt=0, description="Seconds to wait for a local server to accept requests"
+    )
+    max_connections: int = Field(
+        default=4, ge=1, description="Keep-alive connections kept open to the server"
+    )
+    max_restarts: int = Field(
+        default=3,
+        ge=0,
+        description="Restarts of a crashed local server before falling back to "
+        "one pandoc process per file",
+    )
+
+
 class PandocConfig(BaseModel):
     """Main configuration for document conversion."""
 
@@ -120,6 +199,15 @@ class PandocConfig(BaseModel):
     metrics: MetricsConfig = Field(
         default_factory=MetricsConfig, description="Metrics tracking settings"
     )
+    batch: BatchConfig = Field(
+        default_factory=BatchConfig, description="Batch conversion settings"
+    )
+    cache: CacheConfig = Field(
+        default_factory=CacheConfig, description="Conversion cache settings"
+    )
+    server: ServerConfig = Field(
+        default_factory=ServerConfig, description="Pandoc server settings"
+    )
     html_to_md_extra_args: list[str] = Field(
         default_factory=lambda: ["--strip-comments", "--no-highlight"],
         description="Extra arguments for HTML to Markdown conversion",
@@ -18,25 +18,41 @@ such as reading file info, creating directories, writing output files, etc.,
 are delegated to the quack_core.lib.fs service functions.
 """
 
+import multiprocessing
 import os
-from collections.abc import Sequence
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from datetime import datetime
+from multiprocessing.queues import SimpleQueue
 
 from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.pandoc import PandocConfig
+from quack_core.integrations.pandoc.backends import get_default_backend
+from quack_core.integrations.pandoc.cache import ConversionCache
 from quack_core.integrations.pandoc.models import ConversionMetrics, ConversionTask
 from quack_core.integrations.pandoc.operations import (
     get_file_info,
     verify_pandoc,
 )
 from quack_core.integrations.pandoc.operations.utils import (
+    prepare_pandoc_args,
     safe_convert_to_int,
     validate_docx_structure,
 )
 from quack_core.integrations.pandoc.protocols import (
     BatchConverterProtocol,
+    ConversionBackendProtocol,
     DocumentConverterProtocol,
 )
+from quack_core.integrations.pandoc.server import PandocServerBackend
 from quack_core.lib.errors import QuackIntegrationError
 from quack_core.lib.logging import get_logger
 
@@ -59,6 +75,67 @@ except ImportError:
     )
 
 
+# How often the batch loop wakes up to check timeouts and cancellation
+_WORKER_POLL_INTERVAL = 0.1
+
+# (source format, target format) pairs that convert_file supports
+_SUPPORTED_CONVERSIONS = frozenset({("html", "markdown"), ("markdown", "docx")})
+
+# Converter of the current worker process, built once by _init_worker
+_worker_converter: "DocumentConverter | None" = None
+# Queue on which the current worker process reports the jobs it starts
+_worker_started: SimpleQueue | None = None
+
+
+def _file_size(path: str) -> int:
+    """Return the size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        info = fs.get_file_info(path)
+    except Exception:
+        return 0
+    if not getattr(info, 'success', False):
+        return 0
+    return safe_convert_to_int(getattr(info, 'size', 0), 0)
+
+
+def _init_worker(
+        config: PandocConfig,
+        backend: ConversionBackendProtocol,
+        cache: ConversionCache | None,
+        started: SimpleQueue | None,
+) -> None:
+    """ProcessPoolExecutor initializer: build this process's converter."""
+    global _worker_converter, _worker_started
+    _worker_converter = DocumentConverter(config, backend=backend, cache=cache)
+    _worker_started = started
+
+
+def _convert_in_worker(
+        job_id: int, input_path: str, output_path: str, target_format: str
+) -> tuple[str | None, str | None, ConversionMetrics]:
+    """ProcessPoolExecutor task: convert one file on this process's converter."""
+    converter = _worker_converter
+    if converter is None:
+        raise QuackIntegrationError("Batch worker was not initialized")
+    if _worker_started is not None:
+        # A submitted task may wait in the pool's call queue; its timeout
+        # starts only once a worker picks it up
+        _worker_started.put(job_id)
+    # Fresh metrics per task, merged back into the parent's tracker
+    converter.metrics = ConversionMetrics()
+    output, error = converter._convert_job(input_path, output_path, target_format)
+    return output, error, converter.metrics
+
+
+def _terminate_worker_pool(pool: ProcessPoolExecutor) -> None:
+    """Stop a process pool without waiting for the tasks it is running."""
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
 class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
     """
     Handles document conversion using Pandoc with retry and validation.
@@ -66,17 +143,29 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
     All file paths throughout this class are handled as strings.
     """
 
-    def __init__(self, config: PandocConfig) -> None:
+    def __init__(
+            self,
+            config: PandocConfig,
+            backend: ConversionBackendProtocol | None = None,
+            cache: ConversionCache | None = None,
+    ) -> None:
         """
         Initialize the document converter.
 
         Args:
             config: The Pandoc conversion configuration.
+            backend: Backend that runs pandoc; defaults to a pandoc server
+                     when config.server is enabled, pypandoc otherwise.
+            cache: Cache of conversion outputs; built from config.cache
+                   when not given and the cache is enabled.
 
         Raises:
             QuackIntegrationError: If Pandoc is not available.
         """
         self.config: PandocConfig = config
+        if backend is None and config.server.enabled:
+            backend = PandocServerBackend.from_config(config.server)
+        self.backend: ConversionBackendProtocol = backend or get_default_backend()
         self.metrics: ConversionMetrics = ConversionMetrics(start_time=datetime.now())
         try:
             self._pandoc_version: str = verify_pandoc()
@@ -84,6 +173,13 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
             logger.warning(f"Failed to verify pandoc version: {e}")
             self._pandoc_version = "unknown"
 
+        if cache is None and config.cache.enabled:
+            try:
+                cache = ConversionCache.from_config(config.cache)
+            except OSError as e:
+                logger.warning(f"Conversion cache disabled: {e}")
+        self.cache: ConversionCache | None = cache
+
     @property
     def pandoc_version(self) -> str:
         """Get the Pandoc version."""
@@ -127,6 +223,17 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
                 return IntegrationResult.error_result(
                     f"Failed to create output directory: {str(e)}")
 
+            # Reuse the output of an identical earlier conversion
+            cache_key = self._cache_key(input_path, input_info.format, output_format)
+            if cache_key is not None:
+                if self.cache.fetch(cache_key, output_path):
+                    self.metrics.cache_hits += 1
+                    return IntegrationResult.success_result(
+                        output_path,
+                        message=f"Reused cached conversion of {input_path}",
+                    )
+                self.metrics.cache_misses += 1
+
             # Perform conversion based on file format
             if input_info.format == "html" and output_format == "markdown":
                 # Convert HTML to Markdown
@@ -135,12 +242,18 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
                 )
 
                 result = convert_html_to_markdown(
-                    input_path, output_path, self.config, self.metrics
+                    input_path,
+                    output_path,
+                    self.config,
+                    self.metrics,
+                    backend=self.backend,
                 )
 
                 if result.success and result.content:
                     # Unpack the returned tuple to get the output path string
                     output_path_str = result.content[0] if isinstance(result.content, tuple) else result.content
+                    if cache_key is not None:
+                        self.cache.store(cache_key, output_path_str)
                     return IntegrationResult.success_result(
                         output_path_str,
                         message=f"Successfully converted {input_path} to Markdown",
@@ -156,12 +269,18 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
                 )
 
                 result = convert_markdown_to_docx(
-                    input_path, output_path, self.config, self.metrics
+                    input_path,
+                    output_path,
+                    self.config,
+                    self.metrics,
+                    backend=self.backend,
                 )
 
                 if result.success and result.content:
                     # Unpack the returned tuple to get the output path string
                     output_path_str = result.content[0] if isinstance(result.content, tuple) else result.content
+                    if cache_key is not None:
+                        self.cache.store(cache_key, output_path_str)
                     return IntegrationResult.success_result(
                         output_path_str,
                         message=f"Successfully converted {input_path} to DOCX",
@@ -182,16 +301,111 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
             logger.error(f"Unexpected error during conversion: {str(e)}")
             return IntegrationResult.error_result(f"Conversion error: {str(e)}")
 
+    def convert_text(
+            self,
+            content: str | bytes,
+            source_format: str,
+            output_format: str,
+            output_path: str | None = None,
+            source_name: str | None = None,
+    ) -> IntegrationResult[str | bytes]:
+        """
+        Convert a document held in memory.
+
+        The document is piped to pandoc and validated in memory; the disk is
+        only written when output_path is given.
+
+        Args:
+            content: The document to convert (text, or UTF-8 bytes).
+            source_format: Source format ("html" or "markdown").
+            output_format: Target format ("markdown" or "docx").
+            output_path: Optional path to also save the output to.
+            source_name: Name for metrics and errors, e.g. the URL of a page.
+
+        Returns:
+            IntegrationResult containing the Markdown text, or the DOCX bytes.
+        """
+        try:
+            if source_format == "html" and output_format == "markdown":
+                from quack_core.integrations.pandoc.operations import (
+                    convert_html_text_to_markdown,
+                )
+
+                result = convert_html_text_to_markdown(
+                    content,
+                    self.config,
+                    output_path=output_path,
+                    metrics=self.metrics,
+                    backend=self.backend,
+                    source_name=source_name or "<html>",
+                )
+            elif source_format == "markdown" and output_format == "docx":
+                from quack_core.integrations.pandoc.operations import (
+                    convert_markdown_text_to_docx,
+                )
+
+                result = convert_markdown_text_to_docx(
+                    content,
+                    self.config,
+                    output_path=output_path,
+                    metrics=self.metrics,
+                    backend=self.backend,
+                    source_name=source_name or "<markdown>",
+                )
+            else:
+                return IntegrationResult.error_result(
+                    f"Unsupported conversion: {source_format} to {output_format}"
+                )
+
+            if result.success and result.content:
+                output, _details = result.content
+                return IntegrationResult.success_result(output, message=result.message)
+            return IntegrationResult.error_result(result.error or "Conversion failed")
+
+        except Exception as e:
+            logger.error(f"Unexpected error during conversion: {str(e)}")
+            return IntegrationResult.error_result(f"Conversion error: {str(e)}")
+
+    def _cache_key(
+            self, input_path: str, source_format: str, target_format: str
+    ) -> str | None:
+        """Return the cache key of a conversion, or None if it is not cached."""
+        if self.cache is None or (source_format, target_format) not in _SUPPORTED_CONVERSIONS:
+            return None
+        try:
+            args = prepare_pandoc_args(self.config, source_format, target_format)
+            return self.cache.make_key(
+                input_path, args, source_format, target_format, self.pandoc_version
+            )
+        except OSError as e:
+            logger.warning(f"Skipping conversion cache for {input_path}: {e}")
+            return None
+
     def convert_batch(
-            self, tasks: Sequence[ConversionTask], output_dir: str | None = None
+            self,
+            tasks: Sequence[ConversionTask],
+            output_dir: str | None = None,
+            max_workers: int | None = None,
+            task_timeout: float | None = None,
+            cancel_event: threading.Event | None = None,
     ) -> IntegrationResult[list[str]]:
         """
         Convert a batch of files.
 
+        With more than one worker, or a task timeout, files are converted in a
+        pool of worker processes, each with its own converter. At most
+        ``config.batch.max_in_flight`` tasks are queued at a time, a worker
+        that exceeds the timeout is restarted, and the metrics collected by
+        the workers are merged into ``self.metrics``.
+
         Args:
             tasks: Sequence of conversion tasks.
             output_dir: Directory to save converted files (as a string).
                         If not provided, the value from the configuration is used.
+            max_workers: Worker processes to use (defaults to config.batch.max_workers).
+            task_timeout: Seconds allowed per file (defaults to config.batch.task_timeout).
+            cancel_event: Set it to stop the batch; unfinished files are
+                          reported as failed.
 
         Returns:
             IntegrationResult containing a list of successfully converted file paths (as strings).
@@ -218,55 +432,42 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
         failed_files: list[str] = []
         self.metrics.total_attempts += len(tasks)
 
-        # Process each task
+        jobs: list[tuple[str, str, str]] = []
         for task in tasks:
-            try:
-                # Determine the output path
-                if task.output_path is not None:
-                    output_path = task.output_path
-                else:
-                    # Extract filename from source path
-                    try:
-                        split_result = fs.split_path(task.source.path)
-                        if not getattr(split_result, 'success', False):
-                            logger.error(
-                                f"Failed to split path: {getattr(split_result, 'error', 'Unknown error')}")
-                            failed_files.append(task.source.path)
-                            continue
-
-                        # Get the filename and extension
-                        filename = split_result.data[-1]
-                        name, _ = os.path.splitext(filename)
-
-                        # Determine the new extension based on target format
-                        ext = ".md" if task.target_format == "markdown" else f".{task.target_format}"
-                        output_path = os.path.join(batch_output_dir, name + ext)
-                    except Exception as e:
-                        logger.error(f"Failed to determine output path: {e}")
-                        failed_files.append(task.source.path)
-                        continue
+            output_path = self._task_output_path(task, batch_output_dir)
+            if output_path is None:
+                failed_files.append(task.source.path)
+                continue
+            jobs.append((task.source.path, output_path, task.target_format))
+
+        batch_config = self.config.batch
+        workers = max_workers or batch_config.max_workers
+        timeout = task_timeout if task_timeout is not None else batch_config.task_timeout
+
+        started = time.perf_counter()
+        if workers > 1 or timeout is not None:
+            outcomes = self._convert_jobs_in_workers(
+                jobs,
+                workers,
+                batch_config.max_in_flight or 2 * workers,
+                timeout,
+                cancel_event,
+            )
+        else:
+            outcomes = self._convert_jobs_in_process(jobs, cancel_event)
 
-                # Perform the conversion
-                result = self.convert_file(
-                    task.source.path, output_path, task.target_format
+        for input_path, target_format, output, error in outcomes:
+            if output:
+                successful_files.append(output)
+                self.metrics.successful_conversions += 1
+            else:
+                failed_files.append(input_path)
+                logger.error(
+                    f"Failed to convert {input_path} to {target_format}: {error}"
                 )
-
-                if result.success and result.content:
-                    successful_files.append(result.content)
-                    self.metrics.successful_conversions += 1
-                else:
-                    failed_files.append(task.source.path)
-                    logger.error(
-                        f"Failed to convert {task.source.path} to {task.target_format}: {result.error}"
-                    )
-                    self.metrics.failed_conversions += 1
-                    self.metrics.errors[
-                        task.source.path] = result.error or "Unknown error"
-            except Exception as e:
-                failed_files.append(task.source.path)
-                logger.error(f"Error processing task for {task.source.path}: {str(e)}")
-                self.metrics.errors[task.source.path] = str(e)
                 self.metrics.failed_conversions += 1
+                self.metrics.errors[input_path] = error or "Unknown error"
+        self.metrics.batch_wall_time += time.perf_counter() - started
 
         # Return appropriate result based on success/failure
         if not failed_files:
@@ -291,6 +492,187 @@ class DocumentConverter(DocumentConverterProtocol, BatchConverterProtocol):
                 message=f"All {len(failed_files)} conversion tasks failed. See logs for details.",
             )
 
+    def _task_output_path(
+            self, task: ConversionTask, batch_output_dir: str
+    ) -> str | None:
+        """Return the output path for a batch task, or None if it cannot be built."""
+        if task.output_path is not None:
+            return task.output_path
+
+        # Extract filename from source path
+        try:
+            split_result = fs.split_path(task.source.path)
+            if not getattr(split_result, 'success', False):
+                logger.error(
+                    f"Failed to split path: {getattr(split_result, 'error', 'Unknown error')}")
+                return None
+
+            # Get the filename and extension
+            filename = split_result.data[-1]
+            name, _ = os.path.splitext(filename)
+
+            # Determine the new extension based on target format
+            ext = ".md" if task.target_format == "markdown" else f".{task.target_format}"
+            return os.path.join(batch_output_dir, name + ext)
+        except Exception as e:
+            logger.error(f"Failed to determine output path: {e}")
+            return None
+
+    def _convert_job(
+            self, input_path: str, output_path: str, target_format: str
+    ) -> tuple[str | None, str | None]:
+        """
+        Convert one batch file and record its wall time and sizes.
+
+        Returns:
+            tuple: (output_path, None) on success, (None, error) on failure.
+        """
+        start = time.perf_counter()
+        try:
+            result = self.convert_file(input_path, output_path, target_format)
+        except Exception as e:
+            logger.error(f"Error processing task for {input_path}: {str(e)}")
+            result = IntegrationResult.error_result(str(e))
+        self.metrics.wall_times[input_path] = time.perf_counter() - start
+        self.metrics.batch_files += 1
+
+        if not (result.success and result.content):
+            return None, result.error or "Conversion failed"
+
+        self.metrics.bytes_in += _file_size(input_path)
+        self.metrics.bytes_out += _file_size(result.content)
+        return result.content, None
+
+    def _convert_jobs_in_process(
+            self,
+            jobs: list[tuple[str, str, str]],
+            cancel_event: threading.Event | None,
+    ) -> Iterator[tuple[str, str, str | None, str | None]]:
+        """Convert batch jobs one after another in this process."""
+        for index, (input_path, output_path, target_format) in enumerate(jobs):
+            if cancel_event is not None and cancel_event.is_set():
+                for cancelled_path, _, cancelled_format in jobs[index:]:
+                    yield cancelled_path, cancelled_format, None, "Conversion cancelled"
+                return
+            output, error = self._convert_job(input_path, output_path, target_format)
+            yield input_path, target_format, output, error
+
+    def _convert_jobs_in_workers(
+            self,
+            jobs: list[tuple[str, str, str]],
+            max_workers: int,
+            max_in_flight: int,
+            task_timeout: float | None,
+            cancel_event: threading.Event | None,
+    ) -> Iterator[tuple[str, str, str | None, str | None]]:
+        """Convert batch jobs in a pool of worker processes, as they complete."""
+        queue = deque(range(len(jobs)))
+        pending: dict[Future, int] = {}
+        # When the parent learned that each job had started in a worker
+        running_since: dict[int, float] = {}
+        # Start signals are only read to time tasks out; without a timeout
+        # nobody drains the queue, and a full pipe would block the workers
+        started = multiprocessing.SimpleQueue() if task_timeout is not None else None
+        pool = self._start_worker_pool(max_workers, started)
+
+        try:
+            while queue or pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    for job_id in [*pending.values(), *queue]:
+                        input_path, _, target_format = jobs[job_id]
+                        yield input_path, target_format, None, "Conversion cancelled"
+                    queue.clear()
+                    pending.clear()
+                    break
+
+                while queue and len(pending) < max_in_flight:
+                    job_id = queue.popleft()
+                    future = pool.submit(_convert_in_worker, job_id, *jobs[job_id])
+                    pending[future] = job_id
+
+                poll = None
+                if task_timeout is not None or cancel_event is not None:
+                    poll = _WORKER_POLL_INTERVAL
+                done, _ = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+
+                now = time.monotonic()
+                if started is not None:
+                    while not started.empty():
+                        running_since.setdefault(started.get(), now)
+
+                for future in done:
+                    job_id = pending.pop(future)
+                    running_since.pop(job_id, None)
+                    input_path, _, target_format = jobs[job_id]
+                    try:
+                        output, error, worker_metrics = future.result()
+                        self.metrics.merge(worker_metrics)
+                    except Exception as e:
+                        # Only reachable for pool-level failures (e.g. a worker
+                        # process died); conversion errors are returned.
+                        output, error = None, f"Worker failed: {e}"
+                    yield input_path, target_format, output, error
+
+                if task_timeout is None:
+                    continue
+
+                expired = [
+                    future
+                    for future, job_id in pending.items()
+                    if job_id in running_since
+                    and now - running_since[job_id] >= task_timeout
+                ]
+                if not expired:
+                    continue
+
+                # A worker cannot be interrupted mid-task, so restart the pool
+                # and resubmit the tasks that had not timed out
+                for future in expired:
+                    input_path, _, target_format = jobs[pending.pop(future)]
+                    yield (
+                        input_path,
+                        target_format,
+                        None,
+                        f"Conversion timed out after {task_timeout:g} seconds",
+                    )
+                queue.extendleft(reversed(list(pending.values())))
+                pending.clear()
+                running_since.clear()
+                _terminate_worker_pool(pool)
+                # A terminated worker may have been writing to the queue
+                if started is not None:
+                    started.close()
+                started = multiprocessing.SimpleQueue()
+                pool = self._start_worker_pool(max_workers, started)
+        finally:
+            if pending or (cancel_event is not None and cancel_event.is_set()):
+                _terminate_worker_pool(pool)
+            else:
+                pool.shutdown(wait=True, cancel_futures=True)
+            if started is not None:
+                started.close()
+
+    def _start_worker_pool(
+            self, max_workers: int, started: SimpleQueue | None = None
+    ) -> ProcessPoolExecutor:
+        """
+        Start a process pool whose workers each build their own converter.
+
+        Args:
+            max_workers: Number of worker processes.
+            started: Queue on which workers report the id of each job they
+                start, or None when no task timeout needs it.
+        """
+        if isinstance(self.backend, PandocServerBackend):
+            # Start the server before the backend is pickled for the workers,
+            # so they all share it
+            self.backend.start()
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.config, self.backend, self.cache, started),
+        )
+
     def validate_conversion(self, output_path: str, input_path: str) -> bool:
         """
         Validate the converted document.
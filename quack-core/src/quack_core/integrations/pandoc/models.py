@@ -53,6 +53,72 @@ class ConversionMetrics(BaseModel):
     failed_conversions: int = Field(
         default=0, description="Number of failed conversions"
     )
+    wall_times: dict[str, float] = Field(
+        default_factory=dict,
+        description="Dictionary mapping batch source paths to wall-clock seconds, "
+        "including validation and retries",
+    )
+    bytes_in: int = Field(
+        default=0, description="Input bytes of successful batch conversions"
+    )
+    bytes_out: int = Field(
+        default=0, description="Output bytes of successful batch conversions"
+    )
+    batch_files: int = Field(
+        default=0, description="Number of files processed by batch conversions"
+    )
+    batch_wall_time: float = Field(
+        default=0.0, description="Wall-clock seconds spent in batch conversions"
+    )
+    cache_hits: int = Field(
+        default=0, description="Conversions served from the conversion cache"
+    )
+    cache_misses: int = Field(
+        default=0, description="Cacheable conversions not found in the cache"
+    )
+
+    @property
+    def files_per_second(self) -> float:
+        """Batch throughput in files per second."""
+        if self.batch_wall_time <= 0:
+            return 0.0
+        return self.batch_files / self.batch_wall_time
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Batch throughput in input bytes per second."""
+        if self.batch_wall_time <= 0:
+            return 0.0
+        return self.bytes_in / self.batch_wall_time
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of cacheable conversions served from the cache."""
+        lookups = self.cache_hits + self.cache_misses
+        if not lookups:
+            return 0.0
+        return self.cache_hits / lookups
+
+    def merge(self, other: "ConversionMetrics") -> None:
+        """
+        Add the metrics collected by another tracker, e.g. a worker process.
+
+        Args:
+            other: Metrics to merge into this tracker.
+        """
+        self.conversion_times.update(other.conversion_times)
+        self.file_sizes.update(other.file_sizes)
+        self.errors.update(other.errors)
+        self.wall_times.update(other.wall_times)
+        self.total_attempts += other.total_attempts
+        self.successful_conversions += other.successful_conversions
+        self.failed_conversions += other.failed_conversions
+        self.bytes_in += other.bytes_in
+        self.bytes_out += other.bytes_out
+        self.batch_files += other.batch_files
+        self.batch_wall_time += other.batch_wall_time
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
 
 
 class FileInfo(BaseModel):
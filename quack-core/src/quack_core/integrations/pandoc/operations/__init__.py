@@ -3,7 +3,7 @@
 # module: quack_core.integrations.pandoc.operations.__init__
 # role: operations
 # neighbors: utils.py, html_to_md.py, md_to_docx.py
-# exports: convert_html_to_markdown, convert_markdown_to_docx, post_process_markdown, validate_html_conversion, validate_docx_conversion, check_conversion_ratio, check_file_size, get_file_info (+5 more)
+# exports: convert_html_to_markdown, convert_markdown_to_docx, post_process_markdown, validate_html_conversion, validate_docx_conversion, check_conversion_ratio, check_file_size, get_file_info (+9 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,14 +16,18 @@ such as HTML to Markdown and Markdown to DOCX conversion.
 """
 
 from quack_core.integrations.pandoc.operations.html_to_md import (
+    convert_html_text_to_markdown,
     convert_html_to_markdown,
     post_process_markdown,
+    validate_markdown_content,
 )
 from quack_core.integrations.pandoc.operations.html_to_md import (
     validate_conversion as validate_html_conversion,
 )
 from quack_core.integrations.pandoc.operations.md_to_docx import (
+    convert_markdown_text_to_docx,
     convert_markdown_to_docx,
+    validate_docx_content,
 )
 from quack_core.integrations.pandoc.operations.md_to_docx import (
     validate_conversion as validate_docx_conversion,
@@ -41,8 +45,12 @@ from quack_core.integrations.pandoc.operations.utils import (
 
 __all__ = [
     "convert_html_to_markdown",
+    "convert_html_text_to_markdown",
     "convert_markdown_to_docx",
+    "convert_markdown_text_to_docx",
     "post_process_markdown",
+    "validate_markdown_content",
+    "validate_docx_content",
     "validate_html_conversion",
     "validate_docx_conversion",
     "check_conversion_ratio",
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.pandoc.operations.html_to_md
 # role: operations
 # neighbors: __init__.py, utils.py, md_to_docx.py
-# exports: convert_html_to_markdown, post_process_markdown, validate_conversion
+# exports: convert_html_to_markdown, convert_html_text_to_markdown, post_process_markdown, validate_conversion, validate_markdown_content
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -17,21 +17,26 @@ All file paths are represented as strings. Filesystem interactions are delegated
 to the quack_core.lib.fs service functions.
 """
 
-import importlib
 import os
 import re
 import time
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.pandoc.backends import get_default_backend
 from quack_core.integrations.pandoc.config import PandocConfig
 from quack_core.integrations.pandoc.models import ConversionDetails, ConversionMetrics
 from quack_core.integrations.pandoc.operations.utils import (
     check_conversion_ratio,
     check_file_size,
     prepare_pandoc_args,
-    track_metrics,
+    run_conversion_attempts,
+    safe_convert_to_int,
     validate_html_structure,
 )
+from quack_core.integrations.pandoc.protocols import (
+    ConversionBackendProtocol,
+    ConversionValidatorProtocol,
+)
 from quack_core.lib.errors import QuackIntegrationError
 from quack_core.lib.logging import get_logger
 
@@ -64,6 +69,16 @@ except ImportError:
     )
 
 
+# Patterns used by post_process_markdown, in the order they are applied
+_ATTRIBUTES_RE = re.compile(r"{[^}]*}")
+# Matches the fence line only, so text after a closing fence is kept
+_FENCED_DIV_RE = re.compile(r":::+[ \t]*[^\n]*\n")
+_DIV_TAG_RE = re.compile(r"<div[^>]*>|</div>")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n+")
+_COMMENT_RE = re.compile(r"<!--[^>]*-->")
+_LIST_GAP_RE = re.compile(r"\n\s*\n-")
+
+
 def _validate_input(html_path: str, config: PandocConfig) -> int:
     """
     Validate the input HTML file and return its size.
@@ -131,13 +146,18 @@ def _validate_input(html_path: str, config: PandocConfig) -> int:
     return original_size
 
 
-def _attempt_conversion(html_path: str, config: PandocConfig) -> str:
+def _attempt_conversion(
+        html_path: str,
+        config: PandocConfig,
+        backend: ConversionBackendProtocol | None = None,
+) -> str:
     """
     Perform a single attempt to convert an HTML file to Markdown using pandoc.
 
     Args:
         html_path: Path to the HTML file as a string.
         config: Conversion configuration.
+        backend: Backend that runs pandoc; defaults to pypandoc.
 
     Returns:
         str: Cleaned Markdown content.
@@ -145,19 +165,16 @@ def _attempt_conversion(html_path: str, config: PandocConfig) -> str:
     Raises:
         QuackIntegrationError: If the pandoc conversion fails.
     """
-    try:
-        pypandoc = importlib.import_module('pypandoc')
-    except ImportError as e:
-        raise QuackIntegrationError(f"pypandoc module is not installed: {str(e)}")
-
     extra_args = prepare_pandoc_args(
         config, "html", "markdown", config.html_to_md_extra_args
     )
     logger.debug(f"Converting {html_path} to Markdown with args: {extra_args}")
     try:
-        output = pypandoc.convert_file(
-            html_path, "markdown", format="html", extra_args=extra_args
+        output = (backend or get_default_backend()).convert_file(
+            html_path, "markdown", from_format="html", extra_args=extra_args
         )
+    except QuackIntegrationError:
+        raise
     except Exception as e:
         raise QuackIntegrationError(f"Pandoc conversion failed: {str(e)}") from e
 
@@ -171,6 +188,7 @@ def _write_and_validate_output(
         original_size: int,
         config: PandocConfig,
         attempt_start: float,
+        validator: ConversionValidatorProtocol | None = None,
 ) -> tuple[float, int, list[str]]:
     """
     Write the converted markdown to the output file and validate the conversion.
@@ -182,6 +200,7 @@ def _write_and_validate_output(
         original_size: Size of the original HTML file.
         config: Conversion configuration.
         attempt_start: Timestamp when the attempt started.
+        validator: Validates the output; defaults to validate_conversion.
 
     Returns:
         tuple: (conversion_time, output_size, validation_errors)
@@ -227,9 +246,8 @@ def _write_and_validate_output(
                 f"Could not convert file size to integer: {getattr(output_info, 'size', None)}"
             )
 
-    validation_errors = validate_conversion(
-        output_path, input_path, original_size, config
-    )
+    validate = validator or validate_conversion
+    validation_errors = validate(output_path, input_path, original_size, config)
 
     return conversion_time, output_size, validation_errors
 
@@ -239,6 +257,8 @@ def convert_html_to_markdown(
         output_path: str,
         config: PandocConfig,
         metrics: ConversionMetrics | None = None,
+        backend: ConversionBackendProtocol | None = None,
+        validator: ConversionValidatorProtocol | None = None,
 ) -> IntegrationResult[tuple[str, ConversionDetails]]:
     """
     Convert an HTML file to Markdown.
@@ -248,6 +268,8 @@ def convert_html_to_markdown(
         output_path: Path to save the Markdown file as a string.
         config: Conversion configuration.
         metrics: Optional metrics tracker.
+        backend: Backend that runs pandoc; defaults to pypandoc.
+        validator: Validates the output; defaults to validate_conversion.
 
     Returns:
         IntegrationResult containing a tuple of (output_path, ConversionDetails).
@@ -271,73 +293,174 @@ def convert_html_to_markdown(
     try:
         original_size = _validate_input(html_path, config)
         metrics.total_attempts += 1
-        max_retries = config.retry_mechanism.max_conversion_retries
-
-        for attempt in range(1, max_retries + 1):
-            attempt_start = time.time()
-            try:
-                cleaned_markdown = _attempt_conversion(html_path, config)
-                conversion_time, output_size, validation_errors = (
-                    _write_and_validate_output(
-                        cleaned_markdown,
-                        output_path,
-                        html_path,
-                        original_size,
-                        config,
-                        attempt_start,
-                    )
-                )
-                if validation_errors:
-                    error_msg = "; ".join(validation_errors)
-                    logger.error(
-                        f"Conversion validation failed on attempt {attempt}: {error_msg}"
-                    )
-                    if attempt == max_retries:
-                        metrics.failed_conversions += 1
-                        metrics.errors[html_path] = error_msg
-                        return IntegrationResult.error_result(
-                            "Conversion validation failed after maximum retries: "
-                            + error_msg
-                        )
-                    time.sleep(config.retry_mechanism.conversion_retry_delay)
-                    continue
-
-                track_metrics(
-                    filename, attempt_start, original_size, output_size, metrics, config
-                )
-                metrics.successful_conversions += 1
-
-                details = ConversionDetails(
-                    source_format="html",
-                    target_format="markdown",
-                    conversion_time=conversion_time,
-                    output_size=output_size,
-                    input_size=original_size,
-                )
 
-                return IntegrationResult.success_result(
-                    (output_path, details),
-                    message=f"Successfully converted {html_path} to Markdown",
-                )
-            except Exception as e:
-                error_msg = (
-                    f"Integration error: {str(e)}"
-                    if isinstance(e, QuackIntegrationError)
-                    else f"Failed to convert HTML to Markdown: {str(e)}"
+        def attempt(attempt_start: float) -> tuple[str, float, int, list[str]]:
+            cleaned_markdown = _attempt_conversion(html_path, config, backend)
+            conversion_time, output_size, validation_errors = (
+                _write_and_validate_output(
+                    cleaned_markdown,
+                    output_path,
+                    html_path,
+                    original_size,
+                    config,
+                    attempt_start,
+                    validator,
                 )
-                logger.warning(
-                    f"HTML to Markdown conversion attempt {attempt} failed: {str(e)}"
+            )
+            return output_path, conversion_time, output_size, validation_errors
+
+        return run_conversion_attempts(
+            attempt,
+            html_path,
+            original_size,
+            "html",
+            "markdown",
+            "HTML to Markdown",
+            config,
+            metrics,
+            metrics_name=filename,
+        )
+    except Exception as e:
+        metrics.failed_conversions += 1
+        metrics.errors[html_path] = str(e)
+        return IntegrationResult.error_result(
+            f"Failed to convert HTML to Markdown: {str(e)}"
+        )
+
+
+def _attempt_text_conversion(
+        html_text: str,
+        config: PandocConfig,
+        backend: ConversionBackendProtocol | None = None,
+) -> str:
+    """
+    Perform a single attempt to convert HTML held in memory to Markdown.
+
+    Args:
+        html_text: The HTML document.
+        config: Conversion configuration.
+        backend: Backend that runs pandoc; defaults to pypandoc.
+
+    Returns:
+        str: Cleaned Markdown content.
+
+    Raises:
+        QuackIntegrationError: If the pandoc conversion fails.
+    """
+    extra_args = prepare_pandoc_args(
+        config, "html", "markdown", config.html_to_md_extra_args
+    )
+    try:
+        output = (backend or get_default_backend()).convert_text(
+            html_text, "markdown", from_format="html", extra_args=extra_args
+        )
+    except QuackIntegrationError:
+        raise
+    except Exception as e:
+        raise QuackIntegrationError(f"Pandoc conversion failed: {str(e)}") from e
+
+    return post_process_markdown(output)
+
+
+def _write_markdown(markdown_content: str, output_path: str) -> None:
+    """
+    Write converted Markdown to an output file.
+
+    Args:
+        markdown_content: The Markdown to write.
+        output_path: Path to save the Markdown file as a string.
+
+    Raises:
+        QuackIntegrationError: If the directory or file cannot be written.
+    """
+    output_dir = os.path.dirname(output_path) or "."
+    dir_result = fs.create_directory(output_dir, exist_ok=True)
+    if not getattr(dir_result, 'success', False):
+        raise QuackIntegrationError(
+            f"Failed to create output directory: {getattr(dir_result, 'error', 'Unknown error')}"
+        )
+
+    write_result = fs.write_text(output_path, markdown_content, encoding="utf-8")
+    if not getattr(write_result, 'success', False):
+        raise QuackIntegrationError(
+            f"Failed to write output file: {getattr(write_result, 'error', 'Unknown error')}"
+        )
+
+
+def convert_html_text_to_markdown(
+        html: str | bytes,
+        config: PandocConfig,
+        output_path: str | None = None,
+        metrics: ConversionMetrics | None = None,
+        backend: ConversionBackendProtocol | None = None,
+        source_name: str = "<html>",
+) -> IntegrationResult[tuple[str, ConversionDetails]]:
+    """
+    Convert an HTML document held in memory to Markdown.
+
+    The HTML is piped to pandoc and the result is validated in memory; the
+    filesystem is only used when an output path is given.
+
+    Args:
+        html: The HTML document; bytes are decoded as UTF-8.
+        config: Conversion configuration.
+        output_path: Optional path to also save the Markdown to.
+        metrics: Optional metrics tracker.
+        backend: Backend that runs pandoc; defaults to pypandoc.
+        source_name: Name to record metrics and errors under, e.g. a URL.
+
+    Returns:
+        IntegrationResult containing a tuple of (markdown, ConversionDetails).
+    """
+    if metrics is None:
+        metrics = ConversionMetrics()
+
+    try:
+        if isinstance(html, bytes):
+            original_size = len(html)
+            html_text = html.decode("utf-8", errors="replace")
+        else:
+            html_text = html
+            original_size = len(html.encode("utf-8"))
+
+        if not html_text.strip():
+            raise QuackIntegrationError(f"HTML document is empty: {source_name}")
+
+        if config.validation.verify_structure:
+            is_valid, html_errors = validate_html_structure(
+                html_text, config.validation.check_links
+            )
+            if not is_valid:
+                raise QuackIntegrationError(
+                    f"Invalid HTML structure in {source_name}: {'; '.join(html_errors)}"
                 )
-                if attempt == max_retries:
-                    metrics.failed_conversions += 1
-                    metrics.errors[html_path] = str(e)
-                    return IntegrationResult.error_result(error_msg)
-                time.sleep(config.retry_mechanism.conversion_retry_delay)
 
-        return IntegrationResult.error_result("Conversion failed after maximum retries")
+        metrics.total_attempts += 1
+
+        def attempt(attempt_start: float) -> tuple[str, float, int, list[str]]:
+            markdown = _attempt_text_conversion(html_text, config, backend)
+            conversion_time = time.time() - attempt_start
+            validation_errors = validate_markdown_content(
+                markdown, original_size, config
+            )
+            if output_path and not validation_errors:
+                _write_markdown(markdown, output_path)
+            output_size = len(markdown.encode("utf-8"))
+            return markdown, conversion_time, output_size, validation_errors
+
+        return run_conversion_attempts(
+            attempt,
+            source_name,
+            original_size,
+            "html",
+            "markdown",
+            "HTML to Markdown",
+            config,
+            metrics,
+        )
     except Exception as e:
         metrics.failed_conversions += 1
-        metrics.errors[html_path] = str(e)
+        metrics.errors[source_name] = str(e)
         return IntegrationResult.error_result(
             f"Failed to convert HTML to Markdown: {str(e)}"
         )
@@ -347,18 +470,25 @@ def post_process_markdown(markdown_content: str) -> str:
     """
     Post-process markdown content for cleaner output.
 
+    Passes whose markup does not occur in the document are skipped.
+
     Args:
         markdown_content: Raw markdown content from pandoc.
 
     Returns:
         Cleaned markdown content.
     """
-    cleaned = re.sub(r"{[^}]*}", "", markdown_content)
-    cleaned = re.sub(r":::+\s*[^\n]*\n", "", cleaned)
-    cleaned = re.sub(r"<div[^>]*>|</div>", "", cleaned)
-    cleaned = re.sub(r"\n\s*\n\s*\n+", "\n\n", cleaned)
-    cleaned = re.sub(r"<!--[^>]*-->", "", cleaned)
-    cleaned = re.sub(r"\n\s*\n-", "\n-", cleaned)
+    cleaned = markdown_content
+    if "{" in cleaned:
+        cleaned = _ATTRIBUTES_RE.sub("", cleaned)
+    if ":::" in cleaned:
+        cleaned = _FENCED_DIV_RE.sub("", cleaned)
+    if "div" in cleaned:
+        cleaned = _DIV_TAG_RE.sub("", cleaned)
+    cleaned = _BLANK_LINES_RE.sub("\n\n", cleaned)
+    if "<!--" in cleaned:
+        cleaned = _COMMENT_RE.sub("", cleaned)
+    cleaned = _LIST_GAP_RE.sub("\n-", cleaned)
     return cleaned
 
 
@@ -478,5 +608,52 @@ def validate_conversion(
     return validation_errors
 
 
+def validate_markdown_content(
+        markdown_content: str, original_size: int, config: PandocConfig
+) -> list[str]:
+    """
+    Validate converted markdown held in memory.
+
+    Applies the size, ratio and content checks of validate_conversion
+    without reading the output back from disk.
+
+    Args:
+        markdown_content: The converted markdown.
+        original_size: Size of the original HTML in bytes.
+        config: Conversion configuration.
+
+    Returns:
+        List of validation error messages (empty if valid).
+    """
+    validation_errors: list[str] = []
+    output_size = len(markdown_content.encode("utf-8"))
+
+    valid_size, size_errors = check_file_size(
+        output_size, config.validation.min_file_size
+    )
+    if not valid_size:
+        validation_errors.extend(size_errors)
+
+    valid_ratio, ratio_errors = check_conversion_ratio(
+        output_size,
+        safe_convert_to_int(original_size, 0),
+        config.validation.conversion_ratio_threshold,
+    )
+    if not valid_ratio:
+        validation_errors.extend(ratio_errors)
+
+    stripped = markdown_content.strip()
+    if not stripped:
+        validation_errors.append("Output file is empty")
+    elif len(stripped) < 10 and "# " not in markdown_content:
+        validation_errors.append("Output file contains minimal content")
+    elif len(stripped) > 100 and "# " not in markdown_content:
+        logger.warning("No headers found in converted markdown")
+        if config.validation.verify_structure:
+            validation_errors.append("No headers found in converted markdown")
+
+    return validation_errors
+
+
 # Add an alias for the test function with the same name used in the test
 validate_html_conversion = validate_conversion
@@ -3,7 +3,7 @@
 # module: quack_core.integrations.pandoc.operations.md_to_docx
 # role: operations
 # neighbors: __init__.py, utils.py, html_to_md.py
-# exports: convert_markdown_to_docx, validate_conversion
+# exports: convert_markdown_to_docx, convert_markdown_text_to_docx, validate_conversion, validate_docx_content
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,19 +16,25 @@ using pandoc with optimized settings and error handling.
 """
 
 import importlib
-import inspect
+import io
 import os
+import tempfile
 import time
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.pandoc.backends import get_default_backend
 from quack_core.integrations.pandoc.config import PandocConfig
 from quack_core.integrations.pandoc.models import ConversionDetails, ConversionMetrics
 from quack_core.integrations.pandoc.operations.utils import (
     check_conversion_ratio,
     check_file_size,
     prepare_pandoc_args,
+    run_conversion_attempts,
     safe_convert_to_int,
-    track_metrics,
+)
+from quack_core.integrations.pandoc.protocols import (
+    ConversionBackendProtocol,
+    ConversionValidatorProtocol,
 )
 from quack_core.lib.errors import QuackIntegrationError
 from quack_core.lib.logging import get_logger
@@ -83,33 +89,6 @@ def _validate_markdown_input(markdown_path: str) -> int:
     Raises:
         QuackIntegrationError: If the input file is missing or empty.
     """
-    # Check for test functions
-    for frame in inspect.stack():
-        if frame.function == "test_md_to_docx_validate_markdown_input_success" and markdown_path == "test.md":
-            # Call mocked functions to ensure they're tracked as called
-            _ = fs.get_file_info(markdown_path)
-            _ = fs.read_text(markdown_path, encoding="utf-8")
-            return 1000
-
-        if frame.function == "test_md_to_docx_validate_markdown_input_read_error" and markdown_path == "test.md":
-            # Call mocked functions to ensure they're tracked as called
-            _ = fs.get_file_info(markdown_path)
-            _ = fs.read_text(markdown_path, encoding="utf-8")
-            raise QuackIntegrationError(
-                "Could not read Markdown file: Read error",
-                {"path": markdown_path},
-            )
-
-        if frame.function == "test_md_to_docx_validate_markdown_input_empty_file" and markdown_path == "empty.md":
-            # Call mocked functions to ensure they're tracked as called
-            _ = fs.get_file_info(markdown_path)
-            _ = fs.read_text(markdown_path, encoding="utf-8")
-            raise QuackIntegrationError(
-                f"Markdown file is empty: {markdown_path}",
-                {"path": markdown_path},
-            )
-
-    # Standard validation for normal code paths
     file_info = fs.get_file_info(markdown_path)
 
     if not getattr(file_info, 'success', False) or not getattr(file_info, 'exists', False):
@@ -146,7 +125,10 @@ def _validate_markdown_input(markdown_path: str) -> int:
 
 
 def _convert_markdown_to_docx_once(
-        markdown_path: str, output_path: str, config: PandocConfig
+        markdown_path: str,
+        output_path: str,
+        config: PandocConfig,
+        backend: ConversionBackendProtocol | None = None,
 ) -> None:
     """
     Perform a single conversion attempt from Markdown to DOCX using pandoc.
@@ -155,38 +137,11 @@ def _convert_markdown_to_docx_once(
         markdown_path: Path to the Markdown file as a string.
         output_path: Path to save the DOCX file as a string.
         config: Conversion configuration.
+        backend: Backend that runs pandoc; defaults to pypandoc.
 
     Raises:
         QuackIntegrationError: If pandoc conversion fails.
     """
-    # Check for test functions
-    for frame in inspect.stack():
-        if frame.function == "test_md_to_docx_convert_once_success":
-            # Call mocked functions to ensure they're tracked
-            import pypandoc
-            _ = fs.split_path(output_path)
-            _ = fs.join_path("path", "to")
-            _ = fs.create_directory("path/to")
-            pypandoc.convert_file(
-                markdown_path,
-                "docx",
-                format="markdown",
-                outputfile=output_path,
-                extra_args=[],
-            )
-            return
-
-        if frame.function == "test_md_to_docx_convert_once_directory_error":
-            # Call mocked functions then raise error
-            _ = fs.split_path(output_path)
-            _ = fs.join_path("path", "to")
-            _ = fs.create_directory("path/to")
-            raise QuackIntegrationError(
-                "Failed to create output directory: Permission denied",
-                {"path": "path/to", "operation": "create_directory"},
-            )
-
-    # Standard code path for normal operation
     # Prepare pandoc arguments
     extra_args: list[str] = prepare_pandoc_args(
         config, "markdown", "docx", config.md_to_docx_extra_args
@@ -227,23 +182,15 @@ def _convert_markdown_to_docx_once(
 
         logger.debug(f"Converting {markdown_path} to DOCX with args: {extra_args}")
 
-        # Import pypandoc dynamically
-        pypandoc = importlib.import_module('pypandoc')
-
         # Execute the conversion
-        pypandoc.convert_file(
+        (backend or get_default_backend()).convert_file(
             markdown_path,
             "docx",
-            format="markdown",
-            outputfile=output_path,
+            from_format="markdown",
+            output_path=output_path,
             extra_args=extra_args,
         )
 
-    except ImportError:
-        raise QuackIntegrationError(
-            "pypandoc module is not installed",
-            {"module": "pypandoc", "path": markdown_path}
-        )
     except Exception as e:
         if isinstance(e, QuackIntegrationError):
             raise
@@ -269,23 +216,6 @@ def _get_conversion_output(output_path: str, start_time: float) -> tuple[float,
     """
     conversion_time: float = time.time() - start_time
 
-    # Check for test functions
-    for frame in inspect.stack():
-        if frame.function == "test_md_to_docx_get_conversion_output_file_info_error":
-            # Call mock to ensure it's tracked
-            _ = fs.get_file_info(output_path)
-            raise QuackIntegrationError(
-                "Failed to get info for converted file: File not found",
-                {"path": output_path}
-            )
-
-    # For test cases with output.docx, always return 2000 bytes
-    if output_path == "output.docx":
-        # Call mock to ensure it's tracked
-        _ = fs.get_file_info(output_path)
-        return conversion_time, 2000
-
-    # Standard code path for normal operation
     output_info = fs.get_file_info(output_path)
 
     if not getattr(output_info, 'success', False):
@@ -305,6 +235,8 @@ def convert_markdown_to_docx(
         output_path: str,
         config: PandocConfig,
         metrics: ConversionMetrics | None = None,
+        backend: ConversionBackendProtocol | None = None,
+        validator: ConversionValidatorProtocol | None = None,
 ) -> IntegrationResult[tuple[str, ConversionDetails]]:
     """
     Convert a Markdown file to DOCX.
@@ -314,6 +246,8 @@ def convert_markdown_to_docx(
         output_path: Path to save the DOCX file as a string.
         config: Conversion configuration.
         metrics: Optional metrics tracker.
+        backend: Backend that runs pandoc; defaults to pypandoc.
+        validator: Validates the output; defaults to validate_conversion.
 
     Returns:
         IntegrationResult[tuple[str, ConversionDetails]]: Result of the conversion.
@@ -339,76 +273,180 @@ def convert_markdown_to_docx(
 
         # Validate input file
         original_size: int = _validate_markdown_input(markdown_path)
-        max_retries: int = config.retry_mechanism.max_conversion_retries
-        retry_count: int = 0
-
-        while retry_count < max_retries:
-            start_time: float = time.time()
-            try:
-                _convert_markdown_to_docx_once(markdown_path, output_path, config)
-                conversion_time, output_size = _get_conversion_output(
-                    output_path, start_time
-                )
+        validate = validator or validate_conversion
 
-                validation_errors: list[str] = validate_conversion(
-                    output_path, markdown_path, original_size, config
-                )
-                if validation_errors:
-                    error_str: str = "; ".join(validation_errors)
-                    logger.error(f"Conversion validation failed: {error_str}")
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        metrics.failed_conversions += 1
-                        metrics.errors[markdown_path] = error_str
-                        return IntegrationResult.error_result(
-                            f"Conversion failed after maximum retries: {error_str}"
-                        )
-
-                    logger.warning(
-                        f"Markdown to DOCX conversion attempt {retry_count} failed: {error_str}"
-                    )
-                    time.sleep(config.retry_mechanism.conversion_retry_delay)
-                    continue
-
-                track_metrics(
-                    filename, start_time, original_size, output_size, metrics, config
+        def attempt(start_time: float) -> tuple[str, float, int, list[str]]:
+            _convert_markdown_to_docx_once(markdown_path, output_path, config, backend)
+            conversion_time, output_size = _get_conversion_output(
+                output_path, start_time
+            )
+            validation_errors = validate(
+                output_path, markdown_path, original_size, config
+            )
+            return output_path, conversion_time, output_size, validation_errors
+
+        return run_conversion_attempts(
+            attempt,
+            markdown_path,
+            original_size,
+            "markdown",
+            "docx",
+            "Markdown to DOCX",
+            config,
+            metrics,
+            metrics_name=filename,
+        )
+
+    except Exception as e:
+        metrics.failed_conversions += 1
+        metrics.errors[markdown_path] = str(e)
+        return IntegrationResult.error_result(
+            f"Failed to convert Markdown to DOCX: {str(e)}"
+        )
+
+
+def _convert_markdown_text_to_docx_once(
+        markdown_text: str,
+        output_path: str | None,
+        config: PandocConfig,
+        backend: ConversionBackendProtocol | None = None,
+) -> bytes:
+    """
+    Perform a single conversion attempt of Markdown held in memory to DOCX.
+
+    Pandoc can only write DOCX to a file, so without an output path the
+    document goes through a private temporary file.
+
+    Args:
+        markdown_text: The Markdown document.
+        output_path: Path to save the DOCX file to, or None.
+        config: Conversion configuration.
+        backend: Backend that runs pandoc; defaults to pypandoc.
+
+    Returns:
+        bytes: The DOCX document.
+
+    Raises:
+        QuackIntegrationError: If pandoc conversion fails.
+    """
+    extra_args: list[str] = prepare_pandoc_args(
+        config, "markdown", "docx", config.md_to_docx_extra_args
+    )
+    backend = backend or get_default_backend()
+
+    try:
+        if output_path:
+            dir_result = fs.create_directory(
+                os.path.dirname(output_path) or ".", exist_ok=True
+            )
+            if not getattr(dir_result, 'success', True):
+                raise QuackIntegrationError(
+                    f"Failed to create output directory: {getattr(dir_result, 'error', 'Unknown error')}",
+                    {"path": output_path, "operation": "create_directory"},
                 )
-                metrics.successful_conversions += 1
-
-                details = ConversionDetails(
-                    source_format="markdown",
-                    target_format="docx",
-                    conversion_time=conversion_time,
-                    output_size=output_size,
-                    input_size=original_size,
+            backend.convert_text(
+                markdown_text,
+                "docx",
+                from_format="markdown",
+                output_path=output_path,
+                extra_args=extra_args,
+            )
+            read_result = fs.read_binary(output_path)
+            if not getattr(read_result, 'success', False):
+                raise QuackIntegrationError(
+                    f"Failed to read converted file: {getattr(read_result, 'error', 'Unknown error')}",
+                    {"path": output_path},
                 )
+            return read_result.content
 
-                return IntegrationResult.success_result(
-                    (output_path, details),
-                    message=f"Successfully converted {markdown_path} to DOCX",
-                )
+        with tempfile.TemporaryDirectory(prefix="quack-pandoc-") as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "output.docx")
+            backend.convert_text(
+                markdown_text,
+                "docx",
+                from_format="markdown",
+                output_path=tmp_path,
+                extra_args=extra_args,
+            )
+            with open(tmp_path, "rb") as f:
+                return f.read()
 
-            except Exception as e:
-                retry_count += 1
-                logger.warning(
-                    f"Markdown to DOCX conversion attempt {retry_count} failed: {str(e)}"
-                )
-                if retry_count >= max_retries:
-                    metrics.failed_conversions += 1
-                    metrics.errors[markdown_path] = str(e)
-                    error_msg = (
-                        f"Integration error: {str(e)}"
-                        if isinstance(e, QuackIntegrationError)
-                        else f"Failed to convert Markdown to DOCX: {str(e)}"
-                    )
-                    return IntegrationResult.error_result(error_msg)
-                time.sleep(config.retry_mechanism.conversion_retry_delay)
-
-        return IntegrationResult.error_result("Conversion failed after maximum retries")
+    except Exception as e:
+        if isinstance(e, QuackIntegrationError):
+            raise
+        raise QuackIntegrationError(
+            f"Pandoc conversion failed: {str(e)}",
+            {"format": "markdown"},
+        ) from e
+
+
+def convert_markdown_text_to_docx(
+        markdown: str | bytes,
+        config: PandocConfig,
+        output_path: str | None = None,
+        metrics: ConversionMetrics | None = None,
+        backend: ConversionBackendProtocol | None = None,
+        source_name: str = "<markdown>",
+) -> IntegrationResult[tuple[bytes, ConversionDetails]]:
+    """
+    Convert a Markdown document held in memory to DOCX.
+
+    The Markdown is piped to pandoc and the DOCX is validated in memory.
+
+    Args:
+        markdown: The Markdown document; bytes are decoded as UTF-8.
+        config: Conversion configuration.
+        output_path: Optional path to also save the DOCX to.
+        metrics: Optional metrics tracker.
+        backend: Backend that runs pandoc; defaults to pypandoc.
+        source_name: Name to record metrics and errors under.
+
+    Returns:
+        IntegrationResult[tuple[bytes, ConversionDetails]]: The DOCX document.
+    """
+    if metrics is None:
+        metrics = ConversionMetrics()
+
+    try:
+        metrics.total_attempts += 1
+
+        if isinstance(markdown, bytes):
+            original_size = len(markdown)
+            markdown_text = markdown.decode("utf-8", errors="replace")
+        else:
+            markdown_text = markdown
+            original_size = len(markdown.encode("utf-8"))
+
+        if not markdown_text.strip():
+            raise QuackIntegrationError(
+                f"Markdown document is empty: {source_name}",
+                {"path": source_name},
+            )
+
+        def attempt(start_time: float) -> tuple[bytes, float, int, list[str]]:
+            docx_bytes = _convert_markdown_text_to_docx_once(
+                markdown_text, output_path, config, backend
+            )
+            conversion_time = time.time() - start_time
+            validation_errors = validate_docx_content(
+                docx_bytes, original_size, config
+            )
+            return docx_bytes, conversion_time, len(docx_bytes), validation_errors
+
+        return run_conversion_attempts(
+            attempt,
+            source_name,
+            original_size,
+            "markdown",
+            "docx",
+            "Markdown to DOCX",
+            config,
+            metrics,
+        )
 
     except Exception as e:
         metrics.failed_conversions += 1
-        metrics.errors[markdown_path] = str(e)
+        metrics.errors[source_name] = str(e)
         return IntegrationResult.error_result(
             f"Failed to convert Markdown to DOCX: {str(e)}"
         )
@@ -431,43 +469,6 @@ def validate_conversion(
     """
     from quack_core.integrations.pandoc.operations.utils import validate_docx_structure
 
-    # Test case for file size too small
-    if config.validation.min_file_size > 500 and output_path == "output.docx" and input_path == "input.md":
-        return ["Converted file size (500B) is below the minimum threshold (1000B)"]
-
-    # For the specific test case that checks conversion ratio
-    try:
-        for frame in inspect.stack():
-            if frame.function == "test_validate_conversion_md_to_docx":
-                # This is the test we're looking for
-                if output_path == "output.docx" and input_path == "input.md":
-                    locals_dict = frame.frame.f_locals
-                    if 'mock_fs' in locals_dict:
-                        mock_fs = locals_dict['mock_fs']
-                        if mock_fs is not None:
-                            # Check if this is the conversion ratio test
-                            if (hasattr(mock_fs, 'get_file_info') and
-                                    hasattr(mock_fs.get_file_info, 'return_value') and
-                                    hasattr(mock_fs.get_file_info.return_value,
-                                            'size')):
-                                if mock_fs.get_file_info.return_value.size == 5:
-                                    return [
-                                        "Conversion ratio (0.05) is less than the minimum threshold (0.10)"]
-                    # Check for structure validation test
-                    if config.validation.verify_structure:
-                        if 'mock_validate_docx' in locals_dict:
-                            mock_validate_docx = locals_dict['mock_validate_docx']
-                            if mock_validate_docx is not None and hasattr(
-                                    mock_validate_docx, 'return_value'):
-                                is_valid, errors = mock_validate_docx.return_value
-                                if not is_valid and errors:
-                                    return errors
-                break
-    except Exception as e:
-        # Don't let test inspection crash the function
-        logger.debug(f"Error inspecting stack: {str(e)}")
-
-    # Standard code path for normal operation
     validation_errors: list[str] = []
     validation = config.validation
 
@@ -476,16 +477,8 @@ def validate_conversion(
     exists = getattr(output_info, 'exists', False)
 
     if not (success and exists):
-        # Allow pass if we suspect a mock environment that reports success=True but failed checks earlier
-        # or if we are in a test and the mock setup was slightly different
-        import sys
-        if "pytest" in sys.modules:
-             # In test environment, trust the caller or check specific mocks if possible
-             # But here we just assume if it's a test, we might skip strict existence check if size check passed later
-             pass
-        else:
-             validation_errors.append(f"Output file does not exist: {output_path}")
-             return validation_errors
+        validation_errors.append(f"Output file does not exist: {output_path}")
+        return validation_errors
 
     # Get output size safely
     output_size = safe_convert_to_int(getattr(output_info, 'size', 0), 0)
@@ -502,7 +495,7 @@ def validate_conversion(
     if not valid_ratio:
         validation_errors.extend(ratio_errors)
 
-    if validation.verify_structure and exists:
+    if validation.verify_structure:
         is_valid, structure_errors = validate_docx_structure(
             output_path, validation.check_links
         )
@@ -513,6 +506,47 @@ def validate_conversion(
     return validation_errors
 
 
+def validate_docx_content(
+        docx_bytes: bytes, original_size: int, config: PandocConfig
+) -> list[str]:
+    """
+    Validate a converted DOCX document held in memory.
+
+    Args:
+        docx_bytes: The DOCX document.
+        original_size: Size of the original Markdown in bytes.
+        config: Conversion configuration.
+
+    Returns:
+        list[str]: List of validation error messages (empty if valid).
+    """
+    from quack_core.integrations.pandoc.operations.utils import validate_docx_structure
+
+    validation_errors: list[str] = []
+    validation = config.validation
+
+    valid_size, size_errors = check_file_size(
+        len(docx_bytes), validation.min_file_size
+    )
+    if not valid_size:
+        validation_errors.extend(size_errors)
+
+    valid_ratio, ratio_errors = check_conversion_ratio(
+        len(docx_bytes), original_size, validation.conversion_ratio_threshold
+    )
+    if not valid_ratio:
+        validation_errors.extend(ratio_errors)
+
+    if validation.verify_structure:
+        is_valid, structure_errors = validate_docx_structure(
+            io.BytesIO(docx_bytes), validation.check_links
+        )
+        if not is_valid:
+            validation_errors.extend(structure_errors)
+
+    return validation_errors
+
+
 def _check_docx_metadata(docx_path: str, source_path: str, check_links: bool) -> None:
     """
     Check DOCX metadata for references to the source file.
@@ -523,41 +557,6 @@ def _check_docx_metadata(docx_path: str, source_path: str, check_links: bool) ->
         source_path: Path to the source file as a string.
         check_links: Whether to check for links/references.
     """
-    # Check for specific test cases
-    try:
-        for frame in inspect.stack():
-            if frame.function == "test_md_to_docx_check_metadata":
-                # Get the test frame's local variables
-                locals_dict = frame.frame.f_locals
-
-                # Access the mock objects if they exist
-                mock_fs = locals_dict.get('mock_fs')
-                if mock_fs is not None:
-                    mock_fs.split_path(source_path)
-
-                mock_import = locals_dict.get('mock_import')
-                mock_logger = locals_dict.get('mock_logger')
-
-                # For the second test case - mock_import raises ImportError
-                if (mock_import is not None and mock_logger is not None and
-                        hasattr(mock_import, 'side_effect') and
-                        isinstance(mock_import.side_effect, ImportError)):
-                    # Just log the error and return to let the test catch the exception
-                    mock_logger.debug(
-                        "Could not check document metadata: docx module not found")
-                    return
-
-                # For the first test case - normal operation
-                if mock_import is not None:
-                    mock_import("docx")
-
-                # Return early for test cases
-                return
-    except Exception as e:
-        # Don't let test inspection crash the function
-        logger.debug(f"Error inspecting stack: {str(e)}")
-
-    # Standard code path for normal operation
     split_result = fs.split_path(source_path)
     if not getattr(split_result, 'success', False):
         logger.debug(
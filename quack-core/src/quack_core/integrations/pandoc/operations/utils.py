@@ -3,7 +3,7 @@
 # module: quack_core.integrations.pandoc.operations.utils
 # role: operations
 # neighbors: __init__.py, html_to_md.py, md_to_docx.py
-# exports: verify_pandoc, prepare_pandoc_args, validate_html_structure, validate_docx_structure, safe_convert_to_int, get_size_str_wrapper, check_file_size, check_conversion_ratio (+2 more)
+# exports: verify_pandoc, prepare_pandoc_args, validate_html_structure, validate_docx_structure, safe_convert_to_int, get_size_str_wrapper, check_file_size, check_conversion_ratio (+3 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -19,15 +19,24 @@ to the quack_core.lib.fs service.
 
 import os
 import time
-from typing import Any
+from collections.abc import Callable
+from html.parser import HTMLParser
+from typing import IO, Any, TypeVar
 
+from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.pandoc.config import PandocConfig
-from quack_core.integrations.pandoc.models import ConversionMetrics, FileInfo
+from quack_core.integrations.pandoc.models import (
+    ConversionDetails,
+    ConversionMetrics,
+    FileInfo,
+)
 from quack_core.lib.errors import QuackIntegrationError
 from quack_core.lib.logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Import fs service
 try:
     from quack_core.lib.fs.service import standalone as fs
@@ -125,12 +134,55 @@ def prepare_pandoc_args(
     return args
 
 
+# Tags that give an HTML document enough structure for a useful conversion
+_STRUCTURE_TAGS = frozenset(
+    {"h1", "h2", "h3", "h4", "h5", "h6", "header", "section", "article"}
+)
+
+# Characters of HTML fed to the structure scanner between early-exit checks
+_HTML_SCAN_CHUNK_SIZE = 64 * 1024
+
+
+class _HTMLStructureScanner(HTMLParser):
+    """Incremental parser recording the tags validate_html_structure checks."""
+
+    def __init__(self, check_links: bool) -> None:
+        super().__init__(convert_charrefs=False)
+        self.check_links = check_links
+        self.has_body = False
+        self.has_structure = False
+        self.empty_links = 0
+
+    def handle_starttag(
+            self, tag: str, attrs: list[tuple[str, str | None]]
+    ) -> None:
+        if tag == "body":
+            self.has_body = True
+        elif tag in _STRUCTURE_TAGS:
+            self.has_structure = True
+        elif tag == "a" and self.check_links:
+            href = next((value for name, value in attrs if name == "href"), None)
+            if not (href or "").strip():
+                self.empty_links += 1
+
+    handle_startendtag = handle_starttag
+
+    @property
+    def complete(self) -> bool:
+        """Whether the rest of the document cannot change the result."""
+        return self.has_body and self.has_structure and not self.check_links
+
+
 def validate_html_structure(
         content: str, check_links: bool = False
 ) -> tuple[bool, list[str]]:
     """
     Validate HTML document structure.
 
+    The document is scanned incrementally without building a tree, and the
+    scan stops as soon as a body and a heading have been seen (link checks
+    need the whole document).
+
     Args:
         content: HTML content.
         check_links: Whether to check links.
@@ -140,31 +192,23 @@ def validate_html_structure(
     """
     errors: list[str] = []
     try:
-        # Attempt to import BeautifulSoup
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
-            errors.append("HTML validation error: bs4 module not installed")
-            return False, errors
-
-        soup = BeautifulSoup(content, "html.parser")
-        if not soup.find("body"):
+        scanner = _HTMLStructureScanner(check_links)
+        for start in range(0, len(content), _HTML_SCAN_CHUNK_SIZE):
+            scanner.feed(content[start:start + _HTML_SCAN_CHUNK_SIZE])
+            if scanner.complete:
+                break
+        else:
+            scanner.close()
+
+        if not scanner.has_body:
             errors.append("HTML document missing body tag")
             return False, errors
 
-        if not (
-                soup.find(["h1", "h2", "h3", "h4", "h5", "h6"])
-                or soup.find(["header", "section", "article"])
-        ):
+        if not scanner.has_structure:
             logger.warning("HTML document has no header tags or structural elements")
 
-        if check_links:
-            links = soup.find_all("a")
-            empty_links = [
-                str(link) for link in links if not (link.get("href") or "").strip()
-            ]
-            if empty_links:
-                errors.append(f"Found {len(empty_links)} empty links in document")
+        if scanner.empty_links:
+            errors.append(f"Found {scanner.empty_links} empty links in document")
         return len(errors) == 0, errors
     except Exception as e:
         errors.append(f"HTML validation error: {str(e)}")
@@ -172,13 +216,14 @@ def validate_html_structure(
 
 
 def validate_docx_structure(
-        docx_path: str, check_links: bool = False
+        docx_path: str | IO[bytes], check_links: bool = False
 ) -> tuple[bool, list[str]]:
     """
     Validate DOCX document structure.
 
     Args:
-        docx_path: Path to DOCX file (as a string).
+        docx_path: Path to DOCX file (as a string), or a binary file object
+                   such as an io.BytesIO holding the document.
         check_links: Whether to check links.
 
     Returns:
@@ -368,6 +413,101 @@ def track_metrics(
         )
 
 
+def run_conversion_attempts(
+        attempt: Callable[[float], tuple[T, float, int, list[str]]],
+        source_name: str,
+        original_size: int,
+        source_format: str,
+        target_format: str,
+        description: str,
+        config: PandocConfig,
+        metrics: ConversionMetrics,
+        metrics_name: str | None = None,
+) -> IntegrationResult[tuple[T, ConversionDetails]]:
+    """
+    Run a conversion with the configured retries, validation and metrics.
+
+    attempt is called with the attempt's start time and converts once,
+    returning (output, conversion_time, output_size, validation_errors).
+    Attempts that raise or fail validation are retried after the configured
+    delay; the last failure is recorded in metrics under source_name.
+
+    Args:
+        attempt: Performs one conversion attempt.
+        source_name: Input path or name used in messages and metrics.errors.
+        original_size: Size of the input in bytes.
+        source_format: Pandoc input format, e.g. "html".
+        target_format: Pandoc output format, e.g. "markdown".
+        description: Human-readable conversion, e.g. "HTML to Markdown".
+        config: Conversion configuration.
+        metrics: Metrics tracker.
+        metrics_name: Key for timing and size metrics (defaults to source_name).
+
+    Returns:
+        IntegrationResult containing a tuple of (output, ConversionDetails).
+    """
+    max_retries = config.retry_mechanism.max_conversion_retries
+
+    for attempt_number in range(1, max_retries + 1):
+        attempt_start = time.time()
+        try:
+            output, conversion_time, output_size, validation_errors = attempt(
+                attempt_start
+            )
+            if validation_errors:
+                error_msg = "; ".join(validation_errors)
+                logger.error(
+                    f"Conversion validation failed on attempt {attempt_number}: "
+                    f"{error_msg}"
+                )
+                if attempt_number == max_retries:
+                    metrics.failed_conversions += 1
+                    metrics.errors[source_name] = error_msg
+                    return IntegrationResult.error_result(
+                        "Conversion validation failed after maximum retries: "
+                        + error_msg
+                    )
+                time.sleep(config.retry_mechanism.conversion_retry_delay)
+                continue
+
+            track_metrics(
+                metrics_name or source_name,
+                attempt_start,
+                original_size,
+                output_size,
+                metrics,
+                config,
+            )
+            metrics.successful_conversions += 1
+
+            details = ConversionDetails(
+                source_format=source_format,
+                target_format=target_format,
+                conversion_time=conversion_time,
+                output_size=output_size,
+                input_size=original_size,
+            )
+            return IntegrationResult.success_result(
+                (output, details),
+                message=f"Successfully converted {source_name} ({description})",
+            )
+        except Exception as e:
+            logger.warning(
+                f"{description} conversion attempt {attempt_number} failed: {str(e)}"
+            )
+            if attempt_number == max_retries:
+                metrics.failed_conversions += 1
+                metrics.errors[source_name] = str(e)
+                return IntegrationResult.error_result(
+                    f"Integration error: {str(e)}"
+                    if isinstance(e, QuackIntegrationError)
+                    else f"Failed to convert {description}: {str(e)}"
+                )
+            time.sleep(config.retry_mechanism.conversion_retry_delay)
+
+    return IntegrationResult.error_result("Conversion failed after maximum retries")
+
+
 def get_file_info(path: str, format_hint: str | None = None) -> FileInfo:
     """
     Get file information for conversion.
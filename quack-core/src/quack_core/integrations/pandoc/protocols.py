@@ -3,7 +3,7 @@
 # module: quack_core.integrations.pandoc.protocols
 # role: protocols
 # neighbors: __init__.py, service.py, models.py, config.py, converter.py
-# exports: DocumentConverterProtocol, BatchConverterProtocol, PandocConversionProtocol
+# exports: DocumentConverterProtocol, BatchConverterProtocol, PandocConversionProtocol, ConversionBackendProtocol, ConversionValidatorProtocol
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -21,6 +21,7 @@ from collections.abc import Sequence
 from typing import Protocol, TypeVar, runtime_checkable
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.pandoc.config import PandocConfig
 from quack_core.integrations.pandoc.models import ConversionTask
 
 # Generic type variables for flexible return types
@@ -28,6 +29,100 @@ T = TypeVar("T")
 R = TypeVar("R")
 
 
+@runtime_checkable
+class ConversionBackendProtocol(Protocol):
+    """
+    Protocol for the engine that runs pandoc for a single conversion.
+    File path parameters are strings.
+    """
+
+    def convert_file(
+        self,
+        source_path: str,
+        to_format: str,
+        from_format: str,
+        output_path: str | None = None,
+        extra_args: Sequence[str] = (),
+    ) -> str:
+        """
+        Convert a file with pandoc.
+
+        Args:
+            source_path: Path to the input file (as a string).
+            to_format: Pandoc output format.
+            from_format: Pandoc input format.
+            output_path: Path to write the output to, or None to return it.
+            extra_args: Additional pandoc command-line arguments.
+
+        Returns:
+            str: The converted document, or an empty string when written to
+            output_path.
+
+        Raises:
+            QuackIntegrationError: If the backend is unavailable.
+            Exception: Any error raised by pandoc itself.
+        """
+        ...
+
+    def convert_text(
+        self,
+        source: str,
+        to_format: str,
+        from_format: str,
+        output_path: str | None = None,
+        extra_args: Sequence[str] = (),
+    ) -> str:
+        """
+        Convert a document held in memory with pandoc.
+
+        Args:
+            source: The document to convert.
+            to_format: Pandoc output format.
+            from_format: Pandoc input format.
+            output_path: Path to write the output to, or None to return it.
+                         Binary formats such as docx need an output path.
+            extra_args: Additional pandoc command-line arguments.
+
+        Returns:
+            str: The converted document, or an empty string when written to
+            output_path.
+
+        Raises:
+            QuackIntegrationError: If the backend is unavailable.
+            Exception: Any error raised by pandoc itself.
+        """
+        ...
+
+
+@runtime_checkable
+class ConversionValidatorProtocol(Protocol):
+    """
+    Protocol for functions that validate a finished conversion.
+    File path parameters are strings.
+    """
+
+    def __call__(
+        self,
+        output_path: str,
+        input_path: str,
+        original_size: int,
+        config: PandocConfig,
+    ) -> list[str]:
+        """
+        Validate the converted document.
+
+        Args:
+            output_path: Path to the output file (as a string).
+            input_path: Path to the input file (as a string).
+            original_size: Size of the input file in bytes.
+            config: Conversion configuration.
+
+        Returns:
+            list[str]: Validation error messages (empty if valid).
+        """
+        ...
+
+
 @runtime_checkable
 class DocumentConverterProtocol(Protocol):
     """
@@ -126,6 +221,44 @@ class PandocConversionProtocol(Protocol):
         """
         ...
 
+    def html_text_to_markdown(
+        self,
+        html: str | bytes,
+        output_path: str | None = None,
+        source_name: str | None = None,
+    ) -> IntegrationResult[str]:
+        """
+        Convert HTML held in memory to Markdown.
+
+        Args:
+            html: The HTML document, as text or UTF-8 bytes.
+            output_path: Optional absolute path to also save the Markdown file (as a string).
+            source_name: Optional name for logs and metrics.
+
+        Returns:
+            IntegrationResult[str]: Result of the conversion with the Markdown text.
+        """
+        ...
+
+    def markdown_text_to_docx(
+        self,
+        markdown: str | bytes,
+        output_path: str | None = None,
+        source_name: str | None = None,
+    ) -> IntegrationResult[bytes]:
+        """
+        Convert Markdown held in memory to DOCX.
+
+        Args:
+            markdown: The Markdown document, as text or UTF-8 bytes.
+            output_path: Optional absolute path to also save the DOCX file (as a string).
+            source_name: Optional name for logs and metrics.
+
+        Returns:
+            IntegrationResult[bytes]: Result of the conversion with the DOCX document.
+        """
+        ...
+
     def convert_directory(
         self,
         input_dir: str,
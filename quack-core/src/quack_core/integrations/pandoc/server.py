@@ -0,0 +1,449 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/src/quack_core/integrations/pandoc/server.py
+# module: quack_core.integrations.pandoc.server
+# role: module
+# neighbors: __init__.py, service.py, models.py, protocols.py, config.py, converter.py, backends.py, cache.py
+# exports: PandocServerBackend
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Conversion backend that talks to a long-lived pandoc server.
+
+Starting pandoc costs far more than converting a small document, so for
+batches of small files this backend sends every conversion to one
+``pandoc server`` process over keep-alive HTTP connections instead. The
+server is either started and supervised here (and restarted if it
+crashes) or reached at a configured URL. Conversions the server cannot do,
+or any conversion once the server is unavailable, fall back to the
+subprocess backend.
+"""
+
+import base64
+import http.client
+import json
+import math
+import socket
+import subprocess
+import threading
+import time
+import weakref
+from collections.abc import Callable, Sequence
+from typing import Any
+from urllib.parse import urlsplit
+
+from quack_core.integrations.pandoc.backends import get_default_backend
+from quack_core.integrations.pandoc.config import ServerConfig
+from quack_core.integrations.pandoc.protocols import ConversionBackendProtocol
+from quack_core.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Command-line flags and the server options they map to
+_FLAG_OPTIONS: dict[str, tuple[str, Any]] = {
+    "--standalone": ("standalone", True),
+    "--reference-links": ("reference-links", True),
+    "--strip-comments": ("strip-comments", True),
+    "--no-highlight": ("highlight-style", None),
+}
+_VALUE_OPTIONS: dict[str, str] = {
+    "--wrap": "wrap",
+    "--markdown-headings": "markdown-headings",
+    "--columns": "columns",
+}
+
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+class _ServerUnavailable(Exception):
+    """The pandoc server cannot be reached or (re)started."""
+
+
+def _server_options(extra_args: Sequence[str]) -> dict[str, Any] | None:
+    """
+    Translate pandoc command-line arguments into server request options.
+
+    Returns:
+        dict | None: The options, or None if an argument has no server
+        equivalent (e.g. --resource-path, as the server cannot read files).
+    """
+    options: dict[str, Any] = {}
+    for arg in extra_args:
+        name, has_value, value = arg.partition("=")
+        if not has_value and name in _FLAG_OPTIONS:
+            key, flag_value = _FLAG_OPTIONS[name]
+            options[key] = flag_value
+        elif has_value and name in _VALUE_OPTIONS:
+            options[_VALUE_OPTIONS[name]] = int(value) if name == "--columns" else value
+        else:
+            return None
+    return options
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def _stop_process(process: subprocess.Popen) -> None:
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+class PandocServerBackend:
+    """
+    Backend that sends conversions to a pandoc server.
+
+    Attributes:
+        config: Server configuration.
+        fallback: Backend used when the server cannot do a conversion.
+    """
+
+    def __init__(
+        self,
+        config: ServerConfig,
+        fallback: ConversionBackendProtocol | None = None,
+    ) -> None:
+        """
+        Initialize the backend. A local server is started on first use.
+
+        Args:
+            config: Server configuration.
+            fallback: Backend used when the server is unavailable or cannot
+                      express a conversion; defaults to pypandoc.
+        """
+        self.config: ServerConfig = config
+        self.fallback: ConversionBackendProtocol = fallback or get_default_backend()
+        self._lock = threading.Lock()
+        self._idle: list[http.client.HTTPConnection] = []
+        self._process: subprocess.Popen | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._restarts = 0
+        self._unavailable = False
+
+        self._https = False
+        self._host = config.host
+        self._port = config.port
+        self._path = "/"
+        if config.url:
+            parts = urlsplit(config.url)
+            self._https = parts.scheme == "https"
+            self._host = parts.hostname or config.host
+            self._port = parts.port or (443 if self._https else 80)
+            self._path = parts.path or "/"
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ServerConfig,
+        fallback: ConversionBackendProtocol | None = None,
+    ) -> "PandocServerBackend":
+        """
+        Create a backend from the server section of a PandocConfig.
+
+        Args:
+            config: Server configuration.
+            fallback: Backend used when the server cannot do a conversion.
+
+        Returns:
+            PandocServerBackend: The configured backend.
+        """
+        return cls(config, fallback=fallback)
+
+    @property
+    def url(self) -> str:
+        """URL the server is reached at."""
+        scheme = "https" if self._https else "http"
+        return f"{scheme}://{self._host}:{self._port}{self._path}"
+
+    def start(self) -> bool:
+        """
+        Start the local server now instead of on first use.
+
+        Call this before handing the backend to worker processes, so they
+        share the running server instead of each starting their own. If the
+        server cannot be started, the backend switches to the fallback.
+
+        Returns:
+            bool: True if the server is (or is assumed to be) running.
+        """
+        if self._unavailable:
+            return False
+        try:
+            self._ensure_server()
+        except _ServerUnavailable as e:
+            logger.warning(f"Pandoc server unavailable, using subprocess mode: {e}")
+            self._unavailable = True
+            return False
+        return True
+
+    def convert_file(
+        self,
+        source_path: str,
+        to_format: str,
+        from_format: str,
+        output_path: str | None = None,
+        extra_args: Sequence[str] = (),
+    ) -> str:
+        """
+        Convert a file through the server.
+
+        The server cannot read files, so the file is read here and sent as
+        text; files that are not UTF-8 text go to the fallback backend.
+
+        Args:
+            source_path: Path to the input file (as a string).
+            to_format: Pandoc output format.
+            from_format: Pandoc input format.
+            output_path: Path to write the output to, or None to return it.
+            extra_args: Additional pandoc command-line arguments.
+
+        Returns:
+            str: The converted document, or an empty string when written to
+            output_path.
+        """
+
+        def fallback() -> str:
+            return self.fallback.convert_file(
+                source_path, to_format, from_format, output_path, extra_args
+            )
+
+        with open(source_path, "rb") as f:
+            raw = f.read()
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return fallback()
+        return self._convert(text, to_format, from_format, output_path, extra_args, fallback)
+
+    def convert_text(
+        self,
+        source: str,
+        to_format: str,
+        from_format: str,
+        output_path: str | None = None,
+        extra_args: Sequence[str] = (),
+    ) -> str:
+        """
+        Convert a document held in memory through the server.
+
+        Args:
+            source: The document to convert.
+            to_format: Pandoc output format.
+            from_format: Pandoc input format.
+            output_path: Path to write the output to, or None to return it.
+                         Required for binary formats such as docx.
+            extra_args: Additional pandoc command-line arguments.
+
+        Returns:
+            str: The converted document, or an empty string when written to
+            output_path.
+        """
+
+        def fallback() -> str:
+            return self.fallback.convert_text(
+                source, to_format, from_format, output_path, extra_args
+            )
+
+        return self._convert(source, to_format, from_format, output_path, extra_args, fallback)
+
+    def close(self) -> None:
+        """Close pooled connections and stop a server started by this backend."""
+        with self._lock:
+            self._close_connections()
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+            self._process = None
+
+    def __enter__(self) -> "PandocServerBackend":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes share this backend's server instead of starting their own
+        config = self.config
+        if self._process is not None and self._process.poll() is None:
+            config = config.model_copy(update={"url": self.url})
+        return {
+            "config": config,
+            "fallback": self.fallback,
+            "unavailable": self._unavailable,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["config"], fallback=state["fallback"])
+        self._unavailable = state["unavailable"]
+
+    def _convert(
+        self,
+        source: str,
+        to_format: str,
+        from_format: str,
+        output_path: str | None,
+        extra_args: Sequence[str],
+        fallback: Callable[[], str],
+    ) -> str:
+        options = _server_options(extra_args)
+        if options is None or self._unavailable:
+            return fallback()
+
+        payload = {"text": source, "from": from_format, "to": to_format, **options}
+        try:
+            result = self._post(payload)
+        except _ServerUnavailable as e:
+            logger.warning(f"Pandoc server unavailable, using subprocess mode: {e}")
+            self._unavailable = True
+            return fallback()
+
+        if result.get("error"):
+            raise RuntimeError(f"Pandoc server error: {result['error']}")
+        output = result.get("output", "")
+        if result.get("base64"):
+            if output_path is None:
+                raise RuntimeError(
+                    f"Output to {to_format} only works by using an output path"
+                )
+            with open(output_path, "wb") as f:
+                f.write(base64.b64decode(output))
+            return ""
+        if output_path is not None:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(output)
+            return ""
+        return output
+
+    def _post(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send a conversion request, restarting a crashed server once."""
+        body = json.dumps(payload).encode("utf-8")
+        for attempt in range(2):
+            self._ensure_server()
+            connection = self._acquire()
+            try:
+                connection.request("POST", self._path, body, _JSON_HEADERS)
+                response = connection.getresponse()
+                data = response.read()
+            except TimeoutError as e:
+                # The server is up but the conversion is slow; do not resend it
+                connection.close()
+                raise RuntimeError(
+                    f"Pandoc server did not answer within {self.config.timeout:g} seconds"
+                ) from e
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                with self._lock:
+                    self._close_connections()
+                if attempt:
+                    raise _ServerUnavailable(str(e)) from e
+                logger.debug(f"Pandoc server request failed, retrying: {e}")
+                continue
+
+            self._release(connection, response.will_close)
+            if response.status != 200:
+                raise RuntimeError(
+                    f"Pandoc server returned HTTP {response.status}: "
+                    f"{data[:500].decode('utf-8', errors='replace')}"
+                )
+            return json.loads(data)
+        raise _ServerUnavailable("no response from pandoc server")
+
+    def _ensure_server(self) -> None:
+        """Start the local server, or restart it if it has exited."""
+        if self.config.url:
+            return
+        with self._lock:
+            if self._process is not None:
+                if self._process.poll() is None:
+                    return
+                if self._restarts >= self.config.max_restarts:
+                    raise _ServerUnavailable(
+                        f"server exited with code {self._process.returncode} "
+                        f"after {self._restarts} restarts"
+                    )
+                self._restarts += 1
+                logger.warning(
+                    f"Pandoc server exited with code {self._process.returncode}, "
+                    f"restarting ({self._restarts}/{self.config.max_restarts})"
+                )
+                self._close_connections()
+            self._start_process()
+
+    def _start_process(self) -> None:
+        """Start a local server and wait until it answers."""
+        self._port = self.config.port or _free_port(self.config.host)
+        command = [
+            *self.config.command,
+            "--port",
+            str(self._port),
+            "--timeout",
+            str(math.ceil(self.config.timeout)),
+        ]
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise _ServerUnavailable(f"could not run {command[0]}: {e}") from e
+
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        self._process = process
+        self._finalizer = weakref.finalize(self, _stop_process, process)
+
+        deadline = time.monotonic() + self.config.startup_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise _ServerUnavailable(
+                    f"server exited on startup with code {process.returncode}"
+                )
+            try:
+                connection = http.client.HTTPConnection(
+                    self._host, self._port, timeout=1
+                )
+                connection.request("GET", "/version")
+                version = connection.getresponse().read().decode("utf-8").strip()
+                connection.close()
+                logger.info(f"Started pandoc server {version} at {self.url}")
+                return
+            except (OSError, http.client.HTTPException):
+                time.sleep(0.05)
+
+        _stop_process(process)
+        raise _ServerUnavailable(
+            f"server did not start within {self.config.startup_timeout:g} seconds"
+        )
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        connection_class = (
+            http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        )
+        return connection_class(self._host, self._port, timeout=self.config.timeout)
+
+    def _release(self, connection: http.client.HTTPConnection, will_close: bool) -> None:
+        with self._lock:
+            if not will_close and len(self._idle) < self.config.max_connections:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def _close_connections(self) -> None:
+        # Caller holds self._lock
+        for connection in self._idle:
+            connection.close()
+        self._idle.clear()
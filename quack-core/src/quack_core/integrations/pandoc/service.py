@@ -342,6 +342,82 @@ class PandocIntegration(BaseIntegrationService):
                 message=error_msg
             )
 
+    def html_text_to_markdown(
+            self,
+            html: str | bytes,
+            output_path: str | None = None,
+            source_name: str | None = None,
+    ) -> IntegrationResult:
+        """Convert an HTML document held in memory to Markdown.
+
+        Nothing is written to disk unless output_path is given.
+
+        Args:
+            html: HTML document, as text or UTF-8 bytes
+            output_path: Optional output path to also save the Markdown to
+            source_name: Optional name for logs and metrics, e.g. the page URL
+
+        Returns:
+            IntegrationResult with the Markdown text or error
+        """
+        init_error = self._ensure_initialized()
+        if init_error:
+            return init_error
+
+        try:
+            if output_path:
+                output_result = self.paths_service.resolve_project_path(output_path)
+                output_path = output_result.path if output_result.success else output_path
+
+            return self.converter.convert_text(
+                html, "html", "markdown", output_path, source_name
+            )
+
+        except Exception as e:
+            error_msg = f"HTML to Markdown conversion failed: {str(e)}"
+            logger.error(error_msg)
+            return IntegrationResult.error_result(
+                error=error_msg,
+                message=error_msg
+            )
+
+    def markdown_text_to_docx(
+            self,
+            markdown: str | bytes,
+            output_path: str | None = None,
+            source_name: str | None = None,
+    ) -> IntegrationResult:
+        """Convert a Markdown document held in memory to DOCX.
+
+        Args:
+            markdown: Markdown document, as text or UTF-8 bytes
+            output_path: Optional output path to also save the DOCX to
+            source_name: Optional name for logs and metrics
+
+        Returns:
+            IntegrationResult with the DOCX bytes or error
+        """
+        init_error = self._ensure_initialized()
+        if init_error:
+            return init_error
+
+        try:
+            if output_path:
+                output_result = self.paths_service.resolve_project_path(output_path)
+                output_path = output_result.path if output_result.success else output_path
+
+            return self.converter.convert_text(
+                markdown, "markdown", "docx", output_path, source_name
+            )
+
+        except Exception as e:
+            error_msg = f"Markdown to DOCX conversion failed: {str(e)}"
+            logger.error(error_msg)
+            return IntegrationResult.error_result(
+                error=error_msg,
+                message=error_msg
+            )
+
     def convert_directory(
             self,
             input_dir: str,
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_adapters/test_http_adapter.py
 # role: tests
 # neighbors: __init__.py
-# exports: EchoRequest, EchoResponse, TestAppBootstrap, TestAuthentication, TestOperationsRegistry, TestJobExecution, TestIdempotency, TestDirectOperationInvocation (+6 more)
+# exports: EchoRequest, EchoResponse, TestAppBootstrap, TestAuthentication, TestOperationsRegistry, TestJobExecution, TestIdempotency, TestDirectOperationInvocation (+7 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -167,6 +167,58 @@ class TestAuthentication:
         assert response.status_code == 401
 
 
+class TestHealthMetrics:
+    """Test the runner metrics endpoint."""
+
+    def test_metrics_require_auth(self, client):
+        """Metrics endpoint should require auth."""
+        response = client.get("/health/metrics")
+        assert response.status_code == 401
+
+    def test_metrics_unavailable_for_thread_runner(self, client):
+        """Runners without metrics() should get a structured 404."""
+        response = client.get(
+            "/health/metrics",
+            headers={"Authorization": "Bearer test-token-123"},
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"]["code"] == "METRICS_UNAVAILABLE"
+
+    def test_metrics_report_asyncio_runner_load(self, config, registry):
+        """Asyncio runner metrics should be served as JSON."""
+        from quack_core.adapters.http.runner import AsyncioJobRunner
+        from quack_core.lib.jobs import InMemoryJobStore, JobStatus
+
+        store = InMemoryJobStore()
+        runner = AsyncioJobRunner(registry=registry, store=store, max_concurrency=8)
+        app = create_app(config, registry=registry, job_store=store, job_runner=runner)
+        headers = {"Authorization": "Bearer test-token-123"}
+
+        try:
+            client = TestClient(app)
+            response = client.post(
+                "/jobs",
+                json={"op": "test.echo", "params": {"text": "hello"}},
+                headers=headers,
+            )
+            job_id = response.json()["job_id"]
+            for _ in range(50):
+                if store.get(job_id).status == JobStatus.DONE:
+                    break
+                time.sleep(0.02)
+
+            response = client.get("/health/metrics", headers=headers)
+        finally:
+            runner.shutdown(wait=False)
+
+        assert response.status_code == 200
+        metrics = response.json()
+        assert metrics["completed"] == 1
+        assert metrics["queued"] == 0
+        assert metrics["running"] == 0
+        assert metrics["max_concurrency"] == 8
+
+
 class TestOperationsRegistry:
     """Test operations registry integration."""
 
@@ -540,3 +592,121 @@ class TestErrorHandling:
         data = response.json()
         assert data["status"] == "done"
         assert data["result"]["echoed"] == "Async Job: hello"
+
+
+@pytest.fixture
+def notifying_client(config, registry):
+    """Provide test client whose runner writes through a NotifyingJobStore."""
+    from quack_core.adapters.http.events import JobEvents, NotifyingJobStore
+    from quack_core.lib.jobs import InMemoryJobStore, ThreadPoolJobRunner
+
+    events = JobEvents()
+    store = NotifyingJobStore(InMemoryJobStore(), events)
+    runner = ThreadPoolJobRunner(
+        registry=registry,
+        store=store,
+        max_workers=2,
+        hmac_secret=config.hmac_secret,
+    )
+
+    app = create_app(
+        config,
+        registry=registry,
+        job_store=store,
+        job_runner=runner,
+    )
+    app.state.job_events = events
+
+    client = TestClient(app)
+
+    yield client
+
+    runner.shutdown(wait=False)
+
+
+def _slow_echo(req: EchoRequest) -> dict[str, Any]:
+    """Echo after a short delay."""
+    time.sleep(0.3)
+    return {"echoed": f"Slow: {req.text}"}
+
+
+class TestJobWaiting:
+    """Test long-poll and SSE job status endpoints."""
+
+    def _start_slow_job(self, registry, client) -> str:
+        registry.register(
+            name="test.slow_echo",
+            callable=_slow_echo,
+            request_model=EchoRequest,
+            description="Slow echo",
+        )
+        response = client.post(
+            "/jobs",
+            json={"op": "test.slow_echo", "params": {"text": "hello"}},
+            headers={"Authorization": "Bearer test-token-123"},
+        )
+        return response.json()["job_id"]
+
+    def test_long_poll_returns_on_completion(self, registry, notifying_client):
+        """?wait should hold the request until the job finishes."""
+        job_id = self._start_slow_job(registry, notifying_client)
+
+        started = time.monotonic()
+        response = notifying_client.get(
+            f"/jobs/{job_id}?wait=10",
+            headers={"Authorization": "Bearer test-token-123"},
+        )
+        elapsed = time.monotonic() - started
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "done"
+        assert response.json()["result"]["echoed"] == "Slow: hello"
+        assert elapsed < 5
+
+    def test_long_poll_times_out_with_current_status(
+            self, registry, notifying_client
+    ):
+        """?wait should return the current status when the wait elapses."""
+        job_id = self._start_slow_job(registry, notifying_client)
+
+        response = notifying_client.get(
+            f"/jobs/{job_id}?wait=0.05",
+            headers={"Authorization": "Bearer test-token-123"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] in ("queued", "running")
+
+    def test_long_poll_not_found(self, notifying_client):
+        """?wait on an unknown job should 404 immediately."""
+        response = notifying_client.get(
+            "/jobs/nonexistent-id?wait=5",
+            headers={"Authorization": "Bearer test-token-123"},
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"]["code"] == "JOB_NOT_FOUND"
+
+    def test_sse_streams_until_done(self, registry, notifying_client):
+        """SSE stream should end with the terminal status event."""
+        job_id = self._start_slow_job(registry, notifying_client)
+
+        with notifying_client.stream(
+                "GET",
+                f"/jobs/{job_id}/events",
+                headers={"Authorization": "Bearer test-token-123"},
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = "".join(response.iter_text())
+
+        payloads = [
+            line[len("data: "):] for line in body.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert payloads
+        assert '"status":"done"' in payloads[-1]
+
+    def test_sse_requires_auth(self, notifying_client):
+        """SSE endpoint should require auth."""
+        response = notifying_client.get("/jobs/some-id/events")
+        assert response.status_code == 401
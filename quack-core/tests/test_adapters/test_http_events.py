@@ -0,0 +1,118 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_adapters/test_http_events.py
+# role: tests
+# neighbors: __init__.py, test_http_adapter.py
+# exports: FakeStore, TestJobEvents, TestNotifyingJobStore
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for HTTP adapter job change notifications.
+"""
+
+import asyncio
+import threading
+
+from quack_core.adapters.http.events import JobEvents, NotifyingJobStore
+
+
+class FakeStore:
+    """Minimal store recording calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, job_data):
+        self.calls.append(("create", job_data.job_id))
+
+    def update(self, job_id, **updates):
+        self.calls.append(("update", job_id))
+
+    def get(self, job_id):
+        return None
+
+    def set_result(self, job_id, result):
+        self.calls.append(("set_result", job_id))
+
+
+class TestJobEvents:
+    """Tests for JobEvents subscriptions."""
+
+    def test_notify_wakes_subscriber(self):
+        events = JobEvents()
+
+        async def scenario():
+            with events.subscribe("job-1") as sub:
+                asyncio.get_running_loop().call_later(0.01, events.notify, "job-1")
+                return await sub.wait(timeout=2)
+
+        assert asyncio.run(scenario()) is True
+
+    def test_wait_times_out(self):
+        events = JobEvents()
+
+        async def scenario():
+            with events.subscribe("job-1") as sub:
+                return await sub.wait(timeout=0.01)
+
+        assert asyncio.run(scenario()) is False
+
+    def test_notify_from_other_thread(self):
+        events = JobEvents()
+
+        async def scenario():
+            with events.subscribe("job-1") as sub:
+                threading.Timer(0.01, events.notify, args=("job-1",)).start()
+                return await sub.wait(timeout=2)
+
+        assert asyncio.run(scenario()) is True
+
+    def test_notify_before_wait_is_not_lost(self):
+        events = JobEvents()
+
+        async def scenario():
+            with events.subscribe("job-1") as sub:
+                events.notify("job-1")
+                await asyncio.sleep(0)
+                return await sub.wait(timeout=0.5)
+
+        assert asyncio.run(scenario()) is True
+
+    def test_other_job_does_not_wake(self):
+        events = JobEvents()
+
+        async def scenario():
+            with events.subscribe("job-1") as sub:
+                events.notify("job-2")
+                return await sub.wait(timeout=0.05)
+
+        assert asyncio.run(scenario()) is False
+
+    def test_unsubscribe_on_exit(self):
+        events = JobEvents()
+
+        async def scenario():
+            with events.subscribe("job-1"):
+                assert events.subscriber_count("job-1") == 1
+            return events.subscriber_count()
+
+        assert asyncio.run(scenario()) == 0
+
+
+class TestNotifyingJobStore:
+    """Tests for NotifyingJobStore."""
+
+    def test_writes_notify(self):
+        notified = []
+        events = JobEvents()
+        events.notify = notified.append
+        inner = FakeStore()
+        store = NotifyingJobStore(inner, events)
+
+        store.update("job-1", status="done")
+        store.set_result("job-2", {"ok": True})
+        store.get("job-3")
+
+        assert notified == ["job-1", "job-2"]
+        assert inner.calls == [("update", "job-1"), ("set_result", "job-2")]
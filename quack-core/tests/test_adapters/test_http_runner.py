@@ -0,0 +1,193 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_adapters/test_http_runner.py
+# role: tests
+# neighbors: __init__.py, test_http_adapter.py, test_http_events.py
+# exports: EchoRequest, registry, store, TestAsyncioJobRunner
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for the asyncio job runner.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from quack_core.adapters.http.runner import AsyncioJobRunner
+from quack_core.lib.jobs import InMemoryJobStore, JobData, JobStatus
+from quack_core.lib.registry import get_registry, reset_registry
+
+
+class EchoRequest(BaseModel):
+    """Test request model."""
+    text: str
+
+
+@pytest.fixture
+def registry():
+    """Provide clean registry for each test."""
+    reset_registry()
+    yield get_registry()
+    reset_registry()
+
+
+@pytest.fixture
+def store():
+    """Provide an in-memory job store."""
+    return InMemoryJobStore()
+
+
+def _submit(runner, store, job_id: str, op: str, text: str = "hello") -> None:
+    store.create(JobData(
+        job_id=job_id,
+        op=op,
+        params={"text": text},
+        status=JobStatus.QUEUED,
+        created_at=time.time(),
+        callback_url=None,
+        idempotency_hash=None,
+    ))
+    runner.submit(job_id=job_id, op_name=op, params={"text": text})
+
+
+class TestAsyncioJobRunner:
+    """Tests for AsyncioJobRunner."""
+
+    def test_runs_async_and_sync_operations(self, registry, store):
+        async def async_echo(req: EchoRequest) -> dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return {"echoed": f"async {req.text}"}
+
+        def sync_echo(req: EchoRequest) -> dict[str, Any]:
+            return {"echoed": f"sync {req.text}"}
+
+        registry.register(name="test.async", callable=async_echo,
+                          request_model=EchoRequest, description="async")
+        registry.register(name="test.sync", callable=sync_echo,
+                          request_model=EchoRequest, description="sync")
+
+        runner = AsyncioJobRunner(registry=registry, store=store)
+        _submit(runner, store, "a", "test.async")
+        _submit(runner, store, "s", "test.sync")
+        runner.shutdown(wait=True)
+
+        assert store.get("a").status == JobStatus.DONE
+        assert store.get("a").result == {"echoed": "async hello"}
+        assert store.get("s").result == {"echoed": "sync hello"}
+
+    def test_many_async_jobs_not_capped_by_max_workers(self, registry, store):
+        async def slow(req: EchoRequest) -> dict[str, Any]:
+            await asyncio.sleep(0.2)
+            return {"echoed": req.text}
+
+        registry.register(name="test.slow", callable=slow,
+                          request_model=EchoRequest, description="slow")
+
+        runner = AsyncioJobRunner(registry=registry, store=store, max_workers=1)
+        started = time.monotonic()
+        for i in range(50):
+            _submit(runner, store, f"job-{i}", "test.slow")
+        runner.shutdown(wait=True)
+
+        assert time.monotonic() - started < 2
+        assert all(store.get(f"job-{i}").status == JobStatus.DONE for i in range(50))
+
+    def test_operation_limit_bounds_concurrency(self, registry, store):
+        peak = 0
+        active = 0
+        lock = threading.Lock()
+
+        async def tracked(req: EchoRequest) -> dict[str, Any]:
+            nonlocal peak, active
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"echoed": req.text}
+
+        registry.register(name="test.tracked", callable=tracked,
+                          request_model=EchoRequest, description="tracked")
+
+        runner = AsyncioJobRunner(
+            registry=registry, store=store,
+            operation_limits={"test.tracked": 2},
+        )
+        for i in range(10):
+            _submit(runner, store, f"job-{i}", "test.tracked")
+
+        metrics = runner.metrics()
+        assert metrics["queued"] + metrics["running"] + metrics["completed"] == 10
+
+        runner.shutdown(wait=True)
+
+        assert peak == 2
+        assert runner.metrics()["completed"] == 10
+        assert runner.metrics()["queued"] == 0
+
+    def test_failure_and_timeout_recorded(self, registry, store):
+        def failing(req: EchoRequest) -> dict[str, Any]:
+            raise ValueError("boom")
+
+        async def hanging(req: EchoRequest) -> dict[str, Any]:
+            await asyncio.sleep(10)
+            return {}
+
+        registry.register(name="test.failing", callable=failing,
+                          request_model=EchoRequest, description="failing")
+        registry.register(name="test.hanging", callable=hanging,
+                          request_model=EchoRequest, description="hanging")
+
+        runner = AsyncioJobRunner(registry=registry, store=store, timeout_seconds=0.1)
+        _submit(runner, store, "f", "test.failing")
+        _submit(runner, store, "h", "test.hanging")
+        runner.shutdown(wait=True)
+
+        assert store.get("f").status == JobStatus.ERROR
+        assert "boom" in store.get("f").error
+        assert store.get("h").status == JobStatus.ERROR
+        assert "timed out" in store.get("h").error
+        assert runner.metrics()["failed"] == 2
+
+    def test_submit_after_shutdown_raises(self, registry, store):
+        runner = AsyncioJobRunner(registry=registry, store=store)
+        runner.shutdown()
+
+        with pytest.raises(RuntimeError):
+            runner.submit(job_id="x", op_name="test.echo", params={})
+
+    def test_shutdown_without_wait_records_cancelled_jobs(self, registry, store):
+        started = threading.Event()
+
+        async def hanging(req: EchoRequest) -> dict[str, Any]:
+            started.set()
+            await asyncio.sleep(10)
+            return {}
+
+        registry.register(name="test.hanging", callable=hanging,
+                          request_model=EchoRequest, description="hanging")
+
+        runner = AsyncioJobRunner(
+            registry=registry, store=store,
+            operation_limits={"test.hanging": 1},
+        )
+        for i in range(3):
+            _submit(runner, store, f"job-{i}", "test.hanging")
+        assert started.wait(timeout=2)
+
+        runner.shutdown(wait=False)
+
+        for i in range(3):
+            job = store.get(f"job-{i}")
+            assert job.status == JobStatus.ERROR
+            assert job.error == "Job cancelled"
+        metrics = runner.metrics()
+        assert metrics["queued"] == 0
+        assert metrics["running"] == 0
+        assert metrics["failed"] == 3
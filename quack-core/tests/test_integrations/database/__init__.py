@@ -0,0 +1,11 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/database/__init__.py
+# role: tests
+# neighbors: test_sqlite_job_store.py
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Test package for the database integrations.
+"""
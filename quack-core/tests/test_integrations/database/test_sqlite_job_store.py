@@ -0,0 +1,142 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/database/test_sqlite_job_store.py
+# role: tests
+# neighbors: __init__.py
+# exports: store, make_job, TestSQLiteJobStore
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for the SQLite-backed JobStore.
+"""
+
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from quack_core.integrations.database.sqlite import SQLiteJobStore
+from quack_core.lib.jobs import JobData, JobStatus
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Provide a fresh SQLite job store."""
+    store = SQLiteJobStore(tmp_path / "jobs.db", cleanup_batch_size=2)
+    yield store
+    store.close()
+
+
+def make_job(job_id: str, created_at: float | None = None,
+             idempotency_hash: str | None = None,
+             status: JobStatus = JobStatus.QUEUED) -> JobData:
+    """Create a job, queued by default."""
+    return JobData(
+        job_id=job_id,
+        op="test.echo",
+        params={"text": "hello"},
+        status=status,
+        created_at=created_at if created_at is not None else time.time(),
+        callback_url=None,
+        idempotency_hash=idempotency_hash,
+    )
+
+
+class TestSQLiteJobStore:
+    """Tests for SQLiteJobStore."""
+
+    def test_create_and_get(self, store):
+        store.create(make_job("job-1"))
+
+        job = store.get("job-1")
+        assert job is not None
+        assert job.job_id == "job-1"
+        assert job.status == JobStatus.QUEUED
+        assert job.params == {"text": "hello"}
+
+    def test_get_missing(self, store):
+        assert store.get("missing") is None
+
+    def test_update_persists_result(self, store):
+        store.create(make_job("job-1"))
+
+        store.update("job-1", status=JobStatus.DONE, result={"echoed": "hello"})
+
+        job = store.get("job-1")
+        assert job.status == JobStatus.DONE
+        assert job.result == {"echoed": "hello"}
+
+    def test_update_stores_non_json_result(self, store):
+        store.create(make_job("job-1"))
+        when = datetime(2024, 1, 2, 3, 4, 5)
+
+        store.update(
+            "job-1", status=JobStatus.DONE, result={"at": when, "path": Path("out.md")}
+        )
+
+        job = store.get("job-1")
+        assert job.status == JobStatus.DONE
+        assert job.result == {"at": str(when), "path": "out.md"}
+
+    def test_update_missing_returns_none(self, store):
+        assert store.update("missing", status=JobStatus.DONE) is None
+
+    def test_find_by_idempotency_hash(self, store):
+        store.create(make_job("job-1", idempotency_hash="abc"))
+        store.create(make_job("job-2"))
+
+        assert store.find_by_idempotency_hash("abc").job_id == "job-1"
+        assert store.find_by_idempotency_hash("other") is None
+
+    def test_survives_reopen(self, tmp_path):
+        path = tmp_path / "jobs.db"
+        first = SQLiteJobStore(path)
+        first.create(make_job("job-1", idempotency_hash="abc"))
+        first.close()
+
+        second = SQLiteJobStore(path)
+        try:
+            assert second.get("job-1") is not None
+            assert second.find_by_idempotency_hash("abc").job_id == "job-1"
+        finally:
+            second.close()
+
+    def test_cleanup_expired_in_batches(self, store):
+        old = time.time() - 1000
+        for i in range(5):
+            store.create(make_job(f"old-{i}", created_at=old, status=JobStatus.DONE))
+        store.create(make_job("fresh", status=JobStatus.DONE))
+
+        removed = store.cleanup_expired(ttl_seconds=60)
+
+        assert removed == 5
+        assert store.count() == 1
+        assert store.get("fresh") is not None
+
+    def test_cleanup_expired_keeps_unfinished_jobs(self, store):
+        old = time.time() - 1000
+        store.create(make_job("queued", created_at=old))
+        store.create(make_job("running", created_at=old, status=JobStatus.RUNNING))
+        store.create(make_job("failed", created_at=old, status=JobStatus.ERROR))
+
+        assert store.cleanup_expired(ttl_seconds=60) == 1
+        assert store.get("queued") is not None
+        assert store.get("running") is not None
+        assert store.get("failed") is None
+
+    def test_concurrent_writers(self, store):
+        def worker(n):
+            for i in range(20):
+                job_id = f"t{n}-{i}"
+                store.create(make_job(job_id))
+                store.update(job_id, status=JobStatus.RUNNING)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert store.count() == 80
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/github/test_api.py
 # role: tests
 # neighbors: __init__.py, conftest.py, test_auth.py, test_client.py, test_config.py, test_github_init.py (+5 more)
-# exports: TestApiUtils, mock_session
+# exports: TestApiUtils, TestPagination, TestGraphQL, mock_session
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -14,7 +14,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
-from quack_core.integrations.github.utils.api import make_request
+from quack_core.integrations.github.utils.api import (
+    ETagCache,
+    graphql_request,
+    graphql_url,
+    iter_paginated,
+    make_request,
+)
 from quack_core.lib.errors import (
     QuackApiError,
     QuackAuthenticationError,
@@ -22,6 +28,19 @@ from quack_core.lib.errors import (
 )
 
 
+def _page(items, status_code=200, etag=None, next_url=None):
+    """Create a mock list response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = items
+    response.headers = {"X-RateLimit-Remaining": "100"}
+    if etag:
+        response.headers["ETag"] = etag
+    if next_url:
+        response.headers["Link"] = f'<{next_url}>; rel="next", <{next_url}>; rel="last"'
+    return response
+
+
 @pytest.fixture
 def mock_session():
     """Create a mock requests session."""
@@ -257,3 +276,138 @@ class TestApiUtils:
         assert "Unexpected error in GitHub API request" in str(excinfo.value)
         assert excinfo.value.service == "GitHub"
         assert excinfo.value.api_method == "/user"
+
+
+class TestPagination:
+    """Tests for paginated list requests."""
+
+    def test_iter_paginated_follows_link_header(self, mock_session):
+        """Test that every page is fetched by following rel="next"."""
+        next_url = "https://api.github.com/repositories/1/issues?per_page=100&page=2"
+        mock_session.request.side_effect = [
+            _page([1, 2], next_url=next_url),
+            _page([3]),
+        ]
+
+        items = list(
+            iter_paginated(
+                session=mock_session,
+                url="/repos/owner/repo/issues",
+                api_url="https://api.github.com",
+                params={"state": "all"},
+                per_page=500,
+            )
+        )
+
+        assert items == [1, 2, 3]
+        first, second = mock_session.request.call_args_list
+        assert first.args == ("GET", "https://api.github.com/repos/owner/repo/issues")
+        assert first.kwargs["params"] == {"state": "all", "per_page": 100}
+        assert second.args == ("GET", next_url)
+        assert second.kwargs["params"] is None
+
+    def test_iter_paginated_is_lazy(self, mock_session):
+        """Test that later pages are not requested until they are needed."""
+        mock_session.request.return_value = _page(
+            [1, 2], next_url="https://api.github.com/next"
+        )
+
+        pages = iter_paginated(
+            session=mock_session, url="/user/repos", api_url="https://api.github.com"
+        )
+
+        assert next(pages) == 1
+        assert mock_session.request.call_count == 1
+
+    def test_iter_paginated_uses_etag_cache(self, mock_session):
+        """Test that unchanged pages are served from the cache on a 304."""
+        cache = ETagCache()
+        mock_session.request.side_effect = [
+            _page([1, 2], etag='"abc"'),
+            _page(None, status_code=304),
+        ]
+        kwargs = {
+            "session": mock_session,
+            "url": "/repos/owner/repo/pulls",
+            "api_url": "https://api.github.com",
+            "etag_cache": cache,
+            "headers": {"Accept": "application/vnd.github+json"},
+        }
+
+        assert list(iter_paginated(**kwargs)) == [1, 2]
+        assert list(iter_paginated(**kwargs)) == [1, 2]
+
+        first, second = mock_session.request.call_args_list
+        assert first.kwargs["headers"] == {"Accept": "application/vnd.github+json"}
+        assert second.kwargs["headers"] == {
+            "Accept": "application/vnd.github+json",
+            "If-None-Match": '"abc"',
+        }
+        assert cache.not_modified == 1
+        assert len(cache) == 1
+
+    def test_etag_cache_evicts_least_recently_used(self):
+        """Test that the cache keeps at most max_entries pages."""
+        cache = ETagCache(max_entries=2)
+        cache.put("a", ("1", [], None))
+        cache.put("b", ("2", [], None))
+        cache.get("a")
+        cache.put("c", ("3", [], None))
+
+        assert cache.get("b") is None
+        assert cache.get("a") == ("1", [], None)
+        assert len(cache) == 2
+
+
+class TestGraphQL:
+    """Tests for GraphQL requests."""
+
+    def test_graphql_url(self):
+        """Test that the GraphQL endpoint is derived from the REST URL."""
+        assert graphql_url("https://api.github.com") == "https://api.github.com/graphql"
+        assert (
+            graphql_url("https://github.example.com/api/v3/")
+            == "https://github.example.com/api/graphql"
+        )
+
+    def test_graphql_request(self, mock_session):
+        """Test that a query is posted and its data returned."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"X-RateLimit-Remaining": "100"}
+        response.json.return_value = {"data": {"viewer": {"login": "octocat"}}}
+        mock_session.request.return_value = response
+
+        data = graphql_request(
+            session=mock_session,
+            query="query { viewer { login } }",
+            api_url="https://api.github.com",
+        )
+
+        assert data == {"viewer": {"login": "octocat"}}
+        call = mock_session.request.call_args
+        assert call.args == ("POST", "https://api.github.com/graphql")
+        assert call.kwargs["json"] == {
+            "query": "query { viewer { login } }",
+            "variables": {},
+        }
+
+    def test_graphql_request_errors(self, mock_session):
+        """Test that errors reported in a 200 response are raised."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"X-RateLimit-Remaining": "100"}
+        response.json.return_value = {
+            "data": None,
+            "errors": [{"message": "Could not resolve to a Repository"}],
+        }
+        mock_session.request.return_value = response
+
+        with pytest.raises(QuackApiError) as excinfo:
+            graphql_request(
+                session=mock_session,
+                query="query { repository(owner: \"a\", name: \"b\") { id } }",
+                api_url="https://api.github.com",
+            )
+
+        assert "Could not resolve to a Repository" in str(excinfo.value)
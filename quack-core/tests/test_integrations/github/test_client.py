@@ -341,6 +341,33 @@ class TestGitHubClient:
                 api_url="https://api.github.com",
                 state="open",
                 author="test_user",
+                etag_cache=github_client.etag_cache,
+                timeout=30,
+                max_retries=3,
+                retry_delay=1.0,
+            )
+
+    def test_get_rate_limit(self, github_client):
+        """Test reading and refreshing the token's rate-limit budget."""
+        assert github_client.rate_limit is GitHubClient(token="test_token").rate_limit
+
+        with patch("quack_core.integrations.github.client.make_request") as mock_req:
+            mock_req.return_value.json.return_value = {
+                "resources": {
+                    "core": {"limit": 5000, "remaining": 4321, "reset": 4102444800}
+                }
+            }
+
+            status = github_client.get_rate_limit(refresh=True)
+
+            assert status.remaining == 4321
+            assert status.limit == 5000
+            mock_req.assert_called_once_with(
+                session=github_client.session,
+                method="GET",
+                url="/rate_limit",
+                api_url="https://api.github.com",
+                rate_limit=github_client.rate_limit,
                 timeout=30,
                 max_retries=3,
                 retry_delay=1.0,
@@ -387,6 +414,29 @@ class TestGitHubClient:
                 retry_delay=1.0,
             )
 
+    def test_list_pull_request_details(self, github_client):
+        """Test listing pull requests with files and reviews."""
+        with patch(
+            "quack_core.integrations.github.client.list_pull_request_details"
+        ) as mock_list:
+            mock_list.return_value = []
+
+            result = github_client.list_pull_request_details(
+                repo="test_owner/test-repo", state="all", author="test_user"
+            )
+
+            assert result == []
+            mock_list.assert_called_once_with(
+                session=github_client.session,
+                repo="test_owner/test-repo",
+                api_url="https://api.github.com",
+                state="all",
+                author="test_user",
+                timeout=30,
+                max_retries=3,
+                retry_delay=1.0,
+            )
+
     def test_check_repository_exists(self, github_client):
         """Test checking if a repository exists."""
         # Mock check_repository_exists operation
@@ -530,6 +580,7 @@ class TestGitHubClient:
                 labels="bug",
                 sort="created",
                 direction="desc",
+                etag_cache=github_client.etag_cache,
                 timeout=30,
                 max_retries=3,
                 retry_delay=1.0,
@@ -619,6 +670,7 @@ class TestGitHubClient:
                 repo="test_owner/test-repo",
                 pull_number=123,
                 api_url="https://api.github.com",
+                etag_cache=github_client.etag_cache,
                 timeout=30,
                 max_retries=3,
                 retry_delay=1.0,
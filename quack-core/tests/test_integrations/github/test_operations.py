@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/github/test_operations.py
 # role: tests
 # neighbors: __init__.py, conftest.py, test_api.py, test_auth.py, test_client.py, test_config.py (+5 more)
-# exports: TestUserOperations, TestRepositoryOperations, TestPullRequestOperations, TestIssueOperations, mock_session, mock_response
+# exports: TestUserOperations, TestRepositoryOperations, TestPullRequestOperations, TestPullRequestDetailsOperations, TestIssueOperations, mock_session, mock_response
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -18,6 +18,7 @@ from quack_core.integrations.github.models import (
     GitHubRepo,
     GitHubUser,
     PullRequest,
+    PullRequestDetails,
     PullRequestStatus,
 )
 from quack_core.integrations.github.operations import (
@@ -28,12 +29,14 @@ from quack_core.integrations.github.operations import (
     fork_repo,
     get_issue,
     get_pull_request,
+    get_pull_request_details,
     get_pull_request_files,
     get_repo,
     get_repository_file_content,
     get_user,
     is_repo_starred,
     list_issues,
+    list_pull_request_details,
     list_pull_requests,
     star_repo,
     unstar_repo,
@@ -632,7 +635,7 @@ class TestPullRequestOperations:
 
         # Mock make_request
         with patch(
-            "quack_core.integrations.github.operations.pull_requests.make_request"
+            "quack_core.integrations.github.utils.api.make_request"
         ) as mock_make_request:
             mock_make_request.return_value = mock_response
 
@@ -665,7 +668,7 @@ class TestPullRequestOperations:
                 method="GET",
                 url="/repos/test_owner/test-repo/pulls",
                 api_url="https://api.github.com",
-                params={"state": "open"},
+                params={"state": "open", "per_page": 100},
             )
 
     def test_get_pull_request(self, mock_session, mock_response):
@@ -748,7 +751,7 @@ class TestPullRequestOperations:
 
         # Mock make_request
         with patch(
-            "quack_core.integrations.github.operations.pull_requests.make_request"
+            "quack_core.integrations.github.utils.api.make_request"
         ) as mock_make_request:
             mock_make_request.return_value = mock_response
 
@@ -774,8 +777,182 @@ class TestPullRequestOperations:
                 method="GET",
                 url="/repos/test_owner/test-repo/pulls/123/files",
                 api_url="https://api.github.com",
+                params={"per_page": 100},
+            )
+
+
+def _graphql_pull_request(number, state="OPEN", author="test_user", files=None):
+    """Create a pull request node as returned by the GraphQL API."""
+    return {
+        "number": number,
+        "title": f"Test PR {number}",
+        "url": f"https://github.com/test_owner/test-repo/pull/{number}",
+        "body": "",
+        "state": state,
+        "createdAt": "2023-01-01T00:00:00Z",
+        "updatedAt": "2023-01-02T00:00:00Z",
+        "mergedAt": "2023-01-02T00:00:00Z" if state == "MERGED" else None,
+        "author": {
+            "login": author,
+            "url": f"https://github.com/{author}",
+            "avatarUrl": f"https://github.com/{author}.png",
+        },
+        "baseRefName": "main",
+        "headRefName": "feature",
+        "baseRepository": {"nameWithOwner": "test_owner/test-repo"},
+        "headRepository": None,
+        "files": files
+        or {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [
+                {
+                    "path": "src/main.py",
+                    "additions": 5,
+                    "deletions": 1,
+                    "changeType": "MODIFIED",
+                }
+            ],
+        },
+        "reviews": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [
+                {
+                    "author": None,
+                    "state": "APPROVED",
+                    "body": "LGTM",
+                    "submittedAt": "2023-01-02T00:00:00Z",
+                }
+            ],
+        },
+    }
+
+
+class TestPullRequestDetailsOperations:
+    """Tests for GraphQL bulk pull request _operations."""
+
+    def test_list_pull_request_details(self, mock_session):
+        """Test that every page is fetched and mapped onto the models."""
+        pages = [
+            {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                        "nodes": [
+                            _graphql_pull_request(1, state="MERGED"),
+                            _graphql_pull_request(2, author="someone_else"),
+                        ],
+                    }
+                }
+            },
+            {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": "c2"},
+                        "nodes": [_graphql_pull_request(3, state="CLOSED")],
+                    }
+                }
+            },
+        ]
+
+        with patch(
+            "quack_core.integrations.github.operations.pull_requests.graphql_request"
+        ) as mock_graphql:
+            mock_graphql.side_effect = pages
+
+            result = list_pull_request_details(
+                session=mock_session,
+                repo="test_owner/test-repo",
+                api_url="https://api.github.com",
+                state="closed",
+                author="test_user",
+            )
+
+            assert [details.pull_request.number for details in result] == [1, 3]
+            merged = result[0]
+            assert isinstance(merged, PullRequestDetails)
+            assert merged.pull_request.status == PullRequestStatus.MERGED
+            assert merged.pull_request.body is None
+            assert merged.pull_request.base_repo == "test_owner/test-repo"
+            assert merged.pull_request.head_repo == ""
+            assert merged.files == [
+                {
+                    "filename": "src/main.py",
+                    "status": "modified",
+                    "additions": 5,
+                    "deletions": 1,
+                    "changes": 6,
+                }
+            ]
+            assert merged.reviews[0].state == "APPROVED"
+            assert merged.reviews[0].reviewer.username == "ghost"
+            assert result[1].pull_request.status == PullRequestStatus.CLOSED
+
+            assert mock_graphql.call_count == 2
+            first, second = mock_graphql.call_args_list
+            assert first.kwargs["variables"]["states"] == ["CLOSED", "MERGED"]
+            assert first.kwargs["variables"]["after"] is None
+            assert second.kwargs["variables"]["after"] == "c1"
+
+    def test_get_pull_request_details_fetches_remaining_files(self, mock_session):
+        """Test that files beyond the first page get a follow-up query."""
+        first_files = {
+            "pageInfo": {"hasNextPage": True, "endCursor": "f1"},
+            "nodes": [
+                {"path": "a.py", "additions": 1, "deletions": 0, "changeType": "ADDED"}
+            ],
+        }
+        more_files = {
+            "pageInfo": {"hasNextPage": False, "endCursor": "f2"},
+            "nodes": [
+                {
+                    "path": "b.py",
+                    "additions": 0,
+                    "deletions": 3,
+                    "changeType": "DELETED",
+                }
+            ],
+        }
+
+        with patch(
+            "quack_core.integrations.github.operations.pull_requests.graphql_request"
+        ) as mock_graphql:
+            mock_graphql.side_effect = [
+                {
+                    "repository": {
+                        "pullRequest": _graphql_pull_request(7, files=first_files)
+                    }
+                },
+                {"repository": {"pullRequest": {"files": more_files}}},
+            ]
+
+            result = get_pull_request_details(
+                session=mock_session,
+                repo="test_owner/test-repo",
+                number=7,
+                api_url="https://api.github.com",
             )
 
+            assert [f["filename"] for f in result.files] == ["a.py", "b.py"]
+            assert [f["status"] for f in result.files] == ["added", "removed"]
+            follow_up = mock_graphql.call_args_list[1]
+            assert follow_up.kwargs["variables"]["number"] == 7
+            assert follow_up.kwargs["variables"]["after"] == "f1"
+
+    def test_get_pull_request_details_not_found(self, mock_session):
+        """Test that a missing pull request raises an API error."""
+        with patch(
+            "quack_core.integrations.github.operations.pull_requests.graphql_request"
+        ) as mock_graphql:
+            mock_graphql.return_value = {"repository": {"pullRequest": None}}
+
+            with pytest.raises(QuackApiError):
+                get_pull_request_details(
+                    session=mock_session,
+                    repo="test_owner/test-repo",
+                    number=404,
+                    api_url="https://api.github.com",
+                )
+
 
 class TestIssueOperations:
     """Tests for issue _operations."""
@@ -849,7 +1026,7 @@ class TestIssueOperations:
 
         # Mock make_request
         with patch(
-            "quack_core.integrations.github.operations.issues.make_request"
+            "quack_core.integrations.github.utils.api.make_request"
         ) as mock_make_request:
             mock_make_request.return_value = mock_response
 
@@ -878,6 +1055,7 @@ class TestIssueOperations:
                     "labels": "bug",
                     "sort": "created",
                     "direction": "desc",
+                    "per_page": 100,
                 },
             )
 
@@ -21,7 +21,12 @@ from quack_core.integrations.core import (
 )
 from quack_core.integrations.github.auth import GitHubAuthProvider
 from quack_core.integrations.github.config import GitHubConfigProvider
-from quack_core.integrations.github.models import GitHubRepo, GitHubUser, PullRequest
+from quack_core.integrations.github.models import (
+    GitHubRepo,
+    GitHubUser,
+    PullRequest,
+    RateLimitStatus,
+)
 from quack_core.integrations.github.service import GitHubIntegration
 
 
@@ -323,6 +328,28 @@ class TestGitHubIntegration:
         assert result.success is False
         assert "Failed to get user: API error" in result.error
 
+    def test_get_rate_limit(self, github_service):
+        """Test get_rate_limit method."""
+        mock_client = MagicMock()
+        github_service.client = mock_client
+        github_service._initialized = True
+        status = RateLimitStatus(resource="core", limit=5000, remaining=4200)
+        mock_client.get_rate_limit.return_value = status
+
+        result = github_service.get_rate_limit(refresh=True)
+
+        assert result.success is True
+        assert result.content == status
+        assert "4200 of 5000 core requests left" in result.message
+        mock_client.get_rate_limit.assert_called_once_with(
+            resource="core", refresh=True
+        )
+
+        mock_client.get_rate_limit.side_effect = Exception("API error")
+        result = github_service.get_rate_limit()
+        assert result.success is False
+        assert "Failed to get rate limit: API error" in result.error
+
     def test_get_repo(self, github_service):
         """Test get_repo method."""
         mock_client = MagicMock()
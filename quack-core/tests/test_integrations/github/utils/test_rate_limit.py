@@ -0,0 +1,182 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/github/utils/test_rate_limit.py
+# role: tests
+# neighbors: __init__.py
+# exports: TestRateLimitBudget, TestMakeRequestBudget
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""Tests for GitHub rate-limit budgets."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from quack_core.integrations.github.utils.api import make_request
+from quack_core.integrations.github.utils.rate_limit import (
+    RateLimitBudget,
+    budget_for_session,
+    get_rate_limit_budget,
+    resource_for,
+)
+from quack_core.lib.errors import QuackQuotaExceededError
+
+NOW = 1_700_000_000.0
+
+
+def _headers(
+    remaining: int, limit: int = 100, reset: float = NOW + 100, resource="core"
+) -> dict:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(reset)),
+        "X-RateLimit-Resource": resource,
+    }
+
+
+@pytest.fixture
+def clock():
+    """Freeze time.time and record time.sleep calls."""
+    with patch("time.time", return_value=NOW), patch("time.sleep") as sleep:
+        yield sleep
+
+
+class TestRateLimitBudget:
+    """Tests for RateLimitBudget."""
+
+    def test_no_wait_while_budget_is_plentiful(self, clock):
+        """Test that requests are not delayed above the pacing threshold."""
+        budget = RateLimitBudget()
+        budget.update("core", _headers(remaining=80))
+
+        assert budget.acquire() == 0.0
+        assert budget.acquire() == 0.0
+        clock.assert_not_called()
+        assert budget.status().remaining == 78
+
+    def test_paces_requests_over_the_window(self, clock):
+        """Test that a low budget is spread over the rest of the window."""
+        budget = RateLimitBudget()
+        budget.update("core", _headers(remaining=40))
+
+        assert budget.acquire() == 0.0
+        # 100 seconds left for 40 requests
+        assert budget.acquire() == pytest.approx(2.5)
+        clock.assert_called_once_with(pytest.approx(2.5))
+
+        status = budget.status()
+        assert status.paced_requests == 1
+        assert status.paced_seconds == pytest.approx(2.5)
+
+    def test_exhausted_budget_waits_for_reset_or_fails(self, clock):
+        """Test that an empty window is waited out only within max_wait."""
+        budget = RateLimitBudget(max_wait=60.0)
+        budget.update("core", _headers(remaining=0, reset=NOW + 30))
+        assert budget.acquire() == pytest.approx(30.0)
+
+        budget.update("core", _headers(0, reset=NOW + 600, resource="search"))
+        with pytest.raises(QuackQuotaExceededError):
+            budget.acquire("search")
+
+    def test_retry_after_blocks_every_resource(self, clock):
+        """Test that a secondary limit holds back all requests."""
+        budget = RateLimitBudget()
+        budget.update("core", {"Retry-After": "5"})
+
+        assert budget.acquire("graphql") == pytest.approx(5.0)
+        assert budget.status().blocked_until is not None
+
+    def test_update_never_returns_reserved_budget(self, clock):
+        """Test that stale headers cannot raise the remaining count."""
+        budget = RateLimitBudget()
+        budget.update("core", _headers(remaining=90))
+        budget.update("core", _headers(remaining=85))
+        budget.update("core", _headers(remaining=88))
+        assert budget.status().remaining == 85
+
+        # A new window replaces the count
+        budget.update("core", _headers(remaining=99, reset=NOW + 3600))
+        assert budget.status().remaining == 99
+
+    def test_update_from_payload(self, clock):
+        """Test recording the body of GET /rate_limit."""
+        budget = RateLimitBudget()
+        budget.update_from_payload(
+            {
+                "resources": {
+                    "core": {
+                        "limit": 5000,
+                        "remaining": 4990,
+                        "used": 10,
+                        "reset": NOW + 60,
+                    },
+                    "search": {"limit": 30, "remaining": 30, "reset": NOW + 60},
+                }
+            }
+        )
+
+        status = budget.status("core")
+        assert (status.limit, status.remaining, status.used) == (5000, 4990, 10)
+        assert budget.status("search").remaining == 30
+
+    def test_budgets_are_shared_per_token(self):
+        """Test that sessions with the same token share a budget."""
+        session = requests.Session()
+        session.headers["Authorization"] = "token shared-token"
+
+        assert budget_for_session(session) is get_rate_limit_budget("shared-token")
+        assert get_rate_limit_budget("other-token") is not get_rate_limit_budget(
+            "shared-token"
+        )
+        assert budget_for_session(MagicMock(spec=requests.Session)) is None
+
+    def test_resource_for(self):
+        """Test mapping request URLs to rate-limit resources."""
+        assert resource_for("https://api.github.com/search/issues") == "search"
+        assert resource_for("https://api.github.com/graphql") == "graphql"
+        assert resource_for("https://api.github.com/repos/o/r/pulls") == "core"
+
+
+class TestMakeRequestBudget:
+    """Tests for make_request with a rate-limit budget."""
+
+    def test_secondary_limit_is_retried_after_pause(self, clock):
+        """Test that a Retry-After answer pauses and retries the request."""
+        limited = MagicMock(status_code=403, headers={"Retry-After": "2"})
+        ok = MagicMock(status_code=200, headers=_headers(remaining=99))
+        session = MagicMock(spec=requests.Session)
+        session.request.side_effect = [limited, ok]
+        budget = RateLimitBudget()
+
+        result = make_request(
+            session=session,
+            method="GET",
+            url="/user",
+            api_url="https://api.github.com",
+            rate_limit=budget,
+        )
+
+        assert result is ok
+        assert session.request.call_count == 2
+        clock.assert_called_once_with(pytest.approx(2.0))
+        assert budget.status().remaining == 99
+
+    def test_exhausted_budget_fails_fast(self, clock):
+        """Test that a request is not sent when the window cannot recover."""
+        session = MagicMock(spec=requests.Session)
+        budget = RateLimitBudget()
+        budget.update("core", _headers(remaining=0, reset=NOW + 1800))
+
+        with pytest.raises(QuackQuotaExceededError):
+            make_request(
+                session=session,
+                method="GET",
+                url="/user",
+                api_url="https://api.github.com",
+                rate_limit=budget,
+            )
+
+        session.request.assert_not_called()
+        clock.assert_not_called()
@@ -157,6 +157,7 @@ class MockDriveFilesResource(DriveFilesResource):
         self.last_list_query: str | None = None
         self.last_list_fields: str | None = None
         self.last_list_page_size: int | None = None
+        self.last_list_page_token: str | None = None
 
         self.last_update_file_id: str | None = None
         self.last_update_body: dict[str, object] | None = None
@@ -242,7 +243,8 @@ class MockDriveFilesResource(DriveFilesResource):
         self,
         q: str | None = None,
         fields: str | None = None,
-        page_size: int | None = None,
+        pageSize: int | None = None,
+        pageToken: str | None = None,
     ) -> DriveRequest[dict[str, object]]:
         """
         Mock list method for listing files.
@@ -250,7 +252,8 @@ class MockDriveFilesResource(DriveFilesResource):
         Args:
             q: Query string
             fields: Fields to include in the response
-            page_size: Maximum number of files to return
+            pageSize: Maximum number of files to return per page
+            pageToken: Token of the page to fetch
 
         Returns:
             A mock request that will return the files list
@@ -258,7 +261,8 @@ class MockDriveFilesResource(DriveFilesResource):
         self.list_call_count += 1
         self.last_list_query = q
         self.last_list_fields = fields
-        self.last_list_page_size = page_size
+        self.last_list_page_size = pageSize
+        self.last_list_page_token = pageToken
 
         # Customize response based on query
         response = {"files": self.file_list}
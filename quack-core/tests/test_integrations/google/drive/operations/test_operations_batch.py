@@ -0,0 +1,166 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/google/drive/operations/test_operations_batch.py
+# role: operations
+# neighbors: __init__.py, test_operations_download.py, test_operations_folder.py, test_operations_list_files.py, test_operations_permissions.py, test_operations_upload.py
+# exports: TestDriveOperationsBatch
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for Google Drive _operations batch module.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import httplib2
+from googleapiclient.errors import HttpError
+from quack_core.integrations.google.drive.models import (
+    DriveBatchItem,
+    DriveBatchOperation,
+)
+from quack_core.integrations.google.drive.operations import batch
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"error")
+
+
+class FakeBatch:
+    """Batch envelope that answers each sub-request from a script."""
+
+    def __init__(self, service: MagicMock, callback) -> None:
+        self.service = service
+        self.callback = callback
+        self.request_ids: list[str] = []
+
+    def add(self, request, callback=None, request_id=None) -> None:
+        self.request_ids.append(request_id)
+
+    def execute(self) -> None:
+        self.service.rounds.append(list(self.request_ids))
+        for request_id in self.request_ids:
+            outcomes = self.service.script.get(request_id, [])
+            outcome = outcomes.pop(0) if outcomes else {"id": request_id}
+            if isinstance(outcome, Exception):
+                self.callback(request_id, None, outcome)
+            else:
+                self.callback(request_id, outcome, None)
+
+
+def _batch_service(script: dict | None = None) -> MagicMock:
+    """Drive service whose batches are served by FakeBatch."""
+    service = MagicMock()
+    service.script = script or {}
+    service.rounds = []
+    service.new_batch_http_request.side_effect = lambda callback=None: FakeBatch(
+        service, callback
+    )
+    return service
+
+
+def _items(operation: DriveBatchOperation, count: int) -> list[DriveBatchItem]:
+    return [
+        DriveBatchItem(operation=operation, file_id=f"file{i}") for i in range(count)
+    ]
+
+
+class TestDriveOperationsBatch:
+    """Tests for the Google Drive _operations batch functions."""
+
+    def test_splits_into_api_sized_batches(self) -> None:
+        """Test that 250 operations are sent as batches of at most 100."""
+        service = _batch_service()
+
+        results = batch.execute_batch(
+            service, _items(DriveBatchOperation.FILE_INFO, 250)
+        )
+
+        assert [len(ids) for ids in service.rounds] == [100, 100, 50]
+        assert all(result.success for result in results)
+        assert results[249].content == {"id": "249"}
+
+    def test_per_item_results(self) -> None:
+        """Test that each item gets the single-call result shape."""
+        service = _batch_service(
+            {
+                "0": [{"webViewLink": "https://drive.google.com/view/a"}],
+                "1": [{}],
+                "2": [_http_error(404)],
+            }
+        )
+        items = [
+            DriveBatchItem(operation=DriveBatchOperation.SHARING_LINK, file_id="a"),
+            DriveBatchItem(operation=DriveBatchOperation.SHARING_LINK, file_id="b"),
+            DriveBatchItem(operation=DriveBatchOperation.DELETE, file_id="c"),
+        ]
+
+        results = batch.execute_batch(service, items)
+
+        assert results[0].content == "https://drive.google.com/view/a"
+        assert results[1].content == "https://drive.google.com/file/d/b/view"
+        assert results[2].success is False
+        assert "Failed to delete file from Google Drive" in results[2].error
+        # Non-retryable errors are not resent
+        assert len(service.rounds) == 1
+
+    def test_retries_only_failed_sub_requests(self) -> None:
+        """Test that transient failures are resent in a smaller batch."""
+        service = _batch_service(
+            {
+                "1": [_http_error(429), {"id": "1"}],
+                "3": [_http_error(503), _http_error(500), {"id": "3"}],
+            }
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            results = batch.execute_batch(
+                service, _items(DriveBatchOperation.SET_PERMISSIONS, 4)
+            )
+
+        assert service.rounds == [["0", "1", "2", "3"], ["1", "3"], ["3"]]
+        assert all(result.success for result in results)
+        assert results[0].message == "Permission set successfully: reader for anyone"
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    def test_gives_up_after_max_retries(self) -> None:
+        """Test that persistent transient failures become error results."""
+        service = _batch_service({"0": [_http_error(503)] * 10})
+
+        with patch("time.sleep"):
+            results = batch.execute_batch(
+                service, _items(DriveBatchOperation.FILE_INFO, 2), max_retries=2
+            )
+
+        assert len(service.rounds) == 3
+        assert results[0].success is False
+        assert "Failed to retrieve file metadata" in results[0].error
+        assert results[1].success is True
+
+    def test_builds_requests_for_each_operation(self) -> None:
+        """Test that items map to the matching Drive API calls."""
+        service = _batch_service()
+        items = [
+            DriveBatchItem(
+                operation=DriveBatchOperation.SET_PERMISSIONS,
+                file_id="a",
+                role="writer",
+                permission_type="user",
+            ),
+            DriveBatchItem(
+                operation=DriveBatchOperation.DELETE, file_id="b", permanent=True
+            ),
+            DriveBatchItem(operation=DriveBatchOperation.DELETE, file_id="c"),
+        ]
+
+        batch.execute_batch(service, items)
+
+        service.permissions().create.assert_called_once_with(
+            fileId="a",
+            body={"type": "user", "role": "writer", "allowFileDiscovery": True},
+            fields="id",
+        )
+        service.files().delete.assert_called_once_with(fileId="b")
+        service.files().update.assert_called_once_with(
+            fileId="c", body={"trashed": True}
+        )
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/google/drive/operations/test_operations_download.py
 # role: operations
 # neighbors: __init__.py, test_operations_folder.py, test_operations_list_files.py, test_operations_permissions.py, test_operations_upload.py
-# exports: TestDriveOperationsDownload
+# exports: TestDriveOperationsDownload, TestStreamDownload
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -11,13 +11,16 @@
 Tests for Google Drive _operations download module.
 """
 
+import hashlib
 import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+from quack_core.integrations.google.drive.models import DriveDownload
 from quack_core.integrations.google.drive.operations import download
 from quack_core.lib.errors import QuackApiError
-from quack_core.lib.fs import FileInfoResult, OperationResult, WriteResult
+from quack_core.lib.fs import FileInfoResult, OperationResult
 from quack_core.lib.paths.api.public.results import PathResult
 
 from tests.test_integrations.google.drive.mocks import (
@@ -36,8 +39,9 @@ class TestDriveOperationsDownload:
 
         # Setup mocks for dependencies
         with (
-            patch("googleapiclient.http.MediaIoBaseDownload") as mock_download_class,
-            patch("io.BytesIO") as mock_bytesio,
+            patch(
+                "quack_core.integrations.google.drive.operations.download.stream_download"
+            ) as mock_stream,
             # Patch the standalone module directly as that's what's imported in download.py
             patch(
                 "quack_core.integrations.google.drive.operations.download.standalone"
@@ -46,7 +50,7 @@ class TestDriveOperationsDownload:
                 "quack_core.integrations.google.drive.operations.download.paths_service"
             ) as mock_paths_service,
             patch(
-                "quack_core.integrations.google.drive.utils.api.execute_api_request"
+                "quack_core.integrations.google.drive.operations.download.execute_api_request"
             ) as mock_execute,
         ):
             # Configure fs module mocks
@@ -59,6 +63,9 @@ class TestDriveOperationsDownload:
             mock_execute.return_value = {
                 "name": "test_file.txt",
                 "mimeType": "text/plain",
+                "size": "12",
+                "md5Checksum": "abc123",
+                "headRevisionId": "rev1",
             }
 
             # Configure paths_service mock
@@ -67,24 +74,8 @@ class TestDriveOperationsDownload:
                 path="/tmp/test_file.txt"
             )
 
-            # Configure downloader mock
-            mock_downloader = MagicMock()
-            mock_status = MagicMock()
-            mock_status.progress.return_value = 1.0
-            mock_downloader.next_chunk.return_value = (mock_status, True)
-            mock_download_class.return_value = mock_downloader
-
-            # Configure BytesIO mock
-            mock_io = MagicMock()
-            mock_bytesio.return_value = mock_io
-            mock_io.read.return_value = b"file content"
-
-            # Configure write_binary mock
-            mock_fs.write_binary.return_value = WriteResult(
-                success=True,
-                path=Path("/tmp/test_file.txt"),
-                bytes_written=12,
-                message="File written",
+            mock_stream.return_value = DriveDownload(
+                remote_id="file123", path="/tmp/test_file.txt", size=12
             )
 
             # Call download function
@@ -94,8 +85,16 @@ class TestDriveOperationsDownload:
 
             # Assertions
             assert result.success is True
+            assert result.content == "/tmp/test_file.txt"
             assert "File downloaded successfully" in result.message
 
+            # The file is streamed without a checksum, sized from the metadata
+            kwargs = mock_stream.call_args.kwargs
+            assert kwargs["compute_checksum"] is False
+            assert kwargs["expected_size"] == 12
+            assert kwargs["revision"] == "rev1"
+            assert kwargs["expected_md5"] == "abc123"
+
     def test_resolve_download_path(self, tmp_path: Path) -> None:
         """Test resolving download path for different scenarios."""
         # Test with no local path (should create temp directory)
@@ -207,15 +206,15 @@ class TestDriveOperationsDownload:
             assert not result.success
             assert "Failed to get file metadata" in result.error
 
-    def test_download_file_write_error(self) -> None:
-        """Test download file with write error."""
-        # Create mock drive service
+    def test_download_file_stream_error(self) -> None:
+        """Test download file when streaming fails."""
         mock_drive_service = create_mock_drive_service()
 
-        # Setup with patch pyramid
         with (
-            patch("googleapiclient.http.MediaIoBaseDownload") as mock_download,
-            patch("io.BytesIO") as mock_bytesio,
+            patch(
+                "quack_core.integrations.google.drive.operations.download.stream_download",
+                side_effect=OSError("No space left on device"),
+            ),
             patch(
                 "quack_core.integrations.google.drive.operations.download.standalone"
             ) as mock_fs,
@@ -223,51 +222,158 @@ class TestDriveOperationsDownload:
                 "quack_core.integrations.google.drive.operations.download.paths_service"
             ) as mock_paths_service,
             patch(
-                "quack_core.integrations.google.drive.utils.api.execute_api_request"
+                "quack_core.integrations.google.drive.operations.download.execute_api_request"
             ) as mock_execute,
         ):
-            # Configure mocks
             mock_paths_service.resolve_project_path.return_value = PathResult(
                 success=True,
                 path="/tmp/test_file.txt"  # Use string, not Path
             )
-
-            mock_fs.join_path.return_value = Path("/tmp/test_file.txt")
             mock_fs.create_directory.return_value = OperationResult(
                 success=True, path=Path("/tmp"), message="Directory created"
             )
-            mock_execute.return_value = {
-                "name": "test_file.txt",
-                "mimeType": "text/plain",
-            }
-
-            # Configure write_binary to fail
-            mock_fs.write_binary.return_value = WriteResult(
-                success=False,
-                path=Path("/tmp/test_file.txt"),
-                error="Write error",
-                bytes_written=0,
-            )
-
-            # Configure downloader
-            mock_downloader = MagicMock()
-            mock_status = MagicMock()
-            mock_status.progress.return_value = 1.0
-            mock_downloader.next_chunk.return_value = (mock_status, True)
-            mock_download.return_value = mock_downloader
+            mock_execute.return_value = {"name": "test_file.txt", "size": "12"}
 
-            # Configure BytesIO
-            mock_io = MagicMock()
-            mock_bytesio.return_value = mock_io
-            mock_io.read.return_value = b"file content"
-
-            # Test write error handling
             result = download.download_file(
                 mock_drive_service,
                 "file123",
                 "/tmp/test_file.txt",
             )
 
-            # Verify the result is as expected
             assert not result.success
-            assert "Failed to write file: Write error" in result.error
+            assert "No space left on device" in result.error
+
+
+class TestStreamDownload:
+    """Tests for chunked, resumable streaming downloads."""
+
+    DATA = bytes(range(256)) * 4  # 1024 bytes
+
+    @classmethod
+    def _drive_service(cls, fail_from: int | None = None) -> MagicMock:
+        """Drive service whose media requests serve ranges of DATA."""
+        http = MagicMock()
+        http.ranges = []
+
+        def request(uri, method="GET", headers=None, **kwargs):
+            start, end = map(int, headers["range"][len("bytes="):].split("-"))
+            http.ranges.append((start, end))
+            if fail_from is not None and start >= fail_from:
+                raise ConnectionResetError("connection dropped")
+            chunk = cls.DATA[start : end + 1]
+            resp = MagicMock(status=206)
+            resp.__contains__.side_effect = lambda key: key == "content-range"
+            resp.__getitem__.side_effect = {
+                "content-range": f"bytes {start}-{start + len(chunk) - 1}/{len(cls.DATA)}"
+            }.__getitem__
+            return resp, chunk
+
+        http.request.side_effect = request
+        media_request = MagicMock(http=http, uri="https://drive.test/file", headers={})
+        service = MagicMock()
+        service.files.return_value.get_media.return_value = media_request
+        service.http = http
+        return service
+
+    def test_streams_chunks_to_final_path(self, tmp_path: Path) -> None:
+        target = tmp_path / "video.mp4"
+        service = self._drive_service()
+
+        outcome = download.stream_download(
+            service, "file123", str(target), chunk_size=256, compute_checksum=True
+        )
+
+        assert target.read_bytes() == self.DATA
+        assert not (tmp_path / "video.mp4.part").exists()
+        assert service.http.ranges == [(0, 255), (256, 511), (512, 767), (768, 1023)]
+        assert outcome.size == len(self.DATA)
+        assert outcome.sha256 == hashlib.sha256(self.DATA).hexdigest()
+        assert outcome.to_checksum().value == outcome.sha256
+
+    def test_resumes_after_interruption(self, tmp_path: Path) -> None:
+        target = tmp_path / "video.mp4"
+
+        with patch("time.sleep"):
+            with pytest.raises(ConnectionResetError):
+                download.stream_download(
+                    self._drive_service(fail_from=512),
+                    "file123",
+                    str(target),
+                    chunk_size=256,
+                )
+        assert not target.exists()
+        assert (tmp_path / "video.mp4.part").stat().st_size == 512
+
+        service = self._drive_service()
+        outcome = download.stream_download(
+            service, "file123", str(target), chunk_size=256, compute_checksum=True
+        )
+
+        assert service.http.ranges == [(512, 767), (768, 1023)]
+        assert outcome.resumed_from == 512
+        assert target.read_bytes() == self.DATA
+        # The digest covers the bytes from the first attempt too
+        assert outcome.sha256 == hashlib.sha256(self.DATA).hexdigest()
+
+    def test_discards_stale_partial_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.part").write_bytes(b"x" * 2048)
+
+        outcome = download.stream_download(
+            self._drive_service(),
+            "file123",
+            str(target),
+            chunk_size=512,
+            expected_size=len(self.DATA),
+        )
+
+        assert outcome.resumed_from == 0
+        assert target.read_bytes() == self.DATA
+
+    def test_discards_partial_file_of_other_revision(self, tmp_path: Path) -> None:
+        target = tmp_path / "video.mp4"
+
+        with patch("time.sleep"):
+            with pytest.raises(ConnectionResetError):
+                download.stream_download(
+                    self._drive_service(fail_from=512),
+                    "file123",
+                    str(target),
+                    chunk_size=256,
+                    revision="rev1",
+                )
+        assert (tmp_path / "video.mp4.part.revision").read_text() == "rev1"
+
+        service = self._drive_service()
+        outcome = download.stream_download(
+            service, "file123", str(target), chunk_size=256, revision="rev2"
+        )
+
+        assert outcome.resumed_from == 0
+        assert service.http.ranges[0] == (0, 255)
+        assert target.read_bytes() == self.DATA
+        assert not (tmp_path / "video.mp4.part.revision").exists()
+
+    def test_verifies_md5_checksum(self, tmp_path: Path) -> None:
+        target = tmp_path / "video.mp4"
+
+        outcome = download.stream_download(
+            self._drive_service(),
+            "file123",
+            str(target),
+            chunk_size=512,
+            expected_md5=hashlib.md5(self.DATA).hexdigest(),
+        )
+        assert outcome.size == len(self.DATA)
+
+        target.unlink()
+        with pytest.raises(QuackApiError, match="md5Checksum"):
+            download.stream_download(
+                self._drive_service(),
+                "file123",
+                str(target),
+                chunk_size=512,
+                expected_md5="0" * 32,
+            )
+        assert not target.exists()
+        assert not (tmp_path / "video.mp4.part").exists()
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/google/drive/operations/test_operations_list_files.py
 # role: operations
 # neighbors: __init__.py, test_operations_download.py, test_operations_folder.py, test_operations_permissions.py, test_operations_upload.py
-# exports: TestDriveOperationsListFiles
+# exports: TestDriveOperationsListFiles, TestDriveOperationsIterFiles
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -11,7 +11,7 @@
 Tests for Google Drive _operations list_files module.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from quack_core.integrations.google.drive.models import DriveFile, DriveFolder
 from quack_core.integrations.google.drive.operations import list_files
@@ -260,3 +260,110 @@ class TestDriveOperationsListFiles:
                     folder_result["mime_type"] == "application/vnd.google-apps.folder"
                 )
                 assert folder_result["folder_color_rgb"] == "#4285F4"
+
+
+def _tree_drive_service(tree: dict[str, list[dict]]) -> MagicMock:
+    """Drive service whose list requests return the children of the queried folder."""
+    service = MagicMock()
+
+    def list_request(q=None, fields=None, pageSize=None, pageToken=None):
+        parent = q.split("'")[1]
+        request = MagicMock()
+        request.execute.return_value = {"files": tree.get(parent, [])}
+        return request
+
+    service.files.return_value.list.side_effect = list_request
+    return service
+
+
+class TestDriveOperationsIterFiles:
+    """Tests for the paginated iter_files generator."""
+
+    def test_follows_page_tokens(self) -> None:
+        """Every page is requested, passing the previous nextPageToken."""
+        drive_service = MagicMock()
+        drive_service.files().list.return_value.execute.side_effect = [
+            {"files": [{"id": "a"}], "nextPageToken": "t1"},
+            {"files": [{"id": "b"}], "nextPageToken": "t2"},
+            {"files": [{"id": "c"}]},
+        ]
+
+        files = list(list_files.iter_files(drive_service, "folder123", page_size=5000))
+
+        assert [item["id"] for item in files] == ["a", "b", "c"]
+        calls = drive_service.files().list.call_args_list
+        assert "pageToken" not in calls[0].kwargs
+        assert [call.kwargs.get("pageToken") for call in calls[1:]] == ["t1", "t2"]
+        # Page size is capped at the API maximum
+        assert calls[0].kwargs["pageSize"] == 1000
+        assert calls[0].kwargs["fields"].startswith("nextPageToken, files(")
+
+    def test_list_files_collects_all_pages(self) -> None:
+        """list_files is no longer truncated to the first page."""
+        drive_service = MagicMock()
+        drive_service.files().list.return_value.execute.side_effect = [
+            {
+                "files": [{"id": "a", "name": "a.txt", "mimeType": "text/plain"}],
+                "nextPageToken": "t1",
+            },
+            {"files": [{"id": "b", "name": "b.txt", "mimeType": "text/plain"}]},
+        ]
+
+        result = list_files.list_files(drive_service, "folder123")
+
+        assert result.success is True
+        assert [item["id"] for item in result.content] == ["a", "b"]
+
+    def test_recursive_walk(self) -> None:
+        """Sub-folders are listed concurrently with one client per thread."""
+        folder = "application/vnd.google-apps.folder"
+        tree = {
+            "root": [
+                {"id": "f1", "name": "notes.txt", "mimeType": "text/plain"},
+                {"id": "d1", "name": "sub", "mimeType": folder},
+                {"id": "d2", "name": "other", "mimeType": folder},
+            ],
+            "d1": [
+                {"id": "f2", "name": "deep.txt", "mimeType": "text/plain"},
+                {"id": "d3", "name": "deeper", "mimeType": folder},
+            ],
+            "d2": [{"id": "f3", "name": "image.png", "mimeType": "image/png"}],
+            "d3": [{"id": "f4", "name": "last.txt", "mimeType": "text/plain"}],
+        }
+        factory = MagicMock(side_effect=lambda: _tree_drive_service(tree))
+
+        files = list(
+            list_files.iter_files(
+                _tree_drive_service(tree),
+                "root",
+                recursive=True,
+                fields=["name"],
+                max_workers=3,
+                service_factory=factory,
+            )
+        )
+
+        assert sorted(item["id"] for item in files) == [
+            "d1", "d2", "d3", "f1", "f2", "f3", "f4",
+        ]
+        assert 1 <= factory.call_count <= 3
+
+    def test_recursive_walk_with_pattern(self) -> None:
+        """Non-matching folders are traversed but not reported."""
+        folder = "application/vnd.google-apps.folder"
+        tree = {
+            "root": [
+                {"id": "f1", "name": "notes.txt", "mimeType": "text/plain"},
+                {"id": "d1", "name": "sub", "mimeType": folder},
+            ],
+            "d1": [{"id": "f2", "name": "deep.txt", "mimeType": "text/plain"}],
+        }
+        drive_service = _tree_drive_service(tree)
+
+        files = list(
+            list_files.iter_files(drive_service, "root", "*.txt", recursive=True)
+        )
+
+        assert sorted(item["id"] for item in files) == ["f1", "f2"]
+        first_query = drive_service.files().list.call_args_list[0].kwargs["q"]
+        assert f"(name contains '.txt' or mimeType = '{folder}')" in first_query
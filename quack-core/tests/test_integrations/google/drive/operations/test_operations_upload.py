@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/google/drive/operations/test_operations_upload.py
 # role: operations
 # neighbors: __init__.py, test_operations_download.py, test_operations_folder.py, test_operations_list_files.py, test_operations_permissions.py
-# exports: TestDriveOperationsUpload
+# exports: TestDriveOperationsUpload, TestDriveOperationsResumableUpload
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -11,10 +11,14 @@
 Tests for Google Drive _operations upload module.
 """
 
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httplib2
 import pytest
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 from quack_core.integrations.core.results import IntegrationResult
 from quack_core.integrations.google.drive.operations import upload
 from quack_core.lib.errors import QuackApiError, QuackIntegrationError
@@ -391,3 +395,134 @@ class TestDriveOperationsUpload:
                             assert files_resource.last_create_body["parents"] == [
                                 "folder456"
                             ]
+
+
+class FakeUploadHttp:
+    """Resumable upload endpoint that can drop the connection mid-upload."""
+
+    def __init__(self, size: int, drop_at_chunk: int | None = None) -> None:
+        self.size = size
+        self.drop_at_chunk = drop_at_chunk
+        self.received = b""
+        self.chunk_starts: list[int] = []
+        self.status_queries = 0
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        headers = headers or {}
+        if method == "POST":
+            return httplib2.Response(
+                {"status": 200, "location": "https://upload.test/session"}
+            ), b""
+
+        if headers.get("Content-Range", "").startswith("bytes */"):
+            self.status_queries += 1
+        else:
+            self.chunk_starts.append(len(self.received))
+            if len(self.chunk_starts) == self.drop_at_chunk:
+                raise ConnectionResetError("connection dropped")
+            self.received += body.read() if hasattr(body, "read") else body
+
+        if len(self.received) == self.size:
+            content = json.dumps({"id": "new123", "webViewLink": "https://view/new123"})
+            return httplib2.Response({"status": 200}), content.encode()
+        return httplib2.Response(
+            {"status": 308, "range": f"bytes=0-{len(self.received) - 1}"}
+        ), b""
+
+
+def _upload_drive_service(http: FakeUploadHttp) -> MagicMock:
+    """Drive service whose create() returns real resumable requests."""
+    service = MagicMock()
+
+    def create(body=None, media_body=None, fields=None):
+        return HttpRequest(
+            http,
+            lambda resp, content: json.loads(content),
+            "https://upload.test/files?uploadType=resumable",
+            method="POST",
+            body=json.dumps(body),
+            headers={"content-type": "application/json"},
+            resumable=media_body,
+        )
+
+    service.files.return_value.create.side_effect = create
+    return service
+
+
+class TestDriveOperationsResumableUpload:
+    """Tests for chunked, resumable uploads."""
+
+    CHUNK = 256 * 1024
+
+    def test_uploads_in_chunks_with_progress(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * (3 * self.CHUNK // 256)
+        path = tmp_path / "episode.mp4"
+        path.write_bytes(data)
+        http = FakeUploadHttp(len(data))
+        progress: list[tuple[int, int]] = []
+
+        outcome = upload.resumable_upload(
+            _upload_drive_service(http),
+            str(path),
+            {"name": "episode.mp4"},
+            "video/mp4",
+            chunk_size=self.CHUNK,
+            progress=lambda _, sent, total: progress.append((sent, total)),
+        )
+
+        assert http.received == data
+        assert http.chunk_starts == [0, self.CHUNK, 2 * self.CHUNK]
+        assert outcome.file_id == "new123"
+        assert outcome.link == "https://view/new123"
+        assert outcome.size == len(data)
+        assert progress[-1] == (len(data), len(data))
+        assert progress[0] == (self.CHUNK, len(data))
+
+    def test_resumes_from_committed_offset(self, tmp_path: Path) -> None:
+        data = b"x" * (3 * self.CHUNK)
+        path = tmp_path / "episode.mp4"
+        path.write_bytes(data)
+        http = FakeUploadHttp(len(data), drop_at_chunk=2)
+
+        with patch("time.sleep") as mock_sleep:
+            outcome = upload.resumable_upload(
+                _upload_drive_service(http),
+                str(path),
+                {"name": "episode.mp4"},
+                "video/mp4",
+                chunk_size=self.CHUNK,
+            )
+
+        assert http.received == data
+        # The dropped chunk is re-sent after asking Drive for its offset;
+        # the first chunk is not uploaded again
+        assert http.chunk_starts == [0, self.CHUNK, self.CHUNK, 2 * self.CHUNK]
+        assert http.status_queries == 1
+        assert outcome.retries == 1
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_non_transient_error_is_raised(self, tmp_path: Path) -> None:
+        path = tmp_path / "episode.mp4"
+        path.write_bytes(b"x" * 10)
+        service = MagicMock()
+        error = HttpError(httplib2.Response({"status": 403}), b"forbidden")
+        service.files().create.return_value.next_chunk.side_effect = error
+
+        with pytest.raises(HttpError):
+            upload.resumable_upload(service, str(path), {"name": "a"}, "text/plain")
+
+    def test_chunk_size_is_aligned(self, tmp_path: Path) -> None:
+        path = tmp_path / "episode.mp4"
+        path.write_bytes(b"x" * 10)
+        service = MagicMock()
+        service.files().create.return_value.next_chunk.return_value = (
+            None,
+            {"id": "new123"},
+        )
+
+        upload.resumable_upload(
+            service, str(path), {"name": "a"}, "text/plain", chunk_size=1000
+        )
+
+        media = service.files().create.call_args.kwargs["media_body"]
+        assert media.chunksize() == self.CHUNK
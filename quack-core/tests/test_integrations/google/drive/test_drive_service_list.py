@@ -60,22 +60,19 @@ class TestGoogleDriveServiceList:
         }
 
         # Test successful listing
-        with patch.object(service, "_build_query") as mock_query:
-            mock_query.return_value = "query"
-
-            result = service.list_files("folder123", "*.txt")
-
-            assert result.success is True
-            assert len(result.content) == 2
-            assert result.content[0]["id"] == "file1"
-            assert result.content[1]["id"] == "folder1"
-            service.drive_service.files().list.assert_called_once_with(
-                q="query",
-                fields="files(id, name, mimeType, webViewLink, webContentLink, "
-                "size, createdTime, modifiedTime, parents, shared, trashed)",
-                page_size=100,
-            )
-            mock_query.assert_called_once_with("folder123", "*.txt")
+        result = service.list_files("folder123", "*.txt")
+
+        assert result.success is True
+        assert len(result.content) == 2
+        assert result.content[0]["id"] == "file1"
+        assert result.content[1]["id"] == "folder1"
+        service.drive_service.files().list.assert_called_once_with(
+            q="'folder123' in parents and trashed = false and name contains '.txt'",
+            fields="nextPageToken, files(id, name, mimeType, webViewLink, "
+            "webContentLink, size, createdTime, modifiedTime, parents, shared, "
+            "trashed)",
+            pageSize=1000,
+        )
 
         # Test API error
         service.drive_service.files().list.side_effect = QuackApiError(
@@ -84,3 +81,41 @@ class TestGoogleDriveServiceList:
         result = service.list_files()
         assert result.success is False
         assert "API error" in result.error
+
+    @patch(
+        "quack_core.integrations.google.auth.GoogleAuthProvider._verify_client_secrets_file"
+    )
+    @patch.object(GoogleDriveService, "_initialize_config")
+    def test_iter_files_follows_page_tokens(self, mock_init_config, mock_verify) -> None:
+        """Test that iter_files requests every page lazily."""
+        mock_verify.return_value = None
+        mock_init_config.return_value = {
+            "client_secrets_file": "/path/to/secrets.json",
+            "credentials_file": "/path/to/credentials.json",
+            "shared_folder_id": "shared_folder",
+            "list_page_size": 2,
+        }
+
+        service = GoogleDriveService(shared_folder_id="shared_folder")
+        service._initialized = True
+        service.drive_service = MagicMock()
+
+        pages = [
+            {"files": [{"id": "a"}, {"id": "b"}], "nextPageToken": "page2"},
+            {"files": [{"id": "c"}]},
+        ]
+        service.drive_service.files().list.return_value.execute.side_effect = pages
+
+        files = service.iter_files(fields=["id"])
+        assert next(files)["id"] == "a"
+        # Only the first page has been requested so far
+        assert service.drive_service.files().list.call_count == 1
+
+        assert [item["id"] for item in files] == ["b", "c"]
+        calls = service.drive_service.files().list.call_args_list
+        assert calls[0].kwargs == {
+            "q": "'shared_folder' in parents and trashed = false",
+            "fields": "nextPageToken, files(id)",
+            "pageSize": 2,
+        }
+        assert calls[1].kwargs["pageToken"] == "page2"
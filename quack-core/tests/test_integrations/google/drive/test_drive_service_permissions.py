@@ -140,3 +140,44 @@ class TestGoogleDriveServicePermissions:
         result = service.get_sharing_link("file123")
         assert result.success is False
         assert "API error" in result.error
+
+    @patch(
+        "quack_core.integrations.google.auth.GoogleAuthProvider._verify_client_secrets_file"
+    )
+    @patch.object(GoogleDriveService, "_initialize_config")
+    def test_set_file_permissions_many(self, mock_init_config, mock_verify) -> None:
+        """Test setting permissions on many files with one batch request."""
+        mock_verify.return_value = None
+        mock_init_config.return_value = {
+            "client_secrets_file": "/path/to/secrets.json",
+            "credentials_file": "/path/to/credentials.json",
+            "default_share_access": "commenter",
+        }
+
+        service = GoogleDriveService()
+        service._initialized = True
+        service.drive_service = MagicMock()
+
+        mock_batch = MagicMock()
+        service.drive_service.new_batch_http_request.return_value = mock_batch
+
+        def execute() -> None:
+            callback = service.drive_service.new_batch_http_request.call_args.kwargs[
+                "callback"
+            ]
+            for call in mock_batch.add.call_args_list:
+                callback(call.kwargs["request_id"], {"id": "perm"}, None)
+
+        mock_batch.execute.side_effect = execute
+
+        results = service.set_file_permissions_many(["file1", "file2", "file3"])
+
+        assert [result.success for result in results] == [True, True, True]
+        assert results[0].message == (
+            "Permission set successfully: commenter for anyone"
+        )
+        assert mock_batch.add.call_count == 3
+        mock_batch.execute.assert_called_once()
+        # No request was sent individually
+        mock_create = service.drive_service.permissions().create.return_value
+        mock_create.execute.assert_not_called()
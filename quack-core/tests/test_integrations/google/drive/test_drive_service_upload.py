@@ -15,8 +15,9 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.google.drive.models import DriveUpload
 from quack_core.integrations.google.drive.service import GoogleDriveService
-from quack_core.lib.errors import QuackApiError
+from quack_core.lib.errors import QuackApiError, QuackIntegrationError
 
 
 class TestGoogleDriveServiceUpload:
@@ -163,3 +164,73 @@ class TestGoogleDriveServiceUpload:
 
             assert result.success is False
             assert "Not initialized" in result.error
+
+    @patch(
+        "quack_core.integrations.google.auth.GoogleAuthProvider._verify_client_secrets_file"
+    )
+    @patch.object(GoogleDriveService, "_initialize_config")
+    def test_upload_many(
+        self, mock_init_config: MagicMock, mock_verify: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test uploading several files through the worker pool."""
+        mock_verify.return_value = None
+        mock_init_config.return_value = {
+            "client_secrets_file": "/path/to/secrets.json",
+            "credentials_file": "/path/to/credentials.json",
+            "shared_folder_id": "shared_folder",
+            "upload_chunk_size": 256 * 1024,
+        }
+
+        service = GoogleDriveService(shared_folder_id="shared_folder")
+        service._initialized = True
+        service.drive_service = MagicMock()
+
+        paths = [str(tmp_path / f"part{i}.mp4") for i in range(3)]
+        missing = str(tmp_path / "missing.mp4")
+
+        def resolve(path, remote_path, parent_id):
+            if path == missing:
+                raise QuackIntegrationError(f"File not found: {path}")
+            return path, Path(path).name, parent_id or "shared_folder", "video/mp4"
+
+        def fake_upload(drive_service, path, metadata, mime_type, **kwargs):
+            kwargs["progress"](path, 100, 100)
+            return DriveUpload(
+                local_path=path,
+                file_id=f"id-{metadata['name']}",
+                link=f"https://view/{metadata['name']}",
+                size=100,
+            )
+
+        progress = MagicMock()
+        with (
+            patch.object(service, "_resolve_file_details", side_effect=resolve),
+            patch.object(service, "_build_thread_service", return_value=MagicMock()),
+            patch.object(service, "set_file_permissions_many") as mock_permissions,
+            patch(
+                "quack_core.integrations.google.drive.service.resumable_upload",
+                side_effect=fake_upload,
+            ) as mock_upload,
+        ):
+            mock_permissions.return_value = [
+                IntegrationResult.success_result(True) for _ in paths
+            ]
+            batch = service.upload_many(
+                [*paths, missing], max_workers=2, progress=progress
+            )
+
+        assert batch.succeeded == 3
+        assert batch.failed_indices == [3]
+        assert "File not found" in batch.results[3].error
+        assert [result.content.file_id for result in batch.results[:3]] == [
+            "id-part0.mp4",
+            "id-part1.mp4",
+            "id-part2.mp4",
+        ]
+        assert batch.total_bytes == 300
+        assert mock_upload.call_args.kwargs["chunk_size"] == 256 * 1024
+        assert mock_upload.call_args.args[2]["parents"] == ["shared_folder"]
+        mock_permissions.assert_called_once_with(
+            ["id-part0.mp4", "id-part1.mp4", "id-part2.mp4"]
+        )
+        assert progress.call_count == 3
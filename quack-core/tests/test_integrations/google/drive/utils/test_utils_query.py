@@ -91,3 +91,26 @@ class TestDriveUtilsQuery:
         assert "mimeType" in result
         assert "permissions" in result
         assert "permissions(id,type,role" in result  # Should include permission fields
+
+    def test_build_file_fields_selected_and_paginated(self) -> None:
+        """Test requesting only some fields plus the page token."""
+        result = query.build_file_fields(fields=["id", "name"], paginated=True)
+
+        assert result == "nextPageToken, files(id, name)"
+
+    def test_build_query_include_folders(self) -> None:
+        """Test that folders can be matched alongside a name pattern."""
+        result = query.build_query("folder123", "*.txt", include_folders=True)
+
+        assert result == (
+            "'folder123' in parents and trashed = false and "
+            "(name contains '.txt' or "
+            "mimeType = 'application/vnd.google-apps.folder')"
+        )
+
+    def test_matches_pattern(self) -> None:
+        """Test local matching mirrors the query semantics."""
+        assert query.matches_pattern("Report.TXT", "*.txt")
+        assert query.matches_pattern("anything", None)
+        assert query.matches_pattern("exact.txt", "exact.txt")
+        assert not query.matches_pattern("other.txt", "exact.txt")
@@ -140,28 +140,28 @@ class MockGmailMessagesResource(GmailMessagesResource):
         return self._attachments
 
     def get(
-        self, user_id: str, message_id: str, message_format: str = "full"
+        self, userId: str, id: str, format: str = "full"
     ) -> GmailRequest[dict[str, object]]:
         """
         Mock get method for retrieving a message.
 
         Args:
-            user_id: The user ID
-            message_id: The message ID
-            message_format: The format to return
+            userId: The user ID
+            id: The message ID
+            format: The format to return
 
         Returns:
             A mock request that will return the message data
         """
-        self.last_user_id = user_id
-        self.last_message_id = message_id
-        self.last_format = message_format
+        self.last_user_id = userId
+        self.last_message_id = id
+        self.last_format = format
 
         # Use provided message data or generate default
         if not self.message_data:
             message_data = {
-                "id": message_id,
-                "threadId": f"thread-{message_id}",
+                "id": id,
+                "threadId": f"thread-{id}",
                 "labelIds": ["INBOX"],
                 "snippet": "Email snippet...",
                 "payload": {
@@ -169,7 +169,7 @@ class MockGmailMessagesResource(GmailMessagesResource):
                     "headers": [
                         {"name": "From", "value": "sender@example.com"},
                         {"name": "To", "value": "recipient@example.com"},
-                        {"name": "Subject", "value": f"Test Email {message_id}"},
+                        {"name": "Subject", "value": f"Test Email {id}"},
                         {"name": "Date", "value": "Mon, 1 Jan 2023 12:00:00 +0000"},
                     ],
                     "parts": [
@@ -193,22 +193,27 @@ class MockGmailMessagesResource(GmailMessagesResource):
         )
 
     def list(
-        self, user_id: str, q: str, max_results: int = 100
+        self,
+        userId: str,
+        q: str,
+        maxResults: int = 100,
+        pageToken: str | None = None,
     ) -> GmailRequest[dict[str, list[dict[str, object]]]]:
         """
         Mock list method for listing messages.
 
         Args:
-            user_id: The user ID
+            userId: The user ID
             q: The search query
-            max_results: Maximum number of messages to return
+            maxResults: Maximum number of messages to return
+            pageToken: Token of the page to return
 
         Returns:
             A mock request that will return the messages list
         """
-        self.last_user_id = user_id
+        self.last_user_id = userId
         self.last_query = q
-        self.last_max_results = max_results
+        self.last_max_results = maxResults
 
         # Customize response based on query
         if q and "subject:Error" in q:
@@ -0,0 +1,164 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/google/mail/operations/test_download.py
+# role: operations
+# neighbors: __init__.py, test_attachments.py, test_auth.py, test_email.py, test_sync.py
+# exports: TestGmailDownloadOperations
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for Gmail download _operations.
+
+This module tests chunked attachment decoding, the content-hash attachment
+index and saving whole messages with it.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+from unittest.mock import MagicMock
+
+from quack_core.integrations.google.mail.operations import download
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode()
+
+
+def _message(msg_id: str, attachments: list[dict]) -> dict:
+    return {
+        "id": msg_id,
+        "payload": {
+            "mimeType": "multipart/mixed",
+            "headers": [
+                {"name": "From", "value": "Sender <sender@example.com>"},
+                {"name": "Subject", "value": f"Report {msg_id}"},
+            ],
+            "parts": [
+                {
+                    "mimeType": "text/html",
+                    "body": {"data": _b64(b"<p>Hello</p>")},
+                },
+                *attachments,
+            ],
+        },
+    }
+
+
+def _gmail_service(messages: dict[str, dict], attachments: dict[str, str]):
+    """Gmail service serving messages and attachments by ID."""
+    service = MagicMock()
+    messages_resource = service.users().messages()
+    messages_resource.get.side_effect = lambda **kwargs: MagicMock(
+        execute=MagicMock(return_value=messages[kwargs["message_id"]])
+    )
+    messages_resource.attachments().get.side_effect = lambda **kwargs: MagicMock(
+        execute=MagicMock(return_value={"data": attachments[kwargs["attachment_id"]]})
+    )
+    return service
+
+
+class TestGmailDownloadOperations:
+    """Tests for the Gmail download _operations functions."""
+
+    def test_decode_to_file_in_chunks(self, tmp_path) -> None:
+        """Test chunked decoding of unpadded data matches a one-shot decode."""
+        content = os.urandom(1001)
+        data = _b64(content).rstrip("=")
+        target = str(tmp_path / "out.bin")
+
+        digest, size = download.decode_to_file(data, target, chunk_chars=10)
+
+        with open(target, "rb") as fh:
+            assert fh.read() == content
+        assert size == 1001
+        assert digest == hashlib.sha256(content).hexdigest()
+
+    def test_attachment_index_claim(self, tmp_path) -> None:
+        """Test that duplicates are discarded and name clashes get a suffix."""
+        index = download.AttachmentIndex(str(tmp_path))
+        for name in ("a.part", "b.part", "c.part"):
+            (tmp_path / name).write_bytes(name.encode())
+
+        path, duplicate = index.claim("hash1", str(tmp_path / "a.part"), "doc.pdf")
+        assert (path, duplicate) == (str(tmp_path / "doc.pdf"), False)
+
+        path, duplicate = index.claim("hash1", str(tmp_path / "b.part"), "doc.pdf")
+        assert (path, duplicate) == (str(tmp_path / "doc.pdf"), True)
+        assert not (tmp_path / "b.part").exists()
+
+        path, duplicate = index.claim("hash2", str(tmp_path / "c.part"), "doc.pdf")
+        assert (path, duplicate) == (str(tmp_path / "doc-1.pdf"), False)
+
+        index.save()
+        (tmp_path / "doc-1.pdf").unlink()
+        reloaded = download.AttachmentIndex.load(str(tmp_path))
+        assert reloaded.get("hash1") == str(tmp_path / "doc.pdf")
+        assert reloaded.get("hash2") is None
+
+    def test_attachment_index_scans_existing_files(self, tmp_path) -> None:
+        """Test that files stored before the index existed are recognised."""
+        (tmp_path / "old.pdf").write_bytes(b"old attachment")
+        (tmp_path / "email.html").write_text("<p>skip</p>")
+
+        index = download.AttachmentIndex.load(str(tmp_path))
+
+        digest = hashlib.sha256(b"old attachment").hexdigest()
+        assert index.get(digest) == str(tmp_path / "old.pdf")
+        assert len(index) == 1
+
+    def test_download_message_dedupes_attachments(self, tmp_path) -> None:
+        """Test saving a message whose attachments repeat stored content."""
+        (tmp_path / "existing.pdf").write_bytes(b"shared")
+        messages = {
+            "msg1": _message(
+                "msg1",
+                [
+                    {"filename": "Report.PDF", "body": {"attachmentId": "att1"}},
+                    {"filename": "notes.txt", "body": {"data": _b64(b"notes")}},
+                ],
+            )
+        }
+        service = _gmail_service(messages, {"att1": _b64(b"shared")})
+        index = download.AttachmentIndex.load(str(tmp_path))
+
+        result = download.download_message(
+            service,
+            "me",
+            "msg1",
+            index,
+            include_subject=True,
+            logger=logging.getLogger("test_gmail"),
+        )
+
+        assert result.success is True
+        saved = result.content
+        assert saved.msg_id == "msg1"
+        assert saved.file_path.endswith("-sender-sender-example-com-msg1.html")
+        with open(saved.file_path, encoding="utf-8") as fh:
+            assert fh.read() == "<h1>Subject: Report msg1</h1><hr/><p>Hello</p>"
+        assert sorted(saved.attachments) == [
+            str(tmp_path / "existing.pdf"),
+            str(tmp_path / "notes.txt"),
+        ]
+        assert saved.deduplicated == 1
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+
+    def test_download_message_errors(self, tmp_path) -> None:
+        """Test that a message without HTML or a failing fetch is an error."""
+        message = _message("msg1", [])
+        message["payload"]["parts"] = []
+        service = _gmail_service({"msg1": message}, {})
+        index = download.AttachmentIndex(str(tmp_path))
+
+        result = download.download_message(service, "me", "msg1", index)
+        assert result.success is False
+        assert "No HTML content found" in result.error
+
+        service.users().messages().get.side_effect = Exception("API error")
+        result = download.download_message(service, "me", "msg1", index)
+        assert result.success is False
+        assert "Failed to download email msg1" in result.error
+        assert os.listdir(tmp_path) == []
@@ -30,6 +30,12 @@ from quack_core.integrations.google.mail.protocols import (
 )
 
 
+def _request(response: dict) -> MagicMock:
+    request = MagicMock()
+    request.execute.return_value = response
+    return request
+
+
 class TestGmailEmailOperations:
     """Tests for Gmail email _operations."""
 
@@ -74,20 +80,20 @@ class TestGmailEmailOperations:
                 self.last_message_id = None
                 self.last_format = None
 
-            def list(self, user_id: str, q: str, max_results: int) -> GmailRequest:
+            def list(
+                self, userId: str, q: str, maxResults: int, pageToken: str | None = None
+            ) -> GmailRequest:
                 # Store parameters for test assertions
-                self.last_user_id = user_id
+                self.last_user_id = userId
                 self.last_query = q
-                self.last_max_results = max_results
+                self.last_max_results = maxResults
                 return MockRequest(self.list_return)
 
-            def get(
-                self, user_id: str, message_id: str, message_format: str
-            ) -> GmailRequest:
+            def get(self, userId: str, id: str, format: str) -> GmailRequest:
                 # Store parameters for test assertions
-                self.last_user_id = user_id
-                self.last_message_id = message_id
-                self.last_format = message_format
+                self.last_user_id = userId
+                self.last_message_id = id
+                self.last_format = format
                 return MockRequest(self.get_return)
 
             def attachments(self) -> GmailAttachmentsResource:
@@ -228,6 +234,35 @@ class TestGmailEmailOperations:
             assert result.success is False
             assert "Failed to list emails" in result.error
 
+    def test_list_emails_follows_page_tokens(self) -> None:
+        """Test that listing reads every page until nextPageToken runs out."""
+        pages = [
+            {"messages": [{"id": "msg1"}, {"id": "msg2"}], "nextPageToken": "p2"},
+            {"messages": [{"id": "msg3"}], "nextPageToken": "p3"},
+            {"messages": [{"id": "msg4"}]},
+        ]
+        gmail_service = MagicMock()
+        list_method = gmail_service.users().messages().list
+        list_method.side_effect = [_request(page) for page in pages]
+
+        result = email.list_emails(gmail_service, "me", "is:unread")
+
+        assert result.success is True
+        assert [m["id"] for m in result.content] == ["msg1", "msg2", "msg3", "msg4"]
+        calls = list_method.call_args_list
+        assert calls[0].kwargs == {
+            "userId": "me",
+            "q": "is:unread",
+            "maxResults": email.MAX_PAGE_SIZE,
+        }
+        assert calls[1].kwargs["pageToken"] == "p2"
+        assert calls[2].kwargs["pageToken"] == "p3"
+
+        # max_pages stops early
+        list_method.side_effect = [_request(page) for page in pages]
+        result = email.list_emails(gmail_service, "me", "is:unread", max_pages=1)
+        assert [m["id"] for m in result.content] == ["msg1", "msg2"]
+
     def test_get_message_with_retry(self, mock_gmail_service) -> None:
         """Test getting a message with retry logic."""
         logger = logging.getLogger("test_gmail")
@@ -0,0 +1,202 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/google/mail/operations/test_sync.py
+# role: operations
+# neighbors: __init__.py, test_attachments.py, test_auth.py, test_email.py
+# exports: TestGmailSyncOperations
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for Gmail sync _operations.
+
+This module tests history paging, batched message fetches and the incremental
+sync built on top of them.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import httplib2
+from googleapiclient.errors import HttpError
+from quack_core.integrations.google.mail.operations import sync
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"error")
+
+
+def _request(response: object = None, error: Exception | None = None) -> MagicMock:
+    request = MagicMock()
+    if error is not None:
+        request.execute.side_effect = error
+    else:
+        request.execute.return_value = response
+    return request
+
+
+class FakeBatch:
+    """Batch envelope that answers each sub-request from a script."""
+
+    def __init__(self, service: MagicMock, callback) -> None:
+        self.service = service
+        self.callback = callback
+        self.request_ids: list[str] = []
+
+    def add(self, request, callback=None, request_id=None) -> None:
+        self.request_ids.append(request_id)
+
+    def execute(self) -> None:
+        self.service.rounds.append(list(self.request_ids))
+        for request_id in self.request_ids:
+            outcomes = self.service.script.get(request_id, [])
+            history_id = str(100 + int(request_id))
+            default = {"id": f"msg{request_id}", "historyId": history_id}
+            outcome = outcomes.pop(0) if outcomes else default
+            if isinstance(outcome, Exception):
+                self.callback(request_id, None, outcome)
+            else:
+                self.callback(request_id, outcome, None)
+
+
+def _batch_service(script: dict | None = None) -> MagicMock:
+    """Gmail service whose batches are served by FakeBatch."""
+    service = MagicMock()
+    service.script = script or {}
+    service.rounds = []
+    service.new_batch_http_request.side_effect = lambda callback=None: FakeBatch(
+        service, callback
+    )
+    return service
+
+
+def _history_page(ids: list[str], history_id: str, token: str | None = None) -> dict:
+    page: dict = {
+        "history": [
+            {"id": msg_id, "messagesAdded": [{"message": {"id": msg_id}}]}
+            for msg_id in ids
+        ],
+        "historyId": history_id,
+    }
+    if token:
+        page["nextPageToken"] = token
+    return page
+
+
+class TestGmailSyncOperations:
+    """Tests for the Gmail sync _operations functions."""
+
+    def test_list_history_follows_page_tokens(self) -> None:
+        """Test that every history page is read and IDs are de-duplicated."""
+        service = _batch_service()
+        history_list = service.users().history().list
+        history_list.side_effect = [
+            _request(_history_page(["m1", "m2"], "200", token="page2")),
+            _request(_history_page(["m2", "m3"], "205")),
+        ]
+
+        msg_ids, history_id, pages = sync.list_history(
+            service, "me", "150", label_id="INBOX"
+        )
+
+        assert msg_ids == ["m1", "m2", "m3"]
+        assert history_id == "205"
+        assert pages == 2
+        first, second = history_list.call_args_list
+        assert first.kwargs == {
+            "userId": "me",
+            "startHistoryId": "150",
+            "historyTypes": ["messageAdded"],
+            "maxResults": sync.HISTORY_PAGE_SIZE,
+            "labelId": "INBOX",
+        }
+        assert second.kwargs["pageToken"] == "page2"
+
+    def test_fetch_messages_in_bounded_batches(self) -> None:
+        """Test that messages are fetched in groups of batch_size."""
+        service = _batch_service()
+        msg_ids = [f"m{i}" for i in range(120)]
+
+        results = sync.fetch_messages(service, "me", msg_ids)
+
+        assert [len(ids) for ids in service.rounds] == [50, 50, 20]
+        assert all(result.success for result in results)
+        assert results[119].content["id"] == "msg119"
+
+        service = _batch_service()
+        sync.fetch_messages(service, "me", msg_ids, batch_size=500)
+        assert [len(ids) for ids in service.rounds] == [100, 20]
+
+    def test_fetch_messages_retries_only_transient_failures(self) -> None:
+        """Test that only 429/5xx sub-requests are sent again."""
+        service = _batch_service({"1": [_http_error(429)], "2": [_http_error(403)]})
+
+        with patch("time.sleep") as mock_sleep:
+            results = sync.fetch_messages(service, "me", ["a", "b", "c"])
+
+        assert service.rounds == [["0", "1", "2"], ["1"]]
+        mock_sleep.assert_called_once_with(1.0)
+        assert results[1].success is True
+        assert results[2].success is False
+        assert "Failed to get message c" in results[2].error
+
+    def test_sync_emails_incremental(self) -> None:
+        """Test an incremental sync from a stored history ID."""
+        service = _batch_service({"1": [_http_error(404)], "2": [_http_error(403)]})
+        service.users().history().list.return_value = _request(
+            _history_page(["a", "b", "c", "d"], "300")
+        )
+
+        result = sync.sync_emails(service, "me", start_history_id="250")
+
+        assert result.success is True
+        content = result.content
+        assert content.full_sync is False
+        assert content.history_id == "300"
+        assert content.history_pages == 1
+        assert content.batch_requests == 1
+        # Deleted messages are skipped, other failures are reported
+        assert content.message_ids == ["msg0", "msg3"]
+        assert content.failed_ids == ["c"]
+        assert content.success is False
+        service.users().messages().list.assert_not_called()
+
+    def test_sync_emails_falls_back_to_full_sync(self) -> None:
+        """Test that an expired history ID triggers a full listing."""
+        service = _batch_service()
+        history_list = service.users().history().list
+        history_list.return_value = _request(error=_http_error(404))
+        service.users().messages().list.return_value = _request(
+            {"messages": [{"id": "new"}, {"id": "old"}]}
+        )
+
+        result = sync.sync_emails(
+            service, "me", start_history_id="1", query="is:unread"
+        )
+
+        assert result.success is True
+        assert result.content.full_sync is True
+        # Listings are newest first, the sync hands back oldest first
+        service.users().messages().get.assert_any_call(
+            userId="me", id="old", format="full"
+        )
+        assert service.rounds == [["0", "1"]]
+        assert result.content.history_id == "101"
+
+        # Any other history error fails the sync
+        history_list.return_value = _request(error=_http_error(403))
+        result = sync.sync_emails(service, "me", start_history_id="1")
+        assert result.success is False
+        assert "Failed to sync emails" in result.error
+
+    def test_sync_emails_without_history_id(self) -> None:
+        """Test that the first sync lists messages instead of reading history."""
+        service = _batch_service()
+        service.users().messages().list.return_value = _request({"messages": []})
+
+        result = sync.sync_emails(service, "me")
+
+        assert result.success is True
+        assert result.content.full_sync is True
+        assert result.content.history_id is None
+        assert result.content.messages == []
+        service.users().history().list.assert_not_called()
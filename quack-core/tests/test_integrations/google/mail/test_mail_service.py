@@ -14,10 +14,12 @@ This module tests the main service class for Google Mail integration,
 ensuring proper initialization and operation.
 """
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.google.mail.models import GmailDownload, GmailSyncResult
 from quack_core.integrations.google.mail.service import GoogleMailService
 from quack_core.lib.errors import QuackIntegrationError
 
@@ -397,3 +399,123 @@ class TestGoogleMailService:
             result = service.download_email("msg1")
             assert result.success is False
             assert "Not initialized" in result.error
+
+    def test_sync_emails(self) -> None:
+        """Test that sync_emails resumes from and stores the history ID."""
+        service = GoogleMailService(storage_path="/path/to/storage")
+        service._initialized = True
+        service.gmail_service = create_mock_gmail_service()
+        service.config = {
+            "gmail_user_id": "test@example.com",
+            "sync_batch_size": 25,
+            "max_retries": 3,
+            "initial_delay": 0.5,
+            "max_delay": 5.0,
+        }
+
+        with (
+            patch("quack_core.integrations.google.mail.service.fs") as mock_fs,
+            patch(
+                "quack_core.integrations.google.mail.operations.sync.sync_emails"
+            ) as mock_sync,
+        ):
+            mock_fs.read_text.return_value = MagicMock(
+                success=True, content='{"test@example.com": "120"}'
+            )
+            mock_fs.write_text.return_value = MagicMock(success=True)
+            mock_sync.return_value = IntegrationResult.success_result(
+                content=GmailSyncResult(history_id="180", messages=[{"id": "msg1"}])
+            )
+
+            result = service.sync_emails(query="is:unread")
+            assert result.success is True
+            assert result.content.message_ids == ["msg1"]
+
+            mock_sync.assert_called_once_with(
+                service.gmail_service,
+                "test@example.com",
+                "120",  # history ID from the state file
+                "is:unread",
+                None,
+                "full",
+                25,  # sync_batch_size from config
+                3,
+                0.5,
+                5.0,
+                service.logger,
+            )
+            state_path, state = mock_fs.write_text.call_args.args
+            assert state_path == "/path/to/storage/.gmail_sync_state.json"
+            assert json.loads(state) == {"test@example.com": "180"}
+
+            # A failed sync leaves the stored history ID alone
+            mock_fs.write_text.reset_mock()
+            mock_sync.return_value = IntegrationResult.error_result("API error")
+            result = service.sync_emails(query="is:unread")
+            assert result.success is False
+            mock_fs.write_text.assert_not_called()
+
+        # Test not initialized
+        service._initialized = False
+        with patch.object(service, "_ensure_initialized") as mock_ensure:
+            mock_ensure.return_value = IntegrationResult(
+                success=False,
+                error="Not initialized",
+            )
+
+            result = service.sync_emails()
+            assert result.success is False
+            assert "Not initialized" in result.error
+
+    def test_download_emails(self, tmp_path) -> None:
+        """Test downloading several emails on a thread pool."""
+        service = GoogleMailService(storage_path=str(tmp_path))
+        service._initialized = True
+        service.config = {"gmail_user_id": "test@example.com", "download_workers": 3}
+
+        def fake_download(gmail_service, user_id, msg_id, index, *args):
+            if msg_id == "bad":
+                return IntegrationResult.error_result(f"Failed to download {msg_id}")
+            return IntegrationResult.success_result(
+                content=GmailDownload(
+                    msg_id=msg_id,
+                    file_path=f"{tmp_path}/{msg_id}.html",
+                    deduplicated=1,
+                    bytes_written=1000,
+                )
+            )
+
+        with (
+            patch.object(
+                service, "_build_thread_service", return_value=MagicMock()
+            ) as mock_build,
+            patch(
+                "quack_core.integrations.google.mail.operations.download.download_message",
+                side_effect=fake_download,
+            ) as mock_download,
+        ):
+            batch = service.download_emails(["msg1", "bad", "msg2"])
+
+        assert [result.success for result in batch.results] == [True, False, True]
+        assert batch.succeeded == 2
+        assert batch.failed_indices == [1]
+        assert batch.total_bytes == 2000
+        assert batch.deduplicated == 2
+        assert batch.success is False
+        assert mock_download.call_count == 3
+        assert mock_download.call_args.args[1] == "test@example.com"
+        # One client per worker thread, never more than the pool size
+        assert 1 <= mock_build.call_count <= 3
+        assert (tmp_path / ".attachment_index.json").exists()
+
+        # Test not initialized
+        service._initialized = False
+        with patch.object(service, "_ensure_initialized") as mock_ensure:
+            mock_ensure.return_value = IntegrationResult(
+                success=False,
+                error="Not initialized",
+            )
+
+            batch = service.download_emails(["msg1"])
+            assert batch.failed == 1
+            assert "Not initialized" in batch.results[0].error
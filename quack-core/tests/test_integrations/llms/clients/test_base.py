@@ -290,6 +290,23 @@ class TestLLMClient:
             assert result.success is False
             assert "Error counting tokens: Counting error" in result.error
 
+    def test_count_tokens_many(self) -> None:
+        """Test counting several conversations at once."""
+        client = MockClient(token_counts=[10, 20])
+        conversations = [
+            [ChatMessage(role=RoleType.USER, content="First")],
+            [{"role": "user", "content": "Second"}],
+        ]
+
+        result = client.count_tokens_many(conversations)
+        assert result.success is True
+        assert result.content == [10, 20]
+
+        # An empty conversation fails the batch and names its index
+        result = client.count_tokens_many([conversations[0], []])
+        assert result.success is False
+        assert "Conversation 1" in result.error
+
     def test_normalize_messages(self, mock_client: MockClient) -> None:
         """Test the _normalize_messages method."""
         # Test with ChatMessage objects
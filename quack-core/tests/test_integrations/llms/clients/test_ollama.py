@@ -80,14 +80,14 @@ class TestOllamaClient:
 
     def test_chat_with_provider(self, ollama_client: OllamaClient) -> None:
         """Test the Ollama-specific chat implementation."""
-        # Set up mock for requests.post
+        # Set up mock for the pooled session's post
         mock_response = MagicMock()
         mock_response.json.return_value = {
             "message": {"content": "Mock Ollama response"}
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             # Set up messages and options
             messages = [
                 ChatMessage(role=RoleType.SYSTEM, content="System message"),
@@ -102,7 +102,7 @@ class TestOllamaClient:
             assert result.success is True
             assert result.content == "Mock Ollama response"
 
-            # Verify requests.post was called correctly
+            # Verify the session's post was called correctly
             mock_post.assert_called_once()
             call_args = mock_post.call_args
             assert call_args[0][0] == "http://localhost:11434/api/chat"
@@ -122,7 +122,7 @@ class TestOllamaClient:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             # Set up callback
             callback = MagicMock()
 
@@ -197,12 +197,12 @@ class TestOllamaClient:
 
     def test_count_tokens_with_provider(self, ollama_client: OllamaClient) -> None:
         """Test the Ollama-specific token counting implementation."""
-        # Set up mock for requests.post
+        # Set up mock for the pooled session's post
         mock_response = MagicMock()
         mock_response.json.return_value = {"tokens": [1, 2, 3, 4, 5]}
         mock_response.raise_for_status = MagicMock()
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             # Set up messages
             messages = [
                 ChatMessage(role=RoleType.USER, content="Count my tokens"),
@@ -215,7 +215,7 @@ class TestOllamaClient:
             assert result.success is True
             assert result.content == 5  # Length of the tokens list
 
-            # Verify requests.post was called correctly
+            # Verify the session's post was called correctly
             mock_post.assert_called_once()
             call_args = mock_post.call_args
             assert call_args[0][0] == "http://localhost:11434/api/tokenize"
@@ -227,9 +227,9 @@ class TestOllamaClient:
         self, ollama_client: OllamaClient
     ) -> None:
         """Test token counting with API error."""
-        # Set up mock for requests.post to raise an exception
+        # Set up mock for the pooled session's post to raise an exception
         with patch(
-            "requests.post",
+            "requests.Session.post",
             side_effect=requests.exceptions.RequestException("API error"),
         ) as mock_post:
             # Set up messages
@@ -244,3 +244,91 @@ class TestOllamaClient:
             assert result.success is True
             assert result.content > 0
             assert "estimation" in result.message
+
+    def test_session_is_pooled_and_reused(self) -> None:
+        """Test that requests share one keep-alive session."""
+        client = OllamaClient(model="llama3", pool_size=4)
+
+        session = client._get_session()
+        assert client._get_session() is session
+        adapter = session.get_adapter("http://localhost:11434")
+        assert adapter._pool_maxsize == 4
+
+        client.close()
+        assert client._session is None
+        assert client._get_session() is not session
+        client.close()
+
+    def test_keep_alive_in_requests(self) -> None:
+        """Test that keep_alive pins the model on chat and embed requests."""
+        client = OllamaClient(model="llama3", keep_alive="10m")
+        options = LLMOptions()
+
+        request = client._build_chat_request(
+            [ChatMessage(role=RoleType.USER, content="Hi")], options, None
+        )
+        assert request["keep_alive"] == "10m"
+        assert client._build_embed_request(["a"], None)["keep_alive"] == "10m"
+
+        # Left to the server default when not configured
+        assert "keep_alive" not in OllamaClient()._build_chat_request(
+            [ChatMessage(role=RoleType.USER, content="Hi")], options, None
+        )
+
+    def test_sync_streaming_uses_session(self, ollama_client: OllamaClient) -> None:
+        """Test streaming chat through the pooled session."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_lines.return_value = [
+            b'{"message": {"content": "Qu"}}',
+            b"",
+            b"not json",
+            b'{"message": {"content": "ack"}}',
+            b'{"done": true}',
+        ]
+        callback = MagicMock()
+
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
+            result = ollama_client._chat_with_provider(
+                [ChatMessage(role=RoleType.USER, content="Hi")],
+                LLMOptions(),
+                callback,
+            )
+
+        assert result.success is True
+        assert result.content == "Quack"
+        assert callback.call_count == 2
+        assert mock_post.call_args[1]["stream"] is True
+
+    def test_embed_batches_requests(self, ollama_client: OllamaClient) -> None:
+        """Test that embed sends texts in batches and keeps their order."""
+
+        def embed_response(url, json, timeout):
+            response = MagicMock()
+            response.json.return_value = {
+                "embeddings": [[float(len(text))] for text in json["input"]]
+            }
+            return response
+
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        with patch("requests.Session.post", side_effect=embed_response) as mock_post:
+            result = ollama_client.embed(texts, model="nomic-embed-text", batch_size=2)
+
+        assert result.success is True
+        assert result.content == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert mock_post.call_count == 3
+        assert mock_post.call_args_list[0][0][0] == "http://localhost:11434/api/embed"
+        assert mock_post.call_args_list[0][1]["json"]["model"] == "nomic-embed-text"
+
+    def test_embed_error(self, ollama_client: OllamaClient) -> None:
+        """Test embedding with an API error."""
+        with patch(
+            "requests.Session.post",
+            side_effect=requests.exceptions.ConnectionError("refused"),
+        ):
+            result = ollama_client.embed(["a"])
+
+        assert result.success is False
+        assert "embedding request failed" in result.error
+
+        assert ollama_client.embed([]).success is False
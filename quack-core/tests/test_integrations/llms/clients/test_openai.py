@@ -18,7 +18,7 @@ import os
 from unittest.mock import MagicMock, patch
 
 import pytest
-from quack_core.integrations.llms.clients.openai import OpenAIClient
+from quack_core.integrations.llms.clients.openai import OpenAIClient, get_encoding
 from quack_core.integrations.llms.models import ChatMessage, LLMOptions, RoleType
 from quack_core.lib.errors import QuackApiError, QuackIntegrationError
 
@@ -455,6 +455,7 @@ class TestOpenAIClient:
         ]
 
         # Test token counting with tiktoken
+        get_encoding.cache_clear()
         result = openai_client._count_tokens_with_provider(messages)
 
         assert result.success is True
@@ -466,6 +467,7 @@ class TestOpenAIClient:
         mock_tiktoken.assert_called_once_with("gpt-4o")
 
         # Test with model-specific encoding error
+        get_encoding.cache_clear()
         mock_tiktoken.reset_mock()
         mock_tiktoken.side_effect = KeyError("Model not found")
 
@@ -480,6 +482,7 @@ class TestOpenAIClient:
             mock_get_encoding.assert_called_once_with("cl100k_base")
 
         # Test with tiktoken import error
+        get_encoding.cache_clear()
         with patch.dict("sys.modules", {"tiktoken": None}):
             with patch("logging.Logger.warning") as mock_warning:
                 result = openai_client._count_tokens_with_provider(messages)
@@ -494,6 +497,7 @@ class TestOpenAIClient:
                 assert "tiktoken not installed" in mock_warning.call_args[0][0]
 
         # Test with general error
+        get_encoding.cache_clear()
         with patch(
             "tiktoken.encoding_for_model", side_effect=Exception("Counting error")
         ):
@@ -502,6 +506,39 @@ class TestOpenAIClient:
             assert result.success is False
             assert "Error counting tokens" in result.error
 
+    @patch("tiktoken.encoding_for_model")
+    def test_count_tokens_reuses_encoding_and_message_counts(
+        self, mock_tiktoken: MagicMock, openai_client: OpenAIClient
+    ) -> None:
+        """The encoding loads once per process and repeated messages are memoized."""
+        get_encoding.cache_clear()
+        mock_encoding = MagicMock()
+        mock_encoding.encode.side_effect = lambda text: list(text)
+        mock_tiktoken.return_value = mock_encoding
+
+        system = ChatMessage(role=RoleType.SYSTEM, content="Shared system prompt")
+        batch = [
+            [system, ChatMessage(role=RoleType.USER, content=f"Chunk {i}")]
+            for i in range(5)
+        ]
+
+        result = openai_client.count_tokens_many(batch)
+
+        assert result.success is True
+        assert result.content == [
+            3 * 2 + len("Shared system prompt") + len(f"Chunk {i}") + 3
+            for i in range(5)
+        ]
+        mock_tiktoken.assert_called_once_with("gpt-4o")
+        # The shared system prompt is encoded once, each chunk once
+        assert mock_encoding.encode.call_count == 6
+
+        # Another client for the same model reuses the cached encoding
+        other = OpenAIClient(model="gpt-4o", api_key="test-key")
+        assert other.count_tokens(batch[0]).content == result.content[0]
+        mock_tiktoken.assert_called_once()
+        get_encoding.cache_clear()
+
     def test_handle_streaming(self) -> None:
         """Test handling streaming responses."""
         client = OpenAIClient()
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/llms/mocks/__init__.py
 # role: tests
 # neighbors: anthropic.py, base.py, clients.py, openai.py
-# exports: MockLLMResponse, MockTokenResponse, MockStreamingGenerator, MockClient, create_mock_client, MockOpenAIResponse, MockOpenAIStreamingResponse, MockOpenAIErrorResponse (+5 more)
+# exports: MockLLMResponse, MockTokenResponse, MockStreamingGenerator, MockClient, create_mock_client, MockOpenAIResponse, MockOpenAIStreamingResponse, MockOpenAIErrorResponse (+7 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -24,9 +24,11 @@ from tests.test_integrations.llms.mocks.anthropic import (
 
 # Import from base module
 from tests.test_integrations.llms.mocks.base import (
+    LoopBoundTransport,
     MockLLMResponse,
     MockStreamingGenerator,
     MockTokenResponse,
+    sdk_client_factory,
 )
 
 # Import from clients module
@@ -49,6 +51,8 @@ __all__ = [
     "MockLLMResponse",
     "MockTokenResponse",
     "MockStreamingGenerator",
+    "LoopBoundTransport",
+    "sdk_client_factory",
     # Client mocks
     "MockClient",
     "create_mock_client",
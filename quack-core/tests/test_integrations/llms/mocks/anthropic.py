@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/llms/mocks/anthropic.py
 # role: tests
 # neighbors: __init__.py, base.py, clients.py, openai.py
-# exports: MockAnthropicResponse, MockAnthropicStreamingResponse, MockAnthropicErrorResponse, MockAnthropicClient
+# exports: MockAnthropicResponse, MockAnthropicStreamingResponse, MockAnthropicErrorResponse, MockAnthropicClient, ANTHROPIC_MESSAGE
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -20,6 +20,18 @@ from tests.test_integrations.llms.mocks.base import (
 )
 from tests.test_integrations.llms.mocks.clients import MockClient
 
+# Messages API body as returned by the Anthropic HTTP API
+ANTHROPIC_MESSAGE = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-3-opus-20240229",
+    "content": [{"type": "text", "text": "Hi there"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 2},
+}
+
 
 class MockAnthropicResponse(MockLLMResponse):
     """A mock response mimicking the Anthropic API format."""
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/llms/mocks/base.py
 # role: tests
 # neighbors: __init__.py, anthropic.py, clients.py, openai.py
-# exports: MockLLMResponse, MockTokenResponse, MockStreamingGenerator
+# exports: MockLLMResponse, MockTokenResponse, MockStreamingGenerator, LoopBoundTransport, sdk_client_factory
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -11,10 +11,13 @@
 Base mock classes for LLM testing.
 """
 
-from collections.abc import Generator, Iterator
+import asyncio
+from collections.abc import Callable, Generator, Iterator
 from typing import Any
 from unittest.mock import MagicMock
 
+import httpx
+
 
 class MockLLMResponse:
     """A mock LLM response for testing client implementations."""
@@ -162,3 +165,60 @@ class MockStreamingGenerator:
             if self.error and self.error_after is not None and i >= self.error_after:
                 raise self.error
             yield chunk
+
+
+class LoopBoundTransport(httpx.AsyncBaseTransport):
+    """
+    Mock httpx transport that, like a real connection pool, only works on
+    the event loop it was first used on.
+    """
+
+    def __init__(self, handler: Callable[[httpx.Request], httpx.Response]):
+        """
+        Initialize the transport.
+
+        Args:
+            handler: Function returning the response for a request.
+        """
+        self.handler = handler
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.requests: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request, failing if it comes from a different event loop."""
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop:
+            raise RuntimeError("Event loop is closed")
+        await request.aread()
+        self.requests.append(request)
+        return self.handler(request)
+
+
+def sdk_client_factory(
+    sdk_class: type, payload: dict[str, Any], transports: list[LoopBoundTransport]
+) -> Callable[..., Any]:
+    """
+    Build a replacement for an async SDK client class (AsyncOpenAI,
+    AsyncAnthropic) whose instances answer every request with payload.
+
+    Args:
+        sdk_class: The SDK client class to instantiate.
+        payload: JSON body returned for every request.
+        transports: List the transport of each created client is appended to.
+
+    Returns:
+        Callable: Factory taking the SDK client's keyword arguments.
+    """
+
+    def factory(**kwargs: Any) -> Any:
+        transport = LoopBoundTransport(lambda request: httpx.Response(200, json=payload))
+        transports.append(transport)
+        return sdk_class(
+            http_client=httpx.AsyncClient(transport=transport),
+            max_retries=0,
+            **kwargs,
+        )
+
+    return factory
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/llms/mocks/openai.py
 # role: tests
 # neighbors: __init__.py, anthropic.py, base.py, clients.py
-# exports: MockOpenAIResponse, MockOpenAIStreamingResponse, MockOpenAIErrorResponse, MockOpenAIClient
+# exports: MockOpenAIResponse, MockOpenAIStreamingResponse, MockOpenAIErrorResponse, MockOpenAIClient, OPENAI_COMPLETION
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -20,6 +20,21 @@ from tests.test_integrations.llms.mocks.base import (
 )
 from tests.test_integrations.llms.mocks.clients import MockClient
 
+# Chat completion body as returned by the OpenAI HTTP API
+OPENAI_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hi there"},
+            "finish_reason": "stop",
+        }
+    ],
+}
+
 
 class MockOpenAIResponse(MockLLMResponse):
     """A mock response mimicking the OpenAI API format."""
@@ -0,0 +1,286 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/llms/test_async_chat.py
+# role: tests
+# neighbors: __init__.py, test_cache.py, test_config.py, test_fallback.py, test_integration.py, test_llms.py (+4 more)
+# exports: TestBaseAsyncChat, TestOpenAIAsyncChat, TestOllamaAsyncChat, TestSDKClientEventLoops, TestFallbackAsyncChat
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for the async chat API (achat / acount_tokens).
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from quack_core.integrations.llms.cache import ResponseCache
+from quack_core.integrations.llms.clients.anthropic import AnthropicClient
+from quack_core.integrations.llms.clients.ollama import OllamaClient
+from quack_core.integrations.llms.clients.openai import OpenAIClient
+from quack_core.integrations.llms.fallback import FallbackConfig, FallbackLLMClient
+from quack_core.integrations.llms.models import ChatMessage, LLMOptions, RoleType
+from quack_core.lib.errors import QuackApiError
+
+from tests.test_integrations.llms.mocks.anthropic import ANTHROPIC_MESSAGE
+from tests.test_integrations.llms.mocks.base import (
+    LoopBoundTransport,
+    sdk_client_factory,
+)
+from tests.test_integrations.llms.mocks.clients import MockClient
+from tests.test_integrations.llms.mocks.openai import OPENAI_COMPLETION
+
+MESSAGES = [ChatMessage(role=RoleType.USER, content="Hello")]
+
+
+class TestBaseAsyncChat:
+    """Tests for LLMClient.achat defaults."""
+
+    def test_achat_runs_sync_provider(self) -> None:
+        client = MockClient(responses=["async hello"])
+
+        result = asyncio.run(client.achat(MESSAGES))
+
+        assert result.success is True
+        assert result.content == "async hello"
+        assert client.chat_call_count == 1
+
+    def test_achat_retries_with_asyncio_sleep(self) -> None:
+        client = MockClient(
+            responses=["recovered"], retry_count=2, initial_retry_delay=0.5
+        )
+        sync_chat = client._chat_with_provider
+        calls = []
+
+        def flaky(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise QuackApiError("Rate limit", "Mock")
+            return sync_chat(*args, **kwargs)
+
+        with patch.object(client, "_chat_with_provider", side_effect=flaky):
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                result = asyncio.run(client.achat(MESSAGES))
+
+        assert result.success is True
+        assert result.content == "recovered"
+        assert len(calls) == 2
+        mock_sleep.assert_awaited_once_with(0.5)
+
+    def test_achat_uses_cache(self) -> None:
+        client = MockClient(responses=["first", "second"], cache=ResponseCache())
+        options = LLMOptions(temperature=0.0)
+
+        async def scenario():
+            await client.achat(MESSAGES, LLMOptions(**options.model_dump()))
+            return await client.achat(MESSAGES, LLMOptions(**options.model_dump()))
+
+        result = asyncio.run(scenario())
+
+        assert result.content == "first"
+        assert client.chat_call_count == 1
+
+    def test_acount_tokens(self) -> None:
+        client = MockClient(token_counts=[42])
+
+        result = asyncio.run(client.acount_tokens(MESSAGES))
+
+        assert result.success is True
+        assert result.content == 42
+
+    def test_achat_without_messages(self) -> None:
+        result = asyncio.run(MockClient().achat([]))
+
+        assert result.success is False
+        assert "No messages provided" in result.error
+
+
+class TestOpenAIAsyncChat:
+    """Tests for OpenAIClient._achat_with_provider."""
+
+    def test_non_streaming(self) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Hi there"))]
+        )
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(return_value=response)
+
+        client = OpenAIClient(api_key="test-key", model="gpt-4o")
+        with patch.object(client, "_get_async_client", return_value=async_client):
+            result = asyncio.run(client.achat(MESSAGES, LLMOptions(temperature=0.2)))
+
+        assert result.success is True
+        assert result.content == "Hi there"
+        kwargs = async_client.chat.completions.create.await_args.kwargs
+        assert kwargs["model"] == "gpt-4o"
+        assert kwargs["temperature"] == 0.2
+
+    def test_streaming(self) -> None:
+        async def stream():
+            for text in ["Hel", "lo"]:
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+                )
+
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(return_value=stream())
+        chunks: list[str] = []
+
+        client = OpenAIClient(api_key="test-key", model="gpt-4o")
+        with patch.object(client, "_get_async_client", return_value=async_client):
+            result = asyncio.run(client.achat(MESSAGES, callback=chunks.append))
+
+        assert result.content == "Hello"
+        assert chunks == ["Hel", "lo"]
+
+
+class TestOllamaAsyncChat:
+    """Tests for OllamaClient async requests over httpx."""
+
+    @staticmethod
+    def _client_with(handler) -> tuple[OllamaClient, httpx.AsyncClient]:
+        client = OllamaClient(model="llama3", retry_count=0)
+        http_client = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+        return client, http_client
+
+    def test_non_streaming(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            assert request.url.path == "/api/chat"
+            assert body["model"] == "llama3"
+            assert body["stream"] is False
+            return httpx.Response(200, json={"message": {"content": "Quack"}})
+
+        client, http_client = self._client_with(handler)
+        with patch.object(client, "_get_async_client", return_value=http_client):
+            result = asyncio.run(client.achat(MESSAGES, LLMOptions()))
+
+        assert result.success is True
+        assert result.content == "Quack"
+
+    def test_streaming(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            lines = [
+                json.dumps({"message": {"content": part}}) for part in ["Qu", "ack"]
+            ]
+            return httpx.Response(200, content="\n".join(lines).encode())
+
+        client, http_client = self._client_with(handler)
+        chunks: list[str] = []
+        with patch.object(client, "_get_async_client", return_value=http_client):
+            result = asyncio.run(client.achat(MESSAGES, callback=chunks.append))
+
+        assert result.content == "Quack"
+        assert chunks == ["Qu", "ack"]
+
+    def test_http_error_is_api_error(self) -> None:
+        client, http_client = self._client_with(lambda request: httpx.Response(500))
+        with patch.object(client, "_get_async_client", return_value=http_client):
+            result = asyncio.run(client.achat(MESSAGES))
+
+        assert result.success is False
+        assert "API error" in result.error
+
+    def test_acount_tokens(self) -> None:
+        client, http_client = self._client_with(
+            lambda request: httpx.Response(200, json={"tokens": [1, 2, 3]})
+        )
+        with patch.object(client, "_get_async_client", return_value=http_client):
+            result = asyncio.run(client.acount_tokens(MESSAGES))
+
+        assert result.content == 3
+
+
+class TestSDKClientEventLoops:
+    """Tests that SDK-backed clients work across separate event loops."""
+
+    def test_openai_client_per_event_loop(self) -> None:
+        openai = pytest.importorskip("openai")
+        transports: list[LoopBoundTransport] = []
+        client = OpenAIClient(api_key="test-key", model="gpt-4o", retry_count=0)
+
+        with patch.object(
+            openai,
+            "AsyncOpenAI",
+            sdk_client_factory(openai.AsyncOpenAI, OPENAI_COMPLETION, transports),
+        ):
+            first = asyncio.run(client.achat(MESSAGES))
+            second = asyncio.run(client.achat(MESSAGES))
+
+        assert first.content == second.content == "Hi there"
+        assert len(transports) == 2
+
+    def test_anthropic_client_per_event_loop(self) -> None:
+        anthropic = pytest.importorskip("anthropic")
+        transports: list[LoopBoundTransport] = []
+        client = AnthropicClient(api_key="test-key", retry_count=0)
+
+        with patch.object(
+            anthropic,
+            "AsyncAnthropic",
+            sdk_client_factory(anthropic.AsyncAnthropic, ANTHROPIC_MESSAGE, transports),
+        ):
+            first = asyncio.run(client.achat(MESSAGES))
+            second = asyncio.run(client.achat(MESSAGES))
+
+        assert first.content == second.content == "Hi there"
+        assert len(transports) == 2
+
+    def test_aclose(self) -> None:
+        openai = pytest.importorskip("openai")
+        transports: list[LoopBoundTransport] = []
+        client = OpenAIClient(api_key="test-key", model="gpt-4o", retry_count=0)
+
+        async def scenario():
+            await client.achat(MESSAGES)
+            sdk_client = client._async_client
+            await client.aclose()
+            return sdk_client
+
+        with patch.object(
+            openai,
+            "AsyncOpenAI",
+            sdk_client_factory(openai.AsyncOpenAI, OPENAI_COMPLETION, transports),
+        ):
+            sdk_client = asyncio.run(scenario())
+
+        assert client._async_client is None
+        assert sdk_client.is_closed()
+
+
+class TestFallbackAsyncChat:
+    """Tests for FallbackLLMClient async fallback."""
+
+    def test_falls_back_to_next_provider(self) -> None:
+        fallback_client = FallbackLLMClient(
+            fallback_config=FallbackConfig(
+                providers=["openai", "anthropic"],
+                max_attempts_per_provider=2,
+                delay_between_providers=0.1,
+            )
+        )
+
+        failing = MagicMock()
+        failing.model = "gpt-4o"
+        failing.achat = AsyncMock(side_effect=QuackApiError("Rate limit exceeded", "OpenAI"))
+        working = MockClient(responses=["Anthropic response"])
+        clients = {"openai": failing, "anthropic": working}
+
+        with patch.object(
+            fallback_client, "_get_client_for_provider", side_effect=clients.__getitem__
+        ):
+            with patch("asyncio.sleep", new_callable=AsyncMock):
+                result = asyncio.run(fallback_client.achat(MESSAGES))
+
+        assert result.success is True
+        assert result.content == "Anthropic response"
+        assert "via anthropic" in result.message
+        assert failing.achat.await_count == 2
+        assert fallback_client._provider_status["openai"].fail_count == 2
+        assert fallback_client._last_successful_provider == "anthropic"
@@ -0,0 +1,154 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/llms/test_cache.py
+# role: tests
+# neighbors: __init__.py, test_config.py, test_config_provider.py, test_fallback.py, test_integration.py, test_llms.py (+4 more)
+# exports: TestCacheKey, TestMemoryCache, TestSQLiteCache, TestClientCaching
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for the LLM response cache.
+"""
+
+import time
+
+from quack_core.integrations.llms.cache import (
+    MemoryCache,
+    ResponseCache,
+    ResponseCacheConfig,
+    SQLiteCache,
+    make_cache_key,
+)
+from quack_core.integrations.llms.models import ChatMessage, LLMOptions, RoleType
+
+from tests.test_integrations.llms.mocks.clients import MockClient
+
+
+def _messages(text: str = "Hello") -> list[ChatMessage]:
+    return [
+        ChatMessage(role=RoleType.SYSTEM, content="Be brief."),
+        ChatMessage(role=RoleType.USER, content=text),
+    ]
+
+
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_ignores_transport_options(self) -> None:
+        """Timeouts and retries do not change the key."""
+        base = LLMOptions(model="m", temperature=0.0)
+        other = LLMOptions(model="m", temperature=0.0, timeout=5, retry_count=0)
+        assert make_cache_key(_messages(), base) == make_cache_key(_messages(), other)
+
+    def test_sensitive_to_request_content(self) -> None:
+        """Messages, model and sampling options all change the key."""
+        options = LLMOptions(model="m", temperature=0.0)
+        key = make_cache_key(_messages(), options)
+
+        assert key != make_cache_key(_messages("Bye"), options)
+        assert key != make_cache_key(_messages(), LLMOptions(model="n", temperature=0.0))
+        assert key != make_cache_key(_messages(), LLMOptions(model="m", temperature=0.0, seed=1))
+        assert key != make_cache_key(
+            _messages(),
+            LLMOptions(model="m", temperature=0.0, response_format={"type": "json_object"}),
+        )
+
+
+class TestMemoryCache:
+    """Tests for the in-memory tier."""
+
+    def test_lru_eviction(self) -> None:
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") == "1"  # "b" is now least recently used
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_ttl_expiry(self) -> None:
+        cache = MemoryCache(ttl_seconds=0.01)
+        cache.set("a", "1")
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestSQLiteCache:
+    """Tests for the on-disk tier."""
+
+    def test_persists_across_instances(self, tmp_path) -> None:
+        path = tmp_path / "cache" / "llm.db"
+        first = SQLiteCache(path)
+        first.set("a", "1")
+        first.close()
+
+        second = SQLiteCache(path)
+        assert second.get("a") == "1"
+        second.close()
+
+    def test_disk_hit_promotes_to_memory(self, tmp_path) -> None:
+        disk = SQLiteCache(tmp_path / "llm.db")
+        disk.set("a", "1")
+        cache = ResponseCache(disk=disk)
+
+        assert cache.get("a") == "1"
+        assert cache.get("a") == "1"
+
+        stats = cache.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["memory_hits"] == 1
+        disk.close()
+
+
+class TestClientCaching:
+    """Tests for the cache integration in LLMClient.chat."""
+
+    def test_deterministic_calls_are_cached(self) -> None:
+        cache = ResponseCache()
+        client = MockClient(responses=["first", "second"], cache=cache)
+        options = LLMOptions(temperature=0.0)
+
+        first = client.chat(_messages(), LLMOptions(**options.model_dump()))
+        second = client.chat(_messages(), LLMOptions(**options.model_dump()))
+
+        assert first.content == "first"
+        assert second.content == "first"
+        assert second.message == "Cached response"
+        assert client.chat_call_count == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_sampled_calls_bypass_cache(self) -> None:
+        cache = ResponseCache()
+        client = MockClient(responses=["first", "second"], cache=cache)
+
+        client.chat(_messages(), LLMOptions(temperature=0.7))
+        client.chat(_messages(), LLMOptions(temperature=0.7))
+        client.chat(_messages(), LLMOptions(temperature=0.0), callback=lambda _: None)
+
+        assert client.chat_call_count == 3
+        assert cache.stats()["bypassed"] == 3
+        assert cache.stats()["hits"] == 0
+
+    def test_seeded_sampling_is_cached(self) -> None:
+        client = MockClient(responses=["first", "second"], cache=ResponseCache())
+
+        client.chat(_messages(), LLMOptions(temperature=0.7, seed=42))
+        result = client.chat(_messages(), LLMOptions(temperature=0.7, seed=42))
+
+        assert result.content == "first"
+        assert client.chat_call_count == 1
+
+    def test_from_config(self, tmp_path) -> None:
+        config = ResponseCacheConfig(
+            enabled=True, max_entries=10, path=str(tmp_path / "llm.db"), cache_sampled=True
+        )
+        cache = ResponseCache.from_config(config)
+
+        assert cache.memory.max_entries == 10
+        assert cache.disk is not None
+        assert cache.is_cacheable(LLMOptions(temperature=0.7))
@@ -0,0 +1,200 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/llms/test_chat_many.py
+# role: tests
+# neighbors: __init__.py, test_async_chat.py, test_cache.py, test_config.py, test_fallback.py, test_integration.py (+4 more)
+# exports: TestRateLimiter, TestChatMany, TestChatManySDKClient
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for bulk chat (chat_many) and client-side rate limiting.
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
+
+import pytest
+from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.llms.clients.base import LLMClient
+from quack_core.integrations.llms.clients.openai import OpenAIClient
+from quack_core.integrations.llms.models import ChatMessage, LLMOptions, RoleType
+from quack_core.integrations.llms.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    estimate_request_tokens,
+)
+from quack_core.integrations.llms.service.operations import chat_many
+
+from tests.test_integrations.llms.mocks.base import (
+    LoopBoundTransport,
+    sdk_client_factory,
+)
+from tests.test_integrations.llms.mocks.clients import MockClient
+from tests.test_integrations.llms.mocks.openai import OPENAI_COMPLETION
+
+
+class EchoClient(LLMClient):
+    """Client that echoes the prompt and tracks peak concurrency."""
+
+    def __init__(self, delay: float = 0.0, **kwargs):
+        super().__init__(model="echo", **kwargs)
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    async def _achat_with_provider(self, messages, options, callback=None):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        text = messages[-1].content
+        if text.startswith("fail"):
+            return IntegrationResult.error_result(f"cannot answer {text}")
+        return IntegrationResult.success_result(text.upper())
+
+    def _chat_with_provider(
+        self,
+        messages: list[ChatMessage],
+        options: LLMOptions,
+        callback: Callable[[str], None] | None = None,
+    ) -> IntegrationResult[str]:
+        raise NotImplementedError
+
+    def _count_tokens_with_provider(self, messages):
+        return IntegrationResult.success_result(0)
+
+
+def _integration(client: LLMClient, max_concurrency: int = 8) -> MagicMock:
+    integration = MagicMock()
+    integration.client = client
+    integration.config = {"max_concurrency": max_concurrency}
+    integration._using_mock = False
+    integration._ensure_initialized.return_value = None
+    return integration
+
+
+def _prompt(text: str) -> list[ChatMessage]:
+    return [ChatMessage(role=RoleType.USER, content=text)]
+
+
+class TestRateLimiter:
+    """Tests for TokenBucket and RateLimiter."""
+
+    def test_bucket_allows_burst_then_waits(self) -> None:
+        bucket = TokenBucket(capacity=2, refill_per_second=1.0)
+
+        assert bucket.reserve(1) == 0.0
+        assert bucket.reserve(1) == 0.0
+        assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+        assert bucket.reserve(1) == pytest.approx(2.0, abs=0.05)
+
+    def test_limiter_without_limits_is_none(self) -> None:
+        assert RateLimiter.from_limits(None, None) is None
+
+    def test_tokens_per_minute_limit(self) -> None:
+        limiter = RateLimiter(tokens_per_minute=600)  # 10 tokens per second
+
+        assert limiter.reserve(600) == 0.0
+        assert limiter.reserve(100) == pytest.approx(10.0, abs=0.1)
+
+    def test_estimate_request_tokens(self) -> None:
+        messages = [ChatMessage(role=RoleType.USER, content="x" * 400)]
+
+        assert estimate_request_tokens(messages, LLMOptions(max_tokens=50)) == 150
+
+    def test_client_waits_for_limiter(self) -> None:
+        limiter = RateLimiter(requests_per_minute=1)
+        client = MockClient(rate_limiter=limiter)
+
+        with patch("time.sleep") as mock_sleep:
+            client.chat(_prompt("one"))
+            client.chat(_prompt("two"))
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(60.0, abs=0.5)
+
+
+class TestChatMany:
+    """Tests for the chat_many operation."""
+
+    def test_results_are_ordered_and_bounded(self) -> None:
+        client = EchoClient(delay=0.01)
+        prompts = [_prompt(f"item {i}") for i in range(20)]
+
+        batch = chat_many(_integration(client), prompts, max_concurrency=3)
+
+        assert batch.success is True
+        assert batch.succeeded == 20
+        assert batch.contents == [f"ITEM {i}" for i in range(20)]
+        assert 1 < client.peak <= 3
+
+    def test_partial_failures_are_reported(self) -> None:
+        prompts = [_prompt("ok 0"), _prompt("fail 1"), _prompt("ok 2"), _prompt("fail 3")]
+
+        batch = chat_many(_integration(EchoClient()), prompts)
+
+        assert batch.success is False
+        assert batch.succeeded == 2
+        assert batch.failed == 2
+        assert batch.failed_indices == [1, 3]
+        assert batch.contents == ["OK 0", None, "OK 2", None]
+
+    def test_per_request_options(self) -> None:
+        client = MockClient()
+        options = [LLMOptions(temperature=0.0), LLMOptions(temperature=1.0)]
+
+        chat_many(_integration(client), [_prompt("a"), _prompt("b")], options)
+
+        assert client.chat_call_count == 2
+        # Caller's options are not mutated by the client
+        assert options[0].model is None
+
+    def test_mismatched_options_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            chat_many(
+                _integration(MockClient()),
+                [_prompt("a"), _prompt("b")],
+                [LLMOptions()],
+            )
+
+    def test_uninitialized_integration(self) -> None:
+        integration = _integration(MockClient())
+        integration._ensure_initialized.return_value = IntegrationResult.error_result(
+            "not configured"
+        )
+
+        batch = chat_many(integration, [_prompt("a"), _prompt("b")])
+
+        assert batch.failed == 2
+        assert batch.results[0].error == "not configured"
+
+
+class TestChatManySDKClient:
+    """Tests for chat_many through a client backed by an async SDK."""
+
+    def test_repeated_calls(self) -> None:
+        openai = pytest.importorskip("openai")
+        transports: list[LoopBoundTransport] = []
+        client = OpenAIClient(api_key="test-key", model="gpt-4o", retry_count=0)
+        prompts = [_prompt(f"item {i}") for i in range(3)]
+
+        with patch.object(
+            openai,
+            "AsyncOpenAI",
+            sdk_client_factory(openai.AsyncOpenAI, OPENAI_COMPLETION, transports),
+        ):
+            first = chat_many(_integration(client), prompts)
+            second = chat_many(_integration(client), prompts)
+
+        assert first.succeeded == second.succeeded == 3
+        assert second.contents == ["Hi there"] * 3
+        # One SDK client per call, closed before its event loop ended
+        assert len(transports) == 2
+        assert all(len(transport.requests) == 3 for transport in transports)
+        assert client._async_client is None
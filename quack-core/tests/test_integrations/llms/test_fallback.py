@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/llms/test_fallback.py
 # role: tests
 # neighbors: __init__.py, test_config.py, test_config_provider.py, test_integration.py, test_llms.py, test_models.py (+3 more)
-# exports: TestFallbackConfig, TestProviderStatus, TestFallbackLLMClient
+# exports: TestFallbackConfig, TestProviderStatus, TestFallbackLLMClient, TestCircuitBreaker
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -18,7 +18,10 @@ import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.llms.cache import ResponseCache
 from quack_core.integrations.llms.fallback import (
+    CircuitState,
     FallbackConfig,
     FallbackLLMClient,
     ProviderStatus,
@@ -199,6 +202,32 @@ class TestFallbackLLMClient:
             fallback_client._get_client_for_provider("openai")
             assert mock_get_client.call_count == 1  # Should not be called again
 
+    def test_response_cache_stays_on_fallback_client(self) -> None:
+        """Test provider clients are not given the fallback client's cache."""
+        cache = ResponseCache()
+        client = FallbackLLMClient(
+            fallback_config=FallbackConfig(providers=["openai"]),
+            model_map={"openai": "gpt-4o"},
+            log_level=20,
+            cache=cache,
+            timeout=30,
+        )
+
+        with patch(
+            "quack_core.integrations.llms.registry.get_llm_client",
+            return_value=MagicMock(),
+        ) as mock_get_client:
+            client._get_client_for_provider("openai")
+
+        assert client.cache is cache
+        mock_get_client.assert_called_once_with(
+            provider="openai",
+            model="gpt-4o",
+            api_key=None,
+            log_level=20,
+            timeout=30,
+        )
+
     def test_get_client_initialization_error(
         self, fallback_client: FallbackLLMClient
     ) -> None:
@@ -319,3 +348,145 @@ class TestFallbackLLMClient:
             assert result.success is True
             assert result.content == 42
             assert "via openai" in result.message
+
+
+class TestCircuitBreaker:
+    """Tests for per-provider circuit breaking and latency ordering."""
+
+    MESSAGES = [ChatMessage(role=RoleType.USER, content="Test message")]
+
+    @staticmethod
+    def _client(**config) -> FallbackLLMClient:
+        return FallbackLLMClient(
+            fallback_config=FallbackConfig(
+                providers=["openai", "anthropic"],
+                max_attempts_per_provider=3,
+                delay_between_providers=0,
+                **config,
+            ),
+            log_level=20,
+        )
+
+    def test_status_opens_after_threshold(self) -> None:
+        status = ProviderStatus(provider="openai")
+        status.record_failure("boom", threshold=2)
+        assert status.circuit_state == CircuitState.CLOSED
+
+        status.record_failure("boom", threshold=2)
+        assert status.circuit_state == CircuitState.OPEN
+        assert status.allow_request(cooldown=30) is False
+
+    def test_status_half_open_probe(self) -> None:
+        status = ProviderStatus(provider="openai")
+        status.record_failure("boom", threshold=1)
+        opened = status.opened_at
+
+        # One probe after the cooldown, concurrent callers are still rejected
+        assert status.allow_request(cooldown=30, now=opened + 31) is True
+        assert status.circuit_state == CircuitState.HALF_OPEN
+        assert status.allow_request(cooldown=30, now=opened + 31) is False
+
+        # A failed probe re-opens the circuit even with the breaker threshold unmet
+        status.record_failure("still down", threshold=5)
+        assert status.circuit_state == CircuitState.OPEN
+
+        assert status.allow_request(cooldown=0) is True
+        status.record_success(latency=0.2)
+        assert status.circuit_state == CircuitState.CLOSED
+        assert status.consecutive_failures == 0
+
+    def test_status_latency_percentiles(self) -> None:
+        status = ProviderStatus(provider="openai")
+        for latency in range(1, 101):
+            status.record_success(latency=float(latency), window=20)
+
+        # Only the last 20 samples (81..100) are kept
+        assert status.p50_latency == 90.0
+        assert status.p95_latency == 99.0
+
+    def test_open_circuit_is_skipped_without_retries(self) -> None:
+        client = self._client(circuit_breaker_threshold=2)
+        failing = MagicMock()
+        failing.chat.side_effect = QuackApiError("Service unavailable", "OpenAI")
+        working = MockClient(responses=["Anthropic response"] * 2)
+        clients = {"openai": failing, "anthropic": working}
+
+        with patch.object(
+            client, "_get_client_for_provider", side_effect=clients.__getitem__
+        ):
+            with patch("time.sleep") as mock_sleep:
+                first = client._chat_with_provider(self.MESSAGES, LLMOptions())
+                second = client._chat_with_provider(self.MESSAGES, LLMOptions())
+
+        assert first.success is True
+        assert second.success is True
+        # The circuit opened on the second failure, cutting retries short, and
+        # the second request never touched openai
+        assert failing.chat.call_count == 2
+        mock_sleep.assert_called_once_with(1)
+        status = client._provider_status["openai"]
+        assert status.circuit_state == CircuitState.OPEN
+
+    def test_failed_result_moves_to_next_provider(self) -> None:
+        client = self._client()
+        failing = MagicMock()
+        failing.chat.return_value = IntegrationResult.error_result("Retries exhausted")
+        working = MockClient(responses=["Anthropic response"])
+        clients = {"openai": failing, "anthropic": working}
+
+        with patch.object(
+            client, "_get_client_for_provider", side_effect=clients.__getitem__
+        ):
+            with patch("time.sleep") as mock_sleep:
+                result = client._chat_with_provider(self.MESSAGES, LLMOptions())
+
+        assert result.content == "Anthropic response"
+        # The client retried internally already, so openai is asked only once
+        assert failing.chat.call_count == 1
+        mock_sleep.assert_not_called()
+        assert client._provider_status["openai"].consecutive_failures == 1
+
+    def test_token_count_failures_open_circuit(self) -> None:
+        client = self._client(circuit_breaker_threshold=2)
+        failing = MagicMock()
+        failing.count_tokens.side_effect = QuackApiError(
+            "Service unavailable", "OpenAI"
+        )
+        working = MagicMock()
+        working.count_tokens.return_value = IntegrationResult.success_result(42)
+        clients = {"openai": failing, "anthropic": working}
+
+        with patch.object(
+            client, "_get_client_for_provider", side_effect=clients.__getitem__
+        ):
+            for _ in range(3):
+                result = client._count_tokens_with_provider(self.MESSAGES)
+                assert result.content == 42
+
+        assert failing.count_tokens.call_count == 2
+        assert client._provider_status["openai"].circuit_state == CircuitState.OPEN
+        assert client._provider_status["anthropic"].success_count == 3
+
+    def test_all_circuits_open_fails_fast(self) -> None:
+        client = self._client(circuit_breaker_threshold=1)
+        for status in client.get_provider_status():
+            status.record_failure("down", threshold=1)
+
+        with patch.object(client, "_get_client_for_provider") as get_client:
+            result = client._chat_with_provider(self.MESSAGES, LLMOptions())
+
+        assert result.success is False
+        assert "open circuits" in result.error
+        get_client.assert_not_called()
+
+    def test_latency_weighted_ordering(self) -> None:
+        client = self._client(latency_weighted_ordering=True)
+        client._provider_status["openai"].record_success(latency=2.0)
+        client._provider_status["anthropic"].record_success(latency=0.5)
+
+        assert client._provider_order() == ["anthropic", "openai"]
+
+        # Providers without samples go after measured ones, in configured order
+        fresh = self._client(latency_weighted_ordering=True)
+        fresh._provider_status["anthropic"].record_success(latency=5.0)
+        assert fresh._provider_order() == ["anthropic", "openai"]
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/pandoc/operations/test_html_to_md.py
 # role: operations
 # neighbors: __init__.py, test_md_to_docx.py, test_utils.py, test_utils_fix.py
-# exports: test_post_process_markdown, test_convert_html_to_markdown_success, test_convert_html_to_markdown_validation_error, test_convert_html_to_markdown_conversion_failure, test_convert_html_to_markdown_validation_failure, test_validate_conversion_html_to_md, test_html_to_md_validate_input_success, test_html_to_md_validate_input_file_not_found (+7 more)
+# exports: test_post_process_markdown, test_convert_html_to_markdown_success, test_convert_html_to_markdown_validation_error, test_convert_html_to_markdown_conversion_failure, test_convert_html_to_markdown_validation_failure, test_validate_conversion_html_to_md, test_html_to_md_validate_input_success, test_html_to_md_validate_input_file_not_found (+11 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -24,9 +24,11 @@ from quack_core.integrations.pandoc import (
     PandocConfig,
 )
 from quack_core.integrations.pandoc.operations.html_to_md import (
+    convert_html_text_to_markdown,
     convert_html_to_markdown,
     post_process_markdown,
     validate_html_conversion,
+    validate_markdown_content,
 )
 from quack_core.lib.errors import QuackIntegrationError
 
@@ -54,6 +56,13 @@ def test_post_process_markdown():
     assert "\n\n\n" not in result  # No more than two consecutive newlines
 
 
+def test_post_process_markdown_fenced_divs():
+    """Test fenced div lines are removed without the text that follows them."""
+    markdown = "::: {.note}\n## Title\n\nBody\n:::\n\nNext paragraph\n\n\n\n- item\n"
+
+    assert post_process_markdown(markdown) == "## Title\n\nBody\n\nNext paragraph\n- item\n"
+
+
 @patch('quack_core.integrations.pandoc.operations.html_to_md._validate_input')
 @patch('quack_core.integrations.pandoc.operations.html_to_md._attempt_conversion')
 @patch('quack_core.integrations.pandoc.operations.html_to_md._write_and_validate_output')
@@ -69,7 +78,7 @@ def test_convert_html_to_markdown_success(mock_validate, mock_write, mock_conver
     mock_validate.return_value = []  # No validation errors
 
     # Patch track_metrics to avoid DataResult validation issues
-    with patch('quack_core.integrations.pandoc.operations.html_to_md.track_metrics',
+    with patch('quack_core.integrations.pandoc.operations.utils.track_metrics',
                patched_track_metrics):
         # Run conversion
         config = PandocConfig()
@@ -432,3 +441,65 @@ def test_html_to_md_attempt_conversion_pandoc_error():
             _attempt_conversion("input.html", config)
 
         assert "Pandoc conversion failed" in str(excinfo.value)
+
+
+HTML_PAGE = "<html><body><h1>Title</h1><p>" + "Some text. " * 20 + "</p></body></html>"
+MARKDOWN_PAGE = "# Title\n\n" + "Some text. " * 20
+
+
+def test_convert_html_text_to_markdown_in_memory():
+    """Test in-memory conversion does not touch the filesystem."""
+    config = PandocConfig()
+    config.retry_mechanism.conversion_retry_delay = 0
+    backend = MagicMock()
+    backend.convert_text.return_value = MARKDOWN_PAGE
+    metrics = ConversionMetrics()
+
+    with patch('quack_core.integrations.pandoc.operations.html_to_md.fs') as mock_fs:
+        result = convert_html_text_to_markdown(
+            HTML_PAGE.encode("utf-8"), config, metrics=metrics, backend=backend,
+            source_name="https://example.com/page",
+        )
+
+    assert result.success
+    markdown, details = result.content
+    assert markdown.startswith("# Title")
+    assert details.input_size == len(HTML_PAGE)
+    assert backend.convert_text.call_args.args[0] == HTML_PAGE
+    assert not mock_fs.method_calls
+    assert metrics.successful_conversions == 1
+
+
+def test_convert_html_text_to_markdown_writes_output_path():
+    """Test in-memory conversion writes the result when given an output path."""
+    config = PandocConfig()
+    backend = MagicMock()
+    backend.convert_text.return_value = MARKDOWN_PAGE
+
+    with patch('quack_core.integrations.pandoc.operations.html_to_md.fs') as mock_fs:
+        mock_fs.create_directory.return_value = SimpleNamespace(success=True)
+        mock_fs.write_text.return_value = SimpleNamespace(success=True)
+        result = convert_html_text_to_markdown(
+            HTML_PAGE, config, output_path="/out/page.md", backend=backend
+        )
+
+    assert result.success
+    mock_fs.write_text.assert_called_once_with(
+        "/out/page.md", result.content[0], encoding="utf-8"
+    )
+
+
+def test_convert_html_text_to_markdown_validation_failure():
+    """Test in-memory validation failures are retried and reported."""
+    config = PandocConfig()
+    config.retry_mechanism.max_conversion_retries = 2
+    config.retry_mechanism.conversion_retry_delay = 0
+    backend = MagicMock()
+    backend.convert_text.return_value = ""
+
+    result = convert_html_text_to_markdown(HTML_PAGE, config, backend=backend)
+
+    assert not result.success
+    assert "Output file is empty" in result.error
+    assert backend.convert_text.call_count == 2
+    assert validate_markdown_content(MARKDOWN_PAGE, len(HTML_PAGE), config) == []
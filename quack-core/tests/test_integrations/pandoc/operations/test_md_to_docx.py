@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/pandoc/operations/test_md_to_docx.py
 # role: operations
 # neighbors: __init__.py, test_html_to_md.py, test_utils.py, test_utils_fix.py
-# exports: test_convert_markdown_to_docx_success, test_convert_markdown_to_docx_validation_error, test_convert_markdown_to_docx_conversion_failure, test_convert_markdown_to_docx_validation_failure, test_validate_conversion_md_to_docx, test_md_to_docx_validate_markdown_input_success, test_md_to_docx_validate_markdown_input_file_not_found, test_md_to_docx_validate_markdown_input_read_error (+8 more)
+# exports: test_convert_markdown_to_docx_success, test_convert_markdown_to_docx_validation_error, test_convert_markdown_to_docx_conversion_failure, test_convert_markdown_to_docx_validation_failure, test_validate_conversion_md_to_docx, test_md_to_docx_validate_markdown_input_success, test_md_to_docx_validate_markdown_input_file_not_found, test_md_to_docx_validate_markdown_input_read_error (+10 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -25,6 +25,7 @@ from quack_core.integrations.pandoc import (
     PandocConfig,
 )
 from quack_core.integrations.pandoc.operations import (
+    convert_markdown_text_to_docx,
     convert_markdown_to_docx,
     validate_docx_conversion,
 )
@@ -44,7 +45,7 @@ from .test_utils_fix import (
     'quack_core.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once')
 @patch('quack_core.integrations.pandoc.operations.md_to_docx._get_conversion_output')
 @patch('quack_core.integrations.pandoc.operations.md_to_docx.validate_conversion')
-@patch('quack_core.integrations.pandoc.operations.md_to_docx.track_metrics',
+@patch('quack_core.integrations.pandoc.operations.utils.track_metrics',
        patched_track_metrics)
 def test_convert_markdown_to_docx_success(mock_validate, mock_get_output, mock_convert,
                                           mock_validate_input):
@@ -67,6 +68,41 @@ def test_convert_markdown_to_docx_success(mock_validate, mock_get_output, mock_c
     assert metrics.successful_conversions == 1
 
 
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
+@patch('quack_core.integrations.pandoc.operations.utils.track_metrics',
+       patched_track_metrics)
+def test_convert_markdown_to_docx_injected_backend_and_validator(mock_fs):
+    """Test that the given backend and validator are used for the conversion."""
+    mock_fs.get_file_info.return_value = SimpleNamespace(
+        success=True, exists=True, size=1000
+    )
+    mock_fs.read_text.return_value = SimpleNamespace(
+        success=True, content="# Title\n\nBody"
+    )
+    mock_fs.split_path.return_value = SimpleNamespace(
+        success=True, data=["docs", "input.md"]
+    )
+    mock_fs.join_path.return_value = SimpleNamespace(success=True, data="docs")
+    mock_fs.create_directory.return_value = SimpleNamespace(success=True)
+    backend = MagicMock()
+    validator = MagicMock(return_value=[])
+
+    config = PandocConfig()
+    result = convert_markdown_to_docx(
+        "docs/input.md",
+        "docs/output.docx",
+        config,
+        ConversionMetrics(),
+        backend=backend,
+        validator=validator,
+    )
+
+    assert result.success
+    assert backend.convert_file.call_args.args == ("docs/input.md", "docx")
+    validator.assert_called_once_with(
+        "docs/output.docx", "docs/input.md", 1000, config
+    )
+
 @patch('quack_core.integrations.pandoc.operations.md_to_docx._validate_markdown_input')
 def test_convert_markdown_to_docx_validation_error(mock_validate):
     """Test Markdown to DOCX conversion with validation error."""
@@ -110,7 +146,7 @@ def test_convert_markdown_to_docx_conversion_failure(mock_convert, mock_validate
     'quack_core.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once')
 @patch('quack_core.integrations.pandoc.operations.md_to_docx._get_conversion_output')
 @patch('quack_core.integrations.pandoc.operations.md_to_docx.validate_conversion')
-@patch('quack_core.integrations.pandoc.operations.md_to_docx.track_metrics',
+@patch('quack_core.integrations.pandoc.operations.utils.track_metrics',
        patched_track_metrics)
 def test_convert_markdown_to_docx_validation_failure(mock_validate, mock_get_output,
                                                      mock_convert, mock_validate_input):
@@ -135,7 +171,7 @@ def test_convert_markdown_to_docx_validation_failure(mock_validate, mock_get_out
     assert metrics.failed_conversions == 1
 
 
-@patch('quack_core.lib.fs.service.standalone')
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
 @patch('quack_core.integrations.pandoc.operations.utils.check_file_size',
        patched_check_file_size)
 @patch('quack_core.integrations.pandoc.operations.utils.check_conversion_ratio',
@@ -156,7 +192,7 @@ def test_validate_conversion_md_to_docx(mock_fs):
         mock_validate_docx.return_value = (True, [])
 
         errors = validate_docx_conversion("output.docx", "input.md", 100, config)
-        # # assert not errors  # Validation logic on mocks is brittle # Validation logic might be strict on mocked sizes
+        assert not errors
 
     # Test file size too small
     config.validation.min_file_size = 1000
@@ -166,6 +202,7 @@ def test_validate_conversion_md_to_docx(mock_fs):
 
     # Test conversion ratio too small
     config.validation.min_file_size = 50
+    mock_fs.get_file_info.side_effect = None
     mock_fs.get_file_info.return_value = SimpleNamespace(
         success=True, exists=True, size=5
     )
@@ -181,12 +218,12 @@ def test_validate_conversion_md_to_docx(mock_fs):
         config.validation.verify_structure = True
         errors = validate_docx_conversion("output.docx", "input.md", 100, config)
         assert errors
-        # assert any("Invalid DOCX structure" in error for error in errors)
+        assert any("Invalid DOCX structure" in error for error in errors)
 
 
 # --- Markdown to DOCX Operation Tests ---
 
-@patch('quack_core.lib.fs.service.standalone')
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
 def test_md_to_docx_validate_markdown_input_success(mock_fs):
     """Test successful validation of Markdown input."""
     # Setup mock fs
@@ -205,11 +242,11 @@ def test_md_to_docx_validate_markdown_input_success(mock_fs):
     result_size = _validate_markdown_input("test.md")
 
     assert result_size == 1000
-    # assert mock_fs.get_file_info.called
-    # assert mock_fs.read_text.called
+    assert mock_fs.get_file_info.called
+    assert mock_fs.read_text.called
 
 
-@patch('quack_core.lib.fs.service.standalone')
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
 def test_md_to_docx_validate_markdown_input_file_not_found(mock_fs):
     """Test validation of Markdown input when file is not found."""
     # Setup mock fs
@@ -228,7 +265,7 @@ def test_md_to_docx_validate_markdown_input_file_not_found(mock_fs):
     assert "Input file not found" in str(excinfo.value)
 
 
-@patch('quack_core.lib.fs.service.standalone')
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
 def test_md_to_docx_validate_markdown_input_read_error(mock_fs):
     """Test validation of Markdown input with read error."""
     # Setup mock fs
@@ -250,7 +287,7 @@ def test_md_to_docx_validate_markdown_input_read_error(mock_fs):
     assert "Could not read Markdown file" in str(excinfo.value)
 
 
-@patch('quack_core.lib.fs.service.standalone')
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
 def test_md_to_docx_validate_markdown_input_empty_file(mock_fs):
     """Test validation of empty Markdown input."""
     # Setup mock fs
@@ -274,9 +311,9 @@ def test_md_to_docx_validate_markdown_input_empty_file(mock_fs):
 
 def test_md_to_docx_convert_once_success():
     """Test successful single conversion of Markdown to DOCX."""
-    # Mock fs and pypandoc
-    with patch('quack_core.lib.fs.service.standalone') as mock_fs, \
-            patch('pypandoc.convert_file') as mock_convert:
+    backend = MagicMock()
+
+    with patch('quack_core.integrations.pandoc.operations.md_to_docx.fs') as mock_fs:
         # Setup mocks
         mock_fs.split_path.return_value = SimpleNamespace(
             success=True,
@@ -294,16 +331,20 @@ def test_md_to_docx_convert_once_success():
         )
 
         config = PandocConfig()
-        _convert_markdown_to_docx_once("test.md", "output.docx", config)
+        _convert_markdown_to_docx_once("test.md", "output.docx", config, backend)
 
-        assert mock_convert.called
-        # assert mock_fs.create_directory.called
+        backend.convert_file.assert_called_once()
+        call = backend.convert_file.call_args
+        assert call.args == ("test.md", "docx")
+        assert call.kwargs["from_format"] == "markdown"
+        assert call.kwargs["output_path"] == "output.docx"
+        mock_fs.create_directory.assert_called_once_with("path/to", exist_ok=True)
 
 
 def test_md_to_docx_convert_once_directory_error():
     """Test Markdown to DOCX conversion with directory creation error."""
     # Mock fs
-    with patch('quack_core.lib.fs.service.standalone') as mock_fs:
+    with patch('quack_core.integrations.pandoc.operations.md_to_docx.fs') as mock_fs:
         # Setup mock to fail directory creation
         mock_fs.split_path.return_value = SimpleNamespace(
             success=True,
@@ -329,7 +370,7 @@ def test_md_to_docx_convert_once_directory_error():
         assert "Failed to create output directory" in str(excinfo.value)
 
 
-@patch('quack_core.lib.fs.service.standalone')
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
 @patch('quack_core.integrations.pandoc.operations.md_to_docx.time')
 def test_md_to_docx_get_conversion_output_success(mock_time, mock_fs):
     """Test successful retrieval of conversion output metrics."""
@@ -351,7 +392,7 @@ def test_md_to_docx_get_conversion_output_success(mock_time, mock_fs):
     assert output_size == 2000
 
 
-@patch('quack_core.lib.fs.service.standalone')
+@patch('quack_core.integrations.pandoc.operations.md_to_docx.fs')
 def test_md_to_docx_get_conversion_output_file_info_error(mock_fs):
     """Test get conversion output with file info error."""
     # Setup mock to fail getting file info
@@ -375,7 +416,7 @@ def test_md_to_docx_get_conversion_output_file_info_error(mock_fs):
     'quack_core.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once')
 @patch('quack_core.integrations.pandoc.operations.md_to_docx._get_conversion_output')
 @patch('quack_core.integrations.pandoc.operations.md_to_docx.validate_conversion')
-@patch('quack_core.integrations.pandoc.operations.md_to_docx.track_metrics',
+@patch('quack_core.integrations.pandoc.operations.utils.track_metrics',
        patched_track_metrics)
 def test_convert_markdown_to_docx_full_success(mock_validate, mock_get_output,
                                                mock_convert, mock_validate_input):
@@ -446,7 +487,7 @@ def test_md_to_docx_check_metadata():
     )
 
     # Test with docx module available
-    with patch('quack_core.lib.fs.service.standalone') as mock_fs, \
+    with patch('quack_core.integrations.pandoc.operations.md_to_docx.fs') as mock_fs, \
             patch('importlib.import_module') as mock_import:
         mock_fs.split_path.return_value = SimpleNamespace(
             success=True,
@@ -465,7 +506,7 @@ def test_md_to_docx_check_metadata():
         assert mock_fs.split_path.called
 
     # Test with import error
-    with patch('quack_core.lib.fs.service.standalone') as mock_fs, \
+    with patch('quack_core.integrations.pandoc.operations.md_to_docx.fs') as mock_fs, \
             patch('importlib.import_module') as mock_import, \
             patch(
                 'quack_core.integrations.pandoc.operations.md_to_docx.logger') as mock_logger:
@@ -476,3 +517,36 @@ def test_md_to_docx_check_metadata():
 
         assert mock_import.called
         assert mock_logger.debug.called
+
+
+def _write_docx(source, to_format, from_format, output_path=None, extra_args=()):
+    with open(output_path, "wb") as f:
+        f.write(b"PK" + b"\0" * 200)
+    return ""
+
+
+def test_convert_markdown_text_to_docx_returns_bytes():
+    """Test in-memory Markdown to DOCX conversion returns the document bytes."""
+    config = PandocConfig()
+    config.validation.verify_structure = False
+    backend = MagicMock()
+    backend.convert_text.side_effect = _write_docx
+
+    result = convert_markdown_text_to_docx("# Title\n\nBody", config, backend=backend)
+
+    assert result.success
+    docx_bytes, details = result.content
+    assert docx_bytes.startswith(b"PK")
+    assert details.output_size == len(docx_bytes)
+    assert backend.convert_text.call_args.args[:2] == ("# Title\n\nBody", "docx")
+
+
+def test_convert_markdown_text_to_docx_empty_input():
+    """Test in-memory conversion rejects an empty document."""
+    backend = MagicMock()
+
+    result = convert_markdown_text_to_docx(b"  ", PandocConfig(), backend=backend)
+
+    assert not result.success
+    assert "empty" in result.error
+    assert not backend.convert_text.called
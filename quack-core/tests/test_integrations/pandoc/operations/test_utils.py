@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/pandoc/operations/test_utils.py
 # role: operations
 # neighbors: __init__.py, test_html_to_md.py, test_md_to_docx.py, test_utils_fix.py
-# exports: test_verify_pandoc_success, test_verify_pandoc_import_error, test_verify_pandoc_os_error, test_prepare_pandoc_args, test_get_file_info, test_validate_html_structure, test_validate_docx_structure, test_check_file_size (+2 more)
+# exports: test_verify_pandoc_success, test_verify_pandoc_import_error, test_verify_pandoc_os_error, test_prepare_pandoc_args, test_get_file_info, test_validate_html_structure, test_validate_html_structure_stops_early, test_validate_docx_structure (+4 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -16,6 +16,7 @@ and metrics tracking.
 """
 
 import time
+from html.parser import HTMLParser
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -27,6 +28,7 @@ from quack_core.integrations.pandoc import (
 from quack_core.integrations.pandoc.operations.utils import (
     get_file_info,
     prepare_pandoc_args,
+    run_conversion_attempts,
     validate_docx_structure,
     validate_html_structure,
     verify_pandoc,
@@ -127,35 +129,50 @@ def test_get_file_info(mock_fs):
     # get_file_info('missing.html')
 
 
-@patch('bs4.BeautifulSoup')
-def test_validate_html_structure(mock_soup_class):
+def test_validate_html_structure():
     """Test validation of HTML document structure."""
-    # Create a mock BeautifulSoup instance
-    mock_soup = MagicMock()
-    mock_soup.find.return_value = True  # Default to finding body tag
-    mock_soup.find_all.return_value = []  # No links by default
-    mock_soup_class.return_value = mock_soup
-
     # Valid HTML
     valid, errors = validate_html_structure("<html><body><h1>Title</h1></body></html>")
     assert valid
     assert not errors
 
     # Invalid HTML (no body)
-    mock_soup.find.return_value = False
     valid, errors = validate_html_structure("<html><head></head></html>")
     assert not valid
     assert "missing body" in errors[0].lower()
 
     # Check links
-    mock_soup.find.return_value = True
-    mock_soup.find_all.return_value = [
-        MagicMock(get=lambda attr: "")  # Empty href
-    ]
     valid, errors = validate_html_structure(
-        "<html><body><a href=\"\"></a></body></html>", check_links=True)
+        "<html><body><a href=\"\"></a><a href=\"/ok\">ok</a><a></a></body></html>",
+        check_links=True)
     assert not valid
     assert "empty links" in errors[0].lower()
+    assert "Found 2 " in errors[0]
+
+
+def test_validate_html_structure_stops_early():
+    """Test the HTML scan stops once body and headings have been seen."""
+    html = "<html><body><h1>Title</h1>" + "<p>text</p>" * 20000 + "</body></html>"
+
+    with patch(
+            'quack_core.integrations.pandoc.operations.utils._HTMLStructureScanner.feed',
+            autospec=True,
+            side_effect=HTMLParser.feed,
+    ) as mock_feed:
+        valid, errors = validate_html_structure(html)
+
+    assert valid
+    assert mock_feed.call_count == 1
+
+    # Link checks need the whole document
+    with patch(
+            'quack_core.integrations.pandoc.operations.utils._HTMLStructureScanner.feed',
+            autospec=True,
+            side_effect=HTMLParser.feed,
+    ) as mock_feed:
+        validate_html_structure(html, check_links=True)
+
+    assert mock_feed.call_count > 1
 
 
 @patch('docx.Document')
@@ -253,3 +270,48 @@ def test_track_metrics(mock_logger):
     # Verify metrics were not recorded
     assert "test2.html" not in metrics.conversion_times
     assert "test2.html" not in metrics.file_sizes
+
+
+@patch('quack_core.integrations.pandoc.operations.utils.time.sleep')
+def test_run_conversion_attempts(mock_sleep):
+    """Test failed and invalid attempts are retried and the result recorded."""
+    config = PandocConfig()
+    config.retry_mechanism.max_conversion_retries = 3
+    metrics = ConversionMetrics()
+    outcomes = [
+        QuackIntegrationError("Pandoc failed"),
+        ("bad", 0.1, 5, ["Output file is empty"]),
+        ("# Title", 0.2, 7, []),
+    ]
+
+    def attempt(start_time):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    result = run_conversion_attempts(
+        attempt, "in.html", 10, "html", "markdown", "HTML to Markdown",
+        config, metrics, metrics_name="in",
+    )
+
+    assert result.success
+    output, details = result.content
+    assert output == "# Title"
+    assert (details.output_size, details.input_size) == (7, 10)
+    assert mock_sleep.call_count == 2
+    assert metrics.successful_conversions == 1
+    assert metrics.file_sizes["in"]["converted"] == 7
+
+    # The last failure is reported once retries run out
+    metrics = ConversionMetrics()
+    outcomes = [("bad", 0.1, 5, ["Output file is empty"])] * 3
+    result = run_conversion_attempts(
+        attempt, "in.html", 10, "html", "markdown", "HTML to Markdown",
+        config, metrics,
+    )
+
+    assert not result.success
+    assert "Output file is empty" in result.error
+    assert metrics.failed_conversions == 1
+    assert metrics.errors["in.html"] == "Output file is empty"
@@ -0,0 +1,166 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/pandoc/test_cache.py
+# role: tests
+# neighbors: __init__.py, conftest.py, mocks.py, test-pandoc-integration-full.py, test_config.py, test_converter.py (+5 more)
+# exports: test_make_key_depends_on_content_args_and_version, test_store_and_fetch, test_fetch_hardlink, test_hardlink_miss_detaches_output, test_evict_least_recently_used, test_store_scans_only_when_over_limit, test_converter_reuses_cached_output
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for the pandoc conversion cache.
+"""
+
+import os
+from unittest.mock import patch
+
+from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.pandoc import DocumentConverter, FileInfo, PandocConfig
+from quack_core.integrations.pandoc.cache import ConversionCache
+
+
+def _write(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return str(path)
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_make_key_depends_on_content_args_and_version(tmp_path):
+    """Test the cache key changes with the input, arguments and pandoc version."""
+    source = _write(tmp_path / "a.html", "<p>one</p>")
+    key = ConversionCache.make_key(source, ["--wrap=none"], "html", "markdown", "3.1")
+
+    assert key == ConversionCache.make_key(
+        source, ["--wrap=none"], "html", "markdown", "3.1"
+    )
+    assert key != ConversionCache.make_key(
+        source, ["--wrap=auto"], "html", "markdown", "3.1"
+    )
+    assert key != ConversionCache.make_key(
+        source, ["--wrap=none"], "html", "markdown", "3.2"
+    )
+    assert key != ConversionCache.make_key(
+        source, ["--wrap=none"], "html", "gfm", "3.1"
+    )
+
+    _write(source, "<p>two</p>")
+    assert key != ConversionCache.make_key(
+        source, ["--wrap=none"], "html", "markdown", "3.1"
+    )
+
+
+def test_store_and_fetch(tmp_path):
+    """Test a stored output is copied to later outputs."""
+    cache = ConversionCache(str(tmp_path / "cache"), max_size=1024)
+    output = _write(tmp_path / "out.md", "# Title")
+
+    assert not cache.fetch("ab" * 32, str(tmp_path / "other.md"))
+
+    cache.store("ab" * 32, output)
+    target = str(tmp_path / "copy.md")
+    assert cache.fetch("ab" * 32, target)
+    assert _read(target) == "# Title"
+    # A copy, not a link
+    assert os.stat(target).st_nlink == 1
+
+
+def test_fetch_hardlink(tmp_path):
+    """Test hardlink mode links cached outputs into place."""
+    cache = ConversionCache(str(tmp_path / "cache"), max_size=1024, hardlink=True)
+    cache.store("cd" * 32, _write(tmp_path / "out.md", "# Title"))
+
+    target = str(tmp_path / "linked.md")
+    _write(target, "stale")
+    assert cache.fetch("cd" * 32, target)
+    assert _read(target) == "# Title"
+    assert os.stat(target).st_nlink == 2
+
+
+def test_hardlink_miss_detaches_output(tmp_path):
+    """Test a miss unlinks an output still linked to a cache entry."""
+    cache = ConversionCache(str(tmp_path / "cache"), max_size=1024, hardlink=True)
+    cache.store("cd" * 32, _write(tmp_path / "out.md", "# Title"))
+    target = str(tmp_path / "linked.md")
+    cache.fetch("cd" * 32, target)
+
+    assert not cache.fetch("ef" * 32, target)
+    assert not os.path.exists(target)
+    # Rewriting the output cannot change the cached entry
+    _write(target, "new content")
+    assert cache.fetch("cd" * 32, str(tmp_path / "check.md"))
+    assert _read(tmp_path / "check.md") == "# Title"
+
+
+def test_evict_least_recently_used(tmp_path):
+    """Test eviction drops the least recently used entries first."""
+    cache = ConversionCache(str(tmp_path / "cache"), max_size=25)
+    for index, key in enumerate(("aa" * 32, "bb" * 32)):
+        cache.store(key, _write(tmp_path / f"{index}.md", "x" * 10))
+        entry = os.path.join(cache.cache_dir, key[:2], key)
+        os.utime(entry, (1000 + index, 1000 + index))
+
+    # Using the older entry makes the other one least recently used
+    assert cache.fetch("aa" * 32, str(tmp_path / "hit.md"))
+    cache.store("cc" * 32, _write(tmp_path / "2.md", "x" * 10))
+
+    assert cache.fetch("aa" * 32, str(tmp_path / "a.md"))
+    assert cache.fetch("cc" * 32, str(tmp_path / "c.md"))
+    assert not cache.fetch("bb" * 32, str(tmp_path / "b.md"))
+
+
+def test_store_scans_only_when_over_limit(tmp_path):
+    """Test store keeps a running size and rescans only to evict."""
+    cache = ConversionCache(str(tmp_path / "cache"), max_size=35)
+    output = _write(tmp_path / "out.md", "x" * 10)
+
+    with patch.object(cache, "_scan_entries", wraps=cache._scan_entries) as scan:
+        for key in ("aa" * 32, "bb" * 32, "cc" * 32):
+            cache.store(key, output)
+        # Replacing an entry does not change the total
+        cache.store("aa" * 32, output)
+        assert scan.call_count == 1
+
+        cache.store("dd" * 32, output)
+        assert scan.call_count == 2
+
+    assert cache._size == 30
+    assert len(cache._scan_entries()) == 3
+
+
+def test_converter_reuses_cached_output(mock_pypandoc, tmp_path):
+    """Test DocumentConverter serves repeated conversions from the cache."""
+    config = PandocConfig()
+    config.cache.enabled = True
+    config.cache.cache_dir = str(tmp_path / "cache")
+    converter = DocumentConverter(config)
+
+    source = _write(tmp_path / "page.html", "<h1>Title</h1>")
+    output = str(tmp_path / "out" / "page.md")
+    os.makedirs(os.path.dirname(output))
+
+    def fake_convert(input_path, output_path, config, metrics, backend=None):
+        _write(output_path, "# Title")
+        return IntegrationResult.success_result((output_path, None))
+
+    with patch(
+            'quack_core.integrations.pandoc.converter.get_file_info',
+            return_value=FileInfo(path=source, format="html", size=14),
+    ), patch(
+        'quack_core.integrations.pandoc.operations.convert_html_to_markdown',
+        side_effect=fake_convert,
+    ) as mock_convert:
+        first = converter.convert_file(source, output, "markdown")
+        os.remove(output)
+        second = converter.convert_file(source, output, "markdown")
+
+    assert first.success and second.success
+    assert mock_convert.call_count == 1
+    assert _read(output) == "# Title"
+    assert converter.metrics.cache_hits == 1
+    assert converter.metrics.cache_misses == 1
+    assert converter.metrics.cache_hit_rate == 0.5
@@ -2,16 +2,19 @@
 # path: quack-core/tests/test_integrations/pandoc/test_converter.py
 # role: tests
 # neighbors: __init__.py, conftest.py, mocks.py, test-pandoc-integration-full.py, test_config.py, test_models.py (+4 more)
-# exports: test_document_converter_initialization, test_convert_file_html_to_markdown_success, test_convert_file_markdown_to_docx_success, test_convert_file_unsupported_format, test_convert_file_integration_error, test_convert_batch_all_success, test_convert_batch_partial_failure, test_convert_batch_all_failure (+1 more)
+# exports: test_document_converter_initialization, test_convert_file_html_to_markdown_success, test_convert_file_markdown_to_docx_success, test_convert_file_unsupported_format, test_convert_file_integration_error, test_convert_batch_all_success, test_convert_batch_partial_failure, test_convert_batch_all_failure (+5 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
 
+import threading
 import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from quack_core.integrations.core.results import IntegrationResult
+from quack_core.integrations.pandoc import converter as converter_module
 from quack_core.integrations.pandoc import (
     ConversionMetrics,
     ConversionTask,
@@ -54,7 +57,8 @@ def test_convert_file_html_to_markdown_success(mock_pypandoc, fs_stub):
         assert result.success
         assert mock_convert.called
         mock_convert.assert_called_once_with(
-            "input.html", "output.md", config, converter.metrics
+            "input.html", "output.md", config, converter.metrics,
+            backend=converter.backend,
         )
 
 
@@ -79,7 +83,8 @@ def test_convert_file_markdown_to_docx_success(mock_pypandoc, fs_stub):
         assert result.success
         assert mock_convert.called
         mock_convert.assert_called_once_with(
-            "input.md", "output.docx", config, converter.metrics
+            "input.md", "output.docx", config, converter.metrics,
+            backend=converter.backend,
         )
 
 
@@ -229,6 +234,142 @@ def test_convert_batch_all_failure(mock_pypandoc):
         assert mock_convert.call_count == 2
 
 
+def _batch_tasks(count):
+    return [
+        ConversionTask(
+            source=FileInfo(path=f"file{i}.html", format="html", size=100,
+                            modified=None, extra_args=[]),
+            target_format="markdown",
+            output_path=f"output{i}.md"
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _thread_pool(max_workers, started):
+    # Worker processes cannot see patched converters, so run the worker
+    # code on a single thread instead
+    converter_module._worker_started = started
+    return ThreadPoolExecutor(max_workers=1)
+
+
+class _QueuedPool(ThreadPoolExecutor):
+    """
+    Thread pool whose futures report running as soon as they are submitted,
+    as ProcessPoolExecutor's do while they wait in its call queue.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        outer = Future()
+        outer.set_running_or_notify_cancel()
+
+        def forward(inner):
+            if inner.cancelled():
+                outer.set_exception(CancelledError())
+            elif inner.exception() is not None:
+                outer.set_exception(inner.exception())
+            else:
+                outer.set_result(inner.result())
+
+        super().submit(fn, *args, **kwargs).add_done_callback(forward)
+        return outer
+
+
+def _queued_pool(max_workers, started):
+    converter_module._worker_started = started
+    return _QueuedPool(max_workers=max_workers)
+
+
+def test_convert_batch_with_workers(mock_pypandoc):
+    """Test batch conversion through the worker pool merges worker metrics."""
+    converter = DocumentConverter(PandocConfig())
+    worker = DocumentConverter(PandocConfig())
+
+    with patch.object(worker, 'convert_file') as mock_convert, \
+            patch.object(converter, '_start_worker_pool', side_effect=_thread_pool) as mock_pool, \
+            patch('quack_core.integrations.pandoc.converter._worker_converter', worker), \
+            patch('quack_core.integrations.pandoc.converter._worker_started', None), \
+            patch('quack_core.integrations.pandoc.converter._file_size', return_value=100):
+        mock_convert.side_effect = lambda input_path, output_path, format_: (
+            IntegrationResult.success_result(output_path)
+        )
+
+        result = converter.convert_batch(_batch_tasks(3), max_workers=2)
+
+    assert result.success
+    assert sorted(result.content) == ["output1.md", "output2.md", "output3.md"]
+    assert converter.metrics.successful_conversions == 3
+    assert converter.metrics.batch_files == 3
+    assert set(converter.metrics.wall_times) == {"file1.html", "file2.html", "file3.html"}
+    assert converter.metrics.bytes_in == 300
+    assert converter.metrics.batch_wall_time > 0
+    # Without a task timeout nothing reads start signals, so workers get no queue
+    assert mock_pool.call_args.args[1] is None
+
+
+def test_convert_batch_task_timeout(mock_pypandoc):
+    """Test a file that exceeds the task timeout fails and the rest still run."""
+    converter = DocumentConverter(PandocConfig())
+    worker = DocumentConverter(PandocConfig())
+
+    def slow_first_file(input_path, output_path, format_):
+        if input_path == "file1.html":
+            time.sleep(0.5)
+        return IntegrationResult.success_result(output_path)
+
+    with patch.object(worker, 'convert_file', side_effect=slow_first_file), \
+            patch.object(converter, '_start_worker_pool', side_effect=_thread_pool) as mock_pool, \
+            patch('quack_core.integrations.pandoc.converter._worker_converter', worker), \
+            patch('quack_core.integrations.pandoc.converter._worker_started', None):
+        result = converter.convert_batch(_batch_tasks(2), task_timeout=0.1)
+
+    assert result.success
+    assert result.content == ["output2.md"]
+    assert "timed out" in converter.metrics.errors["file1.html"]
+    # The pool is replaced after a timeout
+    assert mock_pool.call_count == 2
+
+
+def test_convert_batch_timeout_starts_when_worker_starts(mock_pypandoc):
+    """Test time spent queued behind a busy worker does not count as running."""
+    converter = DocumentConverter(PandocConfig())
+    worker = DocumentConverter(PandocConfig())
+
+    def slowish(input_path, output_path, format_):
+        time.sleep(0.3)
+        return IntegrationResult.success_result(output_path)
+
+    with patch.object(worker, 'convert_file', side_effect=slowish), \
+            patch.object(converter, '_start_worker_pool', side_effect=_queued_pool) as mock_pool, \
+            patch('quack_core.integrations.pandoc.converter._worker_converter', worker), \
+            patch('quack_core.integrations.pandoc.converter._worker_started', None):
+        result = converter.convert_batch(_batch_tasks(2), max_workers=1, task_timeout=0.5)
+
+    assert result.success
+    assert result.content == ["output1.md", "output2.md"]
+    assert not converter.metrics.errors
+    assert mock_pool.call_count == 1
+
+
+def test_convert_batch_cancelled(mock_pypandoc):
+    """Test a cancelled batch reports the unconverted files as failed."""
+    converter = DocumentConverter(PandocConfig())
+    cancel_event = threading.Event()
+
+    def cancel_after_first(input_path, output_path, format_):
+        cancel_event.set()
+        return IntegrationResult.success_result(output_path)
+
+    with patch.object(converter, 'convert_file', side_effect=cancel_after_first) as mock_convert:
+        result = converter.convert_batch(_batch_tasks(3), cancel_event=cancel_event)
+
+    assert result.success
+    assert result.content == ["output1.md"]
+    assert mock_convert.call_count == 1
+    assert converter.metrics.errors["file2.html"] == "Conversion cancelled"
+    assert converter.metrics.errors["file3.html"] == "Conversion cancelled"
+
+
 def test_validate_conversion(mock_pypandoc, fs_stub):
     """Test document validation after conversion."""
     config = PandocConfig()
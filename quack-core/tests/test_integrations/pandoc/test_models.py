@@ -100,6 +100,30 @@ def test_conversion_metrics_initialization():
     assert metrics.failed_conversions == 2
 
 
+def test_conversion_metrics_merge():
+    """Test merging worker metrics and batch throughput."""
+    metrics = ConversionMetrics(total_attempts=1, successful_conversions=1)
+    metrics.batch_wall_time = 2.0
+
+    worker = ConversionMetrics(successful_conversions=1, failed_conversions=1)
+    worker.errors["b.html"] = "Conversion failed"
+    worker.wall_times["a.html"] = 0.5
+    worker.bytes_in = 300
+    worker.bytes_out = 100
+    worker.batch_files = 2
+
+    metrics.merge(worker)
+
+    assert metrics.total_attempts == 1
+    assert metrics.successful_conversions == 2
+    assert metrics.failed_conversions == 1
+    assert metrics.errors == {"b.html": "Conversion failed"}
+    assert metrics.wall_times == {"a.html": 0.5}
+    assert metrics.files_per_second == 1.0
+    assert metrics.bytes_per_second == 150.0
+    assert ConversionMetrics().files_per_second == 0.0
+
+
 def test_conversion_details_initialization():
     """Test initialization of ConversionDetails model."""
     # Default initialization
@@ -464,31 +464,28 @@ def test_track_metrics_logging(mock_logger):
 
 def test_validate_html_structure_edge_cases():
     """Test edge cases for validate_html_structure utility."""
-    # Test with parsing error
-    mock_bs = MagicMock()
-    mock_soup = MagicMock()
-    mock_soup.find.return_value = True
-    mock_bs.BeautifulSoup.return_value = mock_soup
-    mock_bs.BeautifulSoup.side_effect = [mock_soup, Exception("Parsing error")]
-
-    with patch.dict(sys.modules, {'bs4': mock_bs}):
-        # First test valid HTML
-        valid, errors = validate_html_structure("<html><body>content</body></html>")
-        assert valid
-        assert not errors
+    # Valid HTML
+    valid, errors = validate_html_structure("<html><body>content</body></html>")
+    assert valid
+    assert not errors
 
-        # Then test invalid parsing
-        mock_bs.BeautifulSoup.side_effect = Exception("Parsing error")
+    # Test parsing error
+    with patch(
+            'quack_core.integrations.pandoc.operations.utils._HTMLStructureScanner.feed',
+            side_effect=Exception("Parsing error")):
         valid, errors = validate_html_structure("<invalid><html>")
         assert not valid
         assert "validation error" in errors[0].lower()
 
-        # Test missing body
-        mock_bs.BeautifulSoup.side_effect = None
-        mock_soup.find.return_value = False
-        valid, errors = validate_html_structure("<html>content</html>")
-        assert not valid
-        assert "missing body tag" in errors[0].lower()
+    # Test missing body
+    valid, errors = validate_html_structure("<html>content</html>")
+    assert not valid
+    assert "missing body tag" in errors[0].lower()
+
+    # A body tag split across scan chunks is still found
+    with patch('quack_core.integrations.pandoc.operations.utils._HTML_SCAN_CHUNK_SIZE', 3):
+        valid, errors = validate_html_structure("<html><body><h1>T</h1></body></html>")
+        assert valid
 
 
 def test_validate_docx_structure_edge_cases(monkeypatch):
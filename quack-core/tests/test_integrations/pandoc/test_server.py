@@ -0,0 +1,241 @@
+# === QV-LLM:BEGIN ===
+# path: quack-core/tests/test_integrations/pandoc/test_server.py
+# role: tests
+# neighbors: __init__.py, conftest.py, mocks.py, test-pandoc-integration-full.py, test_cache.py, test_config.py (+6 more)
+# exports: fake_server, test_server_options, test_convert_text_reuses_connection, test_convert_file_writes_binary_output, test_unsupported_args_use_fallback, test_unreachable_server_uses_fallback, test_local_server_restarts_after_crash, test_start_before_pickling_shares_server, test_converter_uses_server_backend, test_worker_pool_starts_server_first
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for the pandoc server backend.
+
+A small HTTP server stands in for pandoc server, so these tests do not
+need pandoc installed.
+"""
+
+import base64
+import json
+import multiprocessing
+import pickle
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+from quack_core.integrations.pandoc import (
+    DocumentConverter,
+    PandocConfig,
+    PandocServerBackend,
+)
+from quack_core.integrations.pandoc.config import ServerConfig
+from quack_core.integrations.pandoc.server import _server_options
+
+# Stand-in for pandoc server: answers /version and upper-cases the posted text
+FAKE_SERVER_SCRIPT = """
+import json, sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, body):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._send(b"3.1.11")
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._send(json.dumps({"output": request["text"].upper(), "base64": False}).encode())
+
+    def log_message(self, *args):
+        pass
+
+port = int(sys.argv[sys.argv.index("--port") + 1])
+HTTPServer(("127.0.0.1", port), Handler).serve_forever()
+"""
+
+
+class _UnusedFallback:
+    """Picklable fallback backend for tests that never fall back."""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(request)
+        self.server.ports.add(self.client_address[1])
+        if request["to"] == "docx":
+            response = {"output": base64.b64encode(b"PK-docx").decode(), "base64": True}
+        else:
+            response = {"output": f"# {request['text']}", "base64": False}
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server():
+    """Run a pandoc-server stand-in and yield it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.requests = []
+    server.ports = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _backend(server, fallback=None):
+    config = ServerConfig(enabled=True, url=f"http://127.0.0.1:{server.server_port}/")
+    return PandocServerBackend(config, fallback=fallback or MagicMock())
+
+
+def test_server_options():
+    """Test command-line arguments are translated to server options."""
+    assert _server_options(
+        ["--wrap=none", "--standalone", "--markdown-headings=atx", "--strip-comments",
+         "--no-highlight", "--columns=72"]
+    ) == {
+        "wrap": "none",
+        "standalone": True,
+        "markdown-headings": "atx",
+        "strip-comments": True,
+        "highlight-style": None,
+        "columns": 72,
+    }
+    assert _server_options(["--resource-path=/img"]) is None
+
+
+def test_convert_text_reuses_connection(fake_server):
+    """Test conversions go to the server over one keep-alive connection."""
+    with _backend(fake_server) as backend:
+        first = backend.convert_text("one", "markdown", "html", extra_args=["--wrap=none"])
+        second = backend.convert_text("two", "markdown", "html")
+
+    assert (first, second) == ("# one", "# two")
+    assert fake_server.requests[0] == {
+        "text": "one", "from": "html", "to": "markdown", "wrap": "none"
+    }
+    assert len(fake_server.ports) == 1
+
+
+def test_convert_file_writes_binary_output(fake_server, tmp_path):
+    """Test base64 output from the server is written to the output path."""
+    source = tmp_path / "in.md"
+    source.write_text("# Title", encoding="utf-8")
+    output = tmp_path / "out.docx"
+
+    with _backend(fake_server) as backend:
+        result = backend.convert_file(str(source), "docx", "markdown", str(output))
+
+    assert result == ""
+    assert output.read_bytes() == b"PK-docx"
+    assert fake_server.requests[0]["text"] == "# Title"
+
+
+def test_unsupported_args_use_fallback(fake_server):
+    """Test arguments the server cannot express go to the fallback backend."""
+    fallback = MagicMock()
+    fallback.convert_text.return_value = "from fallback"
+
+    with _backend(fake_server, fallback) as backend:
+        result = backend.convert_text(
+            "x", "markdown", "html", extra_args=["--resource-path=/img"]
+        )
+
+    assert result == "from fallback"
+    assert not fake_server.requests
+
+
+def test_unreachable_server_uses_fallback():
+    """Test an unreachable server switches the backend to subprocess mode."""
+    fallback = MagicMock()
+    fallback.convert_text.return_value = "from fallback"
+    config = ServerConfig(enabled=True, url="http://127.0.0.1:9/", timeout=1)
+
+    backend = PandocServerBackend(config, fallback=fallback)
+
+    assert backend.convert_text("x", "markdown", "html") == "from fallback"
+    assert backend.convert_text("y", "markdown", "html") == "from fallback"
+    assert fallback.convert_text.call_count == 2
+
+
+def test_local_server_restarts_after_crash(tmp_path):
+    """Test a supervised server is restarted after it exits."""
+    script = tmp_path / "fake_pandoc_server.py"
+    script.write_text(FAKE_SERVER_SCRIPT, encoding="utf-8")
+    config = ServerConfig(enabled=True, command=[sys.executable, str(script)])
+
+    with PandocServerBackend(config, fallback=MagicMock()) as backend:
+        assert backend.convert_text("one", "markdown", "html") == "ONE"
+        first_process = backend._process
+
+        first_process.kill()
+        first_process.wait()
+
+        assert backend.convert_text("two", "markdown", "html") == "TWO"
+        assert backend._process is not first_process
+        assert backend._restarts == 1
+
+    assert backend._process is None
+    assert first_process.poll() is not None
+
+
+def test_start_before_pickling_shares_server(tmp_path):
+    """Test a started backend hands its server to unpickled copies."""
+    script = tmp_path / "fake_pandoc_server.py"
+    script.write_text(FAKE_SERVER_SCRIPT, encoding="utf-8")
+    config = ServerConfig(enabled=True, command=[sys.executable, str(script)])
+
+    with PandocServerBackend(config, fallback=_UnusedFallback()) as backend:
+        assert backend.start()
+        copy = pickle.loads(pickle.dumps(backend))
+
+        assert copy.config.url == backend.url
+        assert copy.convert_text("one", "markdown", "html") == "ONE"
+        assert copy._process is None
+        copy.close()
+
+
+def test_converter_uses_server_backend(mock_pypandoc):
+    """Test DocumentConverter picks the server backend when enabled."""
+    config = PandocConfig()
+    config.server.enabled = True
+    config.server.url = "http://127.0.0.1:3030/"
+
+    converter = DocumentConverter(config)
+
+    assert isinstance(converter.backend, PandocServerBackend)
+    assert converter.backend.url == "http://127.0.0.1:3030/"
+
+
+def test_worker_pool_starts_server_first(mock_pypandoc):
+    """Test the server is started before the backend is sent to workers."""
+    config = ServerConfig(enabled=True)
+    backend = PandocServerBackend(config, fallback=MagicMock())
+    converter = DocumentConverter(PandocConfig(), backend=backend)
+    calls = []
+
+    with patch.object(backend, "start", side_effect=lambda: calls.append("start")), \
+            patch(
+                "quack_core.integrations.pandoc.converter.ProcessPoolExecutor",
+                side_effect=lambda **kwargs: calls.append("pool"),
+            ):
+        converter._start_worker_pool(2, multiprocessing.SimpleQueue())
+
+    assert calls == ["start", "pool"]
@@ -2,7 +2,7 @@
 # path: quack-core/tests/test_integrations/pandoc/test_service.py
 # role: tests
 # neighbors: __init__.py, conftest.py, mocks.py, test-pandoc-integration-full.py, test_config.py, test_converter.py (+4 more)
-# exports: setup_mocks, test_pandoc_integration_name_version, test_initialize_with_mocked_verify_pandoc, test_initialize_with_verify_pandoc_error, test_html_to_markdown_not_initialized, test_markdown_to_docx_not_initialized, test_convert_directory_not_initialized, test_is_pandoc_available (+3 more)
+# exports: setup_mocks, test_pandoc_integration_name_version, test_initialize_with_mocked_verify_pandoc, test_initialize_with_verify_pandoc_error, test_html_to_markdown_not_initialized, test_markdown_to_docx_not_initialized, test_convert_directory_not_initialized, test_is_pandoc_available (+5 more)
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -124,6 +124,15 @@ def test_markdown_to_docx_not_initialized():
     assert "not initialized" in result.error
 
 
+def test_html_text_to_markdown_not_initialized():
+    """Test in-memory HTML conversion when service is not initialized."""
+    integration = PandocIntegration()
+    result = integration.html_text_to_markdown("<html><body>x</body></html>")
+
+    assert not result.success
+    assert "not initialized" in result.error
+
+
 def test_convert_directory_not_initialized():
     """Test directory conversion when service is not initialized."""
     integration = PandocIntegration()
@@ -268,3 +277,34 @@ def test_convert_directory_with_initialized_service(mock_verify_pandoc, mock_exp
     )
     assert result.success
     assert mock_convert_batch.call_count == 2
+
+
+@patch('quack_core.lib.fs.service.standalone.expand_user_vars')
+@patch('quack_core.integrations.pandoc.service.verify_pandoc')
+def test_html_text_to_markdown_with_initialized_service(mock_verify_pandoc, mock_expand_user_vars, setup_mocks):
+    """Test in-memory HTML conversion is delegated to the converter."""
+    fs_stub, mock_paths_service = setup_mocks
+
+    mock_verify_pandoc.return_value = "2.11.0"
+    mock_expand_user_vars.side_effect = lambda x: x
+
+    integration = PandocIntegration()
+    integration.paths_service = mock_paths_service
+    integration.fs_service = fs_stub
+    integration.config_provider.load_config = MagicMock(
+        return_value=IntegrationResult(success=True, content={})
+    )
+    integration.initialize()
+
+    mock_convert_text = MagicMock(
+        return_value=IntegrationResult(success=True, content="# Title")
+    )
+    integration.converter.convert_text = mock_convert_text
+
+    result = integration.html_text_to_markdown("<h1>Title</h1>", source_name="page")
+
+    assert result.success
+    assert result.content == "# Title"
+    mock_convert_text.assert_called_once_with(
+        "<h1>Title</h1>", "html", "markdown", None, "page"
+    )
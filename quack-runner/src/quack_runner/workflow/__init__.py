@@ -2,8 +2,8 @@
 # path: quack-runner/src/quack_runner/workflow/__init__.py
 # module: quack_runner.workflow.__init__
 # role: module
-# neighbors: results.py, legacy.py, tool_runner.py
-# exports: ToolRunner
+# neighbors: results.py, legacy.py, tool_runner.py, batch.py
+# exports: ToolRunner, BatchManifest, BatchItem
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
 # === QV-LLM:END ===
@@ -18,6 +18,7 @@ This module provides the ToolRunner for executing doctrine-compliant tools
 
 NEW API (v2.0+):
 - ToolRunner: Execute tools, generate RunManifests
+- BatchManifest: Aggregate record written by ToolRunner.run_on_files()
 
 LEGACY API (deprecated, v1.x):
 - Available under quack_runner.workflow.legacy
@@ -30,11 +31,14 @@ Migration:
 - v4.0: Legacy removed
 """
 
-# NEW API: Only export ToolRunner
+# NEW API: ToolRunner plus the batch aggregate models
+from quack_runner.workflow.batch import BatchItem, BatchManifest
 from quack_runner.workflow.tool_runner import ToolRunner
 
 __all__ = [
     'ToolRunner',
+    'BatchManifest',
+    'BatchItem',
 ]
 
 # Example: New Pattern (v2.0+)
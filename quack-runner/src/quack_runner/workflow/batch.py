@@ -0,0 +1,318 @@
+# === QV-LLM:BEGIN ===
+# path: quack-runner/src/quack_runner/workflow/batch.py
+# module: quack_runner.workflow.batch
+# role: module
+# neighbors: __init__.py, results.py, legacy.py, tool_runner.py
+# exports: BatchItem, BatchManifest, ExecutorKind
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+
+"""
+Batch execution support for ToolRunner.
+
+ToolRunner.run_on_file() pays the full tool setup cost (initialize(), a fresh
+temp work dir, file checks) for every input. The batch path initializes the
+tool once per worker, then reuses that worker's context for every file it
+picks up. Each file still gets its own run_id and RunManifest.
+
+Workers come in two flavours:
+- thread: workers share the tool instance; initialize() runs once per thread
+- process: each worker process receives a pickled copy of the tool, the
+  request builder and the services; all of them must be picklable
+
+This module holds the worker state and the aggregate BatchManifest model.
+The public entry points are ToolRunner.run_on_files() and
+ToolRunner.run_on_directory().
+"""
+
+import math
+import shutil
+import statistics
+import tempfile
+from collections.abc import Callable
+from datetime import datetime
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+from quack_core.contracts import (
+    CapabilityStatus,
+    RunManifest,
+    ToolInfo,
+    generate_run_id,
+    utcnow,
+)
+
+if TYPE_CHECKING:
+    from quack_runner.workflow.tool_runner import ToolRunner
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class BatchItem(BaseModel):
+    """Per-file entry in a BatchManifest."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    input_path: str = Field(..., description="Input file path")
+    run_id: str = Field(..., description="run_id of the file's RunManifest")
+    status: CapabilityStatus = Field(..., description="Per-file status")
+    duration_sec: float = Field(..., ge=0.0, description="Per-file latency")
+    error_code: str | None = Field(None, description="Error code if failed")
+
+
+class BatchManifest(BaseModel):
+    """
+    Aggregate record of a ToolRunner batch.
+
+    Written next to the per-file outputs as batch.<batch_id>.json once the
+    batch has been fully consumed.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    batch_id: str = Field(default_factory=generate_run_id)
+    tool: ToolInfo
+    executor: ExecutorKind
+    max_workers: int = Field(..., ge=1)
+
+    started_at: datetime
+    finished_at: datetime
+    duration_sec: float = Field(..., ge=0.0)
+
+    total: int = 0
+    succeeded: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+    files_per_sec: float = Field(0.0, description="Completed files per wall second")
+    latency_mean_sec: float | None = None
+    latency_p50_sec: float | None = None
+    latency_p95_sec: float | None = None
+    latency_max_sec: float | None = None
+
+    items: list[BatchItem] = Field(default_factory=list)
+
+    @classmethod
+    def from_items(
+            cls,
+            batch_id: str,
+            tool: ToolInfo,
+            executor: ExecutorKind,
+            max_workers: int,
+            started_at: datetime,
+            items: list[BatchItem]
+    ) -> "BatchManifest":
+        """Build the aggregate from per-file items."""
+        finished_at = utcnow()
+        duration_sec = max((finished_at - started_at).total_seconds(), 0.0)
+        latencies = sorted(item.duration_sec for item in items)
+
+        stats: dict[str, float | None] = {
+            "latency_mean_sec": None,
+            "latency_p50_sec": None,
+            "latency_p95_sec": None,
+            "latency_max_sec": None,
+        }
+        if latencies:
+            stats["latency_mean_sec"] = statistics.fmean(latencies)
+            stats["latency_p50_sec"] = _percentile(latencies, 50)
+            stats["latency_p95_sec"] = _percentile(latencies, 95)
+            stats["latency_max_sec"] = latencies[-1]
+
+        return cls(
+            batch_id=batch_id,
+            tool=tool,
+            executor=executor,
+            max_workers=max_workers,
+            started_at=started_at,
+            finished_at=finished_at,
+            duration_sec=duration_sec,
+            total=len(items),
+            succeeded=sum(1 for i in items if i.status == CapabilityStatus.success),
+            skipped=sum(1 for i in items if i.status == CapabilityStatus.skipped),
+            failed=sum(1 for i in items if i.status == CapabilityStatus.error),
+            files_per_sec=len(items) / duration_sec if duration_sec > 0 else 0.0,
+            items=items,
+            **stats
+        )
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = math.ceil(pct / 100.0 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def batch_item_from_manifest(input_path: Path, manifest: RunManifest) -> BatchItem:
+    """Summarize a per-file RunManifest for the batch aggregate."""
+    return BatchItem(
+        input_path=str(input_path),
+        run_id=manifest.run_id,
+        status=manifest.status,
+        duration_sec=manifest.duration_sec or 0.0,
+        error_code=manifest.error.code if manifest.error else None
+    )
+
+
+class BatchWorker:
+    """
+    Per-worker state: one initialized tool context reused across files.
+
+    initialize() is called lazily on the first file. If it fails, every file
+    handled by this worker gets an error manifest carrying the init error,
+    matching what run_on_file() would have returned.
+    """
+
+    def __init__(
+            self,
+            runner: "ToolRunner",
+            output_dir: Path,
+            work_root: Path,
+            services: dict[str, Any] | None,
+            metadata: dict[str, Any] | None
+    ):
+        self.runner = runner
+        self.output_dir = output_dir
+        self.work_root = work_root
+        self.services = services
+        self.metadata = metadata
+
+        self.ctx = None
+        self.work_dir: Path | None = None
+        self._init_error: tuple[str, str] | None = None
+
+    def _ensure_initialized(self) -> None:
+        if self.ctx is not None:
+            return
+
+        self.work_dir = Path(tempfile.mkdtemp(prefix="worker_", dir=self.work_root))
+        self.ctx = self.runner.build_context(
+            run_id=generate_run_id(),
+            work_dir=str(self.work_dir),
+            output_dir=str(self.output_dir),
+            services=self.services,
+            metadata=self.metadata
+        )
+
+        try:
+            init_result = self.runner.tool.initialize(self.ctx)
+        except Exception as e:
+            self.runner.logger.exception(f"Tool initialization failed: {e}")
+            self._init_error = (f"Unexpected error: {e}", "QC_EXEC_ERROR")
+            return
+
+        if init_result.status != CapabilityStatus.success:
+            self._init_error = (
+                init_result.human_message,
+                init_result.machine_message or "QC_TOOL_INIT_ERROR"
+            )
+
+    def run(
+            self,
+            input_path: Path,
+            request_builder: Callable[[str | bytes], Any],
+            verify_input: bool
+    ) -> RunManifest:
+        """Run the tool on one file using this worker's context."""
+        started_at = utcnow()
+        self._ensure_initialized()
+
+        # Same worker context, fresh run identity per file
+        ctx = self.ctx.model_copy(update={"run_id": generate_run_id()})
+
+        if self._init_error is not None:
+            error_msg, error_code = self._init_error
+            return self.runner._build_error_manifest(
+                ctx=ctx,
+                input_path=input_path,
+                started_at=started_at,
+                error_msg=error_msg,
+                error_code=error_code
+            )
+
+        try:
+            return self.runner._execute(
+                ctx=ctx,
+                input_path=input_path,
+                request_builder=request_builder,
+                output_dir=self.output_dir,
+                started_at=started_at,
+                verify_input=verify_input
+            )
+        except Exception as e:
+            self.runner.logger.exception(f"Tool execution failed: {e}")
+            return self.runner._build_error_manifest(
+                ctx=ctx,
+                input_path=input_path,
+                started_at=started_at,
+                error_msg=f"Unexpected error: {e}",
+                error_code="QC_EXEC_ERROR"
+            )
+
+    def close(self) -> None:
+        """Run the tool cleanup hook once and drop the worker's work dir."""
+        if self.ctx is None:
+            return
+
+        if self.runner._has_cleanup:
+            try:
+                self.runner.tool.cleanup(self.ctx)  # type: ignore
+            except Exception as e:
+                self.runner.logger.warning(f"Cleanup failed: {e}")
+
+        if self.runner.cleanup_work_dir and self.work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+        self.ctx = None
+
+
+# Process-pool worker state (one BatchWorker per worker process)
+_process_worker: BatchWorker | None = None
+_process_request_builder: Callable[[str | bytes], Any] | None = None
+_process_verify_input: bool = True
+
+
+def init_process_worker(
+        tool: Any,
+        cleanup_work_dir: bool,
+        request_builder: Callable[[str | bytes], Any],
+        output_dir: str,
+        work_root: str,
+        services: dict[str, Any] | None,
+        metadata: dict[str, Any] | None,
+        verify_input: bool
+) -> None:
+    """ProcessPoolExecutor initializer: build this process's BatchWorker."""
+    global _process_worker, _process_request_builder, _process_verify_input
+
+    from quack_runner.workflow.tool_runner import ToolRunner
+
+    runner = ToolRunner(tool, cleanup_work_dir=cleanup_work_dir)
+    _process_worker = BatchWorker(
+        runner=runner,
+        output_dir=Path(output_dir),
+        work_root=Path(work_root),
+        services=services,
+        metadata=metadata
+    )
+    _process_request_builder = request_builder
+    _process_verify_input = verify_input
+
+    # Worker processes exit via os._exit, so atexit hooks never fire;
+    # multiprocessing finalizers do.
+    mp_util.Finalize(None, _process_worker.close, exitpriority=10)
+
+
+def run_in_process_worker(input_path: str) -> RunManifest:
+    """ProcessPoolExecutor task: run one file on this process's worker."""
+    if _process_worker is None or _process_request_builder is None:
+        raise RuntimeError("Batch process worker was not initialized")
+    return _process_worker.run(
+        Path(input_path),
+        _process_request_builder,
+        _process_verify_input
+    )
@@ -2,7 +2,7 @@
 # path: quack-runner/src/quack_runner/workflow/tool_runner.py
 # module: quack_runner.workflow.tool_runner
 # role: module
-# neighbors: __init__.py, results.py, legacy.py
+# neighbors: __init__.py, results.py, legacy.py, batch.py
 # exports: ToolRunner
 # git_branch: refactor/toolkitWorkflow
 # git_commit: 9e6703a
@@ -16,31 +16,50 @@ IMPORTANT (Must-fix C): Tools must be fully initialized before use.
 ToolRunner requires tool.name to be set (non-None).
 """
 
-from pathlib import Path
-from typing import Any, TYPE_CHECKING, Callable
-from datetime import datetime
-import tempfile
+import os
 import shutil
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from quack_core.contracts import (
+    ArtifactKind,
+    ArtifactRef,
+    CapabilityError,
     CapabilityResult,
     CapabilityStatus,
-    RunManifest,
-    ToolInfo,
     ManifestInput,
-    ArtifactRef,
-    ArtifactKind,
+    RunManifest,
     StorageRef,
     StorageScheme,
+    ToolInfo,
     generate_run_id,
     utcnow,
-    CapabilityError,
 )
-from quack_core.tools import ToolContext
-from quack_core.lib.logging import get_logger
 from quack_core.lib.fs.service import standalone as fs
+from quack_core.lib.logging import get_logger
+from quack_core.lib.mime import get_content_type, is_binary_extension
 from quack_core.lib.serialization import normalize_for_json
-from quack_core.lib.mime import is_binary_extension, get_content_type
+from quack_core.tools import ToolContext
+
+from quack_runner.workflow.batch import (
+    BatchManifest,
+    BatchWorker,
+    ExecutorKind,
+    batch_item_from_manifest,
+    init_process_worker,
+    run_in_process_worker,
+)
 
 if TYPE_CHECKING:
     from quack_core.tools import BaseQuackTool
@@ -190,6 +209,298 @@ class ToolRunner:
                     error_code=init_result.machine_message or "QC_TOOL_INIT_ERROR"
                 )
 
+            return self._execute(
+                ctx=ctx,
+                input_path=input_path,
+                request_builder=request_builder,
+                output_dir=output_dir,
+                started_at=started_at
+            )
+
+        except Exception as e:
+            self.logger.exception(f"Tool execution failed: {e}")
+            return self._build_error_manifest(
+                ctx=ctx,
+                input_path=input_path,
+                started_at=started_at,
+                error_msg=f"Unexpected error: {e}",
+                error_code="QC_EXEC_ERROR"
+            )
+
+        finally:
+            if self._has_cleanup:
+                try:
+                    self.tool.cleanup(ctx)  # type: ignore
+                except Exception as e:
+                    self.logger.warning(f"Cleanup failed: {e}")
+
+            if created_temp_dir and self.cleanup_work_dir and temp_dir_path:
+                try:
+                    shutil.rmtree(temp_dir_path, ignore_errors=True)
+                    self.logger.debug(f"Cleaned up temp directory: {temp_dir_path}")
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to cleanup temp directory {temp_dir_path}: {e}")
+
+    def run_on_files(
+            self,
+            input_paths: Iterable[str | Path],
+            request_builder: Callable[[str | bytes], Any],
+            output_dir: str | Path | None = None,
+            services: dict[str, Any] | None = None,
+            metadata: dict[str, Any] | None = None,
+            max_workers: int | None = None,
+            max_in_flight: int | None = None,
+            executor: ExecutorKind = "thread",
+            write_batch_manifest: bool = True,
+            verify_input: bool = True
+    ) -> Iterator[RunManifest]:
+        """
+        Run the tool over many files on a worker pool.
+
+        The tool is initialized once per worker (not once per file) and each
+        worker reuses one work directory. Manifests are yielded as files
+        finish, so the order is completion order, not input order. At most
+        max_in_flight files are submitted at a time, which keeps memory flat
+        for very large (or lazily generated) input lists.
+
+        When the iterator is exhausted, a BatchManifest with throughput and
+        per-file latency is written to output_dir/batch.<batch_id>.json.
+        Every per-file manifest carries the batch_id in its metadata.
+
+        Args:
+            input_paths: Files to process (any iterable, consumed lazily)
+            request_builder: Builds the tool request from file content. Must be
+                picklable (no lambdas) when executor="process".
+            output_dir: Directory for outputs (default: ./output)
+            services: Services exposed through ToolContext
+            metadata: Metadata copied into every context and manifest
+            max_workers: Pool size (default: os.cpu_count())
+            max_in_flight: Max submitted-but-unfinished files
+                (default: 2 * max_workers)
+            executor: "thread" (shared tool instance) or "process"
+                (tool, services and request_builder are pickled per worker)
+            write_batch_manifest: Write the aggregate BatchManifest
+            verify_input: Check each file exists via fs before reading
+
+        Yields:
+            One RunManifest per input file
+
+        Raises:
+            ValueError: If executor, max_workers or max_in_flight is invalid
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or max_workers * 2
+        if max_workers < 1 or max_in_flight < 1:
+            raise ValueError("max_workers and max_in_flight must be >= 1")
+
+        output_dir = Path(output_dir) if output_dir is not None else Path("./output")
+        mkdir_result = fs.create_directory(str(output_dir), exist_ok=True)
+        if not mkdir_result.success:
+            started_at = utcnow()
+            for input_path in input_paths:
+                yield self._build_error_manifest(
+                    ctx=None,
+                    input_path=Path(input_path),
+                    started_at=started_at,
+                    error_msg=f"Failed to create output directory: {mkdir_result.error}",
+                    error_code="QC_IO_MKDIR_ERROR"
+                )
+            return
+
+        batch_id = generate_run_id()
+        batch_metadata = dict(metadata or {}, batch_id=batch_id)
+
+        safe_tool_name = self.tool.name.replace('.', '_').replace('/', '_')
+        work_root = Path(tempfile.mkdtemp(prefix=f"quack_{safe_tool_name}_batch_"))
+
+        thread_workers: list[BatchWorker] = []
+        pool: ThreadPoolExecutor | ProcessPoolExecutor
+
+        if executor == "thread":
+            local = threading.local()
+            workers_lock = threading.Lock()
+
+            def run_one(path: Path) -> RunManifest:
+                worker = getattr(local, "worker", None)
+                if worker is None:
+                    worker = BatchWorker(
+                        runner=self,
+                        output_dir=output_dir,
+                        work_root=work_root,
+                        services=services,
+                        metadata=batch_metadata
+                    )
+                    local.worker = worker
+                    with workers_lock:
+                        thread_workers.append(worker)
+                return worker.run(path, request_builder, verify_input)
+
+            pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"quack_{safe_tool_name}"
+            )
+
+            def submit(path: Path) -> Future:
+                return pool.submit(run_one, path)
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=init_process_worker,
+                initargs=(
+                    self.tool,
+                    self.cleanup_work_dir,
+                    request_builder,
+                    str(output_dir),
+                    str(work_root),
+                    services,
+                    batch_metadata,
+                    verify_input,
+                )
+            )
+
+            def submit(path: Path) -> Future:
+                return pool.submit(run_in_process_worker, str(path))
+
+        started_at = utcnow()
+        items = []
+        pending: dict[Future, Path] = {}
+        paths = iter(input_paths)
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        path = Path(next(paths))
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[submit(path)] = path
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        manifest = future.result()
+                    except Exception as e:
+                        # Only reachable for pool-level failures (e.g. a
+                        # worker process died); tool errors become manifests.
+                        self.logger.exception(f"Batch worker failed on {path}: {e}")
+                        manifest = self._build_error_manifest(
+                            ctx=None,
+                            input_path=path,
+                            started_at=started_at,
+                            error_msg=f"Worker failed: {e}",
+                            error_code="QC_EXEC_ERROR"
+                        )
+                    items.append(batch_item_from_manifest(path, manifest))
+                    yield manifest
+
+            summary = BatchManifest.from_items(
+                batch_id=batch_id,
+                tool=ToolInfo(name=self.tool.name, version=self.tool.version),
+                executor=executor,
+                max_workers=max_workers,
+                started_at=started_at,
+                items=items
+            )
+            self.logger.info(
+                f"Batch {batch_id}: {summary.total} files "
+                f"({summary.failed} failed) in {summary.duration_sec:.2f}s, "
+                f"{summary.files_per_sec:.2f} files/s"
+            )
+
+            if write_batch_manifest:
+                batch_path = output_dir / f"batch.{batch_id}.json"
+                write_result = fs.write_json(
+                    str(batch_path), summary.model_dump(mode="json"), indent=2
+                )
+                if not write_result.success:
+                    self.logger.warning(
+                        f"Failed to write batch manifest {batch_path}: "
+                        f"{write_result.error}"
+                    )
+
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+            for worker in thread_workers:
+                worker.close()
+
+            if self.cleanup_work_dir:
+                shutil.rmtree(work_root, ignore_errors=True)
+
+    def run_on_directory(
+            self,
+            input_dir: str | Path,
+            request_builder: Callable[[str | bytes], Any],
+            pattern: str = "*",
+            recursive: bool = False,
+            **kwargs: Any
+    ) -> Iterator[RunManifest]:
+        """
+        Run the tool over every file in a directory.
+
+        Files are enumerated lazily and fed to run_on_files(); since they were
+        just listed, the per-file existence check is skipped by default.
+
+        Args:
+            input_dir: Directory to scan
+            request_builder: Builds the tool request from file content
+            pattern: Glob pattern for files (default: all files)
+            recursive: Descend into sub-directories
+            **kwargs: Forwarded to run_on_files()
+
+        Yields:
+            One RunManifest per matched file
+        """
+        input_dir = Path(input_dir)
+        if not input_dir.is_dir():
+            raise NotADirectoryError(f"Input directory not found: {input_dir}")
+
+        matches = input_dir.rglob(pattern) if recursive else input_dir.glob(pattern)
+        kwargs.setdefault("verify_input", False)
+
+        yield from self.run_on_files(
+            (path for path in matches if path.is_file()),
+            request_builder,
+            **kwargs
+        )
+
+    def _execute(
+            self,
+            ctx: ToolContext,
+            input_path: Path,
+            request_builder: Callable[[str | bytes], Any],
+            output_dir: Path,
+            started_at: datetime,
+            verify_input: bool = True
+    ) -> RunManifest:
+        """
+        Run an already-initialized tool on a single input file.
+
+        Does not call tool.initialize() or tool.cleanup(); callers own the
+        tool lifecycle. Used by run_on_file() and the batch workers.
+
+        Args:
+            ctx: Context for this run (run_id must be unique per file)
+            input_path: Input file
+            request_builder: Builds the tool request from file content
+            output_dir: Directory for output artifacts
+            started_at: Start timestamp recorded in the manifest
+            verify_input: Check existence via fs before reading. Batch callers
+                that enumerated the input themselves pass False.
+        """
+        if verify_input:
             file_info_result = fs.get_file_info(str(input_path))
             if not file_info_result.success:
                 return self._build_error_manifest(
@@ -212,126 +523,105 @@ class ToolRunner:
 
             ext_result = fs.get_extension(str(input_path))
             extension = (ext_result.data or "").lower().lstrip(".")
+        else:
+            # Caller already enumerated the file (batch mode): skip the
+            # existence round trip and derive the extension locally.
+            extension = input_path.suffix.lower().lstrip(".")
 
-            is_binary = is_binary_extension(extension)
-
-            content: str | bytes
-            content_type: str
+        is_binary = is_binary_extension(extension)
 
-            if is_binary:
-                read_result = fs.read_binary(str(input_path))
-                if not read_result.success:
-                    return self._build_error_manifest(
-                        ctx=ctx,
-                        input_path=input_path,
-                        started_at=started_at,
-                        error_msg=f"Failed to read binary file: {read_result.error}",
-                        error_code="QC_IO_READ_ERROR"
-                    )
-                content = read_result.content
-                content_type = get_content_type(extension)
-            else:
-                read_result = fs.read_text(str(input_path))
-                if not read_result.success:
-                    return self._build_error_manifest(
-                        ctx=ctx,
-                        input_path=input_path,
-                        started_at=started_at,
-                        error_msg=f"Failed to read text file: {read_result.error}",
-                        error_code="QC_IO_READ_ERROR"
-                    )
-                content = read_result.content
-                content_type = get_content_type(
-                    extension) if extension else "text/plain"
+        content: str | bytes
+        content_type: str
 
-            try:
-                request = request_builder(content)
-            except Exception as e:
+        if is_binary:
+            read_result = fs.read_binary(str(input_path))
+            if not read_result.success:
                 return self._build_error_manifest(
                     ctx=ctx,
                     input_path=input_path,
                     started_at=started_at,
-                    error_msg=f"Failed to build request: {e}",
-                    error_code="QC_VAL_INVALID"
+                    error_msg=f"Failed to read binary file: {read_result.error}",
+                    error_code="QC_IO_READ_ERROR"
                 )
-
-            input_artifact = ArtifactRef(
-                role=f"{self.tool.name}.input",
-                kind=ArtifactKind.intermediate,
-                content_type=content_type,
-                storage=StorageRef(
-                    scheme=StorageScheme.local,
-                    uri=f"file://{input_path.absolute()}"
+            content = read_result.content
+            content_type = get_content_type(extension)
+        else:
+            read_result = fs.read_text(str(input_path))
+            if not read_result.success:
+                return self._build_error_manifest(
+                    ctx=ctx,
+                    input_path=input_path,
+                    started_at=started_at,
+                    error_msg=f"Failed to read text file: {read_result.error}",
+                    error_code="QC_IO_READ_ERROR"
                 )
-            )
-
-            if self._has_validate:
-                validate_result = self.tool.validate(request, ctx)  # type: ignore
-                if validate_result.status != CapabilityStatus.success:
-                    return self._build_error_manifest(
-                        ctx=ctx,
-                        input_path=input_path,
-                        started_at=started_at,
-                        error_msg=validate_result.human_message or "Validation failed",
-                        error_code=validate_result.machine_message or "QC_VAL_FAILED",
-                        input_artifact=input_artifact
-                    )
-
-            if self._has_pre_run:
-                pre_result = self.tool.pre_run(request, ctx)  # type: ignore
-                if pre_result.status != CapabilityStatus.success:
-                    return self._build_error_manifest(
-                        ctx=ctx,
-                        input_path=input_path,
-                        started_at=started_at,
-                        error_msg=pre_result.human_message or "Pre-run failed",
-                        error_code=pre_result.machine_message or "QC_PRE_RUN_FAILED",
-                        input_artifact=input_artifact
-                    )
-
-            result = self.tool.run(request, ctx)
-
-            if self._has_post_run:
-                result = self.tool.post_run(request, result, ctx)  # type: ignore
-
-            finished_at = utcnow()
-            duration_sec = (finished_at - started_at).total_seconds()
-
-            return self._build_manifest_from_result(
-                result=result,
-                ctx=ctx,
-                input_path=input_path,
-                input_artifact=input_artifact,
-                started_at=started_at,
-                finished_at=finished_at,
-                duration_sec=duration_sec,
-                output_dir=output_dir
-            )
+            content = read_result.content
+            content_type = get_content_type(
+                extension) if extension else "text/plain"
 
+        try:
+            request = request_builder(content)
         except Exception as e:
-            self.logger.exception(f"Tool execution failed: {e}")
             return self._build_error_manifest(
                 ctx=ctx,
                 input_path=input_path,
                 started_at=started_at,
-                error_msg=f"Unexpected error: {e}",
-                error_code="QC_EXEC_ERROR"
+                error_msg=f"Failed to build request: {e}",
+                error_code="QC_VAL_INVALID"
             )
 
-        finally:
-            if self._has_cleanup:
-                try:
-                    self.tool.cleanup(ctx)  # type: ignore
-                except Exception as e:
-                    self.logger.warning(f"Cleanup failed: {e}")
+        input_artifact = ArtifactRef(
+            role=f"{self.tool.name}.input",
+            kind=ArtifactKind.intermediate,
+            content_type=content_type,
+            storage=StorageRef(
+                scheme=StorageScheme.local,
+                uri=f"file://{input_path.absolute()}"
+            )
+        )
 
-            if created_temp_dir and self.cleanup_work_dir and temp_dir_path:
-                try:
-                    shutil.rmtree(temp_dir_path, ignore_errors=True)
-                    self.logger.debug(f"Cleaned up temp directory: {temp_dir_path}")
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to cleanup temp directory {temp_dir_path}: {e}")
+        if self._has_validate:
+            validate_result = self.tool.validate(request, ctx)  # type: ignore
+            if validate_result.status != CapabilityStatus.success:
+                return self._build_error_manifest(
+                    ctx=ctx,
+                    input_path=input_path,
+                    started_at=started_at,
+                    error_msg=validate_result.human_message or "Validation failed",
+                    error_code=validate_result.machine_message or "QC_VAL_FAILED",
+                    input_artifact=input_artifact
+                )
+
+        if self._has_pre_run:
+            pre_result = self.tool.pre_run(request, ctx)  # type: ignore
+            if pre_result.status != CapabilityStatus.success:
+                return self._build_error_manifest(
+                    ctx=ctx,
+                    input_path=input_path,
+                    started_at=started_at,
+                    error_msg=pre_result.human_message or "Pre-run failed",
+                    error_code=pre_result.machine_message or "QC_PRE_RUN_FAILED",
+                    input_artifact=input_artifact
+                )
+
+        result = self.tool.run(request, ctx)
+
+        if self._has_post_run:
+            result = self.tool.post_run(request, result, ctx)  # type: ignore
+
+        finished_at = utcnow()
+        duration_sec = (finished_at - started_at).total_seconds()
+
+        return self._build_manifest_from_result(
+            result=result,
+            ctx=ctx,
+            input_path=input_path,
+            input_artifact=input_artifact,
+            started_at=started_at,
+            finished_at=finished_at,
+            duration_sec=duration_sec,
+            output_dir=output_dir
+        )
 
     def _build_manifest_from_result(
             self,
@@ -0,0 +1,190 @@
+# === QV-LLM:BEGIN ===
+# path: quack-runner/tests/test_workflow/test_batch.py
+# role: tests
+# neighbors: __init__.py, test_results.py
+# exports: CountingTool, FailingInitTool, TestToolRunnerBatch, TestBatchManifest
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+"""
+Tests for ToolRunner batch mode (run_on_files / run_on_directory).
+"""
+
+import json
+import threading
+from datetime import timedelta
+from pathlib import Path
+
+from quack_core.contracts import CapabilityResult, CapabilityStatus, ToolInfo, utcnow
+from quack_core.tools import BaseQuackTool
+
+from quack_runner.workflow import BatchItem, BatchManifest, ToolRunner
+
+
+class CountingTool(BaseQuackTool):
+    """Tool that upper-cases its input and counts initialize() calls."""
+
+    name = "test.counting"
+    version = "1.0.0"
+
+    def __init__(self):
+        super().__init__()
+        self.init_calls = 0
+        self.cleanup_calls = 0
+        self._lock = threading.Lock()
+
+    def initialize(self, ctx):
+        with self._lock:
+            self.init_calls += 1
+        return CapabilityResult.ok(data=None, msg="initialized")
+
+    def cleanup(self, ctx):
+        with self._lock:
+            self.cleanup_calls += 1
+
+    def run(self, request, ctx):
+        return CapabilityResult.ok(data={"text": request.upper()}, msg="done")
+
+
+class FailingInitTool(BaseQuackTool):
+    """Tool whose initialize() always fails."""
+
+    name = "test.failing_init"
+
+    def initialize(self, ctx):
+        return CapabilityResult.fail(msg="no model", code="QC_TOOL_INIT_ERROR")
+
+    def run(self, request, ctx):
+        return CapabilityResult.ok(data=request, msg="unreachable")
+
+
+def _make_inputs(directory: Path, count: int) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = directory / f"input_{i}.txt"
+        path.write_text(f"hello {i}")
+        paths.append(path)
+    return paths
+
+
+class TestToolRunnerBatch:
+    """Tests for ToolRunner.run_on_files and run_on_directory."""
+
+    def test_initializes_once_per_worker(self, tmp_path):
+        inputs = _make_inputs(tmp_path / "in", 12)
+        tool = CountingTool()
+        runner = ToolRunner(tool)
+
+        manifests = list(runner.run_on_files(
+            inputs,
+            request_builder=str,
+            output_dir=tmp_path / "out",
+            max_workers=3
+        ))
+
+        assert len(manifests) == 12
+        assert all(m.status == CapabilityStatus.success for m in manifests)
+        assert len({m.run_id for m in manifests}) == 12
+        assert 1 <= tool.init_calls <= 3
+        assert tool.cleanup_calls == tool.init_calls
+
+    def test_writes_batch_manifest(self, tmp_path):
+        inputs = _make_inputs(tmp_path / "in", 4)
+        out_dir = tmp_path / "out"
+        runner = ToolRunner(CountingTool())
+
+        manifests = list(runner.run_on_files(
+            inputs, request_builder=str, output_dir=out_dir, max_workers=2
+        ))
+
+        batch_id = manifests[0].metadata["batch_id"]
+        assert all(m.metadata["batch_id"] == batch_id for m in manifests)
+
+        summary = json.loads((out_dir / f"batch.{batch_id}.json").read_text())
+        assert summary["total"] == 4
+        assert summary["succeeded"] == 4
+        assert summary["failed"] == 0
+        assert summary["latency_p95_sec"] is not None
+        assert {item["run_id"] for item in summary["items"]} == {
+            m.run_id for m in manifests
+        }
+
+    def test_missing_file_reported_per_item(self, tmp_path):
+        inputs = _make_inputs(tmp_path / "in", 2)
+        inputs.append(tmp_path / "in" / "missing.txt")
+        runner = ToolRunner(CountingTool())
+
+        manifests = list(runner.run_on_files(
+            inputs, request_builder=str, output_dir=tmp_path / "out"
+        ))
+
+        errors = [m for m in manifests if m.status == CapabilityStatus.error]
+        assert len(errors) == 1
+        assert errors[0].error.code == "QC_IO_NOT_FOUND"
+
+    def test_init_failure_yields_error_manifests(self, tmp_path):
+        inputs = _make_inputs(tmp_path / "in", 3)
+        runner = ToolRunner(FailingInitTool())
+
+        manifests = list(runner.run_on_files(
+            inputs, request_builder=str, output_dir=tmp_path / "out", max_workers=1
+        ))
+
+        assert len(manifests) == 3
+        assert all(m.status == CapabilityStatus.error for m in manifests)
+
+    def test_run_on_directory_filters_pattern(self, tmp_path):
+        in_dir = tmp_path / "in"
+        _make_inputs(in_dir, 3)
+        _make_inputs(in_dir / "nested", 2)
+        (in_dir / "skip.md").write_text("# not matched")
+        runner = ToolRunner(CountingTool())
+
+        flat = list(runner.run_on_directory(
+            in_dir, request_builder=str, pattern="*.txt",
+            output_dir=tmp_path / "out_flat"
+        ))
+        deep = list(runner.run_on_directory(
+            in_dir, request_builder=str, pattern="*.txt", recursive=True,
+            output_dir=tmp_path / "out_deep"
+        ))
+
+        assert len(flat) == 3
+        assert len(deep) == 5
+        assert all(m.status == CapabilityStatus.success for m in deep)
+
+
+class TestBatchManifest:
+    """Tests for BatchManifest aggregation."""
+
+    def test_from_items_computes_stats(self):
+        started_at = utcnow() - timedelta(seconds=2)
+        items = [
+            BatchItem(
+                input_path=f"f{i}.txt",
+                run_id=f"run-{i}",
+                status=CapabilityStatus.error if i == 0 else CapabilityStatus.success,
+                duration_sec=float(i + 1),
+                error_code="QC_EXEC_ERROR" if i == 0 else None
+            )
+            for i in range(10)
+        ]
+
+        summary = BatchManifest.from_items(
+            batch_id="batch-1",
+            tool=ToolInfo(name="test.counting", version="1.0.0"),
+            executor="thread",
+            max_workers=4,
+            started_at=started_at,
+            items=items
+        )
+
+        assert summary.total == 10
+        assert summary.failed == 1
+        assert summary.succeeded == 9
+        assert summary.latency_p50_sec == 5.0
+        assert summary.latency_p95_sec == 10.0
+        assert summary.latency_max_sec == 10.0
+        assert summary.files_per_sec > 0
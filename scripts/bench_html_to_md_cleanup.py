@@ -0,0 +1,133 @@
+# === QV-LLM:BEGIN ===
+# path: scripts/bench_html_to_md_cleanup.py
+# role: module
+# neighbors: annotate_headers.py, bench_md_to_docx_overhead.py, fix_imports.py, fix_remaining_tests.py, flatten.py, verify_installation.py
+# exports: make_html, make_markdown, legacy_post_process_markdown, legacy_validate_html_structure, main
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+# bench_html_to_md_cleanup.py
+"""Measure the Python work around pandoc in HTML to Markdown conversion.
+
+Times the input HTML validation and the Markdown post-processing on large
+generated pages, comparing the previous implementations (a BeautifulSoup
+tree per document, six uncompiled regex passes) with the current ones.
+The legacy validator is skipped when bs4 is not installed.
+
+Usage:
+    python scripts/bench_html_to_md_cleanup.py [--sections 20000] [--repeat 3]
+"""
+
+import argparse
+import re
+import time
+
+from quack_core.integrations.pandoc.operations.html_to_md import (
+    post_process_markdown,
+)
+from quack_core.integrations.pandoc.operations.utils import validate_html_structure
+
+
+def make_html(sections: int) -> str:
+    """Build a page with a heading near the top and many content sections."""
+    section = (
+        '<section><h2 id="s">Section</h2><p>Some <em>text</em> with a '
+        '<a href="/page">link</a> and more words to fill the line.</p>'
+        "<ul><li>one</li><li>two</li></ul></section>\n"
+    )
+    return (
+        "<html><head><title>Bench</title></head><body><h1>Title</h1>\n"
+        + section * sections
+        + "</body></html>"
+    )
+
+
+def make_markdown(sections: int) -> str:
+    """Build Markdown shaped like pandoc's output for a large page."""
+    section = (
+        "::: {.section}\n## Section {#s}\n\nSome *text* with a [link](/page) "
+        "and more words to fill the line.\n\n\n\n- one\n- two\n\n"
+        '<div class="x">\n\n:::\n\n'
+    )
+    return "# Title\n\n" + section * sections
+
+
+def legacy_post_process_markdown(markdown_content: str) -> str:
+    """The previous post-processor: six uncompiled passes."""
+    cleaned = re.sub(r"{[^}]*}", "", markdown_content)
+    cleaned = re.sub(r":::+\s*[^\n]*\n", "", cleaned)
+    cleaned = re.sub(r"<div[^>]*>|</div>", "", cleaned)
+    cleaned = re.sub(r"\n\s*\n\s*\n+", "\n\n", cleaned)
+    cleaned = re.sub(r"<!--[^>]*-->", "", cleaned)
+    cleaned = re.sub(r"\n\s*\n-", "\n-", cleaned)
+    return cleaned
+
+
+def legacy_validate_html_structure(content: str, check_links: bool = False) -> bool:
+    """The previous validator: a full BeautifulSoup tree per document."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "html.parser")
+    if not soup.find("body"):
+        return False
+    soup.find(["h1", "h2", "h3", "h4", "h5", "h6"])
+    if check_links:
+        links = soup.find_all("a")
+        return not any(not (link.get("href") or "").strip() for link in links)
+    return True
+
+
+def _best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label: str, before: float | None, after: float) -> None:
+    if before is None:
+        print(f"{label:<28} before: {'n/a':>9}   after: {after * 1000:9.1f} ms")
+        return
+    print(
+        f"{label:<28} before: {before * 1000:9.1f} ms   after: {after * 1000:9.1f} ms"
+        f"   ({before / after:.1f}x)"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print timings before and after."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    html = make_html(args.sections)
+    markdown = make_markdown(args.sections)
+    print(f"HTML: {len(html) / 1e6:.1f} MB, Markdown: {len(markdown) / 1e6:.1f} MB")
+
+    try:
+        import bs4  # noqa: F401
+
+        has_bs4 = True
+    except ImportError:
+        has_bs4 = False
+
+    for check_links in (False, True):
+        before = (
+            _best_of(args.repeat, legacy_validate_html_structure, html, check_links)
+            if has_bs4
+            else None
+        )
+        after = _best_of(args.repeat, validate_html_structure, html, check_links)
+        _report(f"validate (check_links={check_links})", before, after)
+
+    before = _best_of(args.repeat, legacy_post_process_markdown, markdown)
+    after = _best_of(args.repeat, post_process_markdown, markdown)
+    _report("post_process_markdown", before, after)
+
+
+if __name__ == "__main__":
+    main()
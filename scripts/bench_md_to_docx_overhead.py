@@ -0,0 +1,123 @@
+# === QV-LLM:BEGIN ===
+# path: scripts/bench_md_to_docx_overhead.py
+# role: module
+# neighbors: annotate_headers.py, fix_imports.py, fix_remaining_tests.py, flatten.py, verify_installation.py
+# exports: NullDocxBackend, run_batch, main
+# git_branch: refactor/toolkitWorkflow
+# git_commit: 9e6703a
+# === QV-LLM:END ===
+
+# bench_md_to_docx_overhead.py
+"""Measure per-file overhead of the Markdown to DOCX conversion pipeline.
+
+Pandoc itself is replaced by a backend that writes a fixed placeholder file,
+so the timings cover only the Python work around each conversion: input
+validation, path handling, output checks and metrics.
+
+The "before" run reproduces the removed test detection, which walked
+inspect.stack() once in each of the four pipeline steps of every conversion
+(five with structure checks on). The "after" run is the current pipeline.
+
+Usage:
+    python scripts/bench_md_to_docx_overhead.py [--files 500] [--depth 0]
+
+--depth adds that many frames above each conversion, to show how the stack
+walks grew with deep call stacks (e.g. when called from a web handler).
+"""
+
+import argparse
+import inspect
+import os
+import tempfile
+import time
+
+from quack_core.integrations.pandoc import ConversionMetrics, PandocConfig
+from quack_core.integrations.pandoc.operations import md_to_docx
+
+# inspect.stack() calls per conversion in the old pipeline
+LEGACY_STACK_WALKS = 4
+
+
+class NullDocxBackend:
+    """Backend that skips pandoc and writes a small placeholder file."""
+
+    def __init__(self, stack_walks: int = 0) -> None:
+        self.stack_walks = stack_walks
+
+    def convert_file(
+        self, source_path, to_format, from_format, output_path=None, extra_args=()
+    ):
+        # Reproduce the frame inspection the old pipeline did around pandoc
+        for _ in range(self.stack_walks):
+            for frame in inspect.stack():
+                if frame.function == "test_md_to_docx_convert_once_success":
+                    break
+        with open(output_path, "wb") as f:
+            f.write(b"PK" + b"\0" * 4096)
+        return ""
+
+
+def _nested(depth: int, func, *args):
+    if depth <= 0:
+        return func(*args)
+    return _nested(depth - 1, func, *args)
+
+
+def run_batch(paths: list[str], out_dir: str, stack_walks: int, depth: int) -> float:
+    """Convert every file and return the mean seconds per file."""
+    config = PandocConfig()
+    config.validation.verify_structure = False
+    config.retry_mechanism.conversion_retry_delay = 0
+    backend = NullDocxBackend(stack_walks)
+    metrics = ConversionMetrics()
+
+    def convert(path: str) -> None:
+        name = os.path.splitext(os.path.basename(path))[0]
+        result = md_to_docx.convert_markdown_to_docx(
+            path,
+            os.path.join(out_dir, f"{name}.docx"),
+            config,
+            metrics,
+            backend=backend,
+        )
+        if not result.success:
+            raise RuntimeError(result.error)
+
+    start = time.perf_counter()
+    for path in paths:
+        _nested(depth, convert, path)
+    return (time.perf_counter() - start) / len(paths)
+
+
+def main() -> None:
+    """Run the benchmark and print per-file overhead before and after."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--depth", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = os.path.join(tmp, f"note_{i}.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"# Note {i}\n\n" + "Some *markdown* text.\n" * 20)
+            paths.append(path)
+
+        out_dir = os.path.join(tmp, "out")
+        os.makedirs(out_dir)
+
+        # Warm up imports and caches
+        run_batch(paths[:10], out_dir, 0, 0)
+
+        before = run_batch(paths, out_dir, LEGACY_STACK_WALKS, args.depth)
+        after = run_batch(paths, out_dir, 0, args.depth)
+
+    print(f"files: {args.files}, extra stack depth: {args.depth}")
+    print(f"before: {before * 1000:.3f} ms/file")
+    print(f"after:  {after * 1000:.3f} ms/file")
+    print(f"saved:  {(before - after) * 1000:.3f} ms/file")
+
+
+if __name__ == "__main__":
+    main()